@@ -0,0 +1,58 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the dct domain chroma resampling with the pixel domain transcoding for each chroma sampling mode.
+
+    python benchmarks/chroma_resampling.py [--repeat N] [image.jpg ...]
+
+Defaults to the color_*.jpg test images, larger images make the difference more visible.
+"""
+
+import argparse
+import glob
+import os
+import timeit
+
+from jpeg2dct.numpy import loads, set_chroma_resampling
+
+
+def time_loads(buffer, repeat):
+    loads(buffer)
+    return min(timeit.repeat(lambda: loads(buffer), number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='number of timed decodes per image and mode')
+    parser.add_argument('images', nargs='*', help='jpeg images, one per sampling mode')
+    args = parser.parse_args()
+
+    images = args.images
+    if not images:
+        data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'test', 'data')
+        images = sorted(glob.glob(os.path.join(data_dir, 'color_*.jpg')))
+
+    print('{:<30} {:>14} {:>14} {:>8}'.format('image', 'resample (ms)', 'transcode (ms)', 'speedup'))
+    for image in images:
+        with open(image, 'rb') as src:
+            buffer = src.read()
+        try:
+            set_chroma_resampling(True)
+            resample = time_loads(buffer, args.repeat)
+            set_chroma_resampling(False)
+            transcode = time_loads(buffer, args.repeat)
+        finally:
+            set_chroma_resampling(True)
+        print('{:<30} {:>14.2f} {:>14.2f} {:>7.2f}x'.format(
+            os.path.basename(image), resample * 1e3, transcode * 1e3, transcode / resample))
+
+
+if __name__ == '__main__':
+    main()
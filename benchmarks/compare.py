@@ -0,0 +1,78 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare two result files of benchmarks/decode_suite.py, typically of two commits on the same machine.
+
+    python benchmarks/compare.py baseline.json results.json [--threshold 0.05]
+
+Prints the throughput and median latency ratios of every decoder and image they share, and exits with status 1 when
+the throughput of any of them dropped by more than the threshold.
+"""
+
+import argparse
+import json
+import math
+import sys
+
+# metadata which should match for the results to be comparable
+_MACHINE_KEYS = ('platform', 'machine', 'processor', 'cpu_count')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline', help='json results of the reference run')
+    parser.add_argument('results', help='json results of the compared run')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='relative throughput drop reported as a regression')
+    args = parser.parse_args()
+
+    with open(args.baseline) as src:
+        baseline = json.load(src)
+    with open(args.results) as src:
+        results = json.load(src)
+
+    for key in _MACHINE_KEYS:
+        if baseline['metadata'].get(key) != results['metadata'].get(key):
+            print('warning: the runs differ in {}: {} vs {}'.format(
+                key, baseline['metadata'].get(key), results['metadata'].get(key)))
+    print('baseline {} ({}), results {} ({})\n'.format(
+        baseline['metadata'].get('git_commit'), baseline['metadata'].get('timestamp'),
+        results['metadata'].get('git_commit'), results['metadata'].get('timestamp')))
+
+    regressions = 0
+    for name, report in sorted(results['decoders'].items()):
+        reference = baseline['decoders'].get(name)
+        if report['status'] != 'ok' or reference is None or reference['status'] != 'ok':
+            continue
+        reference_results = {result['case']: result for result in reference['results']}
+        print('{:<44} {:>12} {:>12} {:>10} {:>10}'.format(name, 'base img/s', 'img/s', 'speedup', 'p50 ratio'))
+        log_speedups = []
+        for result in report['results']:
+            before = reference_results.get(result['case'])
+            if before is None:
+                continue
+            speedup = result['images_per_second'] / before['images_per_second']
+            log_speedups.append(math.log(speedup))
+            regression = speedup < 1 - args.threshold
+            regressions += regression
+            print('{:<44} {:>12.1f} {:>12.1f} {:>9.2f}x {:>10.2f}{}'.format(
+                result['case'], before['images_per_second'], result['images_per_second'], speedup,
+                result['latency_ms']['p50'] / before['latency_ms']['p50'], '  regression' if regression else ''))
+        if log_speedups:
+            print('{:<44} {:>12} {:>12} {:>9.2f}x\n'.format(
+                'geometric mean', '', '', math.exp(sum(log_speedups) / len(log_speedups))))
+
+    if regressions:
+        print('{} regressions beyond {:.0%}'.format(regressions, args.threshold))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,359 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the throughput, latency percentiles and peak memory of every decoder over a grid of synthetic jpeg images
+varying the size, quality, chroma sampling, progressive coding and restart interval.
+
+    python benchmarks/decode_suite.py [--decoders numpy.loads,...] [--repeat N] [--output results.json] [grid options]
+    python benchmarks/compare.py baseline.json results.json
+
+Each decoder runs in its own process, over the images sorted by size, so that the peak resident memory reported
+after each image is the one of that decoder. Decoders whose dependencies are missing (tensorflow, petastorm, PIL,
+cv2) are reported as skipped. Batch decoders decode --batch-size copies of each image per call: their latency is the
+one of a batch, their throughput counts images.
+
+Results are only comparable between runs on the same machine.
+"""
+
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import jpeg2dct
+from jpeg2dct.numpy import probe
+from synthetic import add_grid_arguments, cases_from_arguments, encode_case
+
+
+class Decoder(object):
+    """a way of decoding jpeg images, set up once per process then bound to each image"""
+    images_per_call = 1
+
+    def setup(self, batch_size):
+        """import the dependencies of the decoder, raising ImportError when they are missing
+        :return: the version of the library doing the decoding
+        """
+        return jpeg2dct.__version__
+
+    def bind(self, path, buffer):
+        """:return: a function decoding images_per_call copies of the image stored at path, whose bytes are buffer"""
+        raise NotImplementedError()
+
+
+class NumpyLoad(Decoder):
+    def setup(self, batch_size):
+        from jpeg2dct.numpy import load
+        self.load = load
+        return super(NumpyLoad, self).setup(batch_size)
+
+    def bind(self, path, buffer):
+        return lambda: self.load(path)
+
+
+class NumpyLoads(Decoder):
+    def setup(self, batch_size):
+        from jpeg2dct.numpy import loads
+        self.loads = loads
+        return super(NumpyLoads, self).setup(batch_size)
+
+    def bind(self, path, buffer):
+        return lambda: self.loads(buffer)
+
+
+class NumpyLoadsTranscode(NumpyLoads):
+    """loads with the pixel domain transcoding of the chroma layouts other than 4:2:0"""
+
+    def setup(self, batch_size):
+        from jpeg2dct.numpy import set_chroma_resampling
+        set_chroma_resampling(False)
+        return super(NumpyLoadsTranscode, self).setup(batch_size)
+
+
+class NumpyLoadsBatch(Decoder):
+    def setup(self, batch_size):
+        from jpeg2dct.numpy import loads_batch
+        self.loads_batch = loads_batch
+        self.images_per_call = batch_size
+        return super(NumpyLoadsBatch, self).setup(batch_size)
+
+    def bind(self, path, buffer):
+        buffers = [buffer] * self.images_per_call
+        return lambda: self.loads_batch(buffers)
+
+
+class TensorflowDecode(Decoder):
+    def setup(self, batch_size):
+        import tensorflow as tf
+        from jpeg2dct.tensorflow import decode
+        tf_v1 = _tf_v1(tf)
+        graph = tf.Graph()
+        with graph.as_default():
+            self.input = tf_v1.placeholder(tf.string, shape=())
+            self.output = decode(self.input)
+        self.session = tf_v1.Session(graph=graph)
+        return tf.__version__
+
+    def bind(self, path, buffer):
+        return lambda: self.session.run(self.output, feed_dict={self.input: buffer})
+
+
+class TensorflowBatchDecode(Decoder):
+    def setup(self, batch_size):
+        import tensorflow as tf
+        from jpeg2dct.tensorflow import batch_decode
+        tf_v1 = _tf_v1(tf)
+        graph = tf.Graph()
+        with graph.as_default():
+            self.input = tf_v1.placeholder(tf.string, shape=(None,))
+            self.output = batch_decode(self.input)
+        self.session = tf_v1.Session(graph=graph)
+        self.images_per_call = batch_size
+        return tf.__version__
+
+    def bind(self, path, buffer):
+        buffers = [buffer] * self.images_per_call
+        return lambda: self.session.run(self.output, feed_dict={self.input: buffers})
+
+
+class PetastormCodec(Decoder):
+    def setup(self, batch_size):
+        try:
+            from jpeg2dct.petastorm.codecs import Jpeg2DCTNumpyCodec
+        except Exception as e:
+            # the codecs module raises a plain Exception when cv2 or pyspark are missing
+            raise ImportError(str(e))
+        self.codec = Jpeg2DCTNumpyCodec()
+        return super(PetastormCodec, self).setup(batch_size)
+
+    def bind(self, path, buffer):
+        value = bytearray(buffer)
+        return lambda: self.codec.decode(None, value)
+
+
+class PilDecode(Decoder):
+    """pixel decoding baseline"""
+
+    def setup(self, batch_size):
+        import PIL
+        from PIL import Image
+        self.image = Image
+        return PIL.__version__
+
+    def bind(self, path, buffer):
+        def decode():
+            image = self.image.open(io.BytesIO(buffer))
+            image.load()
+            return image
+        return decode
+
+
+class Cv2Decode(Decoder):
+    """pixel decoding baseline"""
+
+    def setup(self, batch_size):
+        import cv2
+        self.cv2 = cv2
+        return cv2.__version__
+
+    def bind(self, path, buffer):
+        data = np.frombuffer(buffer, np.uint8)
+        return lambda: self.cv2.imdecode(data, self.cv2.IMREAD_UNCHANGED)
+
+
+DECODERS = {
+    'numpy.load': NumpyLoad,
+    'numpy.loads': NumpyLoads,
+    'numpy.loads_transcode': NumpyLoadsTranscode,
+    'numpy.loads_batch': NumpyLoadsBatch,
+    'tensorflow.decode': TensorflowDecode,
+    'tensorflow.batch_decode': TensorflowBatchDecode,
+    'petastorm': PetastormCodec,
+    'pil': PilDecode,
+    'cv2': Cv2Decode,
+}
+
+
+def _tf_v1(tf):
+    """:return: the tensorflow 1 api, which tensorflow 2 keeps in tf.compat.v1"""
+    compat = getattr(tf, 'compat', None)
+    return getattr(compat, 'v1', tf)
+
+
+def peak_rss_mb():
+    """:return: the peak resident memory of the process so far in MiB"""
+    # linux keeps the ru_maxrss of the parent process across exec, the high water mark of the address space is not
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024.0
+    except (IOError, OSError):
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macOS
+    return peak / (1024.0 ** 2 if sys.platform == 'darwin' else 1024.0)
+
+
+def time_calls(call, repeat, min_time):
+    """:return: the durations of at least repeat calls, and more until they add up to min_time seconds"""
+    call()
+    durations = []
+    total = 0.0
+    while len(durations) < repeat or total < min_time:
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+        total += durations[-1]
+    return durations
+
+
+def run_worker(name, manifest_path):
+    """benchmark decoder name over the images of the manifest, and print the results as json"""
+    with open(manifest_path) as src:
+        manifest = json.load(src)
+    decoder = DECODERS[name]()
+    try:
+        version = decoder.setup(manifest['batch_size'])
+    except ImportError as e:
+        print(json.dumps({'status': 'skipped', 'reason': str(e)}))
+        return
+    report = {'status': 'ok', 'version': version, 'images_per_call': decoder.images_per_call,
+              'baseline_rss_mb': peak_rss_mb(), 'results': []}
+    for case in manifest['cases']:
+        with open(case['path'], 'rb') as src:
+            buffer = src.read()
+        durations = np.array(time_calls(decoder.bind(case['path'], buffer), manifest['repeat'],
+                                        manifest['min_time']))
+        latency = {'mean': durations.mean(), 'min': durations.min()}
+        for percentile in (50, 90, 99):
+            latency['p{}'.format(percentile)] = np.percentile(durations, percentile)
+        report['results'].append({
+            'case': case['name'],
+            'calls': len(durations),
+            'images_per_second': decoder.images_per_call * len(durations) / durations.sum(),
+            'latency_ms': {key: float(value) * 1e3 for key, value in latency.items()},
+            'peak_rss_mb': peak_rss_mb(),
+        })
+    print(json.dumps(report))
+
+
+def run_decoder(name, manifest_path):
+    """:return: the report of decoder name, benchmarked in a new process"""
+    process = subprocess.run([sys.executable, os.path.realpath(__file__), '--worker', name, manifest_path],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode != 0:
+        return {'status': 'failed', 'reason': (process.stderr.strip().splitlines() or ['no output'])[-1]}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def metadata():
+    """:return: what identifies the code and the machine the benchmark ran on"""
+    def git(*command):
+        try:
+            return subprocess.check_output(('git',) + command, cwd=os.path.dirname(os.path.realpath(__file__)),
+                                           stderr=subprocess.DEVNULL, universal_newlines=True).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = git('status', '--porcelain', '--untracked-files=no')
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'git_commit': git('rev-parse', 'HEAD'),
+        'git_dirty': bool(status) if status is not None else None,
+        'jpeg2dct': jpeg2dct.__version__,
+        'numpy': np.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--decoders', default=','.join(DECODERS),
+                        help='comma separated decoders, among {}'.format(', '.join(DECODERS)))
+    parser.add_argument('--repeat', type=int, default=20, help='minimum number of timed calls per image and decoder')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='minimum number of seconds of timed calls per image and decoder')
+    parser.add_argument('--batch-size', type=int, default=16, help='number of images per call of batch decoders')
+    parser.add_argument('--output', help='json file the results are written to')
+    add_grid_arguments(parser)
+    parser.add_argument('--worker', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(*args.worker)
+        return
+
+    decoders = args.decoders.split(',')
+    for name in decoders:
+        if name not in DECODERS:
+            parser.error('unknown decoder {}, expected one of {}'.format(name, ', '.join(DECODERS)))
+
+    results = {'metadata': metadata(),
+               'settings': {'repeat': args.repeat, 'min_time': args.min_time, 'batch_size': args.batch_size},
+               'cases': [], 'decoders': {}}
+    work_dir = tempfile.mkdtemp(prefix='jpeg2dct_bench_')
+    try:
+        manifest = {'repeat': args.repeat, 'min_time': args.min_time, 'batch_size': args.batch_size, 'cases': []}
+        for case in cases_from_arguments(args):
+            buffer = encode_case(case)
+            path = os.path.join(work_dir, case.name + '.jpg')
+            with open(path, 'wb') as dst:
+                dst.write(buffer)
+            manifest['cases'].append({'name': case.name, 'path': path})
+            description = case.to_dict()
+            description.update(jpeg_bytes=len(buffer), decode_path=probe(buffer)['decode_path'])
+            results['cases'].append(description)
+        manifest_path = os.path.join(work_dir, 'manifest.json')
+        with open(manifest_path, 'w') as dst:
+            json.dump(manifest, dst)
+
+        for name in decoders:
+            report = run_decoder(name, manifest_path)
+            results['decoders'][name] = report
+            print_report(name, report)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as dst:
+            json.dump(results, dst, indent=2, sort_keys=True)
+
+
+def print_report(name, report):
+    if report['status'] != 'ok':
+        print('{}: {} ({})\n'.format(name, report['status'], report['reason']))
+        return
+    print('{} {}'.format(name, report['version']))
+    print('{:<44} {:>10} {:>9} {:>9} {:>9} {:>10}'.format(
+        'case', 'img/s', 'p50 (ms)', 'p90 (ms)', 'p99 (ms)', 'peak (MiB)'))
+    for result in report['results']:
+        latency = result['latency_ms']
+        print('{:<44} {:>10.1f} {:>9.2f} {:>9.2f} {:>9.2f} {:>10.1f}'.format(
+            result['case'], result['images_per_second'], latency['p50'], latency['p90'], latency['p99'],
+            result['peak_rss_mb']))
+    print()
+
+
+if __name__ == '__main__':
+    main()
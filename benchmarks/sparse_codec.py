@@ -0,0 +1,63 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the bytes on disk and the read throughput of the jpeg storage of Jpeg2DCTNumpyCodec with the sparse storage
+of Jpeg2DCTSparseCodec, whose decode methods are loads and loads_sparse.
+
+    python benchmarks/sparse_codec.py [--repeat N] [image.jpg ...]
+
+Defaults to the test images, larger images make the difference more visible.
+"""
+
+import argparse
+import glob
+import os
+import timeit
+
+from jpeg2dct.numpy import jpeg_to_sparse, loads, loads_sparse
+
+
+def time_decode(decode, value, repeat):
+    decode(value)
+    return min(timeit.repeat(lambda: decode(value), number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='number of timed decodes per image and storage')
+    parser.add_argument('images', nargs='*', help='jpeg images')
+    args = parser.parse_args()
+
+    images = args.images
+    if not images:
+        data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'test', 'data')
+        images = sorted(glob.glob(os.path.join(data_dir, '*.jpg')))
+
+    print('{:<24} {:>10} {:>10} {:>6} {:>12} {:>14} {:>8}'.format(
+        'image', 'jpeg (B)', 'sparse (B)', 'size', 'jpeg (img/s)', 'sparse (img/s)', 'speedup'))
+    totals = [0, 0, 0.0, 0.0]
+    for image in images:
+        with open(image, 'rb') as src:
+            buffer = src.read()
+        sparse = jpeg_to_sparse(buffer)
+        jpeg_time = time_decode(loads, buffer, args.repeat)
+        sparse_time = time_decode(loads_sparse, sparse, args.repeat)
+        for i, value in enumerate([len(buffer), len(sparse), jpeg_time, sparse_time]):
+            totals[i] += value
+        print('{:<24} {:>10} {:>10} {:>5.2f}x {:>12.0f} {:>14.0f} {:>7.2f}x'.format(
+            os.path.basename(image), len(buffer), len(sparse), len(sparse) / len(buffer), 1 / jpeg_time,
+            1 / sparse_time, jpeg_time / sparse_time))
+    print('{:<24} {:>10} {:>10} {:>5.2f}x {:>12.0f} {:>14.0f} {:>7.2f}x'.format(
+        'total', totals[0], totals[1], totals[1] / totals[0], len(images) / totals[2], len(images) / totals[3],
+        totals[2] / totals[3]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Synthetic jpeg images for the benchmarks: deterministic photo-like content (smooth gradients, flat shapes with sharp
+edges and sensor-like noise) compressed by libjpeg with every chroma sampling mode, baseline or progressive, with or
+without restart markers.
+
+    python benchmarks/synthetic.py OUTPUT_DIR [--sizes 640x480,...] [--qualities 75,...] ...
+
+writes the images of the benchmark grid to OUTPUT_DIR, to try other decoders on them.
+"""
+
+import argparse
+import itertools
+import os
+
+import numpy as np
+
+from jpeg2dct.numpy import encode_jpeg
+
+SAMPLINGS = ('444', '422', '420', '440', '411', 'gray')
+
+
+class Case(object):
+    """the settings of one synthetic jpeg image"""
+
+    def __init__(self, width, height, quality, sampling, progressive, restart_rows):
+        self.width = width
+        self.height = height
+        self.quality = quality
+        self.sampling = sampling
+        self.progressive = progressive
+        self.restart_rows = restart_rows
+
+    @property
+    def name(self):
+        return '{}x{}_q{}_{}_{}_rst{}'.format(self.width, self.height, self.quality, self.sampling,
+                                              'progressive' if self.progressive else 'baseline', self.restart_rows)
+
+    @property
+    def pixels(self):
+        return self.width * self.height
+
+    def to_dict(self):
+        return {'name': self.name, 'width': self.width, 'height': self.height, 'quality': self.quality,
+                'sampling': self.sampling, 'progressive': self.progressive, 'restart_rows': self.restart_rows}
+
+
+def cases(sizes, qualities, samplings, progressive, restart_rows):
+    """
+    :param sizes: (width, height) of the images
+    :param qualities: jpeg qualities
+    :param samplings: chroma sampling modes, among SAMPLINGS
+    :param progressive: progressive settings, among False and True
+    :param restart_rows: restart intervals in rows of MCUs, 0 for no restart markers
+    :return: the list of Case of every combination of the settings, smallest images first
+    """
+    grid = [Case(w, h, q, s, p, r)
+            for (w, h), q, s, p, r in itertools.product(sizes, qualities, samplings, progressive, restart_rows)]
+    return sorted(grid, key=lambda case: case.pixels)
+
+
+def synthetic_image(width, height, seed=0):
+    """:return: a height x width x 3 uint8 image with smooth gradients, flat shapes and noise"""
+    rng = np.random.RandomState(seed)
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    y /= max(height - 1, 1)
+    x /= max(width - 1, 1)
+    image = np.empty((height, width, 3), np.float32)
+    for c in range(3):
+        fx, fy, phase = rng.uniform(0.5, 3.0), rng.uniform(0.5, 3.0), rng.uniform(0, 2 * np.pi)
+        image[:, :, c] = 128 + 60 * np.sin(2 * np.pi * (fx * x + fy * y) + phase) + 40 * (x - y)
+    for _ in range(12):
+        color = rng.uniform(0, 255, 3).astype(np.float32)
+        cx, cy, radius = rng.uniform(0, 1), rng.uniform(0, 1), rng.uniform(0.03, 0.2)
+        if rng.rand() < 0.5:
+            mask = (x - cx) ** 2 + (y - cy) ** 2 < radius ** 2
+        else:
+            mask = (abs(x - cx) < radius) & (abs(y - cy) < radius / 2)
+        image[mask] = 0.3 * image[mask] + 0.7 * color
+    image += rng.normal(0, 4, image.shape).astype(np.float32)
+    return np.clip(image, 0, 255).astype(np.uint8)
+
+
+def encode_case(case, seed=0):
+    """:return: the bytes of the jpeg image of case"""
+    image = synthetic_image(case.width, case.height, seed)
+    if case.sampling == 'gray':
+        image = image.mean(axis=2).astype(np.uint8)
+        return encode_jpeg(image, case.quality, progressive=case.progressive, restart_rows=case.restart_rows)
+    return encode_jpeg(image, case.quality, sampling=case.sampling, progressive=case.progressive,
+                       restart_rows=case.restart_rows)
+
+
+def parse_sizes(value):
+    """:return: the (width, height) of a comma separated list of WIDTHxHEIGHT"""
+    sizes = []
+    for size in value.split(','):
+        width, height = size.lower().split('x')
+        sizes.append((int(width), int(height)))
+    return sizes
+
+
+def parse_list(value, convert=str):
+    return [convert(item) for item in value.split(',')]
+
+
+def add_grid_arguments(parser):
+    """add the arguments of the case grid to an argparse parser, see cases_from_arguments"""
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('320x240,1280x720,2048x1536'),
+                        help='comma separated WIDTHxHEIGHT image sizes')
+    parser.add_argument('--qualities', type=lambda v: parse_list(v, int), default=[75, 95],
+                        help='comma separated jpeg qualities')
+    parser.add_argument('--samplings', type=parse_list, default=['444', '422', '420', '440', '411'],
+                        help='comma separated chroma samplings, among {}'.format(', '.join(SAMPLINGS)))
+    parser.add_argument('--progressive', type=parse_list, default=['baseline', 'progressive'],
+                        help='comma separated modes, among baseline and progressive')
+    parser.add_argument('--restart-rows', type=lambda v: parse_list(v, int), default=[0, 4],
+                        help='comma separated restart intervals in rows of MCUs, 0 for no restart markers')
+
+
+def cases_from_arguments(args):
+    """:return: the cases of the grid given to the arguments added by add_grid_arguments"""
+    for sampling in args.samplings:
+        if sampling not in SAMPLINGS:
+            raise ValueError('unknown sampling {}, expected one of {}'.format(sampling, ', '.join(SAMPLINGS)))
+    progressive = []
+    for mode in args.progressive:
+        if mode not in ('baseline', 'progressive'):
+            raise ValueError('unknown mode {}, expected baseline or progressive'.format(mode))
+        progressive.append(mode == 'progressive')
+    return cases(args.sizes, args.qualities, args.samplings, progressive, args.restart_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('output_dir', help='directory the images are written to')
+    add_grid_arguments(parser)
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for case in cases_from_arguments(args):
+        with open(os.path.join(args.output_dir, case.name + '.jpg'), 'wb') as dst:
+            dst.write(encode_case(case))
+
+
+if __name__ == '__main__':
+    main()
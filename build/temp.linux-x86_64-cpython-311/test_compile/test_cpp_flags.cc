@@ -0,0 +1,3 @@
+#include <unordered_map>
+void test() {
+}
@@ -10,3 +10,24 @@
 
 __version__ = '0.2.4'
 
+
+# the native library is only loaded when the statistics are first used, setup.py imports this module to read the
+# version
+
+
+def stats(reset=False):
+    """counters and cumulative timings of the decoders, see jpeg2dct.numpy.stats"""
+    from jpeg2dct.numpy import stats as read_stats
+    return read_stats(reset)
+
+
+def reset_stats():
+    """reset the statistics of the decoders to zero"""
+    from jpeg2dct.numpy import reset_stats as reset
+    reset()
+
+
+def set_trace_hook(hook):
+    """call hook after each image is decoded or fails, see jpeg2dct.numpy.set_trace_hook"""
+    from jpeg2dct.numpy import set_trace_hook as set_hook
+    set_hook(hook)
@@ -11,6 +11,8 @@ import ctypes
 import os
 import sysconfig
 
+import numpy as np
+
 
 def get_ext_suffix():
     """Determine library extension for various versions of Python."""
@@ -27,3 +29,86 @@ def get_ext_suffix():
 
 ctypes.CDLL(os.path.join(os.path.dirname(__file__),
                          'common_lib' + get_ext_suffix()), mode=ctypes.RTLD_GLOBAL)
+
+
+# natural (row major) index of the coefficients of a block, in zigzag order
+ZIGZAG_ORDER = [
+    0, 1, 8, 16, 9, 2, 3, 10,
+    17, 24, 32, 25, 18, 11, 4, 5,
+    12, 19, 26, 33, 40, 48, 41, 34,
+    27, 20, 13, 6, 7, 14, 21, 28,
+    35, 42, 49, 56, 57, 50, 43, 36,
+    29, 22, 15, 23, 30, 37, 44, 51,
+    58, 59, 52, 45, 38, 31, 39, 46,
+    53, 60, 61, 54, 47, 55, 62, 63,
+]
+
+
+def coefficient_indices(num_coefficients=None, coefficients=None):
+    """
+    indices of the coefficients of a block selected by the decoders
+    :param num_coefficients: select the first num_coefficients coefficients in zigzag order
+    :param coefficients: explicit list of indices in the natural (row major) order of a block, which is the order
+        of the coefficients in the full bands. Exclusive with num_coefficients.
+    :return: the list of the selected indices, empty to select all the coefficients
+    """
+    if num_coefficients is not None and coefficients is not None:
+        raise ValueError('num_coefficients and coefficients are exclusive')
+    if num_coefficients is not None:
+        if not 1 <= num_coefficients <= 64:
+            raise ValueError('num_coefficients should be between 1 and 64')
+        return ZIGZAG_ORDER[:num_coefficients]
+    if coefficients is None:
+        return []
+    coefficients = [int(index) for index in coefficients]
+    if not 1 <= len(coefficients) <= 64 or any(not 0 <= index < 64 for index in coefficients):
+        raise ValueError('coefficients should list between 1 and 64 indices in [0, 64)')
+    return coefficients
+
+
+def band_statistics(mean, std, channels, nb_coefficients):
+    """
+    statistics of the standardization (value - mean) / std of floating point bands
+    :param mean: None, or array-like of shape (nb_coefficients,) shared by the bands or (channels, nb_coefficients)
+    :param std: None, or array-like of the same shapes as mean
+    :param channels: number of decoded bands
+    :param nb_coefficients: number of coefficients per block of the bands
+    :return: mean and std as float32 arrays of shape 3 x nb_coefficients, the missing statistic defaulting to 0 or 1.
+        Empty arrays when both are None.
+    """
+    if mean is None and std is None:
+        return np.empty((0, 0), dtype=np.float32), np.empty((0, 0), dtype=np.float32)
+    statistics = []
+    for values, default in [(mean, 0.0), (std, 1.0)]:
+        full = np.full((3, nb_coefficients), default, dtype=np.float32)
+        if values is not None:
+            values = np.asarray(values, dtype=np.float32)
+            if values.shape not in {(nb_coefficients,), (channels, nb_coefficients)}:
+                raise ValueError('mean and std should be of shape ({0},) or ({1}, {0}), got {2}'.format(
+                    nb_coefficients, channels, values.shape))
+            full[:channels] = values
+        statistics.append(full)
+    if not np.all(statistics[1] != 0):
+        raise ValueError('std should not be zero')
+    return statistics
+
+
+# names of the native decoder counters and phases, in their native order
+_STATS_COUNTERS = ['images', 'failures', 'bytes', 'direct', 'resample', 'transcode', 'segmented', 'progressive',
+                   'cropped']
+_STATS_PHASES = ['header', 'coefficients', 'copy', 'resample', 'transcode', 'total']
+
+
+def format_stats(counters, seconds):
+    """
+    the statistics returned by jpeg2dct.stats
+    :param counters: the native counters, numbers or scalar Tensors
+    :param seconds: the seconds spent in each native phase followed by the total, numbers or scalar Tensors
+    :return: a dict of the counters, the counts of each decode path under 'decode_paths' and the seconds of each phase
+        under 'seconds'
+    """
+    values = dict(zip(_STATS_COUNTERS, counters))
+    stats = {key: values[key] for key in ['images', 'failures', 'bytes', 'segmented', 'progressive', 'cropped']}
+    stats['decode_paths'] = {key: values[key] for key in ['direct', 'resample', 'transcode']}
+    stats['seconds'] = dict(zip(_STATS_PHASES, seconds))
+    return stats
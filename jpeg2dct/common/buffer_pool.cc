@@ -0,0 +1,120 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#include <cstdlib>
+#include <new>
+#include "buffer_pool.h"
+
+namespace jpeg2dct {
+namespace common {
+
+namespace {
+
+const size_t kMinSizeClass = 256;
+
+// the size classes are spaced by a quarter of a power of two, which bounds
+// the memory wasted by rounding up to 25%
+size_t size_class(size_t bytes) {
+  if (bytes <= kMinSizeClass) {
+    return kMinSizeClass;
+  }
+  size_t power = kMinSizeClass;
+  while (power * 2 < bytes) {
+    power *= 2;
+  }
+  size_t step = power / 4;
+  return (bytes + step - 1) / step * step;
+}
+
+thread_local buffer_pool *thread_pool = nullptr;
+
+} // namespace
+
+char *allocate_aligned(size_t bytes) {
+  void *buffer = nullptr;
+  // posix_memalign may return null for 0 bytes
+  if (posix_memalign(&buffer, kBufferAlignment, bytes > 0 ? bytes : 1) != 0) {
+    throw std::bad_alloc();
+  }
+  return static_cast<char *>(buffer);
+}
+
+void free_aligned(char *buffer) { free(buffer); }
+
+buffer_pool::buffer_pool(size_t max_bytes)
+    : max_bytes_(max_bytes), free_bytes_(0), hits_(0), misses_(0) {}
+
+buffer_pool::~buffer_pool() {
+  for (auto &entry : free_) {
+    for (char *buffer : entry.second) {
+      free_aligned(buffer);
+    }
+  }
+}
+
+char *buffer_pool::acquire(size_t bytes) {
+  size_t size = size_class(bytes);
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto entry = free_.find(size);
+    if (entry != free_.end() && !entry->second.empty()) {
+      char *buffer = entry->second.back();
+      entry->second.pop_back();
+      free_bytes_ -= size;
+      hits_++;
+      return buffer;
+    }
+    misses_++;
+  }
+  return allocate_aligned(size);
+}
+
+void buffer_pool::release(char *buffer, size_t bytes) {
+  size_t size = size_class(bytes);
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (free_bytes_ + size <= max_bytes_) {
+      free_[size].push_back(buffer);
+      free_bytes_ += size;
+      return;
+    }
+  }
+  free_aligned(buffer);
+}
+
+size_t buffer_pool::hits() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return hits_;
+}
+
+size_t buffer_pool::misses() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return misses_;
+}
+
+size_t buffer_pool::free_bytes() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return free_bytes_;
+}
+
+buffer_pool *current_pool() { return thread_pool; }
+
+pool_scope::pool_scope(buffer_pool *pool) : previous_(thread_pool) {
+  thread_pool = pool;
+}
+
+pool_scope::~pool_scope() { thread_pool = previous_; }
+
+char *allocate_band_memory(size_t bytes) {
+  return thread_pool != nullptr ? thread_pool->acquire(bytes)
+                                : allocate_aligned(bytes);
+}
+
+} // namespace common
+} // namespace jpeg2dct
@@ -0,0 +1,87 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#ifndef BUFFER_POOL_H_
+#define BUFFER_POOL_H_
+
+#include <cstddef>
+#include <map>
+#include <mutex>
+#include <vector>
+
+namespace jpeg2dct {
+namespace common {
+
+// alignment of the buffers of allocate_aligned: a cache line, and the width of
+// the widest vector registers
+const size_t kBufferAlignment = 64;
+
+// a buffer of `bytes` bytes aligned to kBufferAlignment bytes, to be released
+// with free_aligned. Throws std::bad_alloc when out of memory.
+char *allocate_aligned(size_t bytes);
+void free_aligned(char *buffer);
+
+// free lists of band memory by size class, so that decoding images of similar
+// sizes recycles the buffers of the bands released before instead of going
+// through the allocator, and the page faults of fresh memory, every time.
+// Buffers are allocated with allocate_aligned, and may also be released with
+// free_aligned instead of being handed back. Thread safe.
+class buffer_pool {
+public:
+  // at most `max_bytes` of free buffers are kept
+  explicit buffer_pool(size_t max_bytes);
+  ~buffer_pool();
+
+  buffer_pool(const buffer_pool &) = delete;
+  buffer_pool &operator=(const buffer_pool &) = delete;
+
+  // a buffer of at least `bytes` bytes, recycled when one of its size class
+  // is free
+  char *acquire(size_t bytes);
+  // hand back a buffer returned by acquire(bytes), which is freed when the
+  // pool is full
+  void release(char *buffer, size_t bytes);
+
+  // number of acquire calls served by a free buffer, and by a new one
+  size_t hits() const;
+  size_t misses() const;
+  // bytes of the free buffers
+  size_t free_bytes() const;
+
+private:
+  mutable std::mutex mutex_;
+  std::map<size_t, std::vector<char *>> free_;
+  size_t max_bytes_;
+  size_t free_bytes_;
+  size_t hits_;
+  size_t misses_;
+};
+
+// the pool bands are allocated from on this thread, null (the default) for
+// plain allocate_aligned
+buffer_pool *current_pool();
+
+// make `pool` the pool of this thread for the lifetime of the scope
+class pool_scope {
+public:
+  explicit pool_scope(buffer_pool *pool);
+  ~pool_scope();
+
+private:
+  buffer_pool *previous_;
+};
+
+// memory for a band of `bytes` bytes, from the pool of this thread if any,
+// to be released with free_aligned or handed back to that pool
+char *allocate_band_memory(size_t bytes);
+
+} // namespace common
+} // namespace jpeg2dct
+
+#endif
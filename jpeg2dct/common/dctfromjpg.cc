@@ -7,240 +7,1693 @@
 //See the License for the specific language governing permissions and
 //limitations under the License.
 
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
 #include <cstdlib>
 #include <cstring>
+#include <functional>
+#include <random>
+#include <setjmp.h>
 #include <stdexcept>
 #include <stdio.h>
+#include <string>
+#include <vector>
 
 // Has to come after `stdio.h`
 #include <jpeglib.h>
+#include <jerror.h>
 
+#include "buffer_pool.h"
 #include "dctfromjpg.h"
+#include "mapped_file.h"
+#include "parallel.h"
+#include "resample.h"
+#include "restart.h"
+#include "stats.h"
 
 namespace jpeg2dct {
 namespace common {
 
 void unpack_band_info(band_info band, short **band_dct, int *band_dct_h,
                       int *band_dct_w, int *band_dct_b) {
-  *band_dct = band.dct;
+  *band_dct = static_cast<short *>(band.dct);
   *band_dct_h = band.dct_h;
   *band_dct_w = band.dct_w;
   *band_dct_b = band.dct_b;
 }
 
-void dummy_dct_coefficients(band_info *band) {
-  band->dct_h = 0;
-  band->dct_w = 0;
-  band->dct_b = 0;
-  band->dct = new short[0];
+bool is_grayscale(jpeg_decompress_struct *srcinfo) {
+  return srcinfo->num_components == 1;
 }
 
-void read_dct_coefficients(jpeg_decompress_struct *srcinfo,
-                           jvirt_barray_ptr *src_coef_arrays, int compNum,
-                           band_info *band, bool normalized) {
+bool is_h2_v2(jpeg_decompress_struct *srcinfo) {
+  return (srcinfo->num_components >= 3) &&
+         (srcinfo->comp_info[0].h_samp_factor == 2) &&
+         (srcinfo->comp_info[0].v_samp_factor == 2) &&
+         (srcinfo->comp_info[1].h_samp_factor == 1) &&
+         (srcinfo->comp_info[1].v_samp_factor == 1) &&
+         (srcinfo->comp_info[2].h_samp_factor == 1) &&
+         (srcinfo->comp_info[2].v_samp_factor == 1);
+}
+
+JDIMENSION blocks(JDIMENSION size, int block_size) {
+  return (size + block_size - 1) / block_size;
+}
+
+// set the dimensions of the band decoded for component `compNum`, only the
+// header has to be read: images which are transcoded get the dimensions of
+// the transcoded image
+void set_band_dimensions(jpeg_decompress_struct *srcinfo, int compNum,
+                         band_info *band) {
+  band->dct_b = DCTSIZE2;
+  band->dtype = DTYPE_INT16;
   if (compNum >= srcinfo->num_components) {
-    // make an empty component which would be half size of chroma
+    // an empty component which would be half size of chroma
     band->dct_h = (srcinfo->comp_info[0].height_in_blocks + 1) / 2;
     band->dct_w = (srcinfo->comp_info[0].width_in_blocks + 1) / 2;
-    band->dct_b = DCTSIZE2;
-    long nb_elements =
-        (long)(band->dct_h) * (long)(band->dct_w) * (long)(band->dct_b);
-    band->dct = new short[nb_elements];
-    std::memset((void *)band->dct, 0, sizeof(short) * nb_elements);
-    return;
+  } else if (is_grayscale(srcinfo) || is_h2_v2(srcinfo)) {
+    band->dct_h = srcinfo->comp_info[compNum].height_in_blocks;
+    band->dct_w = srcinfo->comp_info[compNum].width_in_blocks;
+  } else {
+    // transcoding uses the default sampling: H2_V2 for color images and full
+    // resolution for every component of CMYK images
+    int block_size = DCTSIZE;
+    if (srcinfo->num_components == 3 && compNum > 0) {
+      block_size = 2 * DCTSIZE;
+    }
+    band->dct_h = blocks(srcinfo->image_height, block_size);
+    band->dct_w = blocks(srcinfo->image_width, block_size);
   }
+}
 
-  // prepare memory space dimensions
-  band->dct_h = srcinfo->comp_info[compNum].height_in_blocks;
-  band->dct_w = srcinfo->comp_info[compNum].width_in_blocks;
-  band->dct_b = DCTSIZE2;
-  long nb_elements =
-      (long)(band->dct_h) * (long)(band->dct_w) * (long)(band->dct_b);
-  band->dct = new short[nb_elements];
-
-  int quant_idx = srcinfo->comp_info[compNum].quant_tbl_no;
-  short unscale = 1;
-
-  short *current_dct_coeff = band->dct;
-  for (JDIMENSION rowNum = 0; rowNum < band->dct_h; rowNum++) {
-    JBLOCKARRAY rowPtrs = (srcinfo->mem->access_virt_barray)(
-        (j_common_ptr)srcinfo, src_coef_arrays[compNum], rowNum, (JDIMENSION)1,
-        FALSE);
-    for (JDIMENSION colNum = 0; colNum < band->dct_w; colNum++) {
-      for (JDIMENSION c = 0; c < band->dct_b; c++) {
-        if (normalized) {
-          unscale = srcinfo->quant_tbl_ptrs[quant_idx]->quantval[c];
-        }
-        *current_dct_coeff = rowPtrs[0][colNum][c] * unscale;
-        current_dct_coeff++;
+long band_size(const band_info *band) {
+  return (long)(band->dct_h) * (long)(band->dct_w) * (long)(band->dct_b);
+}
+
+int dtype_size(int dtype) { return dtype == DTYPE_FLOAT32 ? 4 : 2; }
+
+long band_bytes(const band_info *band) {
+  return band_size(band) * dtype_size(band->dtype);
+}
+
+static_assert(kBandAlignment <= kBufferAlignment,
+              "band memory should be aligned to kBandAlignment bytes");
+
+// the size of a band rounded up to the alignment of the next one
+size_t aligned_band_bytes(const band_info *band) {
+  return (band_bytes(band) + kBandAlignment - 1) / kBandAlignment *
+         kBandAlignment;
+}
+
+size_t image_bytes(const band_info *band1, const band_info *band2,
+                   const band_info *band3) {
+  return aligned_band_bytes(band1) + aligned_band_bytes(band2) +
+         band_bytes(band3);
+}
+
+void allocate_image_bands(band_info *band1, band_info *band2,
+                          band_info *band3) {
+  place_image_bands(allocate_band_memory(image_bytes(band1, band2, band3)),
+                    band1, band2, band3);
+}
+
+void place_image_bands(char *memory, band_info *band1, band_info *band2,
+                       band_info *band3) {
+  band1->dct = memory;
+  band2->dct = memory + aligned_band_bytes(band1);
+  band3->dct = memory + aligned_band_bytes(band1) + aligned_band_bytes(band2);
+}
+
+void release_image_bands(band_info *band1, band_info *band2,
+                         band_info *band3) {
+  free_aligned(static_cast<char *>(band1->dct));
+  band1->dct = band2->dct = band3->dct = nullptr;
+}
+
+// round to the nearest IEEE half precision float, ties to even
+inline unsigned short float_to_half(float value) {
+  uint32_t bits;
+  std::memcpy(&bits, &value, sizeof(bits));
+  uint32_t sign = (bits >> 16) & 0x8000;
+  uint32_t biased_exponent = (bits >> 23) & 0xff;
+  uint32_t mantissa = bits & 0x7fffff;
+  if (biased_exponent == 0xff) {
+    // infinities and NaNs
+    return sign | 0x7c00 | (mantissa != 0 ? 0x200 : 0);
+  }
+  int exponent = (int)biased_exponent - 127 + 15;
+  if (exponent >= 31) {
+    return sign | 0x7c00;
+  }
+  if (exponent <= 0) {
+    // subnormal half, or zero
+    if (exponent < -10) {
+      return sign;
+    }
+    mantissa |= 0x800000;
+    int shift = 14 - exponent;
+    uint32_t half = mantissa >> shift;
+    uint32_t remainder = mantissa & ((1u << shift) - 1);
+    uint32_t halfway = 1u << (shift - 1);
+    if (remainder > halfway || (remainder == halfway && (half & 1))) {
+      half++;
+    }
+    return sign | half;
+  }
+  // a carry out of the mantissa correctly rounds up the exponent
+  uint32_t half = ((uint32_t)exponent << 10) | (mantissa >> 13);
+  uint32_t remainder = mantissa & 0x1fff;
+  if (remainder > 0x1000 || (remainder == 0x1000 && (half & 1))) {
+    half++;
+  }
+  return sign | half;
+}
+
+// what is written to a band for each coefficient of a block: the coefficient
+// at `index[c]`, times `quant[c]` for int16 bands, or as `coefficient *
+// scale[c] + offset[c]` for floating point bands, which fuses the
+// dequantization and the standardization
+struct coefficient_map {
+  int count;
+  // index[c] == c, the copy loops then run over contiguous coefficients
+  bool contiguous;
+  int index[DCTSIZE2];
+  int quant[DCTSIZE2];
+  float scale[DCTSIZE2];
+  float offset[DCTSIZE2];
+};
+
+// `quantval` is null for the components missing from the image
+void init_coefficient_map(const UINT16 *quantval, bool normalized,
+                          const coefficient_selection *coefficients,
+                          const band_format *format, int band_index,
+                          int count, coefficient_map *map) {
+  map->count = count;
+  map->contiguous = true;
+  for (int c = 0; c < count; c++) {
+    map->index[c] = coefficients != nullptr ? coefficients->index[c] : c;
+    map->contiguous &= map->index[c] == c;
+    map->quant[c] =
+        normalized && quantval != nullptr ? quantval[map->index[c]] : 1;
+    map->scale[c] = (float)map->quant[c];
+    map->offset[c] = 0.0f;
+    if (format != nullptr && format->standardize) {
+      float std = format->std[band_index][c];
+      map->scale[c] /= std;
+      map->offset[c] = -format->mean[band_index][c] / std;
+    }
+  }
+}
+
+inline short saturate_short(int value) {
+  return (short)std::max(-32768, std::min(32767, value));
+}
+
+// the value written for coefficient `c` of the map. The products of int16
+// bands are computed in int and saturated: high frequency terms of coarsely
+// quantized images would overflow a short.
+inline void map_coefficient(JCOEF coefficient, const coefficient_map &map,
+                            int c, short *value) {
+  *value = saturate_short(coefficient * map.quant[c]);
+}
+
+inline void map_coefficient(JCOEF coefficient, const coefficient_map &map,
+                            int c, float *value) {
+  *value = (float)coefficient * map.scale[c] + map.offset[c];
+}
+
+// write the `map.count` values of each block to `out`, in a single pass over
+// the blocks. Contiguous coefficients are mapped on local arrays of a
+// constant size, which the compiler vectorizes.
+template <typename T>
+void write_blocks(const JBLOCK *blocks, JDIMENSION nb_blocks,
+                  const coefficient_map &map, T *out) {
+  JCOEF block[DCTSIZE2];
+  T values[DCTSIZE2];
+  for (JDIMENSION b = 0; b < nb_blocks; b++, out += map.count) {
+    if (map.contiguous) {
+      std::memcpy(block, blocks[b], sizeof(JBLOCK));
+      for (int c = 0; c < DCTSIZE2; c++) {
+        map_coefficient(block[c], map, c, &values[c]);
+      }
+      std::memcpy(out, values, sizeof(T) * map.count);
+    } else {
+      for (int c = 0; c < map.count; c++) {
+        map_coefficient(blocks[b][map.index[c]], map, c, &out[c]);
       }
     }
   }
 }
 
-void add_error_handler(jpeg_error_mgr *jerr) {
-  jerr->error_exit = [](j_common_ptr cinfo) {
-    char pszErr[1024];
-    (cinfo->err->format_message)(cinfo, pszErr);
-    throw std::runtime_error(pszErr);
-  };
+void write_blocks(const JBLOCK *blocks, JDIMENSION nb_blocks,
+                  const coefficient_map &map, int dtype, void *output) {
+  switch (dtype) {
+  case DTYPE_INT16:
+    write_blocks(blocks, nb_blocks, map, static_cast<short *>(output));
+    break;
+  case DTYPE_FLOAT32:
+    write_blocks(blocks, nb_blocks, map, static_cast<float *>(output));
+    break;
+  case DTYPE_FLOAT16: {
+    // through float32 values, one row of blocks at a time
+    unsigned short *out = static_cast<unsigned short *>(output);
+    float values[DCTSIZE2];
+    for (JDIMENSION b = 0; b < nb_blocks; b++, out += map.count) {
+      write_blocks(blocks + b, 1, map, values);
+      for (int c = 0; c < map.count; c++) {
+        out[c] = float_to_half(values[c]);
+      }
+    }
+    break;
+  }
+  }
+}
+
+// fill the band `band_index` of an image missing that component with the
+// values of empty blocks
+void fill_missing_band(band_info *band, const band_format *format,
+                       int band_index) {
+  coefficient_map map;
+  init_coefficient_map(nullptr, false, nullptr, format, band_index,
+                       band->dct_b, &map);
+  JBLOCK empty;
+  std::memset((void *)empty, 0, sizeof(empty));
+  long nb_blocks = (long)band->dct_h * band->dct_w;
+  long block_bytes = (long)band->dct_b * dtype_size(band->dtype);
+  char *out = static_cast<char *>(band->dct);
+  for (long b = 0; b < nb_blocks; b++, out += block_bytes) {
+    write_blocks(&empty, 1, map, band->dtype, out);
+  }
+}
+
+std::atomic<bool> chroma_resampling(true);
+
+void set_chroma_resampling(bool enabled) { chroma_resampling.store(enabled); }
+
+bool get_chroma_resampling() { return chroma_resampling.load(); }
+
+decode_path get_decode_path(jpeg_decompress_struct *srcinfo) {
+  if (is_grayscale(srcinfo) || is_h2_v2(srcinfo)) {
+    return DECODE_DIRECT;
+  }
+  if (chroma_resampling.load() && can_resample_chroma(srcinfo)) {
+    return DECODE_RESAMPLE;
+  }
+  return DECODE_TRANSCODE;
+}
+
+// position of a cropped band in the band of the whole image, and number of
+// rows and columns of blocks read from there, in blocks. Bands of a target
+// grid larger than their window are padded past these rows and columns.
+struct band_origin {
+  JDIMENSION row;
+  JDIMENSION col;
+  JDIMENSION rows;
+  JDIMENSION cols;
+};
+
+// pad `band` past its first `rows` x `cols` blocks, with zeros or with copies
+// of the last block of each row and of the last row
+void pad_band(band_info *band, JDIMENSION rows, JDIMENSION cols, bool edge) {
+  long block_bytes = (long)band->dct_b * dtype_size(band->dtype);
+  long row_bytes = band->dct_w * block_bytes;
+  char *data = static_cast<char *>(band->dct);
+  for (JDIMENSION r = 0; cols < band->dct_w && r < rows; r++) {
+    char *row = data + r * row_bytes;
+    if (!edge) {
+      std::memset(row + cols * block_bytes, 0,
+                  (band->dct_w - cols) * block_bytes);
+      continue;
+    }
+    for (JDIMENSION c = cols; c < band->dct_w; c++) {
+      std::memcpy(row + c * block_bytes, row + (cols - 1) * block_bytes,
+                  block_bytes);
+    }
+  }
+  for (JDIMENSION r = rows; r < band->dct_h; r++) {
+    if (edge) {
+      std::memcpy(data + r * row_bytes, data + (rows - 1) * row_bytes,
+                  row_bytes);
+    } else {
+      std::memset(data + r * row_bytes, 0, row_bytes);
+    }
+  }
+}
+
+// copy the coefficients of component `compNum` into `band->dct`, whose
+// dimensions have been set by `set_band_dimensions`, `crop_bands`,
+// `pad_bands` and `select_coefficients`. The blocks are read from `resampled`
+// when the component has been resampled to the H2_V2 layout, which is already
+// cropped. The rows are written straight at their place in bands of a target
+// grid, which are then padded.
+void read_dct_coefficients(jpeg_decompress_struct *srcinfo,
+                           jvirt_barray_ptr *src_coef_arrays, int compNum,
+                           band_info *band, const band_origin &origin,
+                           bool normalized, JBLOCKARRAY resampled,
+                           const coefficient_selection *coefficients,
+                           const band_format *format) {
+  if (compNum >= srcinfo->num_components) {
+    fill_missing_band(band, format, compNum);
+    return;
+  }
+
+  coefficient_map map;
+  init_coefficient_map(
+      srcinfo->quant_tbl_ptrs[srcinfo->comp_info[compNum].quant_tbl_no]
+          ->quantval,
+      normalized, coefficients, format, compNum, band->dct_b, &map);
+
+  long row_bytes =
+      (long)band->dct_w * band->dct_b * dtype_size(band->dtype);
+  char *output = static_cast<char *>(band->dct);
+  for (JDIMENSION rowNum = 0; rowNum < origin.rows;
+       rowNum++, output += row_bytes) {
+    JBLOCKROW rowPtr;
+    if (resampled != nullptr) {
+      rowPtr = resampled[rowNum];
+    } else {
+      rowPtr = (srcinfo->mem->access_virt_barray)(
+                   (j_common_ptr)srcinfo, src_coef_arrays[compNum],
+                   origin.row + rowNum, (JDIMENSION)1, FALSE)[0] +
+               origin.col;
+    }
+    write_blocks(rowPtr, origin.cols, map, band->dtype, output);
+  }
+  if (origin.rows < band->dct_h || origin.cols < band->dct_w) {
+    pad_band(band, origin.rows, origin.cols,
+             format != nullptr && format->pad_mode == TARGET_PAD_EDGE);
+  }
+}
+
+// libjpeg error manager which unwinds with longjmp back to the decoding entry
+// point instead of throwing through libjpeg's C frames
+struct error_manager {
+  jpeg_error_mgr pub;
+  jmp_buf setjmp_buffer;
+  char message[JMSG_LENGTH_MAX];
+  // libjpeg's handler of warnings and trace messages
+  void (*std_emit_message)(j_common_ptr cinfo, int msg_level);
+  // whether the source ran dry, see emit_message
+  bool source_ended;
+};
+
+void error_exit(j_common_ptr cinfo) {
+  error_manager *err = reinterpret_cast<error_manager *>(cinfo->err);
+  (cinfo->err->format_message)(cinfo, err->message);
+  longjmp(err->setjmp_buffer, 1);
+}
+
+std::atomic<bool> accept_truncated(false);
+
+void set_accept_truncated(bool enabled) { accept_truncated.store(enabled); }
+
+bool get_accept_truncated() { return accept_truncated.load(); }
+
+// libjpeg warns when the source runs dry, inserts an end of image marker, and
+// warns again if the entropy decoder then misses data for the blocks left,
+// which it zero fills. The image is truncated in that case, an error unless
+// truncated images are accepted. Images only missing their end of image
+// marker, and progressive images missing whole scans, are decoded.
+void emit_message(j_common_ptr cinfo, int msg_level) {
+  error_manager *err = reinterpret_cast<error_manager *>(cinfo->err);
+  if (msg_level < 0 && cinfo->err->msg_code == JWRN_JPEG_EOF) {
+    err->source_ended = true;
+  } else if (msg_level < 0 && cinfo->err->msg_code == JWRN_HIT_MARKER &&
+             err->source_ended && !accept_truncated.load()) {
+    cinfo->err->msg_code = JWRN_JPEG_EOF;
+    error_exit(cinfo);
+  }
+  err->std_emit_message(cinfo, msg_level);
+}
+
+jpeg_error_mgr *init_error_manager(error_manager *err) {
+  jpeg_std_error(&err->pub);
+  err->pub.error_exit = error_exit;
+  err->std_emit_message = err->pub.emit_message;
+  err->pub.emit_message = emit_message;
+  err->source_ended = false;
+  err->message[0] = '\0';
+  return &err->pub;
+}
+
+// warnings are expected once the input has been cut short on purpose
+void ignore_warnings(j_common_ptr cinfo, int msg_level) {
+  if (msg_level >= 0 && cinfo->err->trace_level >= msg_level) {
+    (cinfo->err->output_message)(cinfo);
+  }
+}
+
+// progress monitor ending the input once `imcu_rows` iMCU rows have been read
+struct early_stop {
+  jpeg_progress_mgr pub;
+  JDIMENSION imcu_rows;
+};
+
+void stop_input(j_common_ptr cinfo) {
+  jpeg_decompress_struct *srcinfo =
+      reinterpret_cast<jpeg_decompress_struct *>(cinfo);
+  early_stop *stop = reinterpret_cast<early_stop *>(cinfo->progress);
+  if (srcinfo->input_iMCU_row < stop->imcu_rows) {
+    return;
+  }
+  // the entropy decoder runs into an end of image marker and zero fills the
+  // remaining blocks instead of decoding them
+  static const JOCTET eoi[2] = {0xFF, JPEG_EOI};
+  srcinfo->src->next_input_byte = eoi;
+  srcinfo->src->bytes_in_buffer = sizeof(eoi);
+  cinfo->err->emit_message = ignore_warnings;
+  cinfo->progress = nullptr;
+}
+
+// everything which has to be released when a decoding call ends, either
+// normally or through the error manager
+struct decoder_state {
+  error_manager jerr;
+  early_stop stop;
+  jpeg_decompress_struct srcinfo;
+  jpeg_compress_struct transinfo;
+  unsigned char *transcoded;
+  // bands allocated by the decoder, released when decoding fails
+  band_info *allocated[3];
+};
+
+void init_decoder_state(decoder_state *state) {
+  std::memset((void *)&state->srcinfo, 0, sizeof(state->srcinfo));
+  std::memset((void *)&state->transinfo, 0, sizeof(state->transinfo));
+  state->srcinfo.err = init_error_manager(&state->jerr);
+  state->transinfo.err = &state->jerr.pub;
+  state->transcoded = nullptr;
+  for (int i = 0; i < 3; i++) {
+    state->allocated[i] = nullptr;
+  }
+}
+
+// prepare a state released by release_decoder_state with `keep` for the
+// next image, its decompress structure being reused as is
+void reset_decoder_state(decoder_state *state) {
+  std::memset((void *)&state->transinfo, 0, sizeof(state->transinfo));
+  state->transinfo.err = &state->jerr.pub;
+  state->transcoded = nullptr;
+  for (int i = 0; i < 3; i++) {
+    state->allocated[i] = nullptr;
+  }
+  // undo what decoding the previous image may have changed
+  state->jerr.pub.emit_message = emit_message;
+  state->jerr.pub.num_warnings = 0;
+  state->jerr.source_ended = false;
+  state->jerr.message[0] = '\0';
+  state->srcinfo.progress = nullptr;
+}
+
+// `keep` aborts the decompression instead of destroying the structure, which
+// keeps its memory manager and permanent allocations for the next image
+void release_decoder_state(decoder_state *state, bool failed, bool keep) {
+  // these are no-ops on structures which have not been created
+  jpeg_destroy_compress(&state->transinfo);
+  if (keep) {
+    jpeg_abort_decompress(&state->srcinfo);
+  } else {
+    jpeg_destroy_decompress(&state->srcinfo);
+  }
+  if (state->transcoded != nullptr) {
+    free(state->transcoded);
+    state->transcoded = nullptr;
+  }
+  if (failed && state->allocated[0] != nullptr) {
+    release_image_bands(state->allocated[0], state->allocated[1],
+                        state->allocated[2]);
+  }
+}
+
+// abort the decoding on an error detected by the decoder itself. It throws
+// rather than longjmp like libjpeg errors do, the jump would skip the
+// destructors of the C++ frames in between; run_decoder_state releases the
+// state of the failed decoding either way
+[[noreturn]] void fail(decoder_state *, const std::string &message) {
+  throw std::runtime_error(message);
 }
 
-void transcode(jpeg_decompress_struct *srcinfo, unsigned char **outbuffer) {
-  static bool warning_emitted = false;
-  if (!warning_emitted) {
+void transcode(decoder_state *state) {
+  static std::atomic<bool> warning_emitted(false);
+  if (!warning_emitted.exchange(true)) {
     fprintf(stderr, "WARNING: Non-standard JPEG image encountered, transcoding "
                     "to H2_V2 which may negatively impact performance. This is "
-                    "the only time this warning will be shown.\n");
-    warning_emitted = true;
+                    "the only time this warning will be shown, "
+                    "jpeg2dct.stats() counts the transcoded images.\n");
   }
+  long long start_ns = now_ns();
 
   // start decompress
+  jpeg_decompress_struct *srcinfo = &state->srcinfo;
   (void)jpeg_start_decompress(srcinfo);
 
   // create the compression structure
-  jpeg_compress_struct dstinfo;
-  jpeg_error_mgr jerr;
-  dstinfo.err = jpeg_std_error(&jerr);
-  add_error_handler(&jerr);
-  jpeg_create_compress(&dstinfo);
+  jpeg_compress_struct *dstinfo = &state->transinfo;
+  jpeg_create_compress(dstinfo);
 
+  unsigned char *outbuffer = nullptr;
   unsigned long outlen = 0;
-  jpeg_mem_dest(&dstinfo, outbuffer, &outlen);
+  jpeg_mem_dest(dstinfo, &outbuffer, &outlen);
 
-  dstinfo.image_width = srcinfo->image_width;
-  dstinfo.image_height = srcinfo->image_height;
-  dstinfo.input_components = srcinfo->output_components;
-  dstinfo.in_color_space = srcinfo->out_color_space;
+  dstinfo->image_width = srcinfo->image_width;
+  dstinfo->image_height = srcinfo->image_height;
+  dstinfo->input_components = srcinfo->output_components;
+  dstinfo->in_color_space = srcinfo->out_color_space;
 
-  jpeg_set_defaults(&dstinfo);
-  jpeg_set_quality(&dstinfo, 100, TRUE);
-  jpeg_start_compress(&dstinfo, TRUE);
+  jpeg_set_defaults(dstinfo);
+  jpeg_set_quality(dstinfo, 100, TRUE);
+  jpeg_start_compress(dstinfo, TRUE);
 
-  // transcode
-  unsigned char *line_buffer =
-      new unsigned char[srcinfo->output_width * srcinfo->output_components];
+  // transcode, the line buffer belongs to the decompressor's memory pool
+  JSAMPARRAY line_buffer = (*srcinfo->mem->alloc_sarray)(
+      (j_common_ptr)srcinfo, JPOOL_IMAGE,
+      srcinfo->output_width * srcinfo->output_components, 1);
   while (srcinfo->output_scanline < srcinfo->output_height) {
-    jpeg_read_scanlines(srcinfo, &line_buffer, 1);
-    (void)jpeg_write_scanlines(&dstinfo, &line_buffer, 1);
+    jpeg_read_scanlines(srcinfo, line_buffer, 1);
+    (void)jpeg_write_scanlines(dstinfo, line_buffer, 1);
   }
-  delete[] line_buffer;
-  jpeg_finish_compress(&dstinfo);
-  jpeg_destroy_compress(&dstinfo);
+  jpeg_finish_compress(dstinfo);
+  jpeg_destroy_compress(dstinfo);
+  state->transcoded = outbuffer;
 
   // re-create decompress
   jpeg_destroy_decompress(srcinfo);
   jpeg_create_decompress(srcinfo);
-  jpeg_mem_src(srcinfo, *outbuffer, outlen);
+  jpeg_mem_src(srcinfo, state->transcoded, outlen);
   (void)jpeg_read_header(srcinfo, TRUE);
+  add_phase_time(PHASE_TRANSCODE, start_ns);
 }
 
-bool is_grayscale(jpeg_decompress_struct *srcinfo) {
-  return srcinfo->num_components == 1;
-}
-
-bool is_h2_v2(jpeg_decompress_struct *srcinfo) {
-  return (srcinfo->comp_info[0].h_samp_factor == 2) &&
-         (srcinfo->comp_info[0].v_samp_factor == 2) &&
-         (srcinfo->comp_info[1].h_samp_factor == 1) &&
-         (srcinfo->comp_info[1].v_samp_factor == 1) &&
-         (srcinfo->comp_info[2].h_samp_factor == 1) &&
-         (srcinfo->comp_info[2].v_samp_factor == 1);
+// describe the image in the trace of the decoding thread, if any
+void trace_image(jpeg_decompress_struct *srcinfo, decode_path path,
+                 bool segmented) {
+  decode_trace *trace = current_trace();
+  if (trace == nullptr) {
+    return;
+  }
+  trace->image_h = srcinfo->image_height;
+  trace->image_w = srcinfo->image_width;
+  trace->num_components = srcinfo->num_components;
+  trace->progressive = srcinfo->progressive_mode;
+  trace->decode_path = path;
+  trace->segmented = segmented;
 }
 
-void read_dct_coefficients_from_srcinfo(jpeg_decompress_struct *srcinfo,
-                                        bool normalized, int channels,
-                                        band_info *band1, band_info *band2,
-                                        band_info *band3) {
+// jpeg_read_header and jpeg_read_coefficients, timed
+void read_header(jpeg_decompress_struct *srcinfo) {
+  long long start_ns = now_ns();
   (void)jpeg_read_header(srcinfo, TRUE);
+  add_phase_time(PHASE_HEADER, start_ns);
+}
 
-  unsigned char *buffer = nullptr;
-  if (!is_grayscale(srcinfo) && !is_h2_v2(srcinfo)) {
-    transcode(srcinfo, &buffer);
-  }
-
+jvirt_barray_ptr *read_coefficients(jpeg_decompress_struct *srcinfo) {
+  long long start_ns = now_ns();
   jvirt_barray_ptr *src_coef_arrays = jpeg_read_coefficients(srcinfo);
-  read_dct_coefficients(srcinfo, src_coef_arrays, 0, band1, normalized);
+  add_phase_time(PHASE_COEFFICIENTS, start_ns);
+  return src_coef_arrays;
+}
+
+void read_band_dimensions(jpeg_decompress_struct *srcinfo, int channels,
+                          band_info *band1, band_info *band2,
+                          band_info *band3) {
+  set_band_dimensions(srcinfo, 0, band1);
   if (channels == 3) {
-    read_dct_coefficients(srcinfo, src_coef_arrays, 1, band2, normalized);
-    read_dct_coefficients(srcinfo, src_coef_arrays, 2, band3, normalized);
+    set_band_dimensions(srcinfo, 1, band2);
+    set_band_dimensions(srcinfo, 2, band3);
   } else {
-    dummy_dct_coefficients(band2);
-    dummy_dct_coefficients(band3);
+    band2->dct_h = band2->dct_w = band2->dct_b = 0;
+    band3->dct_h = band3->dct_w = band3->dct_b = 0;
+    band2->dtype = band3->dtype = DTYPE_INT16;
   }
+}
 
-  if (buffer != nullptr) {
-    delete[] buffer;
+// the power of 2 the image is downscaled by, 0 at full resolution
+int scale_shift(const band_format *format) {
+  if (format == nullptr) {
+    return 0;
+  }
+  int shift = 0;
+  while (shift < 3 && (1 << shift) < format->scale_denom) {
+    shift++;
   }
+  return shift;
 }
 
-void read_dct_coefficients_from_buffer_(char *jpg_buffer,
-                                        unsigned long buffer_len,
-                                        bool normalized, int channels,
-                                        band_info *band1, band_info *band2,
-                                        band_info *band3) {
-  jpeg_decompress_struct srcinfo;
-  jpeg_error_mgr jerr;
-  srcinfo.err = jpeg_std_error(&jerr);
-  add_error_handler(&jerr);
-  jpeg_create_decompress(&srcinfo);
+// divide the block grids of the bands of the whole image by the scale of
+// `format`, if any
+void scale_bands(decoder_state *state, const band_format *format,
+                 band_info *bands) {
+  if (format == nullptr || format->scale_denom == 1) {
+    return;
+  }
+  int denom = format->scale_denom;
+  if (denom != 2 && denom != 4 && denom != 8) {
+    fail(state, "the scale denominator should be 1, 2, 4 or 8, got " +
+                    std::to_string(denom));
+  }
+  for (int i = 0; i < 3; i++) {
+    bands[i].dct_h = blocks(bands[i].dct_h, denom);
+    bands[i].dct_w = blocks(bands[i].dct_w, denom);
+  }
+}
+
+// whether `format` gives the bands a fixed target grid
+bool has_target(const band_format *format) {
+  return format != nullptr && (format->target_h != 0 || format->target_w != 0);
+}
 
+thread_local std::minstd_rand target_random(std::random_device{}());
+
+// shrink the luminance window `window` to the target grid of `format` along
+// the axes where it is larger, at the position given by its crop mode
+void crop_to_target(decoder_state *state, const band_format *format,
+                    crop_window *window) {
+  if (format->target_h <= 0 || format->target_w <= 0) {
+    fail(state, "the target grid should be positive, got " +
+                    std::to_string(format->target_h) + "x" +
+                    std::to_string(format->target_w));
+  }
+  if (format->crop_mode < TARGET_CROP_TOP_LEFT ||
+      format->crop_mode > TARGET_CROP_RANDOM ||
+      (format->pad_mode != TARGET_PAD_ZERO &&
+       format->pad_mode != TARGET_PAD_EDGE)) {
+    fail(state, "unknown target crop mode " +
+                    std::to_string(format->crop_mode) + " or pad mode " +
+                    std::to_string(format->pad_mode));
+  }
+  auto crop_axis = [&](int target, int *start, int *size) {
+    if (*size <= target) {
+      return;
+    }
+    int slack = *size - target;
+    if (format->crop_mode == TARGET_CROP_CENTER) {
+      *start += slack / 2;
+    } else if (format->crop_mode == TARGET_CROP_RANDOM) {
+      *start += std::uniform_int_distribution<int>(0, slack)(target_random);
+    }
+    *size = target;
+  };
+  crop_axis(format->target_h, &window->y, &window->h);
+  crop_axis(format->target_w, &window->x, &window->w);
+}
+
+// restrict the first `channels` bands to the window `crop` of the luminance
+// band, cropped to the target grid of `format` if any, and store where each of
+// them starts in `origins`. A null `crop` keeps the whole bands.
+void crop_bands(decoder_state *state, const crop_window *crop,
+                const band_format *format, int channels, band_info *bands,
+                band_origin *origins) {
+  for (int i = 0; i < 3; i++) {
+    origins[i].row = origins[i].col = 0;
+    origins[i].rows = bands[i].dct_h;
+    origins[i].cols = bands[i].dct_w;
+  }
+  if (crop == nullptr && !has_target(format)) {
+    return;
+  }
+  const band_info &luma = bands[0];
+  crop_window window = {0, 0, (int)luma.dct_h, (int)luma.dct_w};
+  if (crop != nullptr) {
+    if (crop->y < 0 || crop->x < 0 || crop->h <= 0 || crop->w <= 0 ||
+        (unsigned)(crop->y + crop->h) > luma.dct_h ||
+        (unsigned)(crop->x + crop->w) > luma.dct_w) {
+      fail(state, "crop window " + std::to_string(crop->y) + "," +
+                      std::to_string(crop->x) + " " +
+                      std::to_string(crop->h) + "x" +
+                      std::to_string(crop->w) + " does not fit in the " +
+                      std::to_string(luma.dct_h) + "x" +
+                      std::to_string(luma.dct_w) + " luminance blocks");
+    }
+    window = *crop;
+  }
+  // bands smaller than the luminance band are at half resolution
+  auto crop_axis = [](unsigned luma_size, int start, int size,
+                      unsigned *band_size, JDIMENSION *origin) {
+    if (*band_size == luma_size) {
+      *origin = start;
+      *band_size = size;
+    } else {
+      *origin = start / 2;
+      *band_size = std::min(*band_size, (unsigned)(start + size + 1) / 2) -
+                   *origin;
+    }
+  };
+  if (has_target(format)) {
+    crop_to_target(state, format, &window);
+  }
+  unsigned luma_h = luma.dct_h, luma_w = luma.dct_w;
+  for (int i = 0; i < channels; i++) {
+    crop_axis(luma_h, window.y, window.h, &bands[i].dct_h, &origins[i].row);
+    crop_axis(luma_w, window.x, window.w, &bands[i].dct_w, &origins[i].col);
+    origins[i].rows = bands[i].dct_h;
+    origins[i].cols = bands[i].dct_w;
+  }
+}
+
+// give the first `channels` cropped bands the target grid of `format`, if
+// any, the blocks past their windows being padded. Full resolution chroma
+// bands keep the top left of their window.
+void pad_bands(const band_format *format, int channels, band_info *bands,
+               band_origin *origins) {
+  if (!has_target(format)) {
+    return;
+  }
+  for (int i = 0; i < channels; i++) {
+    unsigned target_h = format->target_h, target_w = format->target_w;
+    if (i > 0) {
+      target_h = (target_h + 1) / 2;
+      target_w = (target_w + 1) / 2;
+    }
+    origins[i].rows = std::min(bands[i].dct_h, target_h);
+    origins[i].cols = std::min(bands[i].dct_w, target_w);
+    bands[i].dct_h = target_h;
+    bands[i].dct_w = target_w;
+  }
+}
+
+// stop reading the input once the rows of blocks read into every band have
+// been read, the bands being downscaled by 2^`scale_shift`. Only single scan
+// images hold every component of a row at once.
+void stop_after_cropped_rows(decoder_state *state, int channels,
+                             const band_info *full_bands,
+                             const band_origin *origins, int scale_shift) {
+  jpeg_decompress_struct *srcinfo = &state->srcinfo;
+  if (jpeg_has_multiple_scans(srcinfo)) {
+    return;
+  }
+  JDIMENSION pixel_rows = 0;
+  for (int i = 0; i < channels; i++) {
+    JDIMENSION block_size = DCTSIZE << scale_shift;
+    if (full_bands[i].dct_h != full_bands[0].dct_h) {
+      block_size *= 2;
+    }
+    pixel_rows =
+        std::max(pixel_rows, (origins[i].row + origins[i].rows) * block_size);
+  }
+  JDIMENSION imcu_rows =
+      blocks(pixel_rows, srcinfo->max_v_samp_factor * DCTSIZE);
+  if (imcu_rows >= srcinfo->total_iMCU_rows) {
+    return;
+  }
+  state->stop.pub.progress_monitor = stop_input;
+  state->stop.imcu_rows = imcu_rows;
+  srcinfo->progress = &state->stop.pub;
+}
+
+// restrict the first `channels` bands to the selected coefficients, a null
+// `coefficients` keeps all of them
+void select_coefficients(decoder_state *state,
+                         const coefficient_selection *coefficients,
+                         int channels, band_info *bands) {
+  if (coefficients == nullptr) {
+    return;
+  }
+  if (coefficients->count <= 0 || coefficients->count > DCTSIZE2) {
+    fail(state, "between 1 and 64 coefficients should be selected, got " +
+                    std::to_string(coefficients->count));
+  }
+  for (int c = 0; c < coefficients->count; c++) {
+    if (coefficients->index[c] < 0 || coefficients->index[c] >= DCTSIZE2) {
+      fail(state, "coefficient index " +
+                      std::to_string(coefficients->index[c]) +
+                      " is out of [0, 64)");
+    }
+  }
+  for (int i = 0; i < channels; i++) {
+    bands[i].dct_b = coefficients->count;
+  }
+}
+
+// set the type of the bands, a null `format` keeping int16 bands
+void format_bands(decoder_state *state, const band_format *format,
+                  band_info *bands) {
+  if (format == nullptr) {
+    return;
+  }
+  if (format->dtype != DTYPE_INT16 && format->dtype != DTYPE_FLOAT16 &&
+      format->dtype != DTYPE_FLOAT32) {
+    fail(state, "unknown band dtype " + std::to_string(format->dtype));
+  }
+  if (format->standardize) {
+    if (format->dtype == DTYPE_INT16) {
+      fail(state, "only floating point bands can be standardized");
+    }
+    if (format->nb_coefficients != (int)bands[0].dct_b) {
+      fail(state, "the mean and std should have " +
+                      std::to_string(bands[0].dct_b) +
+                      " values per band, got " +
+                      std::to_string(format->nb_coefficients));
+    }
+  }
+  for (int i = 0; i < 3; i++) {
+    bands[i].dtype = format->dtype;
+  }
+}
+
+// read the header and the dimensions of the bands within the window `crop`,
+// holding the selected coefficients in the given format, at the scale and on
+// the target grid of the format if any
+void read_cropped_band_dimensions(decoder_state *state, int channels,
+                                  const crop_window *crop,
+                                  const coefficient_selection *coefficients,
+                                  const band_format *format,
+                                  band_info *full_bands, band_info *bands,
+                                  band_origin *origins) {
+  read_header(&state->srcinfo);
+  read_band_dimensions(&state->srcinfo, channels, &full_bands[0],
+                       &full_bands[1], &full_bands[2]);
+  scale_bands(state, format, full_bands);
+  for (int i = 0; i < 3; i++) {
+    bands[i] = full_bands[i];
+  }
+  crop_bands(state, crop, format, channels, bands, origins);
+  pad_bands(format, channels, bands, origins);
+  select_coefficients(state, coefficients, channels, bands);
+  format_bands(state, format, bands);
+}
+
+// allocate the bands with the given dimensions when `allocate` is true and
+// otherwise check that the caller provided bands have these dimensions
+void prepare_bands(decoder_state *state, int channels,
+                   const band_info *dimensions, band_info **bands,
+                   bool allocate) {
+  static const char *dtype_names[] = {"int16", "float16", "float32"};
+  // with a single channel, the chroma bands are allocated as empty dummies
+  if (allocate) {
+    for (int i = 0; i < 3; i++) {
+      *bands[i] = dimensions[i];
+      state->allocated[i] = bands[i];
+    }
+    allocate_image_bands(bands[0], bands[1], bands[2]);
+    return;
+  }
+  for (int i = 0; i < 3; i++) {
+    if (i < channels && (bands[i]->dct_h != dimensions[i].dct_h ||
+                         bands[i]->dct_w != dimensions[i].dct_w ||
+                         bands[i]->dct_b != dimensions[i].dct_b ||
+                         bands[i]->dtype != dimensions[i].dtype)) {
+      fail(state, "band " + std::to_string(i) + " should be " +
+                      std::to_string(dimensions[i].dct_h) + "x" +
+                      std::to_string(dimensions[i].dct_w) + "x" +
+                      std::to_string(dimensions[i].dct_b) + " " +
+                      dtype_names[dimensions[i].dtype]);
+    }
+  }
+}
+
+// decode the image into the bands, see `prepare_bands` for `allocate`
+void read_dct_coefficients_from_srcinfo(
+    decoder_state *state, bool normalized, int channels, band_info *band1,
+    band_info *band2, band_info *band3, const crop_window *crop,
+    const coefficient_selection *coefficients, const band_format *format,
+    bool allocate) {
+  jpeg_decompress_struct *srcinfo = &state->srcinfo;
+  band_info *bands[3] = {band1, band2, band3};
+  band_info full_dimensions[3], dimensions[3];
+  band_origin origins[3];
+  read_cropped_band_dimensions(state, channels, crop, coefficients, format,
+                               full_dimensions, dimensions, origins);
+  prepare_bands(state, channels, dimensions, bands, allocate);
+
+  // chroma is brought to the H2_V2 layout in the DCT domain when possible,
+  // other layouts go through the pixel domain
+  decode_path path = get_decode_path(srcinfo);
+  trace_image(srcinfo, path, false);
+  bool resample = path == DECODE_RESAMPLE;
+  if (path == DECODE_TRANSCODE) {
+    transcode(state);
+  }
+
+  int shift = scale_shift(format);
+  if (crop != nullptr || has_target(format)) {
+    stop_after_cropped_rows(state, channels, full_dimensions, origins, shift);
+  }
+  jvirt_barray_ptr *src_coef_arrays = read_coefficients(srcinfo);
+  for (int i = 0; i < channels; i++) {
+    JBLOCKARRAY resampled = nullptr;
+    long long start_ns = now_ns();
+    if (i < srcinfo->num_components && ((resample && i > 0) || shift > 0)) {
+      resampled = resample_component(srcinfo, src_coef_arrays, i, resample,
+                                     shift, origins[i].row, origins[i].col,
+                                     origins[i].rows, origins[i].cols);
+      add_phase_time(PHASE_RESAMPLE, start_ns);
+      start_ns = now_ns();
+    }
+    read_dct_coefficients(srcinfo, src_coef_arrays, i, bands[i], origins[i],
+                          normalized, resampled, coefficients, format);
+    add_phase_time(PHASE_COPY, start_ns);
+  }
+}
+
+// run `decode` on `state` and the source installed by `set_source`. This is
+// the only frame holding the setjmp buffer: on a libjpeg error the state is
+// released here and the error is re-thrown as a C++ exception. The
+// decompress structure is created on first use, and kept when `keep` is true.
+void run_decoder_state(
+    decoder_state *state, bool keep,
+    const std::function<void(jpeg_decompress_struct *)> &set_source,
+    const std::function<void(decoder_state *)> &decode) {
+  reset_decoder_state(state);
+  if (setjmp(state->jerr.setjmp_buffer)) {
+    release_decoder_state(state, true, keep);
+    throw std::runtime_error(state->jerr.message);
+  }
+
+  if (state->srcinfo.mem == nullptr) {
+    jpeg_create_decompress(&state->srcinfo);
+  }
+  set_source(&state->srcinfo);
+  try {
+    decode(state);
+  } catch (...) {
+    // C++ exceptions, such as failed allocations or the errors raised by fail,
+    // leave the structures in the middle of decoding too
+    release_decoder_state(state, true, keep);
+    throw;
+  }
+  release_decoder_state(state, false, keep);
+}
+
+// the decoder state of a thread, whose decompress structure is reused from
+// one image to the next: creating and destroying it for every image is a
+// noticeable share of the decoding time of small images. The workers of
+// parallel_for are kept, so the batch calls reuse them from one call to the
+// next as well.
+struct thread_decoder {
+  decoder_state state;
+  // whether a decoder is running on the thread
+  bool in_use;
+
+  thread_decoder() : in_use(false) { init_decoder_state(&state); }
+  ~thread_decoder() { jpeg_destroy_decompress(&state.srcinfo); }
+};
+
+thread_local thread_decoder cached_decoder;
+
+// run `decode` on the source installed by `set_source`, with the decoder
+// state of the thread when `reuse` is true and it is not running already,
+// and with a state of its own otherwise
+void run_decoder(
+    const std::function<void(jpeg_decompress_struct *)> &set_source,
+    const std::function<void(decoder_state *)> &decode, bool reuse = true) {
+  thread_decoder &cached = cached_decoder;
+  if (!reuse || cached.in_use) {
+    decoder_state state;
+    init_decoder_state(&state);
+    run_decoder_state(&state, false, set_source, decode);
+    return;
+  }
+  cached.in_use = true;
+  try {
+    run_decoder_state(&cached.state, true, set_source, decode);
+  } catch (...) {
+    cached.in_use = false;
+    throw;
+  }
+  cached.in_use = false;
+}
+
+std::function<void(jpeg_decompress_struct *)>
+buffer_source(char *jpg_buffer, unsigned long buffer_len) {
   unsigned char *u_jpg_buffer = reinterpret_cast<unsigned char *>(jpg_buffer);
-  jpeg_mem_src(&srcinfo, u_jpg_buffer, buffer_len);
+  return [=](jpeg_decompress_struct *srcinfo) {
+    jpeg_mem_src(srcinfo, u_jpg_buffer, buffer_len);
+  };
+}
+
+std::atomic<int> segment_threads(1);
+
+void set_segment_threads(int num_threads) {
+  segment_threads.store(num_threads);
+}
+
+// the smallest number of iMCU rows worth decoding as a separate image
+const JDIMENSION kMinSegmentRows = 4;
 
-  read_dct_coefficients_from_srcinfo(&srcinfo, normalized, channels, band1,
-                                     band2, band3);
+// decode the restart segments of an image concurrently, each range of iMCU
+// rows being decoded as an image of its own into its rows of the bands.
+// Returns false, without touching the bands, for images which do not qualify:
+// when the segments would need cropping, resampling or transcoding, or when
+// the restart intervals do not line up with the MCU rows.
+bool read_dct_coefficients_in_segments(
+    char *jpg_buffer, unsigned long buffer_len, bool normalized, int channels,
+    const coefficient_selection *coefficients, const band_format *format,
+    band_info **bands, bool allocate) {
+  int num_threads = segment_threads.load();
+  if (num_threads <= 0) {
+    num_threads = default_num_threads();
+  }
+  const unsigned char *buffer =
+      reinterpret_cast<unsigned char *>(jpg_buffer);
+  restart_index index;
+  if (num_threads == 1 ||
+      !index_restart_segments(buffer, buffer_len, &index)) {
+    return false;
+  }
+
+  bool eligible = false;
+  int num_components = 0;
+  JDIMENSION image_height = 0, imcu_height = 0, imcu_rows = 0;
+  JDIMENSION rows_per_chunk = 0, segments_per_chunk = 0;
+  run_decoder(buffer_source(jpg_buffer, buffer_len),
+              [&](decoder_state *state) {
+    jpeg_decompress_struct *srcinfo = &state->srcinfo;
+    read_header(srcinfo);
+    jpeg_component_info *luma = &srcinfo->comp_info[0];
+    bool single_block_mcu = is_grayscale(srcinfo) &&
+                            luma->h_samp_factor == 1 &&
+                            luma->v_samp_factor == 1;
+    if (!single_block_mcu &&
+        !(srcinfo->num_components == 3 && is_h2_v2(srcinfo))) {
+      return;
+    }
+    if (srcinfo->comps_in_scan != srcinfo->num_components) {
+      return;
+    }
+    num_components = srcinfo->num_components;
+    image_height = srcinfo->image_height;
+    imcu_height = srcinfo->max_v_samp_factor * DCTSIZE;
+    imcu_rows = srcinfo->total_iMCU_rows;
+    JDIMENSION mcus_per_row =
+        blocks(srcinfo->image_width, srcinfo->max_h_samp_factor * DCTSIZE);
+    JDIMENSION interval = srcinfo->restart_interval;
+    if (index.segments.size() !=
+        blocks(mcus_per_row * imcu_rows, (int)interval)) {
+      return;
+    }
+    // chunks start at the first restart segment of a row of MCUs
+    JDIMENSION step = 1;
+    while ((step * mcus_per_row) % interval != 0) {
+      step++;
+    }
+    rows_per_chunk = std::max(kMinSegmentRows,
+                              blocks(imcu_rows, 2 * num_threads));
+    rows_per_chunk = blocks(rows_per_chunk, step) * step;
+    segments_per_chunk = rows_per_chunk * mcus_per_row / interval;
+    if (rows_per_chunk >= imcu_rows) {
+      return;
+    }
+
+    band_info dimensions[3];
+    read_band_dimensions(srcinfo, channels, &dimensions[0], &dimensions[1],
+                         &dimensions[2]);
+    select_coefficients(state, coefficients, channels, dimensions);
+    format_bands(state, format, dimensions);
+    prepare_bands(state, channels, dimensions, bands, allocate);
+    trace_image(srcinfo, DECODE_DIRECT, true);
+    eligible = true;
+  });
+  if (!eligible) {
+    return false;
+  }
 
-  jpeg_destroy_decompress(&srcinfo);
+  int nb_chunks = blocks(imcu_rows, rows_per_chunk);
+  // the chunks are timed in the trace of the image
+  decode_trace *trace = current_trace();
+  try {
+    for (int i = num_components; i < channels; i++) {
+      fill_missing_band(bands[i], format, i);
+    }
+    parallel_for(nb_chunks, num_threads, [&](int chunk) {
+      trace_scope scope(trace);
+      JDIMENSION first_row = chunk * rows_per_chunk;
+      JDIMENSION height = std::min(image_height - first_row * imcu_height,
+                                   rows_per_chunk * imcu_height);
+      std::vector<unsigned char> image;
+      extract_restart_segments(
+          buffer, index, chunk * segments_per_chunk,
+          std::min(index.segments.size(),
+                   (size_t)(chunk + 1) * segments_per_chunk),
+          height, &image);
+      run_decoder(buffer_source(reinterpret_cast<char *>(image.data()),
+                                image.size()),
+                  [&](decoder_state *state) {
+        jpeg_decompress_struct *srcinfo = &state->srcinfo;
+        read_header(srcinfo);
+        jvirt_barray_ptr *src_coef_arrays = read_coefficients(srcinfo);
+        long long start_ns = now_ns();
+        for (int i = 0; i < std::min(channels, num_components); i++) {
+          // the rows of the band covered by this chunk
+          JDIMENSION offset =
+              first_row * srcinfo->comp_info[i].v_samp_factor;
+          band_info rows = *bands[i];
+          rows.dct = static_cast<char *>(rows.dct) +
+                     (long)offset * rows.dct_w * rows.dct_b *
+                         dtype_size(rows.dtype);
+          rows.dct_h = std::min(srcinfo->comp_info[i].height_in_blocks,
+                                bands[i]->dct_h - offset);
+          read_dct_coefficients(srcinfo, src_coef_arrays, i, &rows,
+                                band_origin{0, 0, rows.dct_h, rows.dct_w},
+                                normalized, nullptr, coefficients, format);
+        }
+        add_phase_time(PHASE_COPY, start_ns);
+      });
+    });
+  } catch (...) {
+    if (allocate) {
+      release_image_bands(bands[0], bands[1], bands[2]);
+    }
+    throw;
+  }
+  return true;
 }
 
-void read_dct_coefficients_from_buffer(
+void read_dct_coefficients_from_buffer_(
     char *jpg_buffer, unsigned long buffer_len, bool normalized, int channels,
-    short **band1_dct, int *band1_dct_h, int *band1_dct_w, int *band1_dct_b,
-    short **band2_dct, int *band2_dct_h, int *band2_dct_w, int *band2_dct_b,
-    short **band3_dct, int *band3_dct_h, int *band3_dct_w, int *band3_dct_b) {
+    band_info *band1, band_info *band2, band_info *band3,
+    const crop_window *crop, const coefficient_selection *coefficients,
+    const band_format *format) {
+  band1->dct = band2->dct = band3->dct = nullptr;
+  band_info *bands[3] = {band1, band2, band3};
+  trace_decode(buffer_len, crop != nullptr, [&]() {
+    if (crop == nullptr && !has_target(format) && scale_shift(format) == 0 &&
+        read_dct_coefficients_in_segments(jpg_buffer, buffer_len, normalized,
+                                          channels, coefficients, format,
+                                          bands, true)) {
+      return;
+    }
+    run_decoder(buffer_source(jpg_buffer, buffer_len),
+                [&](decoder_state *state) {
+                  read_dct_coefficients_from_srcinfo(
+                      state, normalized, channels, band1, band2, band3, crop,
+                      coefficients, format, true);
+                });
+  });
+}
+
+void read_dct_dimensions_from_buffer_(
+    char *jpg_buffer, unsigned long buffer_len, int channels, band_info *band1,
+    band_info *band2, band_info *band3, const crop_window *crop,
+    const coefficient_selection *coefficients, const band_format *format) {
+  run_decoder(buffer_source(jpg_buffer, buffer_len),
+              [&](decoder_state *state) {
+                band_info full_bands[3], bands[3];
+                band_origin origins[3];
+                read_cropped_band_dimensions(state, channels, crop,
+                                             coefficients, format, full_bands,
+                                             bands, origins);
+                *band1 = bands[0];
+                *band2 = bands[1];
+                *band3 = bands[2];
+              });
+}
+
+void read_dct_coefficients_from_buffer_into_(
+    char *jpg_buffer, unsigned long buffer_len, bool normalized, int channels,
+    band_info *band1, band_info *band2, band_info *band3,
+    const crop_window *crop, const coefficient_selection *coefficients,
+    const band_format *format) {
+  band_info *bands[3] = {band1, band2, band3};
+  trace_decode(buffer_len, crop != nullptr, [&]() {
+    if (crop == nullptr && !has_target(format) && scale_shift(format) == 0 &&
+        read_dct_coefficients_in_segments(jpg_buffer, buffer_len, normalized,
+                                          channels, coefficients, format,
+                                          bands, false)) {
+      return;
+    }
+    run_decoder(buffer_source(jpg_buffer, buffer_len),
+                [&](decoder_state *state) {
+                  read_dct_coefficients_from_srcinfo(
+                      state, normalized, channels, band1, band2, band3, crop,
+                      coefficients, format, false);
+                });
+  });
+}
+
+void add_restart_markers_(char *jpg_buffer, unsigned long buffer_len,
+                          int restart_rows, std::string *output) {
+  if (restart_rows <= 0) {
+    throw std::runtime_error("restart_rows should be positive");
+  }
+  // saving markers changes the decompress structure for good, which rules out
+  // the decoder of the thread
+  run_decoder(buffer_source(jpg_buffer, buffer_len),
+              [&](decoder_state *state) {
+    jpeg_decompress_struct *srcinfo = &state->srcinfo;
+    jpeg_save_markers(srcinfo, JPEG_COM, 0xFFFF);
+    for (int m = 0; m < 16; m++) {
+      jpeg_save_markers(srcinfo, JPEG_APP0 + m, 0xFFFF);
+    }
+    (void)jpeg_read_header(srcinfo, TRUE);
+    jvirt_barray_ptr *src_coef_arrays = jpeg_read_coefficients(srcinfo);
+
+    jpeg_compress_struct *dstinfo = &state->transinfo;
+    jpeg_create_compress(dstinfo);
+    unsigned char *outbuffer = nullptr;
+    unsigned long outlen = 0;
+    jpeg_mem_dest(dstinfo, &outbuffer, &outlen);
+    jpeg_copy_critical_parameters(srcinfo, dstinfo);
+    dstinfo->restart_in_rows = restart_rows;
+    dstinfo->optimize_coding = TRUE;
+    jpeg_write_coefficients(dstinfo, src_coef_arrays);
+
+    // libjpeg writes the JFIF and Adobe markers itself
+    for (jpeg_saved_marker_ptr marker = srcinfo->marker_list;
+         marker != nullptr; marker = marker->next) {
+      if (dstinfo->write_JFIF_header && marker->marker == JPEG_APP0 &&
+          marker->data_length >= 5 &&
+          std::memcmp(marker->data, "JFIF", 5) == 0) {
+        continue;
+      }
+      if (dstinfo->write_Adobe_marker && marker->marker == JPEG_APP0 + 14 &&
+          marker->data_length >= 5 &&
+          std::memcmp(marker->data, "Adobe", 5) == 0) {
+        continue;
+      }
+      jpeg_write_marker(dstinfo, marker->marker, marker->data,
+                        marker->data_length);
+    }
+    jpeg_finish_compress(dstinfo);
+    state->transcoded = outbuffer;
+    output->assign(reinterpret_cast<char *>(outbuffer), outlen);
+  }, false);
+}
+
+void encode_jpeg_(const unsigned char *pixels, int height, int width,
+                  int components, bool bgr, int quality, std::string *output,
+                  int h_samp, int v_samp, bool progressive, int restart_rows) {
+  if (height <= 0 || width <= 0) {
+    throw std::runtime_error("the image should not be empty");
+  }
+  if (components != 1 && components != 3) {
+    throw std::runtime_error("the image should have 1 or 3 components");
+  }
+  // nothing is decompressed, the decoder state only handles the errors
+  run_decoder([](jpeg_decompress_struct *) {}, [&](decoder_state *state) {
+    jpeg_compress_struct *dstinfo = &state->transinfo;
+    jpeg_create_compress(dstinfo);
+    unsigned char *outbuffer = nullptr;
+    unsigned long outlen = 0;
+    jpeg_mem_dest(dstinfo, &outbuffer, &outlen);
+    dstinfo->image_width = width;
+    dstinfo->image_height = height;
+    dstinfo->input_components = components;
+    dstinfo->in_color_space = components == 3 ? JCS_RGB : JCS_GRAYSCALE;
+    jpeg_set_defaults(dstinfo);
+    jpeg_set_quality(dstinfo, quality, TRUE);
+    if (components == 3) {
+      // libjpeg rejects the invalid factors
+      dstinfo->comp_info[0].h_samp_factor = h_samp;
+      dstinfo->comp_info[0].v_samp_factor = v_samp;
+    }
+    if (progressive) {
+      jpeg_simple_progression(dstinfo);
+    }
+    dstinfo->restart_in_rows = std::max(restart_rows, 0);
+    jpeg_start_compress(dstinfo, TRUE);
+
+    JDIMENSION row_len = (JDIMENSION)width * components;
+    JSAMPARRAY swapped = (dstinfo->mem->alloc_sarray)(
+        (j_common_ptr)dstinfo, JPOOL_IMAGE, row_len, 1);
+    while (dstinfo->next_scanline < dstinfo->image_height) {
+      const unsigned char *in =
+          pixels + (size_t)dstinfo->next_scanline * row_len;
+      JSAMPROW row = const_cast<JSAMPROW>(in);
+      if (bgr && components == 3) {
+        for (JDIMENSION x = 0; x < row_len; x += 3) {
+          swapped[0][x] = in[x + 2];
+          swapped[0][x + 1] = in[x + 1];
+          swapped[0][x + 2] = in[x];
+        }
+        row = swapped[0];
+      }
+      jpeg_write_scanlines(dstinfo, &row, 1);
+    }
+    jpeg_finish_compress(dstinfo);
+    state->transcoded = outbuffer;
+    output->assign(reinterpret_cast<char *>(outbuffer), outlen);
+  });
+}
+
+void probe_buffer_(char *jpg_buffer, unsigned long buffer_len,
+                   image_info *info) {
+  std::memset((void *)info, 0, sizeof(image_info));
+  run_decoder(buffer_source(jpg_buffer, buffer_len),
+              [&](decoder_state *state) {
+    jpeg_decompress_struct *srcinfo = &state->srcinfo;
+    (void)jpeg_read_header(srcinfo, TRUE);
+    info->image_h = srcinfo->image_height;
+    info->image_w = srcinfo->image_width;
+    info->num_components = srcinfo->num_components;
+    info->progressive = srcinfo->progressive_mode;
+    info->decode_path = get_decode_path(srcinfo);
+    for (int i = 0;
+         i < std::min(srcinfo->num_components, kMaxProbedComponents); i++) {
+      jpeg_component_info *compptr = &srcinfo->comp_info[i];
+      info->block_h[i] = compptr->height_in_blocks;
+      info->block_w[i] = compptr->width_in_blocks;
+      info->h_samp[i] = compptr->h_samp_factor;
+      info->v_samp[i] = compptr->v_samp_factor;
+      // the table selector is only checked by libjpeg when decoding starts,
+      // an out of range one is taken for a table missing from the header
+      int table_no = compptr->quant_tbl_no;
+      JQUANT_TBL *table = table_no >= 0 && table_no < NUM_QUANT_TBLS
+                              ? srcinfo->quant_tbl_ptrs[table_no]
+                              : nullptr;
+      for (int c = 0; table != nullptr && c < DCTSIZE2; c++) {
+        info->quant_table[i][c] = table->quantval[c];
+      }
+    }
+    band_info bands[3];
+    read_band_dimensions(srcinfo, 3, &bands[0], &bands[1], &bands[2]);
+    for (int i = 0; i < 3; i++) {
+      info->dct_h[i] = bands[i].dct_h;
+      info->dct_w[i] = bands[i].dct_w;
+    }
+  });
+}
+
+// the unpacked functions stand for the whole image with a 0x0 window
+const crop_window *unpack_crop_window(int crop_y, int crop_x, int crop_h,
+                                      int crop_w, crop_window *crop) {
+  if (crop_h == 0 && crop_w == 0) {
+    return nullptr;
+  }
+  crop->y = crop_y;
+  crop->x = crop_x;
+  crop->h = crop_h;
+  crop->w = crop_w;
+  return crop;
+}
+
+// the unpacked functions select all the coefficients with no index
+const coefficient_selection *
+unpack_coefficient_selection(int *coefficients, int nb_coefficients,
+                             coefficient_selection *selection) {
+  if (nb_coefficients == 0) {
+    return nullptr;
+  }
+  if (nb_coefficients > DCTSIZE2) {
+    throw std::runtime_error(
+        "between 1 and 64 coefficients should be selected, got " +
+        std::to_string(nb_coefficients));
+  }
+  selection->count = nb_coefficients;
+  std::copy(coefficients, coefficients + nb_coefficients, selection->index);
+  return selection;
+}
+
+void read_dct_dimensions_from_buffer(char *jpg_buffer,
+                                     unsigned long buffer_len, int channels,
+                                     int crop_y, int crop_x, int crop_h,
+                                     int crop_w, int *coefficients,
+                                     int nb_coefficients, int *band1_h,
+                                     int *band1_w, int *band1_b, int *band2_h,
+                                     int *band2_w, int *band2_b, int *band3_h,
+                                     int *band3_w, int *band3_b) {
   band_info band1, band2, band3;
-  read_dct_coefficients_from_buffer_(jpg_buffer, buffer_len, normalized,
-                                     channels, &band1, &band2, &band3);
-  unpack_band_info(band1, band1_dct, band1_dct_h, band1_dct_w, band1_dct_b);
-  unpack_band_info(band2, band2_dct, band2_dct_h, band2_dct_w, band2_dct_b);
-  unpack_band_info(band3, band3_dct, band3_dct_h, band3_dct_w, band3_dct_b);
-}
-
-void read_dct_coefficients_from_file_(char *filename, bool normalized,
-                                      int channels, band_info *band1,
-                                      band_info *band2, band_info *band3) {
-  FILE *infile;
-  if ((infile = fopen(filename, "rb")) == nullptr) {
-    fprintf(stderr, "ERROR: can't open %s\n", filename);
+  crop_window crop;
+  coefficient_selection selection;
+  read_dct_dimensions_from_buffer_(
+      jpg_buffer, buffer_len, channels, &band1, &band2, &band3,
+      unpack_crop_window(crop_y, crop_x, crop_h, crop_w, &crop),
+      unpack_coefficient_selection(coefficients, nb_coefficients, &selection));
+  short *dct;
+  unpack_band_info(band1, &dct, band1_h, band1_w, band1_b);
+  unpack_band_info(band2, &dct, band2_h, band2_w, band2_b);
+  unpack_band_info(band3, &dct, band3_h, band3_w, band3_b);
+}
+
+band_info pack_band_info(short *band_dct, int band_dct_h, int band_dct_w,
+                         int band_dct_b) {
+  band_info band;
+  band.dct = band_dct;
+  band.dct_h = band_dct_h;
+  band.dct_w = band_dct_w;
+  band.dct_b = band_dct_b;
+  band.dtype = DTYPE_INT16;
+  return band;
+}
+
+void read_dct_coefficients_from_buffer_into(
+    char *jpg_buffer, unsigned long buffer_len, bool normalized, int channels,
+    int crop_y, int crop_x, int crop_h, int crop_w, int *coefficients,
+    int nb_coefficients,
+    short *band1_dct, int band1_dct_h, int band1_dct_w, int band1_dct_b,
+    short *band2_dct, int band2_dct_h, int band2_dct_w, int band2_dct_b,
+    short *band3_dct, int band3_dct_h, int band3_dct_w, int band3_dct_b) {
+  band_info band1 = pack_band_info(band1_dct, band1_dct_h, band1_dct_w,
+                                   band1_dct_b);
+  band_info band2 = pack_band_info(band2_dct, band2_dct_h, band2_dct_w,
+                                   band2_dct_b);
+  band_info band3 = pack_band_info(band3_dct, band3_dct_h, band3_dct_w,
+                                   band3_dct_b);
+  crop_window crop;
+  coefficient_selection selection;
+  read_dct_coefficients_from_buffer_into_(
+      jpg_buffer, buffer_len, normalized, channels, &band1, &band2, &band3,
+      unpack_crop_window(crop_y, crop_x, crop_h, crop_w, &crop),
+      unpack_coefficient_selection(coefficients, nb_coefficients, &selection));
+}
+
+void read_dct_coefficients_from_file_(
+    char *filename, bool normalized, int channels, band_info *band1,
+    band_info *band2, band_info *band3, const crop_window *crop,
+    const coefficient_selection *coefficients, const band_format *format) {
+  // decoding from memory avoids the small buffered reads of jpeg_stdio_src,
+  // and lets large files take the restart segments path
+  mapped_file file(filename);
+  read_dct_coefficients_from_buffer_(file.data(), file.size(), normalized,
+                                     channels, band1, band2, band3, crop,
+                                     coefficients, format);
+}
+
+// mark the bands of an image which failed to decode, the decoders having
+// released them already
+void clear_image_bands(band_info *bands) {
+  for (int b = 0; b < 3; b++) {
+    bands[b].dct = nullptr;
+    bands[b].dct_h = bands[b].dct_w = bands[b].dct_b = 0;
+  }
+}
+
+// the message of the error of image `i` of a batch, prefixed with its index
+// when the batch holds several images: the decoders of a single image, such as
+// loads, raise the message of the decoder as is
+std::string image_error(int i, int nb_images, const char *message) {
+  return nb_images == 1 ? message : "image " + std::to_string(i) + ": " +
+                                        message;
+}
+
+void read_dct_coefficients_batch(
+    int nb_images, int num_threads, band_info *bands, std::string *errors,
+    const std::function<void(int, band_info *)> &read_image) {
+  for (int i = 0; i < 3 * nb_images; i++) {
+    bands[i].dct = nullptr;
+  }
+  // the worker threads allocate the bands from the pool of the caller
+  buffer_pool *pool = current_pool();
+  if (errors != nullptr) {
+    parallel_for(nb_images, num_threads, [&](int i) {
+      pool_scope scope(pool);
+      try {
+        read_image(i, &bands[3 * i]);
+      } catch (std::exception &e) {
+        errors[i] = e.what();
+        clear_image_bands(&bands[3 * i]);
+      }
+    });
     return;
   }
+  try {
+    parallel_for(nb_images, num_threads, [&](int i) {
+      pool_scope scope(pool);
+      try {
+        read_image(i, &bands[3 * i]);
+      } catch (file_error &e) {
+        throw file_error(image_error(i, nb_images, e.what()));
+      } catch (std::runtime_error &e) {
+        throw std::runtime_error(image_error(i, nb_images, e.what()));
+      }
+    });
+  } catch (...) {
+    for (int i = 0; i < nb_images; i++) {
+      release_image_bands(&bands[3 * i], &bands[3 * i + 1], &bands[3 * i + 2]);
+    }
+    throw;
+  }
+}
 
-  jpeg_decompress_struct srcinfo;
-  jpeg_error_mgr jerr;
-  srcinfo.err = jpeg_std_error(&jerr);
-  add_error_handler(&jerr);
-  jpeg_create_decompress(&srcinfo);
-  jpeg_stdio_src(&srcinfo, infile);
+void read_dct_coefficients_from_buffers_(
+    char **buffers, unsigned long *buffer_lens, int nb_buffers,
+    bool normalized, int channels, band_info *bands, int num_threads,
+    const crop_window *crop, const coefficient_selection *coefficients,
+    const band_format *format, std::string *errors) {
+  read_dct_coefficients_batch(
+      nb_buffers, num_threads, bands, errors, [&](int i, band_info *image_bands) {
+        read_dct_coefficients_from_buffer_(buffers[i], buffer_lens[i],
+                                           normalized, channels,
+                                           &image_bands[0], &image_bands[1],
+                                           &image_bands[2], crop, coefficients,
+                                           format);
+      });
+}
 
-  read_dct_coefficients_from_srcinfo(&srcinfo, normalized, channels, band1,
-                                     band2, band3);
+void read_dct_coefficients_from_files_(
+    char **filenames, int nb_files, bool normalized, int channels,
+    band_info *bands, int num_threads, const crop_window *crop,
+    const coefficient_selection *coefficients, const band_format *format,
+    std::string *errors) {
+  read_dct_coefficients_batch(
+      nb_files, num_threads, bands, errors, [&](int i, band_info *image_bands) {
+        read_dct_coefficients_from_file_(filenames[i], normalized, channels,
+                                         &image_bands[0], &image_bands[1],
+                                         &image_bands[2], crop, coefficients,
+                                         format);
+      });
+}
 
-  jpeg_destroy_decompress(&srcinfo);
-  fclose(infile);
+// run `task(i)` for every image of a batch: the failures are stored in
+// `errors` when it is given, and the first one is re-thrown with the index of
+// its image otherwise, see image_error
+void for_each_image(int nb_images, int num_threads, std::string *errors,
+                    const std::function<void(int)> &task) {
+  parallel_for(nb_images, num_threads, [&](int i) {
+    try {
+      task(i);
+    } catch (file_error &e) {
+      if (errors == nullptr) {
+        throw file_error(image_error(i, nb_images, e.what()));
+      }
+      errors[i] = e.what();
+    } catch (std::runtime_error &e) {
+      if (errors == nullptr) {
+        throw std::runtime_error(image_error(i, nb_images, e.what()));
+      }
+      errors[i] = e.what();
+    }
+  });
 }
 
-void read_dct_coefficients_from_file(
-    char *filename, bool normalized, int channels, short **band1_dct,
-    int *band1_dct_h, int *band1_dct_w, int *band1_dct_b, short **band2_dct,
-    int *band2_dct_h, int *band2_dct_w, int *band2_dct_b, short **band3_dct,
-    int *band3_dct_h, int *band3_dct_w, int *band3_dct_b) {
-  band_info band1, band2, band3;
-  read_dct_coefficients_from_file_(filename, normalized, channels, &band1,
-                                   &band2, &band3);
-  unpack_band_info(band1, band1_dct, band1_dct_h, band1_dct_w, band1_dct_b);
-  unpack_band_info(band2, band2_dct, band2_dct_h, band2_dct_w, band2_dct_b);
-  unpack_band_info(band3, band3_dct, band3_dct_h, band3_dct_w, band3_dct_b);
+// decode an image into its slot of the batched `outputs`: in place when it
+// has the block grid of the batch, otherwise aside and copied row by row,
+// zero filling the padded area
+void read_dct_coefficients_into_slot(char *jpg_buffer,
+                                     unsigned long buffer_len, bool normalized,
+                                     int channels, int index, band_info *bands,
+                                     const band_info *outputs,
+                                     const crop_window *crop,
+                                     const coefficient_selection *coefficients,
+                                     const band_format *format) {
+  bool padded = false;
+  for (int c = 0; c < channels; c++) {
+    padded |= bands[c].dct_h != outputs[c].dct_h ||
+              bands[c].dct_w != outputs[c].dct_w;
+  }
+  if (!padded) {
+    band_info slots[3];
+    for (int c = 0; c < 3; c++) {
+      slots[c] = bands[c];
+      slots[c].dct = c < channels ? static_cast<char *>(outputs[c].dct) +
+                                        index * band_bytes(&outputs[c])
+                                  : nullptr;
+    }
+    read_dct_coefficients_from_buffer_into_(jpg_buffer, buffer_len, normalized,
+                                            channels, &slots[0], &slots[1],
+                                            &slots[2], crop, coefficients,
+                                            format);
+    return;
+  }
+
+  band_info image[3];
+  read_dct_coefficients_from_buffer_(jpg_buffer, buffer_len, normalized,
+                                     channels, &image[0], &image[1], &image[2],
+                                     crop, coefficients, format);
+  for (int c = 0; c < channels; c++) {
+    const long element_size = dtype_size(outputs[c].dtype);
+    const long row_bytes = long(outputs[c].dct_w) * outputs[c].dct_b *
+                           element_size;
+    const long band_row_bytes = long(image[c].dct_w) * image[c].dct_b *
+                                element_size;
+    char *slot = static_cast<char *>(outputs[c].dct) +
+                 index * band_bytes(&outputs[c]);
+    const char *band_data = static_cast<const char *>(image[c].dct);
+    for (unsigned row = 0; row < outputs[c].dct_h; row++) {
+      long copied = 0;
+      if (row < image[c].dct_h) {
+        std::memcpy(slot + row * row_bytes, band_data + row * band_row_bytes,
+                    band_row_bytes);
+        copied = band_row_bytes;
+      }
+      std::memset(slot + row * row_bytes + copied, 0, row_bytes - copied);
+    }
+  }
+  buffer_pool *pool = current_pool();
+  if (pool != nullptr) {
+    pool->release(static_cast<char *>(image[0].dct),
+                  image_bytes(&image[0], &image[1], &image[2]));
+  } else {
+    release_image_bands(&image[0], &image[1], &image[2]);
+  }
+}
+
+void read_dct_coefficients_from_buffers_padded_(
+    char **buffers, unsigned long *buffer_lens, int nb_buffers,
+    bool normalized, int channels, band_info *bands, band_info *outputs,
+    const std::function<void(band_info *)> &allocate, int num_threads,
+    const crop_window *crop, const coefficient_selection *coefficients,
+    const band_format *format, std::string *errors) {
+  for (int i = 0; i < 3 * nb_buffers; i++) {
+    bands[i].dct = nullptr;
+    bands[i].dct_h = bands[i].dct_w = bands[i].dct_b = 0;
+  }
+  for_each_image(nb_buffers, num_threads, errors, [&](int i) {
+    read_dct_dimensions_from_buffer_(buffers[i], buffer_lens[i], channels,
+                                     &bands[3 * i], &bands[3 * i + 1],
+                                     &bands[3 * i + 2], crop, coefficients,
+                                     format);
+  });
+
+  for (int c = 0; c < 3; c++) {
+    outputs[c].dct = nullptr;
+    outputs[c].dct_h = outputs[c].dct_w = 0;
+    outputs[c].dct_b = c < channels ? (coefficients != nullptr
+                                           ? coefficients->count
+                                           : DCTSIZE2)
+                                    : 0;
+    outputs[c].dtype = format != nullptr ? format->dtype : DTYPE_INT16;
+    for (int i = 0; c < channels && i < nb_buffers; i++) {
+      if (errors == nullptr || errors[i].empty()) {
+        outputs[c].dct_h = std::max(outputs[c].dct_h, bands[3 * i + c].dct_h);
+        outputs[c].dct_w = std::max(outputs[c].dct_w, bands[3 * i + c].dct_w);
+      }
+    }
+  }
+  allocate(outputs);
+
+  buffer_pool *pool = current_pool();
+  for_each_image(nb_buffers, num_threads, errors, [&](int i) {
+    if (errors != nullptr && !errors[i].empty()) {
+      return;
+    }
+    pool_scope scope(pool);
+    read_dct_coefficients_into_slot(buffers[i], buffer_lens[i], normalized,
+                                    channels, i, &bands[3 * i], outputs, crop,
+                                    coefficients, format);
+  });
+  for (int i = 0; errors != nullptr && i < nb_buffers; i++) {
+    if (errors[i].empty()) {
+      continue;
+    }
+    for (int c = 0; c < channels; c++) {
+      std::memset(static_cast<char *>(outputs[c].dct) +
+                      i * band_bytes(&outputs[c]),
+                  0, band_bytes(&outputs[c]));
+    }
+    clear_image_bands(&bands[3 * i]);
+  }
+}
+
+void probe_buffers_(char **buffers, unsigned long *buffer_lens, int nb_buffers,
+                    image_info *infos, int num_threads) {
+  parallel_for(nb_buffers, num_threads, [&](int i) {
+    try {
+      probe_buffer_(buffers[i], buffer_lens[i], &infos[i]);
+    } catch (std::runtime_error &e) {
+      throw std::runtime_error(image_error(i, nb_buffers, e.what()));
+    }
+  });
 }
 
 } // namespace common
@@ -10,36 +10,271 @@
 #ifndef DCTFROMJPG_H_
 #define DCTFROMJPG_H_
 
+#include <cstddef>
+#include <functional>
+#include <string>
+
 namespace jpeg2dct {
 namespace common {
 
+// type of the values of a band
+enum band_dtype { DTYPE_INT16 = 0, DTYPE_FLOAT16 = 1, DTYPE_FLOAT32 = 2 };
+
 struct band_info {
-  short *dct;
+  // dct_h x dct_w x dct_b values of type `dtype`, IEEE half precision floats
+  // being stored as unsigned shorts
+  void *dct;
   unsigned int dct_h;
   unsigned int dct_w;
   unsigned int dct_b;
+  int dtype;
+};
+
+// block-aligned window of the luminance band, in blocks. The window of each
+// chroma band is derived from it: the same window for full resolution bands,
+// and the blocks covering it for half resolution bands. Decoding stops after
+// the last row of blocks needed by the windows when the image has a single
+// scan. The unpacked functions take the window as crop_y, crop_x, crop_h and
+// crop_w, a 0x0 window standing for the whole image.
+struct crop_window {
+  int y;
+  int x;
+  int h;
+  int w;
+};
+
+// subset of the 64 coefficients of each block written to the bands, in the
+// given order. Indices follow the order of the coefficients in the full bands,
+// which is the natural (row major) order of a block, so that the first K
+// coefficients in zigzag order are selected with the first K entries of the
+// zigzag table. The bands get `count` coefficients per block. The unpacked
+// functions take the indices as `coefficients` and `nb_coefficients`, no
+// index standing for all the coefficients.
+struct coefficient_selection {
+  int count;
+  int index[64];
 };
 
-void read_dct_coefficients_from_file_(char *filename, bool normalized,
-                                      int channels, band_info *band1,
-                                      band_info *band2, band_info *band3);
+// where the window of a fixed target grid is taken in a larger image
+enum target_crop {
+  TARGET_CROP_TOP_LEFT = 0,
+  TARGET_CROP_CENTER = 1,
+  TARGET_CROP_RANDOM = 2
+};
 
-void read_dct_coefficients_from_file(
-    char *filename, bool normalized, int channels, short **band1_dct,
-    int *band1_dct_h, int *band1_dct_w, int *band1_dct_b, short **band2_dct,
-    int *band2_dct_h, int *band2_dct_w, int *band2_dct_b, short **band3_dct,
-    int *band3_dct_h, int *band3_dct_w, int *band3_dct_b);
+// what the blocks of a fixed target grid past a smaller image hold: zeros, or
+// copies of the last block of each row and of the last row
+enum target_pad { TARGET_PAD_ZERO = 0, TARGET_PAD_EDGE = 1 };
 
-void read_dct_coefficients_from_buffer_(char *buffer, unsigned long buffer_len,
-                                        bool normalized, int channels,
-                                        band_info *band1, band_info *band2,
-                                        band_info *band3);
+// how the coefficients are written to the bands. Floating point bands hold
+// the dequantized coefficients when decoding normalized coefficients, and are
+// optionally standardized as (value - mean) / std with statistics given for
+// each band and each of its `nb_coefficients` (selected) coefficients. The
+// functions without a format write int16 bands.
+//
+// A target_h x target_w target grid gives every image bands of the same
+// dimensions: the luminance band gets the target grid and the chroma bands
+// half of it rounded up. The luminance window, the crop window if any, is
+// cropped to the target along the axes where it is larger, at the position
+// given by `crop_mode`, and padded past its blocks along the others, as given
+// by `pad_mode`. The random windows are drawn by a generator of each thread.
+// A 0x0 target keeps the dimensions of each image.
+//
+// A `scale_denom` of 2, 4 or 8 gives the bands of the image downscaled by it,
+// in blocks of 8x8 coefficients computed from the decoded ones without going
+// through the pixel domain: each band has its block grid divided by
+// `scale_denom` and rounded up. Crop windows and target grids are in blocks of
+// the downscaled image. 1 keeps the full resolution.
+struct band_format {
+  int dtype;
+  bool standardize;
+  int nb_coefficients;
+  float mean[3][64];
+  float std[3][64];
+  int target_h;
+  int target_w;
+  int crop_mode;
+  int pad_mode;
+  int scale_denom;
+};
 
-void read_dct_coefficients_from_buffer(
+// the functions which allocate the bands of an image allocate the three of
+// them at once: band1->dct points to a single buffer of image_bytes bytes which
+// holds the bands one after the other, empty ones included, at offsets aligned
+// to kBandAlignment bytes from its start, which is aligned as much. It is
+// released with release_image_bands, and is handed over or copied as a whole.
+const size_t kBandAlignment = 64;
+
+size_t image_bytes(const band_info *band1, const band_info *band2,
+                   const band_info *band3);
+
+// allocate the buffer of bands whose dimensions and dtype are set
+void allocate_image_bands(band_info *band1, band_info *band2,
+                          band_info *band3);
+
+// point bands whose dimensions and dtype are set at their place in a caller
+// provided buffer of image_bytes bytes, laid out as allocated
+void place_image_bands(char *memory, band_info *band1, band_info *band2,
+                       band_info *band3);
+
+void release_image_bands(band_info *band1, band_info *band2, band_info *band3);
+
+void read_dct_coefficients_from_file_(
+    char *filename, bool normalized, int channels, band_info *band1,
+    band_info *band2, band_info *band3, const crop_window *crop = nullptr,
+    const coefficient_selection *coefficients = nullptr,
+    const band_format *format = nullptr);
+
+void read_dct_coefficients_from_buffer_(
     char *buffer, unsigned long buffer_len, bool normalized, int channels,
-    short **band1_dct, int *band1_dct_h, int *band1_dct_w, int *band1_dct_b,
-    short **band2_dct, int *band2_dct_h, int *band2_dct_w, int *band2_dct_b,
-    short **band3_dct, int *band3_dct_h, int *band3_dct_w, int *band3_dct_b);
+    band_info *band1, band_info *band2, band_info *band3,
+    const crop_window *crop = nullptr,
+    const coefficient_selection *coefficients = nullptr,
+    const band_format *format = nullptr);
+
+// chroma layouts other than H2_V2 are resampled in the DCT domain when
+// enabled (the default), instead of transcoding the image through the pixel
+// domain
+void set_chroma_resampling(bool enabled);
+bool get_chroma_resampling();
+
+// truncated images, whose entropy coded data ends before their last block,
+// fail to decode unless accepted, the missing blocks being zero filled then.
+// Off by default.
+void set_accept_truncated(bool enabled);
+bool get_accept_truncated();
+
+// number of threads decoding the restart segments of a single image, for the
+// images coded as one sequential scan whose restart intervals line up with
+// rows of MCUs. 1 (the default) decodes serially, 0 uses all cores.
+void set_segment_threads(int num_threads);
+
+// losslessly re-encode a JPEG image as one sequential scan with a restart
+// marker every `restart_rows` rows of MCUs, so that it can be decoded in
+// segments. The APPn and COM markers are kept.
+void add_restart_markers_(char *buffer, unsigned long buffer_len,
+                          int restart_rows, std::string *output);
+
+// compress a height x width x components 8 bits image (1 component for
+// grayscale images, 3 for RGB, or BGR when `bgr` is true) with libjpeg's
+// default settings and jpeg_set_quality(quality, TRUE). By default, this is a
+// baseline JPEG image with H2_V2 chroma subsampling, which is decoded without
+// transcoding. `h_samp` x `v_samp` are the sampling factors of the luminance of
+// color images, the chroma components having 1 x 1. Progressive images use
+// libjpeg's simple progression, and a restart marker is written every
+// `restart_rows` rows of MCUs when it is positive.
+void encode_jpeg_(const unsigned char *pixels, int height, int width,
+                  int components, bool bgr, int quality, std::string *output,
+                  int h_samp = 2, int v_samp = 2, bool progressive = false,
+                  int restart_rows = 0);
+
+// two-phase decoding: read the band dimensions from the header only, then
+// decode into caller provided `dct` buffers of those dimensions
+void read_dct_dimensions_from_buffer_(
+    char *buffer, unsigned long buffer_len, int channels, band_info *band1,
+    band_info *band2, band_info *band3, const crop_window *crop = nullptr,
+    const coefficient_selection *coefficients = nullptr,
+    const band_format *format = nullptr);
+
+void read_dct_dimensions_from_buffer(char *buffer, unsigned long buffer_len,
+                                     int channels, int crop_y, int crop_x,
+                                     int crop_h, int crop_w, int *coefficients,
+                                     int nb_coefficients, int *band1_h,
+                                     int *band1_w, int *band1_b, int *band2_h,
+                                     int *band2_w, int *band2_b, int *band3_h,
+                                     int *band3_w, int *band3_b);
+
+void read_dct_coefficients_from_buffer_into_(
+    char *buffer, unsigned long buffer_len, bool normalized, int channels,
+    band_info *band1, band_info *band2, band_info *band3,
+    const crop_window *crop = nullptr,
+    const coefficient_selection *coefficients = nullptr,
+    const band_format *format = nullptr);
+
+void read_dct_coefficients_from_buffer_into(
+    char *buffer, unsigned long buffer_len, bool normalized, int channels,
+    int crop_y, int crop_x, int crop_h, int crop_w, int *coefficients,
+    int nb_coefficients, short *band1_dct,
+    int band1_dct_h, int band1_dct_w, int band1_dct_b,
+    short *band2_dct, int band2_dct_h, int band2_dct_w, int band2_dct_b,
+    short *band3_dct, int band3_dct_h, int band3_dct_w, int band3_dct_b);
+
+// how the bands of an image are produced
+enum decode_path {
+  // the coefficients are copied
+  DECODE_DIRECT = 0,
+  // the chroma coefficients are resampled in the DCT domain
+  DECODE_RESAMPLE = 1,
+  // the image is transcoded to H2_V2 through the pixel domain
+  DECODE_TRANSCODE = 2
+};
+
+const int kMaxProbedComponents = 4;
+
+// what the header of an image tells, only the first kMaxProbedComponents
+// components are described
+struct image_info {
+  unsigned int image_h;
+  unsigned int image_w;
+  int num_components;
+  bool progressive;
+  int decode_path;
+  // block grid and sampling factors of each component
+  unsigned int block_h[kMaxProbedComponents];
+  unsigned int block_w[kMaxProbedComponents];
+  int h_samp[kMaxProbedComponents];
+  int v_samp[kMaxProbedComponents];
+  // quantization table of each component, in the order of the coefficients
+  // of the bands. Zeros when the table is not defined in the header.
+  unsigned short quant_table[kMaxProbedComponents][64];
+  // block grid of the 3 bands returned by the decoders
+  unsigned int dct_h[3];
+  unsigned int dct_w[3];
+};
+
+// read the header only
+void probe_buffer_(char *buffer, unsigned long buffer_len, image_info *info);
+
+// batched variants: `bands` holds 3 band_info per image, in input order, the
+// same window and coefficients are decoded from every image, and the images
+// are decoded concurrently on `num_threads` threads (all cores if
+// `num_threads <= 0`). If any image fails, every band is released and the
+// error is re-thrown, unless `errors` holds a string per image: the message of
+// each failure is stored there instead, the bands of the failed images being
+// null with a 0x0x0 block grid, and the other images are decoded.
+void read_dct_coefficients_from_buffers_(
+    char **buffers, unsigned long *buffer_lens, int nb_buffers,
+    bool normalized, int channels, band_info *bands, int num_threads,
+    const crop_window *crop = nullptr,
+    const coefficient_selection *coefficients = nullptr,
+    const band_format *format = nullptr, std::string *errors = nullptr);
+
+void read_dct_coefficients_from_files_(
+    char **filenames, int nb_files, bool normalized, int channels,
+    band_info *bands, int num_threads, const crop_window *crop = nullptr,
+    const coefficient_selection *coefficients = nullptr,
+    const band_format *format = nullptr, std::string *errors = nullptr);
+
+// batched decoding into batches of bands provided by the caller, for images
+// of different sizes: the block grids of the images are read from their
+// headers into `bands` (3 band_info per image, with null data), then
+// `allocate` is called on the calling thread with the 3 batched `outputs`,
+// whose block grid is the largest of the images, and points each of them to
+// nb_buffers x dct_h x dct_w x dct_b values of the dtype of the bands. The
+// images smaller than the batch are decoded aside, from the pool of the
+// calling thread, and copied into their slot, zero padded at the bottom and
+// on the right. Failures are handled as by read_dct_coefficients_from_buffers_,
+// the slots of the failed images being zero filled and their block grids 0x0.
+void read_dct_coefficients_from_buffers_padded_(
+    char **buffers, unsigned long *buffer_lens, int nb_buffers,
+    bool normalized, int channels, band_info *bands, band_info *outputs,
+    const std::function<void(band_info *)> &allocate, int num_threads,
+    const crop_window *crop = nullptr,
+    const coefficient_selection *coefficients = nullptr,
+    const band_format *format = nullptr, std::string *errors = nullptr);
+
+void probe_buffers_(char **buffers, unsigned long *buffer_lens, int nb_buffers,
+                    image_info *infos, int num_threads);
 
 } // namespace common
 } // namespace jpeg2dct
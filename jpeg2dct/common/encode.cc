@@ -0,0 +1,424 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <memory>
+#include <stdexcept>
+#include <vector>
+
+#include "encode.h"
+
+namespace jpeg2dct {
+namespace common {
+
+namespace {
+
+// the tables of the JPEG standard (K.1 and K.2) which jpeg_set_quality
+// scales, in natural order
+const unsigned short kLuminanceTable[64] = {
+    16, 11, 10, 16, 24,  40,  51,  61,  12, 12, 14, 19, 26,  58,  60,  55,
+    14, 13, 16, 24, 40,  57,  69,  56,  14, 17, 22, 29, 51,  87,  80,  62,
+    18, 22, 37, 56, 68,  109, 103, 77,  24, 35, 55, 64, 81,  104, 113, 92,
+    49, 64, 78, 87, 103, 121, 120, 101, 72, 92, 95, 98, 112, 100, 103, 99};
+const unsigned short kChrominanceTable[64] = {
+    17, 18, 24, 47, 99, 99, 99, 99, 18, 21, 26, 66, 99, 99, 99, 99,
+    24, 26, 56, 99, 99, 99, 99, 99, 47, 66, 99, 99, 99, 99, 99, 99,
+    99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99,
+    99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99};
+
+// fixed point RGB to YCbCr conversion of jccolor.c
+const int kScaleBits = 16;
+const uint32_t kOneHalf = (uint32_t)1 << (kScaleBits - 1);
+const uint32_t kCbCrOffset = (uint32_t)128 << kScaleBits;
+
+constexpr uint32_t fix(double x) {
+  return (uint32_t)(x * ((uint32_t)1 << kScaleBits) + 0.5);
+}
+
+// constants of the islow forward dct of jfdctint.c, 13 bits fixed point
+const int kConstBits = 13;
+const int kPass1Bits = 2;
+const int32_t kFix_0_298631336 = 2446;
+const int32_t kFix_0_390180644 = 3196;
+const int32_t kFix_0_541196100 = 4433;
+const int32_t kFix_0_765366865 = 6270;
+const int32_t kFix_0_899976223 = 7373;
+const int32_t kFix_1_175875602 = 9633;
+const int32_t kFix_1_501321110 = 12299;
+const int32_t kFix_1_847759065 = 15137;
+const int32_t kFix_1_961570560 = 16069;
+const int32_t kFix_2_053119869 = 16819;
+const int32_t kFix_2_562915447 = 20995;
+const int32_t kFix_3_072711026 = 25172;
+
+inline int32_t descale(int32_t x, int n) {
+  return (x + ((int32_t)1 << (n - 1))) >> n;
+}
+
+// a component of the image sampled at its resolution, as 8 bits samples
+struct plane {
+  std::unique_ptr<unsigned char[]> samples;
+  int height;
+  int width;
+
+  plane(int height, int width)
+      : samples(new unsigned char[(size_t)height * width]), height(height),
+        width(width) {}
+  unsigned char *row(int y) { return samples.get() + (size_t)y * width; }
+};
+
+int blocks(int size, int block_size) {
+  return (size + block_size - 1) / block_size;
+}
+
+// number of pixels converted at once, the loops over a chunk vectorize
+const int kChunk = 16;
+
+// color convert a chunk of pixels. The sums are computed modulo 2^32, their
+// results being positive.
+inline void convert_chunk(const unsigned char *in, int r_offset, int b_offset,
+                          unsigned char *y, unsigned char *cb,
+                          unsigned char *cr) {
+  uint16_t r[kChunk], g[kChunk], b[kChunk];
+  for (int k = 0; k < kChunk; k++) {
+    r[k] = in[3 * k + r_offset];
+    g[k] = in[3 * k + 1];
+    b[k] = in[3 * k + b_offset];
+  }
+  unsigned char y_out[kChunk], cb_out[kChunk], cr_out[kChunk];
+  for (int k = 0; k < kChunk; k++) {
+    y_out[k] = (unsigned char)((fix(0.29900) * r[k] + fix(0.58700) * g[k] +
+                                fix(0.11400) * b[k] + kOneHalf) >>
+                               kScaleBits);
+    cb_out[k] = (unsigned char)((fix(0.50000) * b[k] - fix(0.16874) * r[k] -
+                                 fix(0.33126) * g[k] + kCbCrOffset +
+                                 kOneHalf - 1) >>
+                                kScaleBits);
+    cr_out[k] = (unsigned char)((fix(0.50000) * r[k] - fix(0.41869) * g[k] -
+                                 fix(0.08131) * b[k] + kCbCrOffset +
+                                 kOneHalf - 1) >>
+                                kScaleBits);
+  }
+  std::memcpy(y, y_out, kChunk);
+  std::memcpy(cb, cb_out, kChunk);
+  std::memcpy(cr, cr_out, kChunk);
+}
+
+// 2x2 box downsampling of jcsample.c, whose rounding alternates between the
+// columns
+void downsample_rows(const unsigned char *top, const unsigned char *bottom,
+                     int width, unsigned char *out) {
+  for (int x = 0; x < width; x++) {
+    int bias = 1 + (x & 1);
+    out[x] = (unsigned char)((top[2 * x] + top[2 * x + 1] + bottom[2 * x] +
+                              bottom[2 * x + 1] + bias) >>
+                             2);
+  }
+}
+
+// color convert `rows` rows of the image into the luminance plane and the
+// half resolution chroma planes of a strip, replicating the last column of
+// the image like libjpeg does to fill its blocks. The chroma of each pair of
+// rows is downsampled as soon as it is converted, the last row of an odd
+// height image being paired with itself. The luminance plane of color images
+// is a whole number of chunks wide.
+void convert_colors(const unsigned char *pixels, int rows, int components,
+                    bool bgr, int image_width, plane *y, plane *cb,
+                    plane *cr) {
+  const int r_offset = bgr ? 2 : 0;
+  const int b_offset = bgr ? 0 : 2;
+  // full resolution chroma of a pair of rows
+  std::vector<unsigned char> chroma(components == 3 ? 4 * y->width : 0);
+  for (int row = 0; row < rows; row++) {
+    const unsigned char *in = pixels + (size_t)row * image_width * components;
+    unsigned char *y_row = y->row(row);
+    if (components == 1) {
+      std::memcpy(y_row, in, image_width);
+      std::fill(y_row + image_width, y_row + y->width, y_row[image_width - 1]);
+      continue;
+    }
+    unsigned char *cb_rows = chroma.data();
+    unsigned char *cr_rows = chroma.data() + 2 * y->width;
+    int half = row % 2;
+    for (int x = 0; x < y->width; x += kChunk) {
+      const unsigned char *chunk = in + 3 * x;
+      unsigned char edge[3 * kChunk];
+      if (x + kChunk > image_width) {
+        for (int k = 0; k < kChunk; k++) {
+          std::memcpy(edge + 3 * k, in + 3 * std::min(x + k, image_width - 1),
+                      3);
+        }
+        chunk = edge;
+      }
+      convert_chunk(chunk, r_offset, b_offset, y_row + x,
+                    cb_rows + half * y->width + x,
+                    cr_rows + half * y->width + x);
+    }
+    if (half == 1 || row == rows - 1) {
+      downsample_rows(cb_rows, cb_rows + half * y->width, cb->width,
+                      cb->row(row / 2));
+      downsample_rows(cr_rows, cr_rows + half * y->width, cr->width,
+                      cr->row(row / 2));
+    }
+  }
+}
+
+// fill the rows of a strip below the image with its last row, like libjpeg
+// pads the components to whole blocks
+void replicate_last_row(int rows, plane *samples) {
+  for (int row = rows; row < samples->height; row++) {
+    std::memcpy(samples->row(row), samples->row(rows - 1), samples->width);
+  }
+}
+
+// one pass of the islow forward dct along the first index of `data`, for the
+// 8 lines of the second index at once. The first pass scales its outputs up
+// by kPass1Bits, the second one scales them back down. Like libjpeg-turbo's
+// SIMD version, it works on 16 bits values: the sums of up to 8 values of a
+// pass fit, only the products are widened.
+template <bool first_pass> inline void fdct_pass(int16_t (&data)[8][8]) {
+  const int shift = first_pass ? kConstBits - kPass1Bits
+                               : kConstBits + kPass1Bits;
+  for (int i = 0; i < 8; i++) {
+    int16_t tmp0 = data[0][i] + data[7][i];
+    int16_t tmp7 = data[0][i] - data[7][i];
+    int16_t tmp1 = data[1][i] + data[6][i];
+    int16_t tmp6 = data[1][i] - data[6][i];
+    int16_t tmp2 = data[2][i] + data[5][i];
+    int16_t tmp5 = data[2][i] - data[5][i];
+    int16_t tmp3 = data[3][i] + data[4][i];
+    int16_t tmp4 = data[3][i] - data[4][i];
+
+    // even part
+    int16_t tmp10 = tmp0 + tmp3;
+    int16_t tmp13 = tmp0 - tmp3;
+    int16_t tmp11 = tmp1 + tmp2;
+    int16_t tmp12 = tmp1 - tmp2;
+    if (first_pass) {
+      data[0][i] = (int16_t)((tmp10 + tmp11) * (1 << kPass1Bits));
+      data[4][i] = (int16_t)((tmp10 - tmp11) * (1 << kPass1Bits));
+    } else {
+      data[0][i] = (int16_t)descale(tmp10 + tmp11, kPass1Bits);
+      data[4][i] = (int16_t)descale(tmp10 - tmp11, kPass1Bits);
+    }
+    int32_t z1 = (int16_t)(tmp12 + tmp13) * kFix_0_541196100;
+    data[2][i] = (int16_t)descale(z1 + tmp13 * kFix_0_765366865, shift);
+    data[6][i] = (int16_t)descale(z1 - tmp12 * kFix_1_847759065, shift);
+
+    // odd part
+    int16_t z1_odd = tmp4 + tmp7;
+    int16_t z2_odd = tmp5 + tmp6;
+    int16_t z3_odd = tmp4 + tmp6;
+    int16_t z4_odd = tmp5 + tmp7;
+    int32_t z5 = (int16_t)(z3_odd + z4_odd) * kFix_1_175875602;
+    int32_t p4 = tmp4 * kFix_0_298631336;
+    int32_t p5 = tmp5 * kFix_2_053119869;
+    int32_t p6 = tmp6 * kFix_3_072711026;
+    int32_t p7 = tmp7 * kFix_1_501321110;
+    int32_t p1 = z1_odd * -kFix_0_899976223;
+    int32_t p2 = z2_odd * -kFix_2_562915447;
+    int32_t p3 = z3_odd * -kFix_1_961570560 + z5;
+    int32_t q4 = z4_odd * -kFix_0_390180644 + z5;
+    data[7][i] = (int16_t)descale(p4 + p1 + p3, shift);
+    data[5][i] = (int16_t)descale(p5 + p2 + q4, shift);
+    data[3][i] = (int16_t)descale(p6 + p2 + p3, shift);
+    data[1][i] = (int16_t)descale(p7 + p1 + q4, shift);
+  }
+}
+
+inline void transpose(const int16_t (&in)[8][8], int16_t (&out)[8][8]) {
+  for (int i = 0; i < 8; i++) {
+    for (int j = 0; j < 8; j++) {
+      out[j][i] = in[i][j];
+    }
+  }
+}
+
+// quantization of jcdctmgr.c, which rounds half away from zero. Dividing
+// with floats is exact: the quotient of the rounded magnitude, offset by
+// half a unit, is at least 1 / (2 step) away from the next integer while its
+// error is below 2^-8 / step.
+struct quantizer {
+  // the dct outputs are scaled up by 8
+  float reciprocal[64];
+  int32_t half_step[64];
+  // what the quantized values are multiplied by
+  int32_t scale[64];
+};
+
+void init_quantizer(const unsigned short *quant, bool normalized,
+                    quantizer *q) {
+  for (int c = 0; c < 64; c++) {
+    int32_t step = 8 * (int32_t)quant[c];
+    q->reciprocal[c] = 1.0f / step;
+    q->half_step[c] = step / 2;
+    q->scale[c] = normalized ? quant[c] : 1;
+  }
+}
+
+struct sample_block {
+  int16_t samples[8][8];
+};
+
+// compute the quantized dct coefficients of the row of `dct_w` blocks held
+// by the 8 rows of a plane starting at `first_row`, using `blocks` as scratch
+// space. Each stage runs over the whole row of blocks.
+void encode_blocks(plane &samples, int first_row, const quantizer &q,
+                   std::vector<sample_block> &blocks, unsigned dct_w,
+                   short *out) {
+  for (int y = 0; y < 8; y++) {
+    const unsigned char *row = samples.row(first_row + y);
+    for (unsigned bx = 0; bx < dct_w; bx++) {
+      for (int x = 0; x < 8; x++) {
+        blocks[bx].samples[y][x] = (int16_t)(row[8 * bx + x] - 128);
+      }
+    }
+  }
+
+  // the first pass runs along the rows of the blocks
+  int16_t transposed[8][8];
+  for (unsigned bx = 0; bx < dct_w; bx++) {
+    transpose(blocks[bx].samples, transposed);
+    fdct_pass<true>(transposed);
+    transpose(transposed, blocks[bx].samples);
+    fdct_pass<false>(blocks[bx].samples);
+  }
+
+  for (unsigned bx = 0; bx < dct_w; bx++, out += 64) {
+    const int16_t *coefficients = &blocks[bx].samples[0][0];
+    short values[64];
+    for (int c = 0; c < 64; c++) {
+      int32_t value = coefficients[c];
+      int32_t magnitude = value < 0 ? -value : value;
+      int32_t quotient =
+          (int32_t)(((float)(magnitude + q.half_step[c]) + 0.5f) *
+                    q.reciprocal[c]);
+      values[c] = (short)((value < 0 ? -quotient : quotient) * q.scale[c]);
+    }
+    std::memcpy(out, values, sizeof(values));
+  }
+}
+
+void set_band_dimensions(unsigned dct_h, unsigned dct_w, band_info *band) {
+  band->dct_h = dct_h;
+  band->dct_w = dct_w;
+  band->dct_b = 64;
+  band->dtype = DTYPE_INT16;
+}
+
+void encode_image(const unsigned char *pixels, int height, int width,
+                  int components, bool bgr, const unsigned short *quant,
+                  bool normalized, bool chroma, band_info **bands) {
+  // the image is processed in strips of one row of MCUs, which cover 16
+  // rows when the chroma is subsampled
+  bool color = components == 3;
+  int strip_rows = color ? 16 : 8;
+  int plane_width = blocks(width, strip_rows) * strip_rows;
+  plane y(strip_rows, plane_width);
+  plane cb(color ? strip_rows / 2 : 0, plane_width / 2);
+  plane cr(color ? strip_rows / 2 : 0, plane_width / 2);
+  quantizer luma_quantizer, chroma_quantizer;
+  init_quantizer(quant, normalized, &luma_quantizer);
+  init_quantizer(quant + 64, normalized, &chroma_quantizer);
+  std::vector<sample_block> scratch(bands[0]->dct_w);
+  short *out[3];
+  for (int i = 0; i < 3; i++) {
+    out[i] = static_cast<short *>(bands[i]->dct);
+  }
+
+  for (int top = 0; top < height; top += strip_rows) {
+    int rows = std::min(strip_rows, height - top);
+    convert_colors(pixels + (size_t)top * width * components, rows,
+                   components, bgr, width, &y, &cb, &cr);
+    replicate_last_row(rows, &y);
+    for (int row = 0; row < rows; row += 8) {
+      encode_blocks(y, row, luma_quantizer, scratch, bands[0]->dct_w, out[0]);
+      out[0] += bands[0]->dct_w * 64;
+    }
+    if (!color || !chroma) {
+      continue;
+    }
+    plane *planes[2] = {&cb, &cr};
+    for (int i = 1; i < 3; i++) {
+      replicate_last_row(blocks(rows, 2), planes[i - 1]);
+      encode_blocks(*planes[i - 1], 0, chroma_quantizer, scratch,
+                    bands[i]->dct_w, out[i]);
+      out[i] += bands[i]->dct_w * 64;
+    }
+  }
+}
+
+} // namespace
+
+void quality_quant_tables_(int quality, unsigned short *quant) {
+  // jpeg_quality_scaling
+  quality = std::max(1, std::min(100, quality));
+  long scale = quality < 50 ? 5000 / quality : 200 - 2 * quality;
+  const unsigned short *tables[2] = {kLuminanceTable, kChrominanceTable};
+  for (int t = 0; t < 2; t++) {
+    for (int c = 0; c < 64; c++) {
+      long step = (tables[t][c] * scale + 50) / 100;
+      quant[64 * t + c] = (unsigned short)std::max(1L, std::min(255L, step));
+    }
+  }
+}
+
+void encode_dct_coefficients_(const unsigned char *pixels, int height,
+                              int width, int components, bool bgr,
+                              int quality, bool normalized, int channels,
+                              band_info *band1, band_info *band2,
+                              band_info *band3) {
+  if (height <= 0 || width <= 0) {
+    throw std::runtime_error("the image should not be empty");
+  }
+  if (components != 1 && components != 3) {
+    throw std::runtime_error("the image should have 1 or 3 components");
+  }
+  if (channels != 1 && channels != 3) {
+    throw std::runtime_error("channels should be 3 or 1");
+  }
+  unsigned short quant[128];
+  quality_quant_tables_(quality, quant);
+
+  band_info *bands[3] = {band1, band2, band3};
+  set_band_dimensions(blocks(height, 8), blocks(width, 8), band1);
+  if (channels == 1) {
+    // the empty dummies the decoders return for the chroma bands
+    set_band_dimensions(0, 0, band2);
+    set_band_dimensions(0, 0, band3);
+    band2->dct_b = band3->dct_b = 0;
+  } else if (components == 3) {
+    set_band_dimensions(blocks(height, 16), blocks(width, 16), band2);
+    set_band_dimensions(blocks(height, 16), blocks(width, 16), band3);
+  } else {
+    set_band_dimensions((band1->dct_h + 1) / 2, (band1->dct_w + 1) / 2, band2);
+    set_band_dimensions((band1->dct_h + 1) / 2, (band1->dct_w + 1) / 2, band3);
+  }
+  allocate_image_bands(band1, band2, band3);
+  try {
+    if (channels == 3 && components == 1) {
+      // the empty chroma bands of grayscale images
+      for (int i = 1; i < 3; i++) {
+        std::memset(bands[i]->dct, 0,
+                    (size_t)bands[i]->dct_h * bands[i]->dct_w * 64 *
+                        sizeof(short));
+      }
+    }
+    encode_image(pixels, height, width, components, bgr, quant, normalized,
+                 channels == 3, bands);
+  } catch (...) {
+    release_image_bands(band1, band2, band3);
+    throw;
+  }
+}
+
+} // namespace common
+} // namespace jpeg2dct
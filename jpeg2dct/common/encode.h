@@ -0,0 +1,40 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#ifndef ENCODE_H_
+#define ENCODE_H_
+
+#include "dctfromjpg.h"
+
+namespace jpeg2dct {
+namespace common {
+
+// the quantization steps libjpeg's jpeg_set_quality(quality, TRUE) gives to
+// the luminance, then to the chrominance components: 2 x 64 steps in natural
+// order. `quality` is clamped to [1, 100].
+void quality_quant_tables_(int quality, unsigned short *quant);
+
+// compute the dct coefficients of a height x width x components 8 bits image
+// (1 component for grayscale images, 3 for RGB, or BGR when `bgr` is true)
+// without going through the JPEG bitstream. The coefficients are the ones
+// libjpeg computes when compressing the image with jpeg_set_defaults and
+// jpeg_set_quality(quality, TRUE): YCbCr with H2_V2 chroma subsampling, islow
+// dct. They are written to int16 bands allocated as by
+// read_dct_coefficients_from_buffer_, which returns the same bands for the
+// compressed image.
+void encode_dct_coefficients_(const unsigned char *pixels, int height,
+                              int width, int components, bool bgr,
+                              int quality, bool normalized, int channels,
+                              band_info *band1, band_info *band2,
+                              band_info *band3);
+
+} // namespace common
+} // namespace jpeg2dct
+
+#endif
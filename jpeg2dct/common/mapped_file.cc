@@ -0,0 +1,108 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#include <cerrno>
+#include <string>
+#include <system_error>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include "mapped_file.h"
+
+namespace jpeg2dct {
+namespace common {
+
+namespace {
+
+// files up to this size are read rather than mapped
+const size_t kMinMappedSize = 256 * 1024;
+
+file_error error_from_errno(const char *what, const char *filename) {
+  return file_error(std::string(what) + " " + filename + ": " +
+                    std::generic_category().message(errno));
+}
+
+// closes a file descriptor when leaving the scope
+struct file_descriptor {
+  int fd;
+  ~file_descriptor() {
+    if (fd >= 0) {
+      close(fd);
+    }
+  }
+};
+
+} // namespace
+
+mapped_file::mapped_file(const char *filename)
+    : data_(nullptr), size_(0), mapped_(false) {
+  file_descriptor file = {open(filename, O_RDONLY | O_CLOEXEC)};
+  struct stat status;
+  if (file.fd < 0 || fstat(file.fd, &status) != 0) {
+    throw error_from_errno("can't open", filename);
+  }
+  size_ = status.st_size;
+  if (size_ == 0) {
+    // left to the decoder to report
+    return;
+  }
+
+  if (size_ >= kMinMappedSize) {
+    void *data = mmap(nullptr, size_, PROT_READ, MAP_PRIVATE, file.fd, 0);
+    if (data != MAP_FAILED) {
+      // the decoder reads the file once, front to back
+      posix_madvise(data, size_, POSIX_MADV_SEQUENTIAL);
+      posix_madvise(data, size_, POSIX_MADV_WILLNEED);
+      data_ = static_cast<char *>(data);
+      mapped_ = true;
+      return;
+    }
+    // some file systems can't be mapped, fall back to reading
+  }
+
+  data_ = new char[size_];
+  size_t offset = 0;
+  while (offset < size_) {
+    ssize_t count = read(file.fd, data_ + offset, size_ - offset);
+    if (count < 0 && errno == EINTR) {
+      continue;
+    }
+    if (count <= 0) {
+      if (count == 0) {
+        // truncated while being read
+        errno = EIO;
+      }
+      file_error error = error_from_errno("can't read", filename);
+      delete[] data_;
+      throw error;
+    }
+    offset += count;
+  }
+}
+
+mapped_file::~mapped_file() {
+  if (mapped_) {
+    munmap(data_, size_);
+  } else {
+    delete[] data_;
+  }
+}
+
+void prefetch_file(const char *filename) {
+  file_descriptor file = {open(filename, O_RDONLY | O_CLOEXEC)};
+  if (file.fd >= 0) {
+    posix_fadvise(file.fd, 0, 0, POSIX_FADV_WILLNEED);
+  }
+}
+
+} // namespace common
+} // namespace jpeg2dct
@@ -0,0 +1,54 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#ifndef MAPPED_FILE_H_
+#define MAPPED_FILE_H_
+
+#include <cstddef>
+#include <stdexcept>
+
+namespace jpeg2dct {
+namespace common {
+
+// raised when a file can't be opened or read, so that the bindings can report
+// it as an I/O error
+struct file_error : std::runtime_error {
+  using std::runtime_error::runtime_error;
+};
+
+// read-only view of the whole content of a file. Large files are memory
+// mapped with a readahead hint, small ones are read at once, which costs
+// less than setting up and tearing down a mapping. Throws file_error when the
+// file can't be opened or read.
+class mapped_file {
+public:
+  explicit mapped_file(const char *filename);
+  ~mapped_file();
+
+  mapped_file(const mapped_file &) = delete;
+  mapped_file &operator=(const mapped_file &) = delete;
+
+  char *data() const { return data_; }
+  size_t size() const { return size_; }
+
+private:
+  char *data_;
+  size_t size_;
+  bool mapped_;
+};
+
+// ask the kernel to start reading `filename` into the page cache in the
+// background, so that a later mapped_file finds it there. This is only a
+// hint, failures are ignored.
+void prefetch_file(const char *filename);
+
+} // namespace common
+} // namespace jpeg2dct
+
+#endif
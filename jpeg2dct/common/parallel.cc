@@ -0,0 +1,173 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <unistd.h>
+#include <vector>
+
+#include "parallel.h"
+
+namespace jpeg2dct {
+namespace common {
+
+namespace {
+
+// the tasks of a parallel_for call, shared by the calling thread and the
+// workers which help it. Workers may pick the job up after it is over, and
+// then find no task left.
+struct job {
+  const std::function<void(int)> *task;
+  int nb_tasks;
+  // guards the fields below
+  std::mutex mutex;
+  std::condition_variable done;
+  int next_task;
+  // number of tasks being run
+  int running;
+  bool failed;
+  std::exception_ptr first_error;
+
+  job(const std::function<void(int)> *task, int nb_tasks)
+      : task(task), nb_tasks(nb_tasks), next_task(0), running(0),
+        failed(false) {}
+
+  // run tasks until none is left or one failed
+  void work() {
+    std::unique_lock<std::mutex> lock(mutex);
+    while (!failed && next_task < nb_tasks) {
+      int i = next_task++;
+      running++;
+      lock.unlock();
+      std::exception_ptr error;
+      try {
+        (*task)(i);
+      } catch (...) {
+        error = std::current_exception();
+      }
+      lock.lock();
+      if (error && !failed) {
+        failed = true;
+        first_error = error;
+      }
+      if (--running == 0) {
+        done.notify_all();
+      }
+    }
+  }
+};
+
+// threads kept from one parallel_for call to the next, so that neither their
+// start-up nor their thread-local state, such as the cached decompressors and
+// band buffers, is paid for at every call. Each call queues one entry per
+// helper it wants, picked up by the idle workers.
+class worker_pool {
+public:
+  // make sure that at least `nb_workers` threads are running
+  void reserve(int nb_workers) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    while ((int)workers_.size() < nb_workers) {
+      workers_.emplace_back([this]() { run(); });
+      // the pool lives as long as the process, see instance
+      workers_.back().detach();
+    }
+  }
+
+  void post(const std::shared_ptr<job> &shared_job, int nb_helpers) {
+    {
+      std::lock_guard<std::mutex> lock(mutex_);
+      for (int i = 0; i < nb_helpers; i++) {
+        queue_.push_back(shared_job);
+      }
+    }
+    if (nb_helpers == 1) {
+      ready_.notify_one();
+    } else {
+      ready_.notify_all();
+    }
+  }
+
+  // the pool of this process. It is never destroyed, its idle workers need not
+  // be joined at exit, and is created again in the children of a fork, which
+  // only inherit the calling thread.
+  static worker_pool *instance() {
+    static std::mutex instance_mutex;
+    static worker_pool *pool = nullptr;
+    static pid_t pool_pid = 0;
+    std::lock_guard<std::mutex> lock(instance_mutex);
+    if (pool == nullptr || pool_pid != getpid()) {
+      pool = new worker_pool();
+      pool_pid = getpid();
+    }
+    return pool;
+  }
+
+private:
+  void run() {
+    while (true) {
+      std::shared_ptr<job> next;
+      {
+        std::unique_lock<std::mutex> lock(mutex_);
+        ready_.wait(lock, [this]() { return !queue_.empty(); });
+        next = queue_.front();
+        queue_.pop_front();
+      }
+      next->work();
+    }
+  }
+
+  std::mutex mutex_;
+  std::condition_variable ready_;
+  std::deque<std::shared_ptr<job>> queue_;
+  std::vector<std::thread> workers_;
+};
+
+} // namespace
+
+int default_num_threads() {
+  unsigned int nb_cores = std::thread::hardware_concurrency();
+  return nb_cores > 0 ? (int)nb_cores : 1;
+}
+
+void parallel_for(int nb_tasks, int num_threads,
+                  const std::function<void(int)> &task) {
+  if (num_threads <= 0) {
+    num_threads = default_num_threads();
+  }
+  if (num_threads > nb_tasks) {
+    num_threads = nb_tasks;
+  }
+  if (num_threads <= 1) {
+    for (int i = 0; i < nb_tasks; i++) {
+      task(i);
+    }
+    return;
+  }
+
+  auto shared_job = std::make_shared<job>(&task, nb_tasks);
+  worker_pool *pool = worker_pool::instance();
+  pool->reserve(num_threads - 1);
+  pool->post(shared_job, num_threads - 1);
+
+  // the calling thread takes its share of the work as well, and all of it when
+  // the workers are busy, e.g. with the batch a nested call comes from
+  shared_job->work();
+  std::unique_lock<std::mutex> lock(shared_job->mutex);
+  shared_job->done.wait(lock, [&]() { return shared_job->running == 0; });
+  if (shared_job->first_error) {
+    std::rethrow_exception(shared_job->first_error);
+  }
+}
+
+} // namespace common
+} // namespace jpeg2dct
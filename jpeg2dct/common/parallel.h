@@ -0,0 +1,34 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#ifndef PARALLEL_H_
+#define PARALLEL_H_
+
+#include <functional>
+
+namespace jpeg2dct {
+namespace common {
+
+// number of threads used when the caller asks for `num_threads <= 0`
+int default_num_threads();
+
+// run `task(i)` for every i in [0, nb_tasks) on up to `num_threads` threads:
+// the calling thread and workers of a pool started on first use and kept for
+// the lifetime of the process, so that their thread-local state carries over
+// from one call to the next. Calls may be nested, the calling thread running
+// the tasks no idle worker takes. The first exception raised by a task stops
+// the scheduling of the remaining tasks and is re-thrown in the calling thread
+// once the running ones are over.
+void parallel_for(int nb_tasks, int num_threads,
+                  const std::function<void(int)> &task);
+
+} // namespace common
+} // namespace jpeg2dct
+
+#endif
@@ -0,0 +1,311 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#include <algorithm>
+#include <cmath>
+
+#include "resample.h"
+
+namespace jpeg2dct {
+namespace common {
+
+namespace {
+
+// the largest downscaling of an axis, in powers of 2: the chroma of a 4:4:4
+// image downscaled by 8 into the H2_V2 layout
+const int kMaxShrinkShift = 4;
+const int kMaxShrinkParts = 1 << kMaxShrinkShift;
+
+// 1-D operators acting on the DCT coefficients along one axis of a block.
+// `down[half]` maps the left (top) and right (bottom) blocks of a pair to the
+// block of the 2x downsampled signal, averaging pairs of samples. `up[half]`
+// maps a block to the left (top) or right (bottom) block of the 2x upsampled
+// signal, replicating samples. `shrink[s - 1][p]` maps block p of 2^s
+// consecutive blocks to the block of the 2^s x downscaled signal, keeping the
+// 8 lowest frequencies of the DCT of the 2^s blocks, which is what libjpeg's
+// scaled inverse DCTs compute.
+struct resampling_matrices {
+  float down[2][DCTSIZE][DCTSIZE];
+  float up[2][DCTSIZE][DCTSIZE];
+  float shrink[kMaxShrinkShift][kMaxShrinkParts][DCTSIZE][DCTSIZE];
+  // transposed copies, for the horizontal pass
+  float down_t[2][DCTSIZE][DCTSIZE];
+  float up_t[2][DCTSIZE][DCTSIZE];
+  float shrink_t[kMaxShrinkShift][kMaxShrinkParts][DCTSIZE][DCTSIZE];
+};
+
+// orthonormal DCT-II of size n, which is the scaling used by JPEG
+double dct_basis(int n, int k, int x) {
+  const double pi = std::acos(-1.0);
+  double scale = std::sqrt((k == 0 ? 1.0 : 2.0) / n);
+  return scale * std::cos((2 * x + 1) * k * pi / (2 * n));
+}
+
+resampling_matrices compute_resampling_matrices() {
+  double dct[DCTSIZE][DCTSIZE];
+  for (int k = 0; k < DCTSIZE; k++) {
+    for (int n = 0; n < DCTSIZE; n++) {
+      dct[k][n] = dct_basis(DCTSIZE, k, n);
+    }
+  }
+
+  resampling_matrices matrices;
+  for (int half = 0; half < 2; half++) {
+    for (int k = 0; k < DCTSIZE; k++) {
+      for (int u = 0; u < DCTSIZE; u++) {
+        // downsampled sample m averages the samples 2m and 2m + 1 of the
+        // pair, which belong to block `half` for m in [4 half, 4 half + 4)
+        double down = 0;
+        for (int m = 4 * half; m < 4 * half + 4; m++) {
+          for (int n = 2 * m; n < 2 * m + 2; n++) {
+            down += dct[k][m] * 0.5 * dct[u][n - DCTSIZE * half];
+          }
+        }
+        // upsampled sample n of block `half` is the sample 4 half + n / 2
+        double up = 0;
+        for (int n = 0; n < DCTSIZE; n++) {
+          up += dct[k][n] * dct[u][4 * half + n / 2];
+        }
+        matrices.down[half][k][u] = matrices.down_t[half][u][k] = (float)down;
+        matrices.up[half][k][u] = matrices.up_t[half][u][k] = (float)up;
+      }
+    }
+  }
+  for (int shift = 1; shift <= kMaxShrinkShift; shift++) {
+    // the DCT of the parts x 8 samples, scaled so that a constant signal
+    // keeps the coefficients of a constant block
+    int parts = 1 << shift, size = parts * DCTSIZE;
+    double scale = 1.0 / std::sqrt((double)parts);
+    for (int p = 0; p < parts; p++) {
+      for (int k = 0; k < DCTSIZE; k++) {
+        for (int u = 0; u < DCTSIZE; u++) {
+          double shrink = 0;
+          for (int n = 0; n < DCTSIZE; n++) {
+            shrink += dct_basis(size, k, p * DCTSIZE + n) * dct[u][n];
+          }
+          matrices.shrink[shift - 1][p][k][u] =
+              matrices.shrink_t[shift - 1][p][u][k] = (float)(scale * shrink);
+        }
+      }
+    }
+  }
+  return matrices;
+}
+
+const resampling_matrices &get_resampling_matrices() {
+  static const resampling_matrices matrices = compute_resampling_matrices();
+  return matrices;
+}
+
+// how one axis of a component is brought to the resolution of its band:
+// output block i combines the `parts` source blocks starting at
+// (i / phases) * parts, source block p through the matrix
+// [(i % phases) * parts + p]. Null matrices copy the blocks as they are.
+struct axis_operator {
+  int parts;
+  int phases;
+  const float (*matrices)[DCTSIZE][DCTSIZE];
+  const float (*transposed)[DCTSIZE][DCTSIZE];
+};
+
+// the operator bringing an axis of a component sampled `samp_factor` times
+// out of `max_samp_factor` to its band: the H2_V2 layout when `h2_v2` is true
+// and the resolution of the component otherwise, in the image downscaled by
+// 2^`scale_shift`. Returns false for the sampling factors it cannot handle.
+bool get_axis_operator(int max_samp_factor, int samp_factor, bool h2_v2,
+                       int scale_shift, axis_operator *op) {
+  const resampling_matrices &matrices = get_resampling_matrices();
+  if (samp_factor <= 0 || max_samp_factor % samp_factor != 0) {
+    return false;
+  }
+  // the number of luminance samples per sample of the component and of the
+  // band
+  int ratio = max_samp_factor / samp_factor;
+  int band_ratio = (h2_v2 ? 2 : ratio) << scale_shift;
+  *op = axis_operator{1, 1, nullptr, nullptr};
+  if (band_ratio == ratio) {
+    return true;
+  }
+  if (2 * band_ratio == ratio && scale_shift == 0) {
+    *op = axis_operator{1, 2, matrices.up, matrices.up_t};
+    return true;
+  }
+  if (band_ratio == 2 * ratio && scale_shift == 0) {
+    *op = axis_operator{2, 1, matrices.down, matrices.down_t};
+    return true;
+  }
+  for (int shift = 1; shift <= kMaxShrinkShift; shift++) {
+    if (band_ratio == ratio << shift) {
+      *op = axis_operator{1 << shift, 1, matrices.shrink[shift - 1],
+                          matrices.shrink_t[shift - 1]};
+      return true;
+    }
+  }
+  return false;
+}
+
+// out[v][k] += sum_u matrix[k][u] in[v][u]: resampling along the horizontal
+// frequencies of a block, given the transposed matrix. Quantization leaves
+// most coefficients at zero, they are skipped.
+void accumulate_horizontal(const float (*transposed)[DCTSIZE], const float *in,
+                           float *out) {
+  for (int v = 0; v < DCTSIZE; v++) {
+    for (int u = 0; u < DCTSIZE; u++) {
+      float value = in[v * DCTSIZE + u];
+      if (value == 0.0f) {
+        continue;
+      }
+      for (int k = 0; k < DCTSIZE; k++) {
+        out[v * DCTSIZE + k] += value * transposed[u][k];
+      }
+    }
+  }
+}
+
+// out[k][u] += sum_v matrix[k][v] in[v][u]: resampling along the vertical
+// frequencies of a block, skipping the empty rows of frequencies
+void accumulate_vertical(const float (*matrix)[DCTSIZE], const float *in,
+                         float *out) {
+  for (int v = 0; v < DCTSIZE; v++) {
+    const float *in_row = in + v * DCTSIZE;
+    bool empty = true;
+    for (int u = 0; u < DCTSIZE && empty; u++) {
+      empty = in_row[u] == 0.0f;
+    }
+    if (empty) {
+      continue;
+    }
+    for (int k = 0; k < DCTSIZE; k++) {
+      float weight = matrix[k][v];
+      for (int u = 0; u < DCTSIZE; u++) {
+        out[k * DCTSIZE + u] += weight * in_row[u];
+      }
+    }
+  }
+}
+
+// dequantize source block row `row` and resample it horizontally into the
+// `dct_w` blocks of floats starting at column `first_col`
+void resample_row(jpeg_decompress_struct *srcinfo, jvirt_barray_ptr coef_array,
+                  jpeg_component_info *compptr, JDIMENSION row,
+                  const axis_operator &op, JDIMENSION first_col,
+                  JDIMENSION dct_w, float *out) {
+  const UINT16 *quantval =
+      srcinfo->quant_tbl_ptrs[compptr->quant_tbl_no]->quantval;
+  JBLOCKROW blocks = (srcinfo->mem->access_virt_barray)(
+      (j_common_ptr)srcinfo, coef_array, row, (JDIMENSION)1, FALSE)[0];
+  JDIMENSION last = compptr->width_in_blocks - 1;
+
+  float source[DCTSIZE2];
+  auto dequantize = [&](JDIMENSION col, float *block) {
+    col = std::min(col, last);
+    for (int c = 0; c < DCTSIZE2; c++) {
+      block[c] = (float)blocks[col][c] * quantval[c];
+    }
+  };
+
+  for (JDIMENSION i = 0; i < dct_w; i++) {
+    JDIMENSION col = first_col + i;
+    float *block = out + i * DCTSIZE2;
+    if (op.matrices == nullptr) {
+      dequantize(col, block);
+      continue;
+    }
+    std::fill(block, block + DCTSIZE2, 0.0f);
+    for (int p = 0; p < op.parts; p++) {
+      dequantize(col / op.phases * op.parts + p, source);
+      accumulate_horizontal(op.transposed[col % op.phases * op.parts + p],
+                            source, block);
+    }
+  }
+}
+
+} // namespace
+
+bool can_resample_chroma(jpeg_decompress_struct *srcinfo) {
+  if (srcinfo->num_components != 3 ||
+      srcinfo->comp_info[0].h_samp_factor != srcinfo->max_h_samp_factor ||
+      srcinfo->comp_info[0].v_samp_factor != srcinfo->max_v_samp_factor) {
+    return false;
+  }
+  axis_operator op;
+  for (int compNum = 1; compNum < 3; compNum++) {
+    jpeg_component_info *compptr = &srcinfo->comp_info[compNum];
+    if (!get_axis_operator(srcinfo->max_h_samp_factor, compptr->h_samp_factor,
+                           true, 0, &op) ||
+        !get_axis_operator(srcinfo->max_v_samp_factor, compptr->v_samp_factor,
+                           true, 0, &op)) {
+      return false;
+    }
+  }
+  return true;
+}
+
+JBLOCKARRAY resample_component(jpeg_decompress_struct *srcinfo,
+                               jvirt_barray_ptr *src_coef_arrays, int compNum,
+                               bool h2_v2, int scale_shift,
+                               JDIMENSION first_row, JDIMENSION first_col,
+                               JDIMENSION dct_h, JDIMENSION dct_w) {
+  jpeg_component_info *compptr = &srcinfo->comp_info[compNum];
+  h2_v2 = h2_v2 && compNum > 0;
+  axis_operator h_op, v_op;
+  get_axis_operator(srcinfo->max_h_samp_factor, compptr->h_samp_factor, h2_v2,
+                    scale_shift, &h_op);
+  get_axis_operator(srcinfo->max_v_samp_factor, compptr->v_samp_factor, h2_v2,
+                    scale_shift, &v_op);
+
+  // everything lives in the image pool, which is released with `srcinfo`
+  // even when libjpeg bails out
+  JBLOCKARRAY output = (srcinfo->mem->alloc_barray)(
+      (j_common_ptr)srcinfo, JPOOL_IMAGE, dct_w, dct_h);
+  size_t row_bytes = sizeof(float) * dct_w * DCTSIZE2;
+  float *source = (float *)(srcinfo->mem->alloc_large)(
+      (j_common_ptr)srcinfo, JPOOL_IMAGE, row_bytes);
+  float *resampled = (float *)(srcinfo->mem->alloc_large)(
+      (j_common_ptr)srcinfo, JPOOL_IMAGE, row_bytes);
+
+  JDIMENSION last = compptr->height_in_blocks - 1;
+  const UINT16 *quantval =
+      srcinfo->quant_tbl_ptrs[compptr->quant_tbl_no]->quantval;
+  auto resample_source_row = [&](JDIMENSION row, float *out) {
+    resample_row(srcinfo, src_coef_arrays[compNum], compptr,
+                 std::min(row, last), h_op, first_col, dct_w, out);
+  };
+  for (JDIMENSION i = 0; i < dct_h; i++) {
+    JDIMENSION row = first_row + i;
+    if (v_op.matrices == nullptr) {
+      resample_source_row(row, resampled);
+    } else {
+      std::fill(resampled, resampled + dct_w * DCTSIZE2, 0.0f);
+      for (int p = 0; p < v_op.parts; p++) {
+        resample_source_row(row / v_op.phases * v_op.parts + p, source);
+        const float(*matrix)[DCTSIZE] =
+            v_op.matrices[row % v_op.phases * v_op.parts + p];
+        for (JDIMENSION col = 0; col < dct_w; col++) {
+          accumulate_vertical(matrix, source + col * DCTSIZE2,
+                              resampled + col * DCTSIZE2);
+        }
+      }
+    }
+
+    // quantize back with the component's table
+    for (JDIMENSION col = 0; col < dct_w; col++) {
+      const float *block = resampled + col * DCTSIZE2;
+      for (int c = 0; c < DCTSIZE2; c++) {
+        float value = std::round(block[c] / quantval[c]);
+        value = std::max(-32768.0f, std::min(32767.0f, value));
+        output[i][col][c] = (JCOEF)value;
+      }
+    }
+  }
+  return output;
+}
+
+} // namespace common
+} // namespace jpeg2dct
@@ -0,0 +1,44 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#ifndef RESAMPLE_H_
+#define RESAMPLE_H_
+
+#include <stdio.h>
+
+// Has to come after `stdio.h`
+#include <jpeglib.h>
+
+namespace jpeg2dct {
+namespace common {
+
+// whether the chroma components of `srcinfo` can be converted to the H2_V2
+// layout in the DCT domain: the luminance has to be at full resolution and
+// each chroma axis subsampled by 1, 2 or 4
+bool can_resample_chroma(jpeg_decompress_struct *srcinfo);
+
+// resample the coefficients of component `compNum` to the `dct_h` x `dct_w`
+// blocks starting at (`first_row`, `first_col`) of its band, without going
+// through the pixel domain. The band is the component in the image downscaled
+// by 2^`scale_shift` (0 to 3), brought to the H2_V2 layout for the chroma
+// components when `h2_v2` is true, which requires `can_resample_chroma`.
+// Chroma is brought to H2_V2 by averaging or replicating samples, and
+// downscaling keeps the lowest frequencies of the DCT of the blocks combined
+// into each block. The returned blocks are quantized with the component's
+// quantization table and belong to the image memory pool of `srcinfo`.
+JBLOCKARRAY resample_component(jpeg_decompress_struct *srcinfo,
+                               jvirt_barray_ptr *src_coef_arrays, int compNum,
+                               bool h2_v2, int scale_shift,
+                               JDIMENSION first_row, JDIMENSION first_col,
+                               JDIMENSION dct_h, JDIMENSION dct_w);
+
+} // namespace common
+} // namespace jpeg2dct
+
+#endif
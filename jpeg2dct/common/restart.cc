@@ -0,0 +1,141 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#include <cstring>
+
+#include "restart.h"
+
+namespace jpeg2dct {
+namespace common {
+
+namespace {
+
+const unsigned char M_SOF0 = 0xC0;
+const unsigned char M_SOF1 = 0xC1;
+const unsigned char M_RST0 = 0xD0;
+const unsigned char M_RST7 = 0xD7;
+const unsigned char M_SOI = 0xD8;
+const unsigned char M_EOI = 0xD9;
+const unsigned char M_SOS = 0xDA;
+const unsigned char M_DRI = 0xDD;
+
+size_t read_uint16(const unsigned char *data) {
+  return ((size_t)data[0] << 8) | data[1];
+}
+
+// every SOFn marker, leaving out DHT, JPG and DAC which share the range
+bool is_sof(unsigned char marker) {
+  return marker >= 0xC0 && marker <= 0xCF && marker != 0xC4 &&
+         marker != 0xC8 && marker != 0xCC;
+}
+
+} // namespace
+
+bool index_restart_segments(const unsigned char *buffer, size_t buffer_len,
+                            restart_index *index) {
+  if (buffer_len < 4 || buffer[0] != 0xFF || buffer[1] != M_SOI) {
+    return false;
+  }
+
+  // the markers up to the first scan
+  bool sequential = false, restarts = false;
+  size_t pos = 2;
+  while (true) {
+    if (pos >= buffer_len || buffer[pos] != 0xFF) {
+      return false;
+    }
+    // markers may be preceded by fill bytes
+    while (pos < buffer_len && buffer[pos] == 0xFF) {
+      pos++;
+    }
+    if (pos + 3 > buffer_len) {
+      return false;
+    }
+    unsigned char marker = buffer[pos];
+    size_t segment = pos + 1;
+    size_t length = read_uint16(buffer + segment);
+    if (length < 2 || segment + length > buffer_len) {
+      return false;
+    }
+    if (is_sof(marker)) {
+      // progressive, lossless and arithmetic coded images are left out
+      if ((marker != M_SOF0 && marker != M_SOF1) || length < 8) {
+        return false;
+      }
+      sequential = true;
+      index->height_offset = segment + 3;
+    } else if (marker == M_DRI) {
+      restarts = length >= 4 && read_uint16(buffer + segment + 2) > 0;
+    }
+    pos = segment + length;
+    if (marker == M_SOS) {
+      break;
+    }
+  }
+  if (!sequential || !restarts) {
+    return false;
+  }
+  index->header_len = pos;
+  index->segments.assign(1, pos);
+
+  // in the entropy coded data, a 0xFF byte is followed by a stuffed zero, by
+  // fill bytes or by a marker
+  while (true) {
+    const unsigned char *ff = static_cast<const unsigned char *>(
+        std::memchr(buffer + pos, 0xFF, buffer_len - pos));
+    if (ff == nullptr) {
+      return false;
+    }
+    pos = ff - buffer + 1;
+    while (pos < buffer_len && buffer[pos] == 0xFF) {
+      pos++;
+    }
+    if (pos >= buffer_len) {
+      return false;
+    }
+    unsigned char marker = buffer[pos++];
+    if (marker >= M_RST0 && marker <= M_RST7) {
+      index->segments.push_back(pos);
+    } else if (marker != 0) {
+      // anything but the end of the image means more scans or a DNL marker
+      index->data_end = ff - buffer;
+      return marker == M_EOI;
+    }
+  }
+}
+
+void extract_restart_segments(const unsigned char *buffer,
+                              const restart_index &index, size_t first,
+                              size_t last, unsigned height,
+                              std::vector<unsigned char> *output) {
+  size_t start = index.segments[first];
+  size_t end = last < index.segments.size() ? index.segments[last] - 2
+                                            : index.data_end;
+  output->resize(index.header_len + (end - start) + 2);
+  unsigned char *data = output->data();
+
+  std::memcpy(data, buffer, index.header_len);
+  data[index.height_offset] = (unsigned char)(height >> 8);
+  data[index.height_offset + 1] = (unsigned char)(height & 0xFF);
+
+  unsigned char *segments = data + index.header_len;
+  std::memcpy(segments, buffer + start, end - start);
+  // the decoder expects the restart markers to count from RST0
+  for (size_t i = first + 1; i < last; i++) {
+    segments[index.segments[i] - 1 - start] =
+        (unsigned char)(M_RST0 + (i - first - 1) % 8);
+  }
+
+  unsigned char *eoi = segments + (end - start);
+  eoi[0] = 0xFF;
+  eoi[1] = M_EOI;
+}
+
+} // namespace common
+} // namespace jpeg2dct
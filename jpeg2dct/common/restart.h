@@ -0,0 +1,49 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#ifndef RESTART_H_
+#define RESTART_H_
+
+#include <cstddef>
+#include <vector>
+
+namespace jpeg2dct {
+namespace common {
+
+// layout of a JPEG image coded as a single sequential Huffman scan with
+// restart markers, whose restart segments can be entropy decoded on their own
+struct restart_index {
+  // size of everything up to the end of the SOS segment
+  size_t header_len;
+  // offset of the image height in the SOF segment
+  size_t height_offset;
+  // offset of the first byte of each restart segment
+  std::vector<size_t> segments;
+  // offset of the marker ending the entropy coded data
+  size_t data_end;
+};
+
+// scan the markers of `buffer` and the RST markers of its entropy coded data.
+// Returns false for images which are not a single sequential Huffman scan
+// with restart markers.
+bool index_restart_segments(const unsigned char *buffer, size_t buffer_len,
+                            restart_index *index);
+
+// build a JPEG image of its own holding the restart segments [first, last) of
+// an image indexed by `index`, which are `height` pixels high. The restart
+// markers are renumbered from RST0.
+void extract_restart_segments(const unsigned char *buffer,
+                              const restart_index &index, size_t first,
+                              size_t last, unsigned height,
+                              std::vector<unsigned char> *output);
+
+} // namespace common
+} // namespace jpeg2dct
+
+#endif
@@ -0,0 +1,278 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include "sparse.h"
+
+namespace jpeg2dct {
+namespace common {
+
+namespace {
+
+// natural index of each zigzag position
+const int kZigzag[64] = {
+    0,  1,  8,  16, 9,  2,  3,  10, 17, 24, 32, 25, 18, 11, 4,  5,
+    12, 19, 26, 33, 40, 48, 41, 34, 27, 20, 13, 6,  7,  14, 21, 28,
+    35, 42, 49, 56, 57, 50, 43, 36, 29, 22, 15, 23, 30, 37, 44, 51,
+    58, 59, 52, 45, 38, 31, 39, 46, 53, 60, 61, 54, 47, 55, 62, 63};
+
+// a token holds runs up to kMaxRun, kLongRun escapes the run to a byte
+const int kMaxRun = 6;
+const int kLongRun = 7;
+// and values in [-kMaxValue, kMaxValue], 0 escapes the value to a varint
+const int kMaxValue = 15;
+
+void put_varint(int32_t value, std::string *output) {
+  // zigzag mapping of the sign, then 7 bits per byte
+  uint32_t bits = ((uint32_t)value << 1) ^ (uint32_t)(value >> 31);
+  while (bits >= 0x80) {
+    output->push_back((char)(bits | 0x80));
+    bits >>= 7;
+  }
+  output->push_back((char)bits);
+}
+
+[[noreturn]] void malformed() {
+  throw std::runtime_error("malformed sparse band");
+}
+
+// reads the bytes of a band, throwing when running past its end
+struct byte_reader {
+  const unsigned char *data;
+  const unsigned char *end;
+
+  inline int next() {
+    if (data == end) {
+      malformed();
+    }
+    return *data++;
+  }
+
+  int32_t varint() {
+    uint32_t bits = 0;
+    for (int shift = 0; shift < 35; shift += 7) {
+      int byte = next();
+      bits |= (uint32_t)(byte & 0x7f) << shift;
+      if (byte < 0x80) {
+        return (int32_t)(bits >> 1) ^ -(int32_t)(bits & 1);
+      }
+    }
+    malformed();
+  }
+};
+
+inline short saturate_short(int value) {
+  return (short)std::max(-32768, std::min(32767, value));
+}
+
+const char kMagic[4] = {'J', '2', 'D', 'S'};
+const int kVersion = 1;
+// magic, version and number of bands
+const size_t kHeaderLen = 6;
+// dct_h, dct_w, length of the coded band and quantization steps
+const size_t kBandHeaderLen = 3 * 4 + 64 * 2;
+
+void put_uint(uint32_t value, int nb_bytes, std::string *output) {
+  for (int i = 0; i < nb_bytes; i++) {
+    output->push_back((char)(value >> (8 * i)));
+  }
+}
+
+uint32_t get_uint(const unsigned char *data, int nb_bytes) {
+  uint32_t value = 0;
+  for (int i = 0; i < nb_bytes; i++) {
+    value |= (uint32_t)data[i] << (8 * i);
+  }
+  return value;
+}
+
+} // namespace
+
+void pack_sparse_band_(const short *dct, size_t nb_blocks,
+                       std::string *output) {
+  int32_t previous_dc = 0;
+  for (size_t b = 0; b < nb_blocks; b++) {
+    const short *block = dct + b * 64;
+    int32_t values[64];
+    for (int k = 0; k < 64; k++) {
+      values[k] = block[kZigzag[k]];
+    }
+    values[0] -= previous_dc;
+    previous_dc = block[0];
+
+    int count = 0;
+    for (int k = 0; k < 64; k++) {
+      count += values[k] != 0;
+    }
+    output->push_back((char)count);
+    int last = -1;
+    for (int k = 0; k < 64; k++) {
+      int32_t value = values[k];
+      if (value == 0) {
+        continue;
+      }
+      int run = k - last - 1;
+      last = k;
+      bool long_run = run > kMaxRun;
+      bool large_value = value < -kMaxValue || value > kMaxValue;
+      output->push_back((char)((long_run ? kLongRun : run) << 5 |
+                               (large_value ? 0 : value & 31)));
+      if (long_run) {
+        output->push_back((char)run);
+      }
+      if (large_value) {
+        put_varint(value, output);
+      }
+    }
+  }
+}
+
+void unpack_sparse_band_(const char *data, size_t data_len,
+                         const unsigned short *quant, short *dct,
+                         size_t nb_blocks) {
+  byte_reader reader = {reinterpret_cast<const unsigned char *>(data),
+                        reinterpret_cast<const unsigned char *>(data) +
+                            data_len};
+  // zeros stay zeros, only the decoded coefficients are normalized
+  int steps[64];
+  for (int c = 0; c < 64; c++) {
+    steps[c] = quant != nullptr ? quant[c] : 1;
+  }
+  short previous_dc = 0;
+  for (size_t b = 0; b < nb_blocks; b++) {
+    short block[64] = {0};
+    int dc = previous_dc;
+    int count = reader.next();
+    int position = -1;
+    for (int k = 0; k < count; k++) {
+      int token = reader.next();
+      int run = token >> 5;
+      if (run == kLongRun) {
+        run = reader.next();
+      }
+      position += run + 1;
+      if (position >= 64) {
+        malformed();
+      }
+      int code = token & 31;
+      int value =
+          code != 0 ? (code ^ 16) - 16 : saturate_short(reader.varint());
+      if (position == 0) {
+        dc += value;
+      } else {
+        int index = kZigzag[position];
+        block[index] = saturate_short(value * steps[index]);
+      }
+    }
+    previous_dc = (short)dc;
+    block[0] = saturate_short(previous_dc * steps[0]);
+    std::memcpy(dct + b * 64, block, sizeof(block));
+  }
+  if (reader.data != reader.end) {
+    malformed();
+  }
+}
+
+void pack_sparse_(const band_info *bands, int nb_bands,
+                  const unsigned short *quant, std::string *output) {
+  std::vector<std::string> coded(nb_bands);
+  for (int i = 0; i < nb_bands; i++) {
+    if (bands[i].dct_b != 64 && bands[i].dct_h * bands[i].dct_w != 0) {
+      throw std::runtime_error("bands should hold the 64 coefficients");
+    }
+    pack_sparse_band_(static_cast<const short *>(bands[i].dct),
+                      (size_t)bands[i].dct_h * bands[i].dct_w, &coded[i]);
+  }
+  output->append(kMagic, sizeof(kMagic));
+  put_uint(kVersion, 1, output);
+  put_uint(nb_bands, 1, output);
+  for (int i = 0; i < nb_bands; i++) {
+    put_uint(bands[i].dct_h, 4, output);
+    put_uint(bands[i].dct_w, 4, output);
+    put_uint(coded[i].size(), 4, output);
+    for (int c = 0; c < 64; c++) {
+      put_uint(quant[64 * i + c], 2, output);
+    }
+  }
+  for (auto &band : coded) {
+    output->append(band);
+  }
+}
+
+void unpack_sparse_(const char *data, size_t data_len, bool normalized,
+                    band_info *band1, band_info *band2, band_info *band3,
+                    int *nb_bands) {
+  const unsigned char *bytes = reinterpret_cast<const unsigned char *>(data);
+  if (data_len < kHeaderLen || std::memcmp(data, kMagic, sizeof(kMagic)) != 0) {
+    throw std::runtime_error("not a sparse coefficients buffer");
+  }
+  if (bytes[4] != kVersion) {
+    throw std::runtime_error("unsupported sparse coefficients version " +
+                             std::to_string(bytes[4]));
+  }
+  *nb_bands = bytes[5];
+  if ((*nb_bands != 1 && *nb_bands != 3) ||
+      data_len < kHeaderLen + *nb_bands * kBandHeaderLen) {
+    malformed();
+  }
+
+  band_info *bands[3] = {band1, band2, band3};
+  size_t band_lens[3] = {0, 0, 0};
+  unsigned short quant[3][64];
+  // the headers give the dimensions of the bands, which are allocated at once
+  size_t offset = kHeaderLen + *nb_bands * kBandHeaderLen;
+  for (int i = 0; i < 3; i++) {
+    bands[i]->dct = nullptr;
+    bands[i]->dct_h = bands[i]->dct_w = 0;
+    bands[i]->dct_b = 64;
+    bands[i]->dtype = DTYPE_INT16;
+    if (i < *nb_bands) {
+      const unsigned char *header = bytes + kHeaderLen + i * kBandHeaderLen;
+      bands[i]->dct_h = get_uint(header, 4);
+      bands[i]->dct_w = get_uint(header + 4, 4);
+      band_lens[i] = get_uint(header + 8, 4);
+      for (int c = 0; c < 64; c++) {
+        quant[i][c] = get_uint(header + 12 + 2 * c, 2);
+      }
+      // each block takes at least one byte
+      size_t nb_blocks = (size_t)bands[i]->dct_h * bands[i]->dct_w;
+      if (band_lens[i] > data_len - offset || nb_blocks > band_lens[i]) {
+        malformed();
+      }
+      offset += band_lens[i];
+    }
+  }
+  if (offset != data_len) {
+    malformed();
+  }
+
+  allocate_image_bands(band1, band2, band3);
+  offset = kHeaderLen + *nb_bands * kBandHeaderLen;
+  try {
+    for (int i = 0; i < 3; i++) {
+      size_t nb_blocks = (size_t)bands[i]->dct_h * bands[i]->dct_w;
+      unpack_sparse_band_(data + offset, band_lens[i],
+                          normalized ? quant[i] : nullptr,
+                          static_cast<short *>(bands[i]->dct), nb_blocks);
+      offset += band_lens[i];
+    }
+  } catch (...) {
+    release_image_bands(band1, band2, band3);
+    throw;
+  }
+}
+
+} // namespace common
+} // namespace jpeg2dct
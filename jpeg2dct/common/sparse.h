@@ -0,0 +1,61 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#ifndef SPARSE_H_
+#define SPARSE_H_
+
+#include <cstddef>
+#include <string>
+
+#include "dctfromjpg.h"
+
+namespace jpeg2dct {
+namespace common {
+
+// Compact storage of quantized dct coefficients, designed to be unpacked
+// much faster than JPEG's Huffman coding. Each block is coded in zigzag order
+// as its number of non zero coefficients followed by one token per non zero
+// coefficient: a byte holding the run of zeros before it on 3 bits and its
+// value on 5 bits, larger runs and values being escaped to extra bytes. The
+// DC coefficient is coded as the difference with the previous block's.
+
+// append the sparse coding of `nb_blocks` blocks of 64 coefficients in
+// natural order to `output`
+void pack_sparse_band_(const short *dct, size_t nb_blocks, std::string *output);
+
+// decode `nb_blocks` blocks packed by pack_sparse_band_ into `dct`. When
+// `quant` is not null, the coefficients are multiplied by these 64
+// quantization steps, saturating to int16. Throws std::runtime_error for
+// malformed data.
+void unpack_sparse_band_(const char *data, size_t data_len,
+                         const unsigned short *quant, short *dct,
+                         size_t nb_blocks);
+
+// The sparse coefficients of an image are stored after a header holding the
+// "J2DS" magic, a version byte and the number of bands, then for each band its
+// block grid (dct_h, dct_w), the length of its sparse coding and the 64
+// quantization steps normalizing it, all little-endian.
+
+// pack the int16 bands of an image, holding the 64 coefficients of each
+// block, with `quant` the nb_bands x 64 quantization steps of the bands
+void pack_sparse_(const band_info *bands, int nb_bands,
+                  const unsigned short *quant, std::string *output);
+
+// unpack the bands of an image packed by pack_sparse_, normalized with their
+// quantization steps when `normalized` is true. The bands are allocated as
+// by read_dct_coefficients_from_buffer_, the ones missing from a single band
+// image being left empty. Throws std::runtime_error for malformed data.
+void unpack_sparse_(const char *data, size_t data_len, bool normalized,
+                    band_info *band1, band_info *band2, band_info *band3,
+                    int *nb_bands);
+
+} // namespace common
+} // namespace jpeg2dct
+
+#endif
@@ -0,0 +1,127 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#include <chrono>
+#include <exception>
+
+#include "stats.h"
+
+namespace jpeg2dct {
+namespace common {
+
+namespace {
+
+// relaxed atomics: the values are only ever added to, and read as a whole
+// once the decoding threads are done with them
+std::atomic<long long> counters[kNumCounters];
+std::atomic<long long> phase_ns[kNumPhases];
+std::atomic<long long> total_ns;
+std::atomic<trace_hook> hook(nullptr);
+
+thread_local decode_trace *thread_trace = nullptr;
+
+void add(std::atomic<long long> *value, long long amount) {
+  value->fetch_add(amount, std::memory_order_relaxed);
+}
+
+long long read(std::atomic<long long> *value, bool reset) {
+  return reset ? value->exchange(0, std::memory_order_relaxed)
+               : value->load(std::memory_order_relaxed);
+}
+
+// account for a decoded or failed image and hand its trace to the hook
+void publish(decode_trace *trace, long long start_ns) {
+  trace->total_ns = now_ns() - start_ns;
+  add(&total_ns, trace->total_ns);
+  add(&counters[COUNTER_BYTES], trace->bytes);
+  if (trace->error != nullptr) {
+    add(&counters[COUNTER_FAILURES], 1);
+  } else {
+    add(&counters[COUNTER_IMAGES], 1);
+    if (trace->decode_path >= 0 && trace->decode_path < 3) {
+      add(&counters[COUNTER_DIRECT + trace->decode_path], 1);
+    }
+    add(&counters[COUNTER_SEGMENTED], trace->segmented);
+    add(&counters[COUNTER_PROGRESSIVE], trace->progressive);
+    add(&counters[COUNTER_CROPPED], trace->cropped);
+  }
+  trace_hook current = hook.load();
+  if (current != nullptr) {
+    current(trace);
+  }
+}
+
+} // namespace
+
+void get_decoder_stats(bool reset, decoder_stats *stats) {
+  for (int i = 0; i < kNumCounters; i++) {
+    stats->counters[i] = read(&counters[i], reset);
+  }
+  for (int i = 0; i < kNumPhases; i++) {
+    stats->phase_ns[i] = read(&phase_ns[i], reset);
+  }
+  stats->total_ns = read(&total_ns, reset);
+}
+
+void set_trace_hook(trace_hook new_hook) { hook.store(new_hook); }
+
+void trace_decode(unsigned long bytes, bool cropped,
+                  const std::function<void()> &decode) {
+  decode_trace trace;
+  trace.bytes = bytes;
+  trace.image_h = trace.image_w = 0;
+  trace.num_components = 0;
+  trace.progressive = false;
+  trace.decode_path = -1;
+  trace.segmented = false;
+  trace.cropped = cropped;
+  trace.error = nullptr;
+  for (int i = 0; i < kNumPhases; i++) {
+    trace.phase_ns[i].store(0, std::memory_order_relaxed);
+  }
+  long long start_ns = now_ns();
+  trace_scope scope(&trace);
+  try {
+    decode();
+  } catch (std::exception &e) {
+    trace.error = e.what();
+    publish(&trace, start_ns);
+    throw;
+  } catch (...) {
+    trace.error = "unknown exception";
+    publish(&trace, start_ns);
+    throw;
+  }
+  publish(&trace, start_ns);
+}
+
+decode_trace *current_trace() { return thread_trace; }
+
+trace_scope::trace_scope(decode_trace *trace) : previous_(thread_trace) {
+  thread_trace = trace;
+}
+
+trace_scope::~trace_scope() { thread_trace = previous_; }
+
+long long now_ns() {
+  return std::chrono::duration_cast<std::chrono::nanoseconds>(
+             std::chrono::steady_clock::now().time_since_epoch())
+      .count();
+}
+
+void add_phase_time(decode_phase phase, long long start_ns) {
+  long long elapsed = now_ns() - start_ns;
+  add(&phase_ns[phase], elapsed);
+  if (thread_trace != nullptr) {
+    add(&thread_trace->phase_ns[phase], elapsed);
+  }
+}
+
+} // namespace common
+} // namespace jpeg2dct
@@ -0,0 +1,119 @@
+//Copyright (c) 2018 Uber Technologies, Inc.
+//
+//Licensed under the Uber Non-Commercial License (the "License");
+//you may not use this file except in compliance with the License.
+//You may obtain a copy of the License at the root directory of this project.
+//
+//See the License for the specific language governing permissions and
+//limitations under the License.
+
+#ifndef STATS_H_
+#define STATS_H_
+
+#include <atomic>
+#include <functional>
+
+namespace jpeg2dct {
+namespace common {
+
+// the phases of decoding whose time is accumulated
+enum decode_phase {
+  // jpeg_read_header
+  PHASE_HEADER = 0,
+  // jpeg_read_coefficients, the entropy decoding
+  PHASE_COEFFICIENTS = 1,
+  // writing the coefficients to the bands
+  PHASE_COPY = 2,
+  // resampling the chroma coefficients in the DCT domain
+  PHASE_RESAMPLE = 3,
+  // transcoding the image to H2_V2 through the pixel domain
+  PHASE_TRANSCODE = 4,
+  kNumPhases = 5
+};
+
+// what is counted over the decoded images
+enum decode_counter {
+  // images decoded, and images whose decoding failed
+  COUNTER_IMAGES = 0,
+  COUNTER_FAILURES = 1,
+  // bytes of the decoded and failed images
+  COUNTER_BYTES = 2,
+  // decoded images taking each decode_path
+  COUNTER_DIRECT = 3,
+  COUNTER_RESAMPLE = 4,
+  COUNTER_TRANSCODE = 5,
+  // decoded images whose restart segments were decoded concurrently
+  COUNTER_SEGMENTED = 6,
+  COUNTER_PROGRESSIVE = 7,
+  COUNTER_CROPPED = 8,
+  kNumCounters = 9
+};
+
+// what happened while decoding one image. The phases run on other threads for
+// the images decoded in segments, hence the atomic timings.
+struct decode_trace {
+  unsigned long bytes;
+  // filled once the header has been read, decode_path staying -1 otherwise
+  unsigned int image_h;
+  unsigned int image_w;
+  int num_components;
+  bool progressive;
+  int decode_path;
+  bool segmented;
+  bool cropped;
+  // null when the image was decoded
+  const char *error;
+  std::atomic<long long> phase_ns[kNumPhases];
+  long long total_ns;
+};
+
+// cumulative counters and timings since the start of the process or the last
+// reset. Each value is read atomically, but not all of them at once.
+struct decoder_stats {
+  long long counters[kNumCounters];
+  long long phase_ns[kNumPhases];
+  // wall time of the decoding calls, which includes the phases of the images
+  // decoded in segments once per thread
+  long long total_ns;
+};
+
+// read the statistics, resetting them to zero when `reset` is true
+void get_decoder_stats(bool reset, decoder_stats *stats);
+
+// called on the decoding thread once each image has been decoded or failed,
+// null (the default) for no hook
+typedef void (*trace_hook)(const decode_trace *trace);
+void set_trace_hook(trace_hook hook);
+
+// run `decode`, which decodes an image of `bytes` bytes, with a trace which
+// the decoder fills through current_trace. The counters are updated and the
+// hook called when it returns or throws.
+void trace_decode(unsigned long bytes, bool cropped,
+                  const std::function<void()> &decode);
+
+// the trace of the image decoded by this thread, null outside of trace_decode
+decode_trace *current_trace();
+
+// make `trace` the trace of this thread for the lifetime of the scope, for
+// the threads decoding parts of an image
+class trace_scope {
+public:
+  explicit trace_scope(decode_trace *trace);
+  ~trace_scope();
+
+private:
+  decode_trace *previous_;
+};
+
+// monotonic clock in nanoseconds
+long long now_ns();
+
+// add the time elapsed since `start_ns` to `phase`. Phases running outside of
+// trace_decode, such as the header reads sizing the tensorflow outputs, are
+// only accumulated in the statistics.
+void add_phase_time(decode_phase phase, long long start_ns);
+
+} // namespace common
+} // namespace jpeg2dct
+
+#endif
@@ -7,42 +7,983 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import glob
 import os
+import queue
+import tarfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
 
 import jpeg2dct.common
+from jpeg2dct.common import band_statistics, coefficient_indices
 from . import dctfromjpg_wrapper
 
 
-def load(filename, normalized=True, channels=3):
+def load(filename, normalized=True, channels=3, crop=None, num_coefficients=None, coefficients=None, dtype=np.int16,
+         mean=None, std=None, target_blocks=None, target_crop='center', target_pad='zero', scale=1):
     """
     read/load the dct coefficients from a jpg file
     :param filename: the jpg file name
     :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
     :param channels: number of color channels for the decoded image
+    :param crop: (y, x, h, w) window of the luminance blocks to decode, the chroma bands hold the blocks covering it.
+        None decodes the whole image.
+    :param num_coefficients: only keep the first num_coefficients dct coefficients of each block in zigzag order
+    :param coefficients: only keep the dct coefficients of each block at these indices, in the natural (row major)
+        order of a block. Exclusive with num_coefficients, all the coefficients are kept when both are None.
+    :param dtype: type of the returned arrays, np.int16, np.float16 or np.float32. The values are converted while
+        being dequantized, in a single pass.
+    :param mean: per coefficient mean subtracted from floating point bands, of shape (nb dct coef,) or
+        (channels, nb dct coef), None for no centering
+    :param std: per coefficient standard deviation dividing floating point bands, of the shapes of mean, None for no
+        scaling
+    :param target_blocks: (h, w) luminance block grid of every returned image, None for the grid of each image. The
+        luminance window, the crop window if any, is cropped to it where it is larger and padded on the bottom and
+        right where it is smaller, and the chroma bands get half of it rounded up. The blocks are written straight
+        at their place in the bands of the target grid.
+    :param target_crop: where the window of the target grid is taken in larger images: 'center', 'top_left', or
+        'random' for a window drawn for each image
+    :param target_pad: what the blocks of the target grid past smaller images hold: 'zero' for zeros, or 'edge' for
+        copies of the last block of each row and of the last row
+    :param scale: 1, 1/2, 1/4 or 1/8. The bands are those of the image downscaled by it, 8x8 blocks of coefficients
+        computed from the decoded ones in the DCT domain, their block grids being divided by 1 / scale and rounded up.
+        crop and target_blocks are in blocks of the downscaled image.
     :return: (dct_y, dct_c, dct_r) as numpy arrays of size h x w x nb dct coef
     :note: given an image of size 512 x 512 x 64, the dct_y will be 64 x 64 x 64 and dct_c, dct_r will be 32 x 32 x 64
     """
-    if not os.path.exists(filename):
-        raise IOError('{} does not exists'.format(filename))
     if channels not in {3, 1}:
         raise ValueError('channels should be 3 or 1')
-    [band1, band2, band3] = dctfromjpg_wrapper.read_dct_coefficients_from_file(
-        filename.encode(), normalized, channels)
-    return [band1, band2, band3] if channels == 3 else [band1]
+    band_format = _band_format(dtype, mean, std, channels, num_coefficients, coefficients, target_blocks, target_crop,
+                               target_pad, scale)
+    return dctfromjpg_wrapper.read_dct_coefficients_from_files(
+        [filename.encode()], normalized, channels, *(_crop_window(crop) + band_format + [1, False, None]))[0][0][:channels]
 
 
-def loads(buffer, normalized=True, channels=3):
+def load_many(filenames, normalized=True, channels=3, crop=None, num_coefficients=None, coefficients=None,
+              dtype=np.int16, mean=None, std=None, prefetch=8, target_blocks=None, target_crop='center',
+              target_pad='zero', scale=1):
+    """
+    read/load the dct coefficients from a sequence of jpg files one after the other, the kernel reading the next
+    files in the background while the current one is decoded
+    :param filenames: iterable of jpg file names, consumed lazily
+    :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+    :param channels: number of color channels for the decoded images
+    :param crop: (y, x, h, w) window of the luminance blocks to decode, see loads
+    :param num_coefficients: number of dct coefficients kept in zigzag order, see loads
+    :param coefficients: indices of the dct coefficients kept, see loads
+    :param dtype: type of the returned arrays, see loads
+    :param mean: per coefficient mean subtracted from floating point bands, see loads
+    :param std: per coefficient standard deviation dividing floating point bands, see loads
+    :param prefetch: number of files ahead of the decoded one whose reading is started
+    :param target_blocks: (h, w) luminance block grid of every image, see loads
+    :param target_crop: where the window of the target grid is taken in larger images, see loads
+    :param target_pad: what the blocks of the target grid past smaller images hold, see loads
+    :param scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see loads
+    :return: a generator of the (dct_y, dct_c, dct_r) of every file, in order, see load
+    """
+    if channels not in {3, 1}:
+        raise ValueError('channels should be 3 or 1')
+    if prefetch < 0:
+        raise ValueError('prefetch should not be negative')
+    options = dict(normalized=normalized, channels=channels, crop=crop, num_coefficients=num_coefficients,
+                   coefficients=coefficients, dtype=dtype, mean=mean, std=std, target_blocks=target_blocks,
+                   target_crop=target_crop, target_pad=target_pad, scale=scale)
+    _check_load_options(options)
+    return (image for _, image in _load_many(filenames, prefetch, 'raise', options))
+
+
+def _check_load_options(options):
+    """raise the errors of the load options before any file is read"""
+    _band_format(options['dtype'], options['mean'], options['std'], options['channels'], options['num_coefficients'],
+                 options['coefficients'], options['target_blocks'], options['target_crop'], options['target_pad'],
+                 options['scale'])
+
+
+def _load_many(filenames, prefetch, errors, options):
+    """:return: a generator of (filename, bands) pairs, without the files which fail to decode if errors is 'drop'"""
+    pending = collections.deque()
+
+    def load_next():
+        filename = pending.popleft()
+        try:
+            return filename, load(filename, **options)
+        except IOError:
+            # the file errors name the file already
+            if errors == 'raise':
+                raise
+            return None
+        except RuntimeError as e:
+            if errors == 'raise':
+                raise RuntimeError('{}: {}'.format(filename, e)) from e
+            return None
+
+    for filename in filenames:
+        dctfromjpg_wrapper.prefetch_file(filename.encode())
+        pending.append(filename)
+        if len(pending) > prefetch:
+            loaded = load_next()
+            if loaded is not None:
+                yield loaded
+    while pending:
+        loaded = load_next()
+        if loaded is not None:
+            yield loaded
+
+
+def load_dir(directory, extensions=('.jpg', '.jpeg'), normalized=True, channels=3, crop=None, num_coefficients=None,
+             coefficients=None, dtype=np.int16, mean=None, std=None, prefetch=8, errors='raise', target_blocks=None,
+             target_crop='center', target_pad='zero', scale=1):
+    """
+    read/load the dct coefficients from the jpg files of a directory, see load_many for the decoding options
+    :param directory: the directory, its sub-directories are not visited
+    :param extensions: case insensitive extensions of the loaded files
+    :param errors: 'raise' to raise the error of the first file which fails to decode, 'drop' to leave the files
+        which fail out, their failures being counted by stats
+    :return: a generator of (filename, (dct_y, dct_c, dct_r)) pairs, in the sorted order of the file names
+    """
+    if errors not in ('raise', 'drop'):
+        raise ValueError("errors should be 'raise' or 'drop'")
+    if channels not in {3, 1}:
+        raise ValueError('channels should be 3 or 1')
+    if prefetch < 0:
+        raise ValueError('prefetch should not be negative')
+    options = dict(normalized=normalized, channels=channels, crop=crop, num_coefficients=num_coefficients,
+                   coefficients=coefficients, dtype=dtype, mean=mean, std=std, target_blocks=target_blocks,
+                   target_crop=target_crop, target_pad=target_pad, scale=scale)
+    _check_load_options(options)
+    extensions = tuple(extension.lower() for extension in extensions)
+    filenames = sorted(entry.path for entry in os.scandir(directory)
+                       if entry.is_file() and entry.name.lower().endswith(extensions))
+    return _load_many(filenames, prefetch, errors, options)
+
+
+def iter_decode(source, prefetch=16, workers=0, normalized=True, channels=3, crop=None, num_coefficients=None,
+                coefficients=None, dtype=np.int16, mean=None, std=None, extensions=('.jpg', '.jpeg'), errors='raise',
+                target_blocks=None, target_crop='center', target_pad='zero', scale=1):
+    """
+    stream the dct coefficients of a dataset, a background pipeline reading and decoding the images ahead of the
+    consumer
+    :param source: a jpg or tar file name, a glob pattern matching such files, or an iterable of such file names.
+        Tar shards follow the WebDataset layout: the files sharing a key, their name up to the first dot of the
+        basename, make a sample, and the jpg file of each sample is decoded.
+    :param prefetch: maximum number of images read or decoded ahead of the consumer, which bounds the memory used
+    :param workers: number of decoding threads, 0 uses all available cores
+    :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+    :param channels: number of color channels for the decoded images
+    :param crop: (y, x, h, w) window of the luminance blocks to decode, see loads
+    :param num_coefficients: number of dct coefficients kept in zigzag order, see loads
+    :param coefficients: indices of the dct coefficients kept, see loads
+    :param dtype: type of the returned arrays, see loads
+    :param mean: per coefficient mean subtracted from floating point bands, see loads
+    :param std: per coefficient standard deviation dividing floating point bands, see loads
+    :param extensions: case insensitive extensions of the decoded files
+    :param errors: 'raise' to raise the error of the first image which fails to decode, 'drop' to leave the images
+        which fail out of the stream, their failures being counted by stats. Errors reading the source are raised
+        either way.
+    :param target_blocks: (h, w) luminance block grid of every image, see loads
+    :param target_crop: where the window of the target grid is taken in larger images, see loads
+    :param target_pad: what the blocks of the target grid past smaller images hold, see loads
+    :param scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see loads
+    :return: a generator of (key, dct_y, dct_c, dct_r) tuples, or (key, dct_y) for a single channel, in the order of
+        the source whatever the number of workers. The key is the file name, or the sample key within a tar shard.
+    """
+    if errors not in ('raise', 'drop'):
+        raise ValueError("errors should be 'raise' or 'drop'")
+    if channels not in {3, 1}:
+        raise ValueError('channels should be 3 or 1')
+    if prefetch < 1:
+        raise ValueError('prefetch should be positive')
+    options = dict(normalized=normalized, channels=channels, crop=crop, num_coefficients=num_coefficients,
+                   coefficients=coefficients, dtype=dtype, mean=mean, std=std, target_blocks=target_blocks,
+                   target_crop=target_crop, target_pad=target_pad, scale=scale)
+    _check_load_options(options)
+    extensions = tuple(extension.lower() for extension in extensions)
+    return _iter_decode(_iter_images(source, extensions), prefetch, workers or os.cpu_count() or 1, options, errors)
+
+
+_TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz')
+
+
+def _iter_images(source, extensions):
+    """:return: a generator of (key, filename, None) for jpg files and (key, None, buffer) for the members of tar
+        shards"""
+    if isinstance(source, (str, os.PathLike)):
+        source = os.fspath(source)
+        filenames = sorted(glob.glob(source)) if any(c in source for c in '*?[') else [source]
+    else:
+        filenames = source
+    for filename in filenames:
+        filename = os.fspath(filename)
+        if not filename.lower().endswith(_TAR_EXTENSIONS):
+            yield filename, filename, None
+            continue
+        # streamed, the members of a shard are read in the order they are stored
+        with tarfile.open(filename, mode='r|*') as shard:
+            for member in shard:
+                if member.isfile() and member.name.lower().endswith(extensions):
+                    directory, basename = os.path.split(member.name)
+                    key = os.path.join(directory, basename.split('.', 1)[0])
+                    yield key, None, shard.extractfile(member).read()
+
+
+def _iter_decode(images, prefetch, workers, options, errors):
+    # a producer thread submits the images in order and queues their futures, so that the consumer gets them in
+    # order too. The bounded queue stops the producer once prefetch images are pending.
+    pending = queue.Queue(prefetch)
+    stop = threading.Event()
+
+    def put(entry):
+        while not stop.is_set():
+            try:
+                pending.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for key, filename, buffer in images:
+                if buffer is None:
+                    future = executor.submit(load, filename, **options)
+                else:
+                    future = executor.submit(loads, buffer, **options)
+                if not put((key, future)):
+                    return
+        except BaseException as e:
+            # reported to the consumer after the images queued before the failure
+            failure = Future()
+            failure.set_exception(e)
+            put((None, failure))
+        put(None)
+
+    executor = ThreadPoolExecutor(workers)
+    producer = threading.Thread(target=produce, name='jpeg2dct-iter-decode', daemon=True)
+    producer.start()
+    try:
+        while True:
+            entry = pending.get()
+            if entry is None:
+                return
+            key, future = entry
+            try:
+                bands = future.result()
+            except IOError:
+                # the failures of the producer, whose key is None, are raised whatever errors is
+                if errors == 'raise' or key is None:
+                    raise
+                continue
+            except RuntimeError as e:
+                if key is None:
+                    raise
+                if errors == 'raise':
+                    # the decoding errors get the file name or tar key of their image
+                    raise RuntimeError('{}: {}'.format(key, e)) from e
+                continue
+            yield (key,) + tuple(bands)
+    finally:
+        # the consumer is done, possibly early: unblock the producer and drop the pending images
+        stop.set()
+        while producer.is_alive() or not pending.empty():
+            try:
+                entry = pending.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if entry is not None:
+                entry[1].cancel()
+        executor.shutdown(wait=True)
+
+
+def loads(buffer, normalized=True, channels=3, crop=None, num_coefficients=None, coefficients=None, dtype=np.int16,
+          mean=None, std=None, target_blocks=None, target_crop='center', target_pad='zero', scale=1):
     """
     read/load the dct coefficients from a string of bytes representing a jpeg image
     :param buffer: the jpg file buffer
     :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
     :param channels: number of color channels for the decoded image
+    :param crop: (y, x, h, w) window of the luminance blocks to decode, the chroma bands hold the blocks covering it.
+        None decodes the whole image.
+    :param num_coefficients: only keep the first num_coefficients dct coefficients of each block in zigzag order
+    :param coefficients: only keep the dct coefficients of each block at these indices, in the natural (row major)
+        order of a block. Exclusive with num_coefficients, all the coefficients are kept when both are None.
+    :param dtype: type of the returned arrays, np.int16, np.float16 or np.float32. The values are converted while
+        being dequantized, in a single pass.
+    :param mean: per coefficient mean subtracted from floating point bands, of shape (nb dct coef,) or
+        (channels, nb dct coef), None for no centering
+    :param std: per coefficient standard deviation dividing floating point bands, of the shapes of mean, None for no
+        scaling
+    :param target_blocks: (h, w) luminance block grid of every returned image, None for the grid of each image. The
+        luminance window, the crop window if any, is cropped to it where it is larger and padded on the bottom and
+        right where it is smaller, and the chroma bands get half of it rounded up. The blocks are written straight
+        at their place in the bands of the target grid.
+    :param target_crop: where the window of the target grid is taken in larger images: 'center', 'top_left', or
+        'random' for a window drawn for each image
+    :param target_pad: what the blocks of the target grid past smaller images hold: 'zero' for zeros, or 'edge' for
+        copies of the last block of each row and of the last row
+    :param scale: 1, 1/2, 1/4 or 1/8. The bands are those of the image downscaled by it, 8x8 blocks of coefficients
+        computed from the decoded ones in the DCT domain, their block grids being divided by 1 / scale and rounded up.
+        crop and target_blocks are in blocks of the downscaled image.
     :return: (dct_y, dct_c, dct_r) as numpy arrays of size h x w x nb dct coef
     :note: given an image of size 512 x 512 x 64, the dct_y will be 64 x 64 x 64 and dct_c, dct_r will be 32 x 32 x 64
     """
     if channels not in {3, 1}:
         raise ValueError('channels should be 3 or 1')
-    l_buffer = int(len(buffer))
-    [band1, band2, band3] = dctfromjpg_wrapper.read_dct_coefficients_from_buffer(
-        buffer, l_buffer, normalized, channels)
-    return [band1, band2, band3] if channels == 3 else [band1]
+    band_format = _band_format(dtype, mean, std, channels, num_coefficients, coefficients, target_blocks, target_crop,
+                               target_pad, scale)
+    return dctfromjpg_wrapper.read_dct_coefficients_from_buffers(
+        [buffer], normalized, channels, *(_crop_window(crop) + band_format + [1, False, None]))[0][0][:channels]
+
+
+def jpeg_to_sparse(buffer, channels=3):
+    """
+    convert a jpeg image into a compact sparse storage of its quantized dct coefficients, which loads_sparse reads
+    several times faster than loads decodes the jpeg image, for about twice its size
+    :param buffer: the jpg file buffer
+    :param channels: number of color channels stored
+    :return: the bytes of the sparse coefficients
+    """
+    bands = loads(buffer, normalized=False, channels=channels)
+    info = probe(buffer)
+    # the bands are normalized with the tables of their components, and transcoded images with quality 100 ones
+    quant = np.ones((channels, 64), dtype=np.uint16)
+    if info['decode_path'] != 'transcode':
+        for i, component in enumerate(info['components'][:channels]):
+            quant[i] = component['quant_table']
+    return dctfromjpg_wrapper.pack_sparse(channels, *(bands + [_EMPTY_BAND] * (3 - channels) + [quant]))
+
+
+def loads_sparse(buffer, normalized=True):
+    """
+    read/load the dct coefficients stored by jpeg_to_sparse
+    :param buffer: the bytes returned by jpeg_to_sparse
+    :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+    :return: (dct_y, dct_c, dct_r) as numpy arrays of size h x w x 64, or (dct_y,) when a single channel is stored,
+        equal to the ones returned by loads for the jpeg image
+    """
+    if not isinstance(buffer, bytes):
+        buffer = bytes(buffer)
+    return dctfromjpg_wrapper.unpack_sparse(buffer, int(len(buffer)), normalized)
+
+
+def pixels_to_dct(image, quality=80, is_rgb=True, normalized=True, channels=3):
+    """
+    compute the dct coefficients of an image as jpeg compression computes them, without encoding nor decoding a jpeg
+    image: YCbCr with 4:2:0 chroma subsampling, quantized with the tables of the given quality
+    :param image: uint8 numpy array of size h x w for grayscale images, or h x w x 3 for color images
+    :param quality: jpeg quality, between 1 and 100
+    :param is_rgb: boolean indicating if color images come as rgb rather than bgr
+    :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+    :param channels: number of color channels returned
+    :return: (dct_y, dct_c, dct_r) as numpy arrays of size h x w x 64, equal to the ones returned by loads for
+        encode_jpeg(image, quality, is_rgb)
+    """
+    if channels not in {3, 1}:
+        raise ValueError('channels should be 3 or 1')
+    bands = dctfromjpg_wrapper.encode_dct_coefficients(_pixel_array(image), not is_rgb, quality, normalized, channels)
+    return bands if channels == 3 else bands[:1]
+
+
+def pixels_to_sparse(image, quality=80, is_rgb=True, channels=3):
+    """
+    compute the dct coefficients of an image as pixels_to_dct, and pack them into the sparse storage read by
+    loads_sparse
+    :param image: uint8 numpy array of size h x w for grayscale images, or h x w x 3 for color images
+    :param quality: jpeg quality, between 1 and 100
+    :param is_rgb: boolean indicating if color images come as rgb rather than bgr
+    :param channels: number of color channels stored
+    :return: the bytes of the sparse coefficients, the same as jpeg_to_sparse(encode_jpeg(image, quality, is_rgb))
+    """
+    image = _pixel_array(image)
+    bands = pixels_to_dct(image, quality, is_rgb, normalized=False, channels=channels)
+    tables = dctfromjpg_wrapper.quality_quant_tables(quality)
+    # the empty chroma bands of grayscale images are stored with unit steps, like jpeg_to_sparse does
+    quant = np.ones((channels, 64), dtype=np.uint16)
+    quant[0] = tables[0]
+    if image.shape[2] == 3:
+        quant[1:] = tables[1]
+    return dctfromjpg_wrapper.pack_sparse(channels, *(bands + [_EMPTY_BAND] * (3 - channels) + [quant]))
+
+
+def encode_jpeg(image, quality=80, is_rgb=True, sampling='420', progressive=False, restart_rows=0):
+    """
+    compress an image into a jpeg image with libjpeg. With the default settings, this is a baseline jpeg image with
+    4:2:0 chroma subsampling, which the decoders read without resampling nor transcoding its chroma
+    :param image: uint8 numpy array of size h x w for grayscale images, or h x w x 3 for color images
+    :param quality: jpeg quality, between 1 and 100
+    :param is_rgb: boolean indicating if color images come as rgb rather than bgr
+    :param sampling: chroma subsampling of color images, '444', '422', '420', '440' or '411'
+    :param progressive: boolean. If True, the image is coded as a progressive jpeg image.
+    :param restart_rows: number of rows of MCUs between restart markers, 0 for no restart markers
+    :return: the bytes of the jpeg image
+    """
+    if sampling not in _SAMPLING_FACTORS:
+        raise ValueError('sampling should be one of {}'.format(', '.join(sorted(_SAMPLING_FACTORS))))
+    h_samp, v_samp = _SAMPLING_FACTORS[sampling]
+    return dctfromjpg_wrapper.encode_jpeg(_pixel_array(image), not is_rgb, quality, h_samp, v_samp, progressive,
+                                          restart_rows)
+
+
+# luminance sampling factors of the chroma subsampling modes, the chroma components having 1 x 1
+_SAMPLING_FACTORS = {'444': (1, 1), '422': (2, 1), '420': (2, 2), '440': (1, 2), '411': (4, 1)}
+
+
+def _pixel_array(image):
+    """:return: the image as a contiguous h x w x components uint8 array"""
+    image = np.ascontiguousarray(image)
+    if image.dtype != np.uint8:
+        raise ValueError('Unexpected image type, expected uint8, got {}'.format(image.dtype))
+    if image.ndim == 2:
+        image = image[:, :, np.newaxis]
+    if image.ndim != 3 or image.shape[2] not in (1, 3):
+        raise ValueError('Unexpected image dimensions. Supported dimensions are (H, W) or (H, W, 3). '
+                         'Got {}'.format(image.shape))
+    return image
+
+
+def stats(reset=False):
+    """
+    counters and cumulative timings of the decoders since the start of the process or the last reset. They cover every
+    image decoded in the process, by the tensorflow ops as well, and cost a few atomic additions per image.
+    :param reset: boolean. If True, the statistics are reset to zero as they are read.
+    :return: a dict with
+        images: number of decoded images
+        failures: number of images which failed to decode
+        bytes: jpeg bytes of the decoded and failed images
+        decode_paths: number of decoded images per decode path, see probe: {'direct': n, 'resample': n, 'transcode': n}
+        segmented: number of images whose restart segments were decoded concurrently, see set_segment_threads
+        progressive: number of progressive images
+        cropped: number of images decoded with a crop window
+        seconds: seconds spent reading the headers ('header'), entropy decoding ('coefficients'), writing the bands
+            ('copy'), resampling the chroma ('resample') and transcoding ('transcode'), summed over the decoding
+            threads, and the wall time of the decoding calls ('total')
+    """
+    return jpeg2dct.common.format_stats(*dctfromjpg_wrapper.get_stats(bool(reset)))
+
+
+def reset_stats():
+    """reset the statistics returned by stats to zero"""
+    dctfromjpg_wrapper.get_stats(True)
+
+
+def set_trace_hook(hook):
+    """
+    call a function after each image is decoded or fails, to find the slow or failing images of a dataset
+    :param hook: None to remove the hook, or a function called with a dict describing the image:
+        bytes: jpeg bytes
+        size: (height, width) in pixels, (0, 0) when the header could not be read
+        num_components: number of color components
+        progressive: whether the image is progressive
+        decode_path: 'direct', 'resample' or 'transcode', None when the header could not be read
+        segmented: whether its restart segments were decoded concurrently
+        cropped: whether it was decoded with a crop window
+        error: the error message when decoding failed, None otherwise
+        seconds: the seconds spent in each phase, see stats, and the wall time of the call ('total')
+    :note: the hook runs on the decoding threads, the tensorflow ones included, while holding the GIL, and serializes
+        them. Exceptions it raises are printed and ignored.
+    """
+    if hook is not None and not callable(hook):
+        raise ValueError('hook should be callable or None')
+    dctfromjpg_wrapper.set_trace_callback(hook)
+
+
+def set_chroma_resampling(enabled):
+    """
+    select how chroma layouts other than 4:2:0 are brought to half the luminance resolution
+    :param enabled: boolean. If True (the default), the chroma dct coefficients are resampled in the dct domain.
+        If False, the image is decoded to pixels and re-encoded as 4:2:0, which is slower and loses precision.
+    :note: the setting is process wide and also applies to the tensorflow ops
+    """
+    dctfromjpg_wrapper.set_chroma_resampling(bool(enabled))
+
+
+def set_accept_truncated(enabled):
+    """
+    select whether truncated images, whose data ends before their last row of blocks, are decoded
+    :param enabled: boolean. If True, libjpeg's recovery is taken: the missing blocks are zero filled. If False (the
+        default), decoding them fails with 'Premature end of JPEG file'. Images only missing their end of image marker
+        are decoded either way.
+    :note: the setting is process wide and also applies to the tensorflow ops
+    """
+    dctfromjpg_wrapper.set_accept_truncated(bool(enabled))
+
+
+def set_segment_threads(num_threads):
+    """
+    decode the restart segments of a single image concurrently
+    :param num_threads: number of native threads decoding one image, 1 (the default) decodes serially and 0 uses all
+        available cores. Only images coded as one sequential scan whose restart intervals line up with rows of MCUs
+        are split, see add_restart_markers, and only when decoding from a buffer.
+    :note: the setting is process wide and also applies to the tensorflow ops. Batched decoding already runs one
+        image per thread, leave it to 1 there.
+    """
+    dctfromjpg_wrapper.set_segment_threads(int(num_threads))
+
+
+def add_restart_markers(buffer, restart_rows=1):
+    """
+    losslessly re-encode a jpeg image as one sequential scan with restart markers, so that its segments can be decoded
+    concurrently, see set_segment_threads. The dct coefficients are left untouched.
+    :param buffer: the jpg file buffer
+    :param restart_rows: number of rows of MCUs between two restart markers
+    :return: the re-encoded jpg file buffer
+    """
+    return dctfromjpg_wrapper.add_restart_markers(buffer, int(len(buffer)), restart_rows)
+
+
+def dct_shapes(buffer, channels=3, crop=None, num_coefficients=None, coefficients=None):
+    """
+    read the shapes of the dct coefficients of a jpeg image from its header only
+    :param buffer: the jpg file buffer
+    :param channels: number of color channels for the decoded image
+    :param crop: (y, x, h, w) window of the luminance blocks, see loads
+    :param num_coefficients: number of dct coefficients kept in zigzag order, see loads
+    :param coefficients: indices of the dct coefficients kept, see loads
+    :return: the shapes of the arrays returned by loads, (dct_y, dct_c, dct_r) or (dct_y,) for a single channel
+    """
+    if channels not in {3, 1}:
+        raise ValueError('channels should be 3 or 1')
+    dims = dctfromjpg_wrapper.read_dct_dimensions_from_buffer(buffer, int(len(buffer)), channels,
+                                                              *_crop_window(crop),
+                                                              _coefficient_array(num_coefficients, coefficients))
+    return [tuple(dims[i:i + 3]) for i in range(0, 3 * channels, 3)]
+
+
+def probe(buffer):
+    """
+    read what the header of a jpeg image tells, without decoding it
+    :param buffer: the jpg file buffer
+    :return: a dict with
+        size: (height, width) of the image in pixels
+        num_components: number of color components
+        progressive: whether the image is progressive
+        decode_path: how loads produces the bands, 'direct' copies the coefficients, 'resample' resamples the chroma
+            coefficients and 'transcode' goes through the pixel domain
+        components: for each of the first 4 components, a dict of its 'blocks' grid (h, w), its 'sampling' factors
+            (h, v) and its 'quant_table', the uint16 array of its 64 quantization steps in the order of the dct
+            coefficients
+        dct_shapes: the shapes of (dct_y, dct_c, dct_r) as returned by loads
+    """
+    return dctfromjpg_wrapper.probe_buffers([buffer], 1)[0]
+
+
+def probe_batch(buffers, num_threads=0):
+    """
+    probe a list of strings of bytes representing jpeg images concurrently, see probe
+    :param buffers: the jpg file buffers
+    :param num_threads: number of native threads, 0 uses all available cores
+    :return: the list of the dicts returned by probe
+    """
+    return dctfromjpg_wrapper.probe_buffers(list(buffers), num_threads)
+
+
+def loads_into(buffer, out_y, out_cb=None, out_cr=None, normalized=True, crop=None, num_coefficients=None,
+               coefficients=None):
+    """
+    read/load the dct coefficients from a string of bytes representing a jpeg image into preallocated arrays
+    :param buffer: the jpg file buffer
+    :param out_y: C contiguous int16 array receiving dct_y, of the shape given by dct_shapes
+    :param out_cb: C contiguous int16 array receiving dct_c, None to only decode the luminance
+    :param out_cr: C contiguous int16 array receiving dct_r, None to only decode the luminance
+    :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+    :param crop: (y, x, h, w) window of the luminance blocks to decode, see loads
+    :param num_coefficients: number of dct coefficients kept in zigzag order, see loads
+    :param coefficients: indices of the dct coefficients kept, see loads
+    :return: the filled arrays, (out_y, out_cb, out_cr) or (out_y,) for a single channel
+    """
+    if (out_cb is None) != (out_cr is None):
+        raise ValueError('out_cb and out_cr should be both given or both None')
+    channels = 1 if out_cb is None else 3
+    outputs = [out_y, out_cb, out_cr] if channels == 3 else [out_y, _EMPTY_BAND, _EMPTY_BAND]
+    arguments = _crop_window(crop) + [_coefficient_array(num_coefficients, coefficients)] + outputs
+    dctfromjpg_wrapper.read_dct_coefficients_from_buffer_into(buffer, int(len(buffer)), normalized, channels, *arguments)
+    return outputs[:channels]
+
+
+def image_buffer(band):
+    """
+    the single allocation holding the three bands of a decoded image, chroma dummies included, which the bands are
+    views of. Passing an image to another process or into shared memory is a single copy of it, read back with
+    bands_from_buffer.
+    :param band: any band of an image returned by the decoders of this module, except for the batches stacked into
+        n x h x w x nb dct coef arrays
+    :return: the uint8 array of the buffer
+    """
+    buffer = band.base
+    if not isinstance(buffer, np.ndarray) or buffer.dtype != np.uint8 or buffer.ndim != 1 or \
+            not dctfromjpg_wrapper.is_image_capsule(buffer.base):
+        raise ValueError('band should be a band of a decoded image')
+    return buffer
+
+
+def bands_from_buffer(buffer, shapes, dtype=np.int16):
+    """
+    the bands of an image in a buffer laid out like the buffers of image_buffer, one after the other at offsets
+    aligned to 64 bytes
+    :param buffer: an object exposing the bytes of the buffer, e.g. a copy of image_buffer in shared memory
+    :param shapes: the shapes of the first bands of the image, as many as the bands returned
+    :param dtype: type of the bands
+    :return: the list of the bands, as numpy arrays viewing the buffer without copying
+    """
+    dtype = np.dtype(dtype)
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    bands = []
+    offset = 0
+    for shape in shapes:
+        size = int(np.prod(shape)) * dtype.itemsize
+        if offset + size > len(data):
+            raise ValueError('the buffer is too small for bands of shapes {}'.format(list(shapes)))
+        bands.append(data[offset:offset + size].view(dtype).reshape(shape))
+        offset += -(-size // _BAND_ALIGNMENT) * _BAND_ALIGNMENT
+    return bands
+
+
+# the alignment of the bands in the buffer of an image
+_BAND_ALIGNMENT = dctfromjpg_wrapper.kBandAlignment
+
+_EMPTY_BAND = np.empty((0, 0, 0), dtype=np.int16)
+
+
+def _crop_window(crop):
+    """:return: the (y, x, h, w) arguments of the native decoders, 0x0 standing for the whole image"""
+    if crop is None:
+        return [0, 0, 0, 0]
+    if len(crop) != 4:
+        raise ValueError('crop should be a (y, x, h, w) window of luminance blocks')
+    y, x, h, w = [int(value) for value in crop]
+    if h <= 0 or w <= 0:
+        raise ValueError('crop should have a positive height and width')
+    return [y, x, h, w]
+
+
+def _coefficient_array(num_coefficients, coefficients):
+    """:return: the int32 array of the selected coefficient indices of the native decoders, empty for all of them"""
+    return np.array(coefficient_indices(num_coefficients, coefficients), dtype=np.int32)
+
+
+_DTYPES = {np.dtype(np.int16): 0, np.dtype(np.float16): 1, np.dtype(np.float32): 2}
+
+
+_TARGET_CROPS = {'top_left': 0, 'center': 1, 'random': 2}
+
+_TARGET_PADS = {'zero': 0, 'edge': 1}
+
+
+def _band_format(dtype, mean, std, channels, num_coefficients, coefficients, target_blocks=None,
+                 target_crop='center', target_pad='zero', scale=1):
+    """:return: the coefficients, dtype, mean, std, target grid and scale arguments of the batched native decoders"""
+    dtype = np.dtype(dtype)
+    if dtype not in _DTYPES:
+        raise ValueError('dtype should be int16, float16 or float32')
+    if dtype == np.int16 and (mean is not None or std is not None):
+        raise ValueError('only float16 and float32 bands can be standardized')
+    if target_crop not in _TARGET_CROPS:
+        raise ValueError('target_crop should be one of {}'.format(', '.join(_TARGET_CROPS)))
+    if target_pad not in _TARGET_PADS:
+        raise ValueError('target_pad should be one of {}'.format(', '.join(_TARGET_PADS)))
+    target = [0, 0]
+    if target_blocks is not None:
+        if len(target_blocks) != 2:
+            raise ValueError('target_blocks should be a (h, w) grid of luminance blocks')
+        target = [int(value) for value in target_blocks]
+        if target[0] <= 0 or target[1] <= 0:
+            raise ValueError('target_blocks should have a positive height and width')
+    scale_denom = int(round(1 / scale)) if scale > 0 else 0
+    if scale_denom not in (1, 2, 4, 8) or abs(scale * scale_denom - 1) > 1e-6:
+        raise ValueError('scale should be 1, 1/2, 1/4 or 1/8')
+    indices = _coefficient_array(num_coefficients, coefficients)
+    mean, std = band_statistics(mean, std, channels, len(indices) or 64)
+    return [indices, _DTYPES[dtype], mean, std] + target + [_TARGET_CROPS[target_crop], _TARGET_PADS[target_pad],
+                                                           scale_denom]
+
+
+def load_batch(filenames, normalized=True, channels=3, num_threads=0, num_coefficients=None, coefficients=None,
+               dtype=np.int16, mean=None, std=None, errors='raise', target_blocks=None, target_crop='center',
+               target_pad='zero', scale=1):
+    """
+    read/load the dct coefficients from a list of jpg files, decoding them concurrently
+    :param filenames: the jpg file names
+    :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+    :param channels: number of color channels for the decoded images
+    :param num_threads: number of native decoding threads, 0 uses all available cores
+    :param num_coefficients: number of dct coefficients kept in zigzag order, see loads
+    :param coefficients: indices of the dct coefficients kept, see loads
+    :param dtype: type of the returned arrays, see loads
+    :param mean: per coefficient mean subtracted from floating point bands, see loads
+    :param std: per coefficient standard deviation dividing floating point bands, see loads
+    :param errors: what to do with the images which fail to decode, see loads_batch
+    :param target_blocks: (h, w) luminance block grid of every image, see loads
+    :param target_crop: where the window of the target grid is taken in larger images, see loads
+    :param target_pad: what the blocks of the target grid past smaller images hold, see loads
+    :param scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see loads
+    :return: (dct_y, dct_c, dct_r) as numpy arrays of size n x h x w x nb dct coef when all images share the same
+        shape, otherwise as lists of n arrays of size h x w x nb dct coef. When errors is not 'raise', a
+        (bands, ok, messages) tuple, see loads_batch.
+    """
+    if channels not in {3, 1}:
+        raise ValueError('channels should be 3 or 1')
+    if errors not in _ERRORS:
+        raise ValueError('errors should be one of {}'.format(', '.join(_ERRORS)))
+    band_format = _band_format(dtype, mean, std, channels, num_coefficients, coefficients, target_blocks, target_crop,
+                               target_pad, scale)
+    result = dctfromjpg_wrapper.read_dct_coefficients_from_files(
+        [filename.encode() for filename in filenames], normalized, channels,
+        *(_crop_window(None) + band_format + [num_threads, errors != 'raise', None]))
+    return _batch_result(result, channels, errors, dtype, len(band_format[0]) or 64)
+
+
+def loads_batch(buffers, normalized=True, channels=3, num_threads=0, num_coefficients=None, coefficients=None,
+                dtype=np.int16, mean=None, std=None, errors='raise', target_blocks=None, target_crop='center',
+                target_pad='zero', scale=1):
+    """
+    read/load the dct coefficients from a list of strings of bytes representing jpeg images, decoding them concurrently
+    :param buffers: the jpg file buffers
+    :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+    :param channels: number of color channels for the decoded images
+    :param num_threads: number of native decoding threads, 0 uses all available cores
+    :param num_coefficients: number of dct coefficients kept in zigzag order, see loads
+    :param coefficients: indices of the dct coefficients kept, see loads
+    :param dtype: type of the returned arrays, see loads
+    :param mean: per coefficient mean subtracted from floating point bands, see loads
+    :param std: per coefficient standard deviation dividing floating point bands, see loads
+    :param errors: what to do with the images which fail to decode: 'raise' raises the error of the first of them
+        and releases the batch, 'zero' puts zero bands in their place, of the shape of the other images when they
+        share one and empty otherwise, and 'drop' leaves them out of the bands
+    :param target_blocks: (h, w) luminance block grid of every image, see loads
+    :param target_crop: where the window of the target grid is taken in larger images, see loads
+    :param target_pad: what the blocks of the target grid past smaller images hold, see loads
+    :param scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see loads
+    :return: (dct_y, dct_c, dct_r) as numpy arrays of size n x h x w x nb dct coef when all images share the same
+        shape, otherwise as lists of n arrays of size h x w x nb dct coef. When errors is not 'raise', a
+        (bands, ok, messages) tuple where ok is a boolean numpy array telling which of the n inputs were decoded and
+        messages the list of the error message of each input, None for the decoded ones.
+    """
+    if channels not in {3, 1}:
+        raise ValueError('channels should be 3 or 1')
+    if errors not in _ERRORS:
+        raise ValueError('errors should be one of {}'.format(', '.join(_ERRORS)))
+    band_format = _band_format(dtype, mean, std, channels, num_coefficients, coefficients, target_blocks, target_crop,
+                               target_pad, scale)
+    result = dctfromjpg_wrapper.read_dct_coefficients_from_buffers(
+        list(buffers), normalized, channels, *(_crop_window(None) + band_format + [num_threads, errors != 'raise', None]))
+    return _batch_result(result, channels, errors, dtype, len(band_format[0]) or 64)
+
+
+def loads_batch_padded(buffers, normalized=True, channels=3, num_threads=0, num_coefficients=None,
+                       coefficients=None, dtype=np.int16, mean=None, std=None, errors='raise', target_blocks=None,
+                       target_crop='center', target_pad='zero', scale=1):
+    """
+    read/load the dct coefficients from a list of strings of bytes representing jpeg images of different sizes into
+    batched arrays, zero padding each image to the largest block grid of the batch. The images of the largest block
+    grid are decoded in place, the smaller ones are decoded aside and copied once.
+    :param buffers: the jpg file buffers
+    :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+    :param channels: number of color channels for the decoded images
+    :param num_threads: number of native decoding threads, 0 uses all available cores
+    :param num_coefficients: number of dct coefficients kept in zigzag order, see loads
+    :param coefficients: indices of the dct coefficients kept, see loads
+    :param dtype: type of the returned arrays, see loads
+    :param mean: per coefficient mean subtracted from floating point bands, see loads
+    :param std: per coefficient standard deviation dividing floating point bands, see loads
+    :param errors: what to do with the images which fail to decode: 'raise' raises the error of the first of them,
+        'zero' zero fills their slots and gives them a 0x0 valid block grid, and 'drop' leaves them out
+    :param target_blocks: (h, w) luminance block grid of every image, see loads. The images are then decoded in
+        place and their valid block grid is the target grid
+    :param target_crop: where the window of the target grid is taken in larger images, see loads
+    :param target_pad: what the blocks of the target grid past smaller images hold, see loads
+    :param scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see loads
+    :return: (dct_y, dct_c, dct_r, sizes) where the bands are numpy arrays of size n x h x w x nb dct coef and sizes
+        is the n x channels x 2 int32 array of the valid (h, w) block grid of each band, (dct_y, sizes) for a single
+        channel. When errors is not 'raise', ok and messages follow, see loads_batch.
+    """
+    if channels not in {3, 1}:
+        raise ValueError('channels should be 3 or 1')
+    if errors not in _ERRORS:
+        raise ValueError('errors should be one of {}'.format(', '.join(_ERRORS)))
+    band_format = _band_format(dtype, mean, std, channels, num_coefficients, coefficients, target_blocks, target_crop,
+                               target_pad, scale)
+    result = dctfromjpg_wrapper.read_dct_coefficients_from_buffers_padded(
+        list(buffers), normalized, channels, *(_crop_window(None) + band_format + [num_threads, errors != 'raise', None]))
+    return _padded_result(result, channels, errors)
+
+
+# how the batched decoders handle the images which fail to decode
+_ERRORS = ('raise', 'zero', 'drop')
+
+
+def _padded_result(result, channels, errors):
+    """:return: the bands and sizes of a padded batch, with the status of its images unless errors is 'raise'"""
+    bands, sizes, messages = result
+    outputs = bands[:channels] + [sizes]
+    if errors == 'raise':
+        return tuple(outputs)
+    ok = np.array([message is None for message in messages], dtype=bool)
+    if errors == 'drop' and not ok.all():
+        outputs = [output[ok] for output in outputs]
+    return tuple(outputs) + (ok, messages)
+
+
+def _batch_result(result, channels, errors, dtype, nb_coefficients):
+    """:return: the bands of the images decoded by a batched native decoder, with their status unless errors is
+        'raise'"""
+    images, messages = result
+    if errors == 'raise':
+        return _stack_images(images, channels)
+    ok = np.array([message is None for message in messages], dtype=bool)
+    decoded = [image for image in images if image is not None]
+    if errors == 'zero':
+        shapes = set(tuple(band.shape for band in image) for image in decoded)
+        if len(shapes) == 1:
+            zeros = [np.zeros_like(band) for band in decoded[0]]
+        else:
+            zeros = [np.zeros((0, 0, nb_coefficients), dtype=dtype)] * 3
+        decoded = [image if image is not None else zeros for image in images]
+    return _stack_images(decoded, channels), ok, messages
+
+
+def _stack_images(images, channels):
+    """Regroup per image [band1, band2, band3] lists into per band batches, stacked when shapes agree."""
+    bands = [[image[b] for image in images] for b in range(channels)]
+    shapes = set(tuple(band.shape for band in image[:channels]) for image in images)
+    if len(shapes) == 1:
+        return [np.stack(band) for band in bands]
+    return bands
+
+
+class Decoder(object):
+    """
+    Decoder bound to a set of decoding options, for decoding many images with the same settings at a lower cost
+    per image than loads.
+
+    The options are checked and converted once, and the bands are allocated from a pool of buffers which recycles
+    the memory of the arrays once they are released, instead of going through the allocator for each image. Every
+    decoding thread also keeps its libjpeg decompressor from one image to the next, for all the decoders of this
+    module, and the native threads of the batch calls are kept from one call to the next along with theirs. These
+    setup costs weigh the most on small images such as thumbnails.
+
+    Usage:
+        decoder = Decoder(num_coefficients=16)
+        for buffer in thumbnails:
+            dct_y, dct_cb, dct_cr = decoder.loads(buffer)
+        print(decoder.pool_stats())
+    """
+
+    def __init__(self, normalized=True, channels=3, crop=None, num_coefficients=None, coefficients=None,
+                 dtype=np.int16, mean=None, std=None, pool_bytes=64 * 1024 ** 2, target_blocks=None,
+                 target_crop='center', target_pad='zero', scale=1):
+        """
+        :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+        :param channels: number of color channels for the decoded images
+        :param crop: (y, x, h, w) window of the luminance blocks to decode, see loads
+        :param num_coefficients: number of dct coefficients kept in zigzag order, see loads
+        :param coefficients: indices of the dct coefficients kept, see loads
+        :param dtype: type of the returned arrays, see loads
+        :param mean: per coefficient mean subtracted from floating point bands, see loads
+        :param std: per coefficient standard deviation dividing floating point bands, see loads
+        :param pool_bytes: bound on the memory of the released arrays kept for the next images, 0 for no pool
+        :param target_blocks: (h, w) luminance block grid of every image, see loads
+        :param target_crop: where the window of the target grid is taken in larger images, see loads
+        :param target_pad: what the blocks of the target grid past smaller images hold, see loads
+        :param scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see loads
+        """
+        if channels not in {3, 1}:
+            raise ValueError('channels should be 3 or 1')
+        if pool_bytes < 0:
+            raise ValueError('pool_bytes should not be negative')
+        band_format = _band_format(dtype, mean, std, channels, num_coefficients, coefficients, target_blocks,
+                                   target_crop, target_pad, scale)
+        self.channels = channels
+        self._dtype = np.dtype(dtype)
+        self._nb_coefficients = len(band_format[0]) or 64
+        self._arguments = [normalized, channels] + _crop_window(crop) + band_format
+        self._pool = dctfromjpg_wrapper.new_buffer_pool(int(pool_bytes)) if pool_bytes else None
+
+    def load(self, filename):
+        """
+        read/load the dct coefficients from a jpg file
+        :param filename: the jpg file name
+        :return: (dct_y, dct_c, dct_r) as numpy arrays of size h x w x nb dct coef, see loads
+        """
+        images, _ = dctfromjpg_wrapper.read_dct_coefficients_from_files(
+            [filename.encode()], *(self._arguments + [1, False, self._pool]))
+        return images[0][:self.channels]
+
+    def loads(self, buffer):
+        """
+        read/load the dct coefficients from a string of bytes representing a jpeg image
+        :param buffer: the jpg file buffer
+        :return: (dct_y, dct_c, dct_r) as numpy arrays of size h x w x nb dct coef, see loads
+        """
+        images, _ = dctfromjpg_wrapper.read_dct_coefficients_from_buffers(
+            [buffer], *(self._arguments + [1, False, self._pool]))
+        return images[0][:self.channels]
+
+    def loads_into_buffer(self, buffer, image):
+        """
+        read/load the dct coefficients from a string of bytes representing a jpeg image straight into a preallocated
+        buffer, in any dtype, laid out like the buffers of image_buffer
+        :param buffer: the jpg file buffer
+        :param image: a writable object exposing the bytes receiving the bands, e.g. a slot of shared memory
+        :return: the bands as numpy arrays viewing image, see bands_from_buffer, or None when they do not fit it
+        """
+        shapes = dctfromjpg_wrapper.read_dct_coefficients_from_buffer_into_image(buffer, image, *self._arguments)
+        if shapes is None:
+            return None
+        return bands_from_buffer(image, shapes, self._dtype)
+
+    def load_batch(self, filenames, num_threads=0, errors='raise'):
+        """
+        read/load the dct coefficients from a list of jpg files, decoding them concurrently
+        :param filenames: the jpg file names
+        :param num_threads: number of native decoding threads, 0 uses all available cores
+        :param errors: what to do with the images which fail to decode, see loads_batch
+        :return: the bands of the images, see loads_batch
+        """
+        if errors not in _ERRORS:
+            raise ValueError('errors should be one of {}'.format(', '.join(_ERRORS)))
+        result = dctfromjpg_wrapper.read_dct_coefficients_from_files(
+            [filename.encode() for filename in filenames],
+            *(self._arguments + [num_threads, errors != 'raise', self._pool]))
+        return _batch_result(result, self.channels, errors, self._dtype, self._nb_coefficients)
+
+    def loads_batch(self, buffers, num_threads=0, errors='raise'):
+        """
+        read/load the dct coefficients from a list of strings of bytes representing jpeg images, decoding them
+        concurrently
+        :param buffers: the jpg file buffers
+        :param num_threads: number of native decoding threads, 0 uses all available cores
+        :param errors: what to do with the images which fail to decode, see loads_batch
+        :return: the bands of the images, see loads_batch
+        """
+        if errors not in _ERRORS:
+            raise ValueError('errors should be one of {}'.format(', '.join(_ERRORS)))
+        result = dctfromjpg_wrapper.read_dct_coefficients_from_buffers(
+            list(buffers), *(self._arguments + [num_threads, errors != 'raise', self._pool]))
+        return _batch_result(result, self.channels, errors, self._dtype, self._nb_coefficients)
+
+    def loads_batch_padded(self, buffers, num_threads=0, errors='raise'):
+        """
+        read/load the dct coefficients from a list of strings of bytes representing jpeg images of different sizes
+        into batched arrays, zero padding each image to the largest block grid of the batch
+        :param buffers: the jpg file buffers
+        :param num_threads: number of native decoding threads, 0 uses all available cores
+        :param errors: what to do with the images which fail to decode, see loads_batch_padded
+        :return: the batched bands and the valid block grid of each band, see loads_batch_padded
+        """
+        if errors not in _ERRORS:
+            raise ValueError('errors should be one of {}'.format(', '.join(_ERRORS)))
+        result = dctfromjpg_wrapper.read_dct_coefficients_from_buffers_padded(
+            list(buffers), *(self._arguments + [num_threads, errors != 'raise', self._pool]))
+        return _padded_result(result, self.channels, errors)
+
+    def pool_stats(self):
+        """
+        :return: dict of the allocations served by a recycled buffer ('hits') and by a new one ('misses'), and of
+            the bytes of the buffers waiting to be recycled ('free_bytes'), all zero without a pool
+        """
+        if self._pool is None:
+            return {'hits': 0, 'misses': 0, 'free_bytes': 0}
+        hits, misses, free_bytes = dctfromjpg_wrapper.buffer_pool_stats(self._pool)
+        return {'hits': hits, 'misses': misses, 'free_bytes': free_bytes}
@@ -0,0 +1,205 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import fcntl
+import hashlib
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import jpeg2dct
+from jpeg2dct.numpy import dctfromjpg_wrapper, loads
+
+_ENTRY_SUFFIX = '.dct'
+# version of the layout of the entries, part of their key with the version of the library
+_FORMAT_VERSION = 1
+_TMP_SUFFIX = '.tmp'
+# temporary files older than this are leftovers of crashed writers
+_STALE_TMP_SECONDS = 3600
+# eviction brings the store down to this fraction of its maximum size, so that it does not run on every miss
+_EVICTION_TARGET = 0.9
+
+
+class DCTCache(object):
+    """
+    On-disk cache of decoded dct coefficients, shared by all the processes using the same directory.
+
+    Entries are keyed by a hash of the jpeg content and the decoding settings, the process wide ones of
+    jpeg2dct.numpy.set_chroma_resampling and set_accept_truncated and the library version included. Cache hits are
+    returned as read-only np.memmap arrays without copying, cache misses are decoded with jpeg2dct.numpy.loads and
+    stored. The least recently used entries are evicted once the store grows beyond max_bytes. Entries are published with an atomic rename and
+    evicted entries stay readable by the processes which mapped them, so no reader ever sees a partial entry.
+
+    Usage:
+        cache = DCTCache('/tmp/dct_cache', max_bytes=50 * 1024 ** 3)
+        dct_y, dct_cb, dct_cr = cache.load(jpeg_file)
+        print(cache.hits, cache.misses)
+    """
+
+    def __init__(self, directory, max_bytes):
+        """
+        :param directory: directory of the store, created if missing
+        :param max_bytes: approximate bound on the size of the store. Each process accounts for its own writes
+            and rescans the store when it believes it full, so concurrent writers may briefly overshoot it.
+        """
+        if max_bytes <= 0:
+            raise ValueError('max_bytes should be positive')
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = os.path.join(directory, 'lock')
+        self._size = self._scan()[0]
+
+    def load(self, filename, normalized=True, channels=3):
+        """
+        read/load the dct coefficients from a jpg file, see jpeg2dct.numpy.load
+        :return: (dct_y, dct_c, dct_r) as numpy arrays, read-only np.memmap arrays on a cache hit
+        """
+        if not os.path.exists(filename):
+            raise IOError('{} does not exists'.format(filename))
+        with open(filename, 'rb') as src:
+            buffer = src.read()
+        return self.loads(buffer, normalized, channels)
+
+    def loads(self, buffer, normalized=True, channels=3):
+        """
+        read/load the dct coefficients from a string of bytes representing a jpeg image, see jpeg2dct.numpy.loads
+        :return: (dct_y, dct_c, dct_r) as numpy arrays, read-only np.memmap arrays on a cache hit
+        """
+        if channels not in {3, 1}:
+            raise ValueError('channels should be 3 or 1')
+        path = self._entry_path(buffer, normalized, channels)
+        bands = self._read_entry(path, channels)
+        if bands is not None:
+            self.hits += 1
+            return bands
+        self.misses += 1
+        bands = loads(buffer, normalized, channels)
+        self._write_entry(path, bands)
+        return bands
+
+    def clear(self):
+        """remove every entry of the store"""
+        for path, _, _ in self._scan()[1]:
+            _remove(path)
+        self._size = 0
+
+    def _entry_path(self, buffer, normalized, channels):
+        key = hashlib.blake2b(buffer, digest_size=20)
+        key.update('version={},format={},normalized={},channels={},chroma_resampling={},accept_truncated={}'.format(
+            jpeg2dct.__version__, _FORMAT_VERSION, bool(normalized), channels,
+            dctfromjpg_wrapper.get_chroma_resampling(), dctfromjpg_wrapper.get_accept_truncated()).encode())
+        return os.path.join(self.directory, key.hexdigest() + _ENTRY_SUFFIX)
+
+    def _read_entry(self, path, channels):
+        try:
+            data = np.memmap(path, dtype=np.uint8, mode='r')
+            # refresh the recency of the entry for the LRU eviction
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            # missing, or evicted by another process in the meantime
+            return None
+        bands = []
+        offset = 0
+        for _ in range(channels):
+            band, offset = _read_band(data, offset)
+            bands.append(band)
+        return bands
+
+    def _write_entry(self, path, bands):
+        fd, tmp_path = tempfile.mkstemp(suffix=_TMP_SUFFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as dst:
+                for band in bands:
+                    np.lib.format.write_array(dst, np.ascontiguousarray(band), allow_pickle=False)
+                # another process may evict the entry as soon as it is published
+                size = dst.tell()
+            os.replace(tmp_path, path)
+        except BaseException:
+            _remove(tmp_path)
+            raise
+        self._size += size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _scan(self):
+        """:return: the total size of the entries and the (path, size, mtime) of each, oldest first"""
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if name.endswith(_ENTRY_SUFFIX):
+                entries.append((path, stat.st_size, stat.st_mtime))
+            elif name.endswith(_TMP_SUFFIX) and now - stat.st_mtime > _STALE_TMP_SECONDS:
+                _remove(path)
+        entries.sort(key=lambda entry: entry[2])
+        return sum(entry[1] for entry in entries), entries
+
+    def _evict(self):
+        with open(self._lock_file, 'a') as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except (IOError, OSError):
+                # another process is already evicting
+                return
+            try:
+                size, entries = self._scan()
+                target = self.max_bytes * _EVICTION_TARGET
+                for path, entry_size, _ in entries:
+                    if size <= target:
+                        break
+                    if _remove(path):
+                        self.evictions += 1
+                    size -= entry_size
+                self._size = size
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read_band(data, offset):
+    """:return: the band stored in the .npy format at offset in data, and the offset of the next band"""
+    header = _ByteReader(data, offset)
+    version = np.lib.format.read_magic(header)
+    if version == (1, 0):
+        shape, _, dtype = np.lib.format.read_array_header_1_0(header)
+    else:
+        shape, _, dtype = np.lib.format.read_array_header_2_0(header)
+    start = header.offset
+    end = start + int(np.prod(shape)) * dtype.itemsize
+    return data[start:end].view(dtype).reshape(shape), end
+
+
+class _ByteReader(object):
+    """minimal file-like reader over a mapped array, for the np.lib.format header parsers"""
+
+    def __init__(self, data, offset):
+        self.data = data
+        self.offset = offset
+
+    def read(self, size):
+        chunk = self.data[self.offset:self.offset + size].tobytes()
+        self.offset += len(chunk)
+        return chunk
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
@@ -7,12 +7,21 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
-%module dctfromjpg_wrapper
+%module(threads="1") dctfromjpg_wrapper
 
 
 %{
 #define SWIG_FILE_WITH_INIT
+#include <algorithm>
+#include <cstring>
+#include <memory>
+#include <vector>
+#include "../common/buffer_pool.h"
 #include "../common/dctfromjpg.h"
+#include "../common/encode.h"
+#include "../common/mapped_file.h"
+#include "../common/sparse.h"
+#include "../common/stats.h"
 %}
 
 %include "numpy.i"
@@ -24,14 +33,31 @@ import_array();
 #define SWIG_PYTHON_STRICT_BYTE_CHAR
 %}
 
-%apply (short **ARGOUTVIEWM_ARRAY3, int *DIM1, int *DIM2, int *DIM3) {(short **band1_dct, int *band1_dct_h, int *band1_dct_w, int *band1_dct_b)};
-%apply (short **ARGOUTVIEWM_ARRAY3, int *DIM1, int *DIM2, int *DIM3) {(short **band2_dct, int *band2_dct_h, int *band2_dct_w, int *band2_dct_b)};
-%apply (short **ARGOUTVIEWM_ARRAY3, int *DIM1, int *DIM2, int *DIM3) {(short **band3_dct, int *band3_dct_h, int *band3_dct_w, int *band3_dct_b)};
+%apply (short *INPLACE_ARRAY3, int DIM1, int DIM2, int DIM3) {(short *band1_dct, int band1_dct_h, int band1_dct_w, int band1_dct_b)};
+%apply (short *INPLACE_ARRAY3, int DIM1, int DIM2, int DIM3) {(short *band2_dct, int band2_dct_h, int band2_dct_w, int band2_dct_b)};
+%apply (short *INPLACE_ARRAY3, int DIM1, int DIM2, int DIM3) {(short *band3_dct, int band3_dct_h, int band3_dct_w, int band3_dct_b)};
+
+%apply (short *IN_ARRAY3, int DIM1, int DIM2, int DIM3) {(short *band1, int band1_h, int band1_w, int band1_b)};
+%apply (short *IN_ARRAY3, int DIM1, int DIM2, int DIM3) {(short *band2, int band2_h, int band2_w, int band2_b)};
+%apply (short *IN_ARRAY3, int DIM1, int DIM2, int DIM3) {(short *band3, int band3_h, int band3_w, int band3_b)};
+%apply (unsigned short *IN_ARRAY2, int DIM1, int DIM2) {(unsigned short *quant, int quant_h, int quant_w)};
+%apply (unsigned char *IN_ARRAY3, int DIM1, int DIM2, int DIM3) {(unsigned char *pixels, int height, int width, int components)};
+
+%apply (int *IN_ARRAY1, int DIM1) {(int *coefficients, int nb_coefficients)};
+%apply (float *IN_ARRAY2, int DIM1, int DIM2) {(float *mean, int mean_h, int mean_w)};
+%apply (float *IN_ARRAY2, int DIM1, int DIM2) {(float *std, int std_h, int std_w)};
+
+%include "typemaps.i"
+%apply int *OUTPUT {int *band1_h, int *band1_w, int *band1_b};
+%apply int *OUTPUT {int *band2_h, int *band2_w, int *band2_b};
+%apply int *OUTPUT {int *band3_h, int *band3_w, int *band3_b};
 
 %include "exception.i"
 %exception {
   try {
     $action
+  } catch (file_error &e) {
+    SWIG_exception(SWIG_IOError, e.what());
   } catch (std::runtime_error &e) {
     SWIG_exception(SWIG_RuntimeError, e.what());
   } catch (...) {
@@ -39,5 +65,856 @@ import_array();
   }
 }
 
+// the decoders do not touch Python objects and drop the GIL while running, so
+// that Python threads calling them decode concurrently
+%nothread;
+%thread read_dct_coefficients_from_file_;
+%thread read_dct_coefficients_from_buffer_;
+%thread read_dct_dimensions_from_buffer_;
+%thread read_dct_dimensions_from_buffer;
+%thread read_dct_coefficients_from_buffer_into_;
+%thread read_dct_coefficients_from_buffer_into;
+%thread prefetch_file;
+
+%ignore image_bytes;
+%ignore allocate_image_bands;
+%ignore place_image_bands;
+%ignore release_image_bands;
+%ignore read_dct_coefficients_from_buffers_;
+%ignore read_dct_coefficients_from_files_;
+%ignore read_dct_coefficients_from_buffers_padded_;
+%ignore add_restart_markers_;
+%ignore encode_jpeg_;
+%ignore image_info;
+%ignore probe_buffer_;
+%ignore probe_buffers_;
+
 %include "../common/dctfromjpg.h"
 using namespace jpeg2dct::common;
+
+void prefetch_file(const char *filename);
+
+%{
+using namespace jpeg2dct::common;
+
+// holds the buffer protocol views on a Python sequence of bytes-like objects
+// for the duration of a native call
+struct buffer_list {
+  std::vector<Py_buffer> views;
+  std::vector<char *> data;
+  std::vector<unsigned long> lengths;
+
+  ~buffer_list() {
+    for (auto &view : views) {
+      PyBuffer_Release(&view);
+    }
+  }
+
+  bool acquire(PyObject *sequence) {
+    PyObject *items = PySequence_Fast(sequence, "expected a sequence of bytes");
+    if (items == NULL) {
+      return false;
+    }
+    Py_ssize_t nb_items = PySequence_Fast_GET_SIZE(items);
+    views.reserve(nb_items);
+    for (Py_ssize_t i = 0; i < nb_items; i++) {
+      Py_buffer view;
+      if (PyObject_GetBuffer(PySequence_Fast_GET_ITEM(items, i), &view,
+                             PyBUF_SIMPLE) != 0) {
+        Py_DECREF(items);
+        return false;
+      }
+      views.push_back(view);
+      data.push_back(static_cast<char *>(view.buf));
+      lengths.push_back(static_cast<unsigned long>(view.len));
+    }
+    Py_DECREF(items);
+    return true;
+  }
+};
+
+// a buffer pool shared by a Python object and the arrays of the bands it
+// allocated, which hand their memory back to it when they are released
+typedef std::shared_ptr<buffer_pool> shared_pool;
+
+static void delete_pool_capsule(PyObject *capsule) {
+  delete static_cast<shared_pool *>(
+      PyCapsule_GetPointer(capsule, "jpeg2dct.buffer_pool"));
+}
+
+// the pool of a capsule made by new_buffer_pool, null for None. Sets a Python
+// error and returns null for anything else.
+static shared_pool *get_pool(PyObject *capsule) {
+  if (capsule == Py_None) {
+    return NULL;
+  }
+  return static_cast<shared_pool *>(
+      PyCapsule_GetPointer(capsule, "jpeg2dct.buffer_pool"));
+}
+
+// where the buffer of an image goes back to
+struct pooled_image {
+  shared_pool pool;
+  size_t bytes;
+};
+
+static void delete_image_capsule(PyObject *capsule) {
+  char *memory =
+      static_cast<char *>(PyCapsule_GetPointer(capsule, "jpeg2dct.image"));
+  pooled_image *owner =
+      static_cast<pooled_image *>(PyCapsule_GetContext(capsule));
+  if (owner == NULL) {
+    free_aligned(memory);
+    return;
+  }
+  owner->pool->release(memory, owner->bytes);
+  delete owner;
+}
+
+// wrap the buffer holding the bands of an image in a uint8 numpy array which
+// takes ownership of it, handing it back to `pool` when the array is released
+// if the bands come from it
+static PyObject *image_to_buffer(band_info *bands, shared_pool *pool) {
+  size_t bytes = image_bytes(&bands[0], &bands[1], &bands[2]);
+  npy_intp dims[1] = {(npy_intp)bytes};
+  PyObject *buffer =
+      PyArray_SimpleNewFromData(1, dims, NPY_UINT8, bands[0].dct);
+  if (buffer == NULL) {
+    return NULL;
+  }
+  PyObject *capsule =
+      PyCapsule_New(bands[0].dct, "jpeg2dct.image", delete_image_capsule);
+  if (capsule == NULL) {
+    Py_DECREF(buffer);
+    return NULL;
+  }
+  if (pool != NULL) {
+    PyCapsule_SetContext(capsule, new pooled_image{*pool, bytes});
+  }
+  PyArray_SetBaseObject(reinterpret_cast<PyArrayObject *>(buffer), capsule);
+  for (int b = 0; b < 3; b++) {
+    bands[b].dct = nullptr;
+  }
+  return buffer;
+}
+
+// a numpy array viewing a band in the buffer of its image
+static PyObject *band_view(const band_info *band, char *data,
+                           PyObject *buffer) {
+  static const int typenums[] = {NPY_SHORT, NPY_HALF, NPY_FLOAT};
+  npy_intp dims[3] = {band->dct_h, band->dct_w, band->dct_b};
+  PyObject *array =
+      PyArray_SimpleNewFromData(3, dims, typenums[band->dtype], data);
+  if (array == NULL) {
+    return NULL;
+  }
+  Py_INCREF(buffer);
+  PyArray_SetBaseObject(reinterpret_cast<PyArrayObject *>(array), buffer);
+  return array;
+}
+
+// convert decoded images into a list of [band1, band2, band3] lists, None
+// for the images which failed to decode when `errors` is given. The bands of
+// an image are views of the uint8 array of its buffer, allocated from `pool`
+// when it is given.
+static PyObject *bands_to_list(std::vector<band_info> &bands,
+                               const std::vector<std::string> *errors = NULL,
+                               shared_pool *pool = NULL) {
+  Py_ssize_t nb_images = bands.size() / 3;
+  PyObject *result = PyList_New(nb_images);
+  for (Py_ssize_t i = 0; result != NULL && i < nb_images; i++) {
+    if (errors != NULL && !(*errors)[i].empty()) {
+      Py_INCREF(Py_None);
+      PyList_SET_ITEM(result, i, Py_None);
+      continue;
+    }
+    PyObject *image = PyList_New(3);
+    if (image == NULL) {
+      Py_CLEAR(result);
+      break;
+    }
+    PyList_SET_ITEM(result, i, image);
+    char *data[3];
+    for (int b = 0; b < 3; b++) {
+      data[b] = static_cast<char *>(bands[3 * i + b].dct);
+    }
+    PyObject *buffer = image_to_buffer(&bands[3 * i], pool);
+    if (buffer == NULL) {
+      Py_CLEAR(result);
+      break;
+    }
+    for (int b = 0; b < 3; b++) {
+      PyObject *array = band_view(&bands[3 * i + b], data[b], buffer);
+      if (array == NULL) {
+        Py_CLEAR(result);
+        break;
+      }
+      PyList_SET_ITEM(image, b, array);
+    }
+    Py_DECREF(buffer);
+  }
+  // release whatever has not been handed over to numpy
+  for (size_t i = 0; i < bands.size(); i += 3) {
+    release_image_bands(&bands[i], &bands[i + 1], &bands[i + 2]);
+  }
+  return result;
+}
+
+// the selection of the batched decoders, no index selecting all the
+// coefficients. Sets a Python error and returns NULL for too many indices.
+static const coefficient_selection *
+select_coefficients(int *coefficients, int nb_coefficients,
+                    coefficient_selection *selection) {
+  if (nb_coefficients == 0) {
+    return NULL;
+  }
+  if (nb_coefficients > 64) {
+    PyErr_SetString(PyExc_RuntimeError,
+                    "between 1 and 64 coefficients should be selected");
+    return NULL;
+  }
+  selection->count = nb_coefficients;
+  std::copy(coefficients, coefficients + nb_coefficients, selection->index);
+  return selection;
+}
+
+// the format of the batched decoders, null for int16 bands which are not
+// standardized, scaled nor on a target grid. `mean` and `std` are
+// 3 x nb_coefficients arrays, or empty. Sets a Python error and returns NULL
+// when they do not fit.
+static const band_format *make_band_format(int dtype, float *mean, int mean_h,
+                                           int mean_w, float *std, int std_h,
+                                           int std_w, int target_h,
+                                           int target_w, int crop_mode,
+                                           int pad_mode, int scale_denom,
+                                           band_format *format) {
+  bool standardize = mean_h * mean_w != 0 || std_h * std_w != 0;
+  if (dtype == DTYPE_INT16 && !standardize && target_h == 0 &&
+      target_w == 0 && scale_denom == 1) {
+    return NULL;
+  }
+  format->dtype = dtype;
+  format->standardize = standardize;
+  format->nb_coefficients = mean_w;
+  format->target_h = target_h;
+  format->target_w = target_w;
+  format->crop_mode = crop_mode;
+  format->pad_mode = pad_mode;
+  format->scale_denom = scale_denom;
+  if (standardize) {
+    if (mean_h != 3 || std_h != 3 || mean_w != std_w || mean_w > 64) {
+      PyErr_SetString(PyExc_RuntimeError,
+                      "mean and std should be 3 x nb_coefficients arrays");
+      return NULL;
+    }
+    for (int b = 0; b < 3; b++) {
+      std::copy(mean + b * mean_w, mean + (b + 1) * mean_w, format->mean[b]);
+      std::copy(std + b * std_w, std + (b + 1) * std_w, format->std[b]);
+    }
+  }
+  return format;
+}
+
+// the list of the error message of each image of a batch, None for the
+// decoded ones
+static PyObject *errors_to_list(const std::vector<std::string> &errors) {
+  PyObject *messages = PyList_New(errors.size());
+  for (size_t i = 0; messages != NULL && i < errors.size(); i++) {
+    PyObject *message = errors[i].empty()
+                            ? (Py_INCREF(Py_None), Py_None)
+                            : PyUnicode_DecodeUTF8(errors[i].data(),
+                                                   errors[i].size(), "replace");
+    if (message == NULL) {
+      Py_CLEAR(messages);
+      break;
+    }
+    PyList_SET_ITEM(messages, i, message);
+  }
+  return messages;
+}
+
+// the decoded images of a batch and the list of their error messages
+static PyObject *batch_to_tuple(std::vector<band_info> &bands,
+                                const std::vector<std::string> &errors,
+                                shared_pool *pool) {
+  PyObject *images = bands_to_list(bands, &errors, pool);
+  PyObject *messages = images != NULL ? errors_to_list(errors) : NULL;
+  if (messages == NULL) {
+    Py_XDECREF(images);
+    return NULL;
+  }
+  return Py_BuildValue("(NN)", images, messages);
+}
+
+// allocate the batched bands of a padded batch as numpy arrays, in `arrays`.
+// Called by the decoders without the GIL.
+static void allocate_batches(int nb_images, band_info *outputs,
+                             PyObject **arrays) {
+  static const int typenums[] = {NPY_SHORT, NPY_HALF, NPY_FLOAT};
+  PyGILState_STATE gil = PyGILState_Ensure();
+  bool failed = false;
+  for (int b = 0; b < 3 && !failed; b++) {
+    npy_intp dims[4] = {nb_images, outputs[b].dct_h, outputs[b].dct_w,
+                        outputs[b].dct_b};
+    arrays[b] = PyArray_SimpleNew(4, dims, typenums[outputs[b].dtype]);
+    failed = arrays[b] == NULL;
+    if (!failed) {
+      outputs[b].dct =
+          PyArray_DATA(reinterpret_cast<PyArrayObject *>(arrays[b]));
+    }
+  }
+  if (failed) {
+    PyErr_Clear();
+  }
+  PyGILState_Release(gil);
+  if (failed) {
+    throw std::runtime_error("cannot allocate the bands of the batch");
+  }
+}
+
+// the nb_images x channels x 2 int32 array of the block grid of each band
+static PyObject *band_sizes(const std::vector<band_info> &bands,
+                            int channels) {
+  npy_intp dims[3] = {(npy_intp)bands.size() / 3, channels, 2};
+  PyObject *sizes = PyArray_SimpleNew(3, dims, NPY_INT32);
+  if (sizes == NULL) {
+    return NULL;
+  }
+  int *data = static_cast<int *>(
+      PyArray_DATA(reinterpret_cast<PyArrayObject *>(sizes)));
+  for (npy_intp i = 0; i < dims[0]; i++) {
+    for (int c = 0; c < channels; c++) {
+      *data++ = bands[3 * i + c].dct_h;
+      *data++ = bands[3 * i + c].dct_w;
+    }
+  }
+  return sizes;
+}
+
+// describe a probed image as a dict
+static PyObject *image_info_to_dict(const image_info &info) {
+  static const char *decode_paths[] = {"direct", "resample", "transcode"};
+  PyObject *components = PyList_New(0);
+  for (int i = 0; components != NULL &&
+                  i < std::min(info.num_components, kMaxProbedComponents);
+       i++) {
+    npy_intp dims[1] = {64};
+    PyObject *table = PyArray_SimpleNew(1, dims, NPY_UINT16);
+    if (table == NULL) {
+      Py_CLEAR(components);
+      break;
+    }
+    std::memcpy(PyArray_DATA(reinterpret_cast<PyArrayObject *>(table)),
+                info.quant_table[i], sizeof(info.quant_table[i]));
+    PyObject *component = Py_BuildValue(
+        "{s:(II),s:(ii),s:N}", "blocks", info.block_h[i], info.block_w[i],
+        "sampling", info.h_samp[i], info.v_samp[i], "quant_table", table);
+    if (component == NULL || PyList_Append(components, component) != 0) {
+      Py_XDECREF(component);
+      Py_CLEAR(components);
+      break;
+    }
+    Py_DECREF(component);
+  }
+  if (components == NULL) {
+    return NULL;
+  }
+  return Py_BuildValue(
+      "{s:(II),s:i,s:O,s:s,s:N,s:[(III)(III)(III)]}", "size", info.image_h,
+      info.image_w, "num_components", info.num_components, "progressive",
+      info.progressive ? Py_True : Py_False, "decode_path",
+      decode_paths[info.decode_path], "components", components, "dct_shapes",
+      info.dct_h[0], info.dct_w[0], 64, info.dct_h[1], info.dct_w[1], 64,
+      info.dct_h[2], info.dct_w[2], 64);
+}
+
+static const char *phase_names[kNumPhases] = {"header", "coefficients", "copy",
+                                              "resample", "transcode"};
+
+// the trace of a decoded image as a dict, see jpeg2dct.numpy.set_trace_hook
+static PyObject *trace_to_dict(const decode_trace *trace) {
+  static const char *decode_paths[] = {"direct", "resample", "transcode"};
+  PyObject *seconds = PyDict_New();
+  for (int i = 0; seconds != NULL && i <= kNumPhases; i++) {
+    long long ns = i < kNumPhases ? trace->phase_ns[i].load() : trace->total_ns;
+    PyObject *value = PyFloat_FromDouble(ns * 1e-9);
+    if (value == NULL ||
+        PyDict_SetItemString(seconds, i < kNumPhases ? phase_names[i] : "total",
+                             value) != 0) {
+      Py_XDECREF(value);
+      Py_CLEAR(seconds);
+      break;
+    }
+    Py_DECREF(value);
+  }
+  if (seconds == NULL) {
+    return NULL;
+  }
+  const char *path = trace->decode_path >= 0 && trace->decode_path < 3
+                         ? decode_paths[trace->decode_path]
+                         : NULL;
+  return Py_BuildValue(
+      "{s:k,s:(II),s:i,s:O,s:z,s:O,s:O,s:z,s:N}", "bytes", trace->bytes,
+      "size", trace->image_h, trace->image_w, "num_components",
+      trace->num_components, "progressive",
+      trace->progressive ? Py_True : Py_False, "decode_path", path,
+      "segmented", trace->segmented ? Py_True : Py_False, "cropped",
+      trace->cropped ? Py_True : Py_False, "error", trace->error, "seconds",
+      seconds);
+}
+
+// the Python trace hook, only accessed with the GIL held
+static PyObject *trace_callback = NULL;
+
+// called on the decoding threads, which do not hold the GIL
+static void call_trace_callback(const decode_trace *trace) {
+  if (!Py_IsInitialized()) {
+    return;
+  }
+  PyGILState_STATE gil = PyGILState_Ensure();
+  PyObject *callback = trace_callback;
+  if (callback != NULL) {
+    Py_INCREF(callback);
+    PyObject *info = trace_to_dict(trace);
+    PyObject *result =
+        info != NULL ? PyObject_CallFunctionObjArgs(callback, info, NULL)
+                     : NULL;
+    if (result == NULL) {
+      PyErr_WriteUnraisable(callback);
+    }
+    Py_XDECREF(result);
+    Py_XDECREF(info);
+    Py_DECREF(callback);
+  }
+  PyGILState_Release(gil);
+}
+%}
+
+%inline %{
+PyObject *read_dct_coefficients_from_buffers(
+    PyObject *buffers, bool normalized, int channels, int crop_y, int crop_x,
+    int crop_h, int crop_w, int *coefficients, int nb_coefficients, int dtype,
+    float *mean, int mean_h, int mean_w, float *std, int std_h, int std_w,
+    int target_h, int target_w, int target_crop, int target_pad,
+    int scale_denom, int num_threads, bool skip_failures, PyObject *pool) {
+  shared_pool *bands_pool = get_pool(pool);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  buffer_list inputs;
+  if (!inputs.acquire(buffers)) {
+    return NULL;
+  }
+  crop_window crop = {crop_y, crop_x, crop_h, crop_w};
+  coefficient_selection selection;
+  const coefficient_selection *selected =
+      select_coefficients(coefficients, nb_coefficients, &selection);
+  if (selected == NULL && nb_coefficients != 0) {
+    return NULL;
+  }
+  band_format format;
+  const band_format *formatted =
+      make_band_format(dtype, mean, mean_h, mean_w, std, std_h, std_w,
+                       target_h, target_w, target_crop, target_pad, scale_denom,
+                       &format);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  std::vector<band_info> bands(3 * inputs.data.size());
+  std::vector<std::string> errors(inputs.data.size());
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    pool_scope scope(bands_pool != NULL ? bands_pool->get() : NULL);
+    read_dct_coefficients_from_buffers_(
+        inputs.data.data(), inputs.lengths.data(), (int)inputs.data.size(),
+        normalized, channels, bands.data(), num_threads,
+        crop_h == 0 && crop_w == 0 ? NULL : &crop, selected, formatted,
+        skip_failures ? errors.data() : NULL);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return batch_to_tuple(bands, errors, bands_pool);
+}
+
+PyObject *read_dct_coefficients_from_files(
+    PyObject *filenames, bool normalized, int channels, int crop_y,
+    int crop_x, int crop_h, int crop_w, int *coefficients,
+    int nb_coefficients, int dtype, float *mean, int mean_h, int mean_w,
+    float *std, int std_h, int std_w, int target_h, int target_w,
+    int target_crop, int target_pad, int scale_denom, int num_threads,
+    bool skip_failures, PyObject *pool) {
+  shared_pool *bands_pool = get_pool(pool);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  buffer_list inputs;
+  if (!inputs.acquire(filenames)) {
+    return NULL;
+  }
+  // the filenames are handed to open and need to be null terminated
+  std::vector<std::vector<char>> paths;
+  std::vector<char *> path_ptrs;
+  for (size_t i = 0; i < inputs.data.size(); i++) {
+    paths.emplace_back(inputs.data[i], inputs.data[i] + inputs.lengths[i]);
+    paths.back().push_back('\0');
+  }
+  for (auto &path : paths) {
+    path_ptrs.push_back(path.data());
+  }
+  crop_window crop = {crop_y, crop_x, crop_h, crop_w};
+  coefficient_selection selection;
+  const coefficient_selection *selected =
+      select_coefficients(coefficients, nb_coefficients, &selection);
+  if (selected == NULL && nb_coefficients != 0) {
+    return NULL;
+  }
+  band_format format;
+  const band_format *formatted =
+      make_band_format(dtype, mean, mean_h, mean_w, std, std_h, std_w,
+                       target_h, target_w, target_crop, target_pad, scale_denom,
+                       &format);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  std::vector<band_info> bands(3 * paths.size());
+  std::vector<std::string> errors(paths.size());
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    pool_scope scope(bands_pool != NULL ? bands_pool->get() : NULL);
+    read_dct_coefficients_from_files_(
+        path_ptrs.data(), (int)path_ptrs.size(), normalized, channels,
+        bands.data(), num_threads, crop_h == 0 && crop_w == 0 ? NULL : &crop,
+        selected, formatted, skip_failures ? errors.data() : NULL);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return batch_to_tuple(bands, errors, bands_pool);
+}
+
+PyObject *read_dct_coefficients_from_buffers_padded(
+    PyObject *buffers, bool normalized, int channels, int crop_y, int crop_x,
+    int crop_h, int crop_w, int *coefficients, int nb_coefficients, int dtype,
+    float *mean, int mean_h, int mean_w, float *std, int std_h, int std_w,
+    int target_h, int target_w, int target_crop, int target_pad,
+    int scale_denom, int num_threads, bool skip_failures, PyObject *pool) {
+  shared_pool *bands_pool = get_pool(pool);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  buffer_list inputs;
+  if (!inputs.acquire(buffers)) {
+    return NULL;
+  }
+  crop_window crop = {crop_y, crop_x, crop_h, crop_w};
+  coefficient_selection selection;
+  const coefficient_selection *selected =
+      select_coefficients(coefficients, nb_coefficients, &selection);
+  if (selected == NULL && nb_coefficients != 0) {
+    return NULL;
+  }
+  band_format format;
+  const band_format *formatted =
+      make_band_format(dtype, mean, mean_h, mean_w, std, std_h, std_w,
+                       target_h, target_w, target_crop, target_pad, scale_denom,
+                       &format);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  int nb_images = (int)inputs.data.size();
+  std::vector<band_info> bands(3 * nb_images);
+  std::vector<std::string> errors(nb_images);
+  band_info outputs[3];
+  PyObject *arrays[3] = {NULL, NULL, NULL};
+  try {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    pool_scope scope(bands_pool != NULL ? bands_pool->get() : NULL);
+    read_dct_coefficients_from_buffers_padded_(
+        inputs.data.data(), inputs.lengths.data(), nb_images, normalized,
+        channels, bands.data(), outputs,
+        [&](band_info *outputs) {
+          allocate_batches(nb_images, outputs, arrays);
+        },
+        num_threads, crop_h == 0 && crop_w == 0 ? NULL : &crop, selected,
+        formatted, skip_failures ? errors.data() : NULL);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  } catch (...) {
+    for (int b = 0; b < 3; b++) {
+      Py_XDECREF(arrays[b]);
+    }
+    throw;
+  }
+  PyObject *sizes = band_sizes(bands, channels);
+  PyObject *messages = sizes != NULL ? errors_to_list(errors) : NULL;
+  if (messages == NULL) {
+    Py_XDECREF(sizes);
+    for (int b = 0; b < 3; b++) {
+      Py_DECREF(arrays[b]);
+    }
+    return NULL;
+  }
+  return Py_BuildValue("([NNN]NN)", arrays[0], arrays[1], arrays[2], sizes,
+                       messages);
+}
+
+// decode an image into `image`, a writable buffer receiving its bands laid out
+// as the buffers of the decoded images. Returns the list of the shapes of the
+// bands, or None when they do not fit and `image` is left untouched.
+PyObject *read_dct_coefficients_from_buffer_into_image(
+    PyObject *buffer, PyObject *image, bool normalized, int channels,
+    int crop_y, int crop_x, int crop_h, int crop_w, int *coefficients,
+    int nb_coefficients, int dtype, float *mean, int mean_h, int mean_w,
+    float *std, int std_h, int std_w, int target_h, int target_w,
+    int target_crop, int target_pad, int scale_denom) {
+  crop_window crop = {crop_y, crop_x, crop_h, crop_w};
+  coefficient_selection selection;
+  const coefficient_selection *selected =
+      select_coefficients(coefficients, nb_coefficients, &selection);
+  if (selected == NULL && nb_coefficients != 0) {
+    return NULL;
+  }
+  band_format format;
+  const band_format *formatted =
+      make_band_format(dtype, mean, mean_h, mean_w, std, std_h, std_w,
+                       target_h, target_w, target_crop, target_pad, scale_denom,
+                       &format);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  Py_buffer input, output;
+  if (PyObject_GetBuffer(buffer, &input, PyBUF_SIMPLE) != 0) {
+    return NULL;
+  }
+  if (PyObject_GetBuffer(image, &output, PyBUF_WRITABLE) != 0) {
+    PyBuffer_Release(&input);
+    return NULL;
+  }
+  band_info bands[3];
+  bool fits = false;
+  try {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    char *data = static_cast<char *>(input.buf);
+    unsigned long length = static_cast<unsigned long>(input.len);
+    const crop_window *window = crop_h == 0 && crop_w == 0 ? NULL : &crop;
+    read_dct_dimensions_from_buffer_(data, length, channels, &bands[0],
+                                     &bands[1], &bands[2], window, selected,
+                                     formatted);
+    fits = image_bytes(&bands[0], &bands[1], &bands[2]) <=
+           static_cast<size_t>(output.len);
+    if (fits) {
+      place_image_bands(static_cast<char *>(output.buf), &bands[0], &bands[1],
+                        &bands[2]);
+      read_dct_coefficients_from_buffer_into_(data, length, normalized,
+                                              channels, &bands[0], &bands[1],
+                                              &bands[2], window, selected,
+                                              formatted);
+    }
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  } catch (...) {
+    PyBuffer_Release(&output);
+    PyBuffer_Release(&input);
+    throw;
+  }
+  PyBuffer_Release(&output);
+  PyBuffer_Release(&input);
+  if (!fits) {
+    Py_RETURN_NONE;
+  }
+  PyObject *shapes = PyList_New(channels);
+  for (int b = 0; shapes != NULL && b < channels; b++) {
+    PyObject *shape = Py_BuildValue("(III)", bands[b].dct_h, bands[b].dct_w,
+                                    bands[b].dct_b);
+    if (shape == NULL) {
+      Py_CLEAR(shapes);
+      break;
+    }
+    PyList_SET_ITEM(shapes, b, shape);
+  }
+  return shapes;
+}
+
+// whether `capsule` owns the buffer of a decoded image, see image_to_buffer
+bool is_image_capsule(PyObject *capsule) {
+  return PyCapsule_IsValid(capsule, "jpeg2dct.image") != 0;
+}
+
+PyObject *new_buffer_pool(unsigned long max_bytes) {
+  return PyCapsule_New(new shared_pool(new buffer_pool(max_bytes)),
+                       "jpeg2dct.buffer_pool", delete_pool_capsule);
+}
+
+PyObject *buffer_pool_stats(PyObject *pool) {
+  shared_pool *bands_pool = get_pool(pool);
+  if (bands_pool == NULL) {
+    if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_ValueError, "a buffer pool is expected");
+    }
+    return NULL;
+  }
+  return Py_BuildValue("(nnn)", (Py_ssize_t)(*bands_pool)->hits(),
+                       (Py_ssize_t)(*bands_pool)->misses(),
+                       (Py_ssize_t)(*bands_pool)->free_bytes());
+}
+
+PyObject *probe_buffers(PyObject *buffers, int num_threads) {
+  buffer_list inputs;
+  if (!inputs.acquire(buffers)) {
+    return NULL;
+  }
+  std::vector<image_info> infos(inputs.data.size());
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    probe_buffers_(inputs.data.data(), inputs.lengths.data(),
+                   (int)inputs.data.size(), infos.data(), num_threads);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  PyObject *result = PyList_New(infos.size());
+  for (size_t i = 0; result != NULL && i < infos.size(); i++) {
+    PyObject *info = image_info_to_dict(infos[i]);
+    if (info == NULL) {
+      Py_CLEAR(result);
+      break;
+    }
+    PyList_SET_ITEM(result, i, info);
+  }
+  return result;
+}
+
+// the decoder statistics as the list of the counters and the list of the
+// seconds spent in each phase followed by the total
+PyObject *get_stats(bool reset) {
+  decoder_stats stats;
+  get_decoder_stats(reset, &stats);
+  PyObject *counters = PyList_New(kNumCounters);
+  PyObject *seconds = PyList_New(kNumPhases + 1);
+  if (counters == NULL || seconds == NULL) {
+    Py_XDECREF(counters);
+    Py_XDECREF(seconds);
+    return NULL;
+  }
+  for (int i = 0; i < kNumCounters; i++) {
+    PyList_SET_ITEM(counters, i, PyLong_FromLongLong(stats.counters[i]));
+  }
+  for (int i = 0; i <= kNumPhases; i++) {
+    long long ns = i < kNumPhases ? stats.phase_ns[i] : stats.total_ns;
+    PyList_SET_ITEM(seconds, i, PyFloat_FromDouble(ns * 1e-9));
+  }
+  return Py_BuildValue("(NN)", counters, seconds);
+}
+
+// install a callable called with the trace of every decoded image, None
+// removes it
+PyObject *set_trace_callback(PyObject *callback) {
+  PyObject *previous = trace_callback;
+  if (callback == Py_None) {
+    set_trace_hook(nullptr);
+    trace_callback = NULL;
+  } else {
+    Py_INCREF(callback);
+    trace_callback = callback;
+    set_trace_hook(call_trace_callback);
+  }
+  Py_XDECREF(previous);
+  Py_RETURN_NONE;
+}
+
+PyObject *add_restart_markers(char *buffer, unsigned long buffer_len,
+                              int restart_rows) {
+  std::string output;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    add_restart_markers_(buffer, buffer_len, restart_rows, &output);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return PyBytes_FromStringAndSize(output.data(), output.size());
+}
+
+PyObject *encode_dct_coefficients(unsigned char *pixels, int height,
+                                  int width, int components, bool bgr,
+                                  int quality, bool normalized, int channels) {
+  std::vector<band_info> bands(3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    encode_dct_coefficients_(pixels, height, width, components, bgr, quality,
+                             normalized, channels, &bands[0], &bands[1],
+                             &bands[2]);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  PyObject *images = bands_to_list(bands);
+  if (images == NULL) {
+    return NULL;
+  }
+  PyObject *image = PyList_GetItem(images, 0);
+  Py_INCREF(image);
+  Py_DECREF(images);
+  return image;
+}
+
+PyObject *encode_jpeg(unsigned char *pixels, int height, int width,
+                      int components, bool bgr, int quality, int h_samp,
+                      int v_samp, bool progressive, int restart_rows) {
+  std::string output;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    encode_jpeg_(pixels, height, width, components, bgr, quality, &output,
+                 h_samp, v_samp, progressive, restart_rows);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return PyBytes_FromStringAndSize(output.data(), output.size());
+}
+
+// the luminance and chrominance quantization tables of a quality, as a 2 x 64
+// array
+PyObject *quality_quant_tables(int quality) {
+  npy_intp dims[2] = {2, 64};
+  PyObject *tables = PyArray_SimpleNew(2, dims, NPY_UINT16);
+  if (tables == NULL) {
+    return NULL;
+  }
+  quality_quant_tables_(quality, static_cast<unsigned short *>(PyArray_DATA(
+                                     reinterpret_cast<PyArrayObject *>(tables))));
+  return tables;
+}
+
+PyObject *pack_sparse(int channels, short *band1, int band1_h, int band1_w,
+                      int band1_b, short *band2, int band2_h, int band2_w,
+                      int band2_b, short *band3, int band3_h, int band3_w,
+                      int band3_b, unsigned short *quant, int quant_h,
+                      int quant_w) {
+  if (quant_h != channels || quant_w != 64) {
+    PyErr_SetString(PyExc_RuntimeError,
+                    "quant should be a channels x 64 array");
+    return NULL;
+  }
+  band_info bands[3] = {
+      {band1, (unsigned)band1_h, (unsigned)band1_w, (unsigned)band1_b,
+       DTYPE_INT16},
+      {band2, (unsigned)band2_h, (unsigned)band2_w, (unsigned)band2_b,
+       DTYPE_INT16},
+      {band3, (unsigned)band3_h, (unsigned)band3_w, (unsigned)band3_b,
+       DTYPE_INT16}};
+  std::string output;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    pack_sparse_(bands, channels, quant, &output);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return PyBytes_FromStringAndSize(output.data(), output.size());
+}
+
+PyObject *unpack_sparse(char *buffer, unsigned long buffer_len,
+                        bool normalized) {
+  std::vector<band_info> bands(3);
+  int nb_bands;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    unpack_sparse_(buffer, buffer_len, normalized, &bands[0], &bands[1],
+                   &bands[2], &nb_bands);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  PyObject *images = bands_to_list(bands);
+  if (images == NULL) {
+    return NULL;
+  }
+  PyObject *image = PyList_GetSlice(PyList_GET_ITEM(images, 0), 0, nb_bands);
+  Py_DECREF(images);
+  return image;
+}
+%}
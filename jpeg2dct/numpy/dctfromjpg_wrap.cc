@@ -1,7 +1,7 @@
-// Command: swig -python -modern -c++ -o dctfromjpg_wrap.cc dctfromjpg.i
+// Command: swig -python -c++ -o dctfromjpg_wrap.cc dctfromjpg.i
 /* ----------------------------------------------------------------------------
  * This file was automatically generated by SWIG (http://www.swig.org).
- * Version 3.0.10
+ * Version 4.0.2
  *
  * This file is not intended to be easily readable and contains a number of
  * coding conventions designed to improve portability and efficiency. Do not make
@@ -17,6 +17,7 @@
 #define SWIGPYTHON
 #endif
 
+#define SWIG_PYTHON_THREADS
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
 
 
@@ -168,11 +169,16 @@ template <typename T> T SwigValueInit() {
 #endif
 
 
+#if defined(__GNUC__) && defined(_WIN32) && !defined(SWIG_PYTHON_NO_HYPOT_WORKAROUND)
+/* Workaround for '::hypot' has not been declared', see https://bugs.python.org/issue11566 */
+# include <math.h>
+#endif
+
 #if defined(_DEBUG) && defined(SWIG_PYTHON_INTERPRETER_NO_DEBUG)
 /* Use debug wrappers with the Python release dll */
 # undef _DEBUG
 # include <Python.h>
-# define _DEBUG
+# define _DEBUG 1
 #else
 # include <Python.h>
 #endif
@@ -222,6 +228,7 @@ template <typename T> T SwigValueInit() {
 /* Flags for pointer conversions */
 #define SWIG_POINTER_DISOWN        0x1
 #define SWIG_CAST_NEW_MEMORY       0x2
+#define SWIG_POINTER_NO_NULL       0x4
 
 /* Flags for new pointer objects */
 #define SWIG_POINTER_OWN           0x1
@@ -806,25 +813,31 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 SWIGINTERN char*
 SWIG_Python_str_AsChar(PyObject *str)
 {
-#if PY_VERSION_HEX >= 0x03000000
-  char *cstr;
-  char *newstr;
-  Py_ssize_t len;
+#if PY_VERSION_HEX >= 0x03030000
+  return (char *)PyUnicode_AsUTF8(str);
+#elif PY_VERSION_HEX >= 0x03000000
+  char *newstr = 0;
   str = PyUnicode_AsUTF8String(str);
-  PyBytes_AsStringAndSize(str, &cstr, &len);
-  newstr = (char *) malloc(len+1);
-  memcpy(newstr, cstr, len+1);
-  Py_XDECREF(str);
+  if (str) {
+    char *cstr;
+    Py_ssize_t len;
+    if (PyBytes_AsStringAndSize(str, &cstr, &len) != -1) {
+      newstr = (char *) malloc(len+1);
+      if (newstr)
+        memcpy(newstr, cstr, len+1);
+    }
+    Py_XDECREF(str);
+  }
   return newstr;
 #else
   return PyString_AsString(str);
 #endif
 }
 
-#if PY_VERSION_HEX >= 0x03000000
-#  define SWIG_Python_str_DelForPy3(x) free( (void*) (x) )
+#if PY_VERSION_HEX >= 0x03030000 || PY_VERSION_HEX < 0x03000000
+#  define SWIG_Python_str_DelForPy3(x)
 #else
-#  define SWIG_Python_str_DelForPy3(x) 
+#  define SWIG_Python_str_DelForPy3(x) free( (void*) (x) )
 #endif
 
 
@@ -838,148 +851,19 @@ SWIG_Python_str_FromChar(const char *c)
 #endif
 }
 
-/* Add PyOS_snprintf for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
-# if defined(_MSC_VER) || defined(__BORLANDC__) || defined(_WATCOM)
-#  define PyOS_snprintf _snprintf
-# else
-#  define PyOS_snprintf snprintf
-# endif
-#endif
-
-/* A crude PyString_FromFormat implementation for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
-
-#ifndef SWIG_PYBUFFER_SIZE
-# define SWIG_PYBUFFER_SIZE 1024
-#endif
-
-static PyObject *
-PyString_FromFormat(const char *fmt, ...) {
-  va_list ap;
-  char buf[SWIG_PYBUFFER_SIZE * 2];
-  int res;
-  va_start(ap, fmt);
-  res = vsnprintf(buf, sizeof(buf), fmt, ap);
-  va_end(ap);
-  return (res < 0 || res >= (int)sizeof(buf)) ? 0 : PyString_FromString(buf);
-}
-#endif
-
 #ifndef PyObject_DEL
 # define PyObject_DEL PyObject_Del
 #endif
 
-/* A crude PyExc_StopIteration exception for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
-# ifndef PyExc_StopIteration
-#  define PyExc_StopIteration PyExc_RuntimeError
-# endif
-# ifndef PyObject_GenericGetAttr
-#  define PyObject_GenericGetAttr 0
-# endif
-#endif
-
-/* Py_NotImplemented is defined in 2.1 and up. */
-#if PY_VERSION_HEX < 0x02010000
-# ifndef Py_NotImplemented
-#  define Py_NotImplemented PyExc_RuntimeError
-# endif
-#endif
-
-/* A crude PyString_AsStringAndSize implementation for old Pythons */
-#if PY_VERSION_HEX < 0x02010000
-# ifndef PyString_AsStringAndSize
-#  define PyString_AsStringAndSize(obj, s, len) {*s = PyString_AsString(obj); *len = *s ? strlen(*s) : 0;}
-# endif
-#endif
-
-/* PySequence_Size for old Pythons */
-#if PY_VERSION_HEX < 0x02000000
-# ifndef PySequence_Size
-#  define PySequence_Size PySequence_Length
-# endif
-#endif
-
-/* PyBool_FromLong for old Pythons */
-#if PY_VERSION_HEX < 0x02030000
-static
-PyObject *PyBool_FromLong(long ok)
-{
-  PyObject *result = ok ? Py_True : Py_False;
-  Py_INCREF(result);
-  return result;
-}
-#endif
-
-/* Py_ssize_t for old Pythons */
-/* This code is as recommended by: */
-/* http://www.python.org/dev/peps/pep-0353/#conversion-guidelines */
-#if PY_VERSION_HEX < 0x02050000 && !defined(PY_SSIZE_T_MIN)
-typedef int Py_ssize_t;
-# define PY_SSIZE_T_MAX INT_MAX
-# define PY_SSIZE_T_MIN INT_MIN
-typedef inquiry lenfunc;
-typedef intargfunc ssizeargfunc;
-typedef intintargfunc ssizessizeargfunc;
-typedef intobjargproc ssizeobjargproc;
-typedef intintobjargproc ssizessizeobjargproc;
-typedef getreadbufferproc readbufferproc;
-typedef getwritebufferproc writebufferproc;
-typedef getsegcountproc segcountproc;
-typedef getcharbufferproc charbufferproc;
-static long PyNumber_AsSsize_t (PyObject *x, void *SWIGUNUSEDPARM(exc))
-{
-  long result = 0;
-  PyObject *i = PyNumber_Int(x);
-  if (i) {
-    result = PyInt_AsLong(i);
-    Py_DECREF(i);
-  }
-  return result;
-}
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-#define PyInt_FromSize_t(x) PyInt_FromLong((long)x)
-#endif
-
-#if PY_VERSION_HEX < 0x02040000
-#define Py_VISIT(op)				\
-  do { 						\
-    if (op) {					\
-      int vret = visit((op), arg);		\
-      if (vret)					\
-        return vret;				\
-    }						\
-  } while (0)
-#endif
-
-#if PY_VERSION_HEX < 0x02030000
-typedef struct {
-  PyTypeObject type;
-  PyNumberMethods as_number;
-  PyMappingMethods as_mapping;
-  PySequenceMethods as_sequence;
-  PyBufferProcs as_buffer;
-  PyObject *name, *slots;
-} PyHeapTypeObject;
-#endif
-
-#if PY_VERSION_HEX < 0x02030000
-typedef destructor freefunc;
-#endif
-
-#if ((PY_MAJOR_VERSION == 2 && PY_MINOR_VERSION > 6) || \
-     (PY_MAJOR_VERSION == 3 && PY_MINOR_VERSION > 0) || \
-     (PY_MAJOR_VERSION > 3))
+// SWIGPY_USE_CAPSULE is no longer used within SWIG itself, but some user
+// interface files check for it.
 # define SWIGPY_USE_CAPSULE
-# define SWIGPY_CAPSULE_NAME ((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION ".type_pointer_capsule" SWIG_TYPE_TABLE_NAME)
-#endif
+# define SWIGPY_CAPSULE_NAME ("swig_runtime_data" SWIG_RUNTIME_VERSION ".type_pointer_capsule" SWIG_TYPE_TABLE_NAME)
 
 #if PY_VERSION_HEX < 0x03020000
 #define PyDescr_TYPE(x) (((PyDescrObject *)(x))->d_type)
 #define PyDescr_NAME(x) (((PyDescrObject *)(x))->d_name)
+#define Py_hash_t long
 #endif
 
 /* -----------------------------------------------------------------------------
@@ -1037,14 +921,17 @@ SWIG_Python_AddErrorMsg(const char* mesg)
   PyObject *value = 0;
   PyObject *traceback = 0;
 
-  if (PyErr_Occurred()) PyErr_Fetch(&type, &value, &traceback);
+  if (PyErr_Occurred())
+    PyErr_Fetch(&type, &value, &traceback);
   if (value) {
-    char *tmp;
     PyObject *old_str = PyObject_Str(value);
+    const char *tmp = SWIG_Python_str_AsChar(old_str);
     PyErr_Clear();
     Py_XINCREF(type);
-
-    PyErr_Format(type, "%s %s", tmp = SWIG_Python_str_AsChar(old_str), mesg);
+    if (tmp)
+      PyErr_Format(type, "%s %s", tmp, mesg);
+    else
+      PyErr_Format(type, "%s", mesg);
     SWIG_Python_str_DelForPy3(tmp);
     Py_DECREF(old_str);
     Py_DECREF(value);
@@ -1053,6 +940,37 @@ SWIG_Python_AddErrorMsg(const char* mesg)
   }
 }
 
+SWIGRUNTIME int
+SWIG_Python_TypeErrorOccurred(PyObject *obj)
+{
+  PyObject *error;
+  if (obj)
+    return 0;
+  error = PyErr_Occurred();
+  return error && PyErr_GivenExceptionMatches(error, PyExc_TypeError);
+}
+
+SWIGRUNTIME void
+SWIG_Python_RaiseOrModifyTypeError(const char *message)
+{
+  if (SWIG_Python_TypeErrorOccurred(NULL)) {
+    /* Use existing TypeError to preserve stacktrace and enhance with given message */
+    PyObject *newvalue;
+    PyObject *type = NULL, *value = NULL, *traceback = NULL;
+    PyErr_Fetch(&type, &value, &traceback);
+#if PY_VERSION_HEX >= 0x03000000
+    newvalue = PyUnicode_FromFormat("%S\nAdditional information:\n%s", value, message);
+#else
+    newvalue = PyString_FromFormat("%s\nAdditional information:\n%s", PyString_AsString(value), message);
+#endif
+    Py_XDECREF(value);
+    PyErr_Restore(type, newvalue, traceback);
+  } else {
+    /* Raise TypeError using given message */
+    PyErr_SetString(PyExc_TypeError, message);
+  }
+}
+
 #if defined(SWIG_PYTHON_NO_THREADS)
 #  if defined(SWIG_PYTHON_THREADS)
 #    undef SWIG_PYTHON_THREADS
@@ -1060,9 +978,7 @@ SWIG_Python_AddErrorMsg(const char* mesg)
 #endif
 #if defined(SWIG_PYTHON_THREADS) /* Threading support is enabled */
 #  if !defined(SWIG_PYTHON_USE_GIL) && !defined(SWIG_PYTHON_NO_USE_GIL)
-#    if (PY_VERSION_HEX >= 0x02030000) /* For 2.3 or later, use the PyGILState calls */
-#      define SWIG_PYTHON_USE_GIL
-#    endif
+#    define SWIG_PYTHON_USE_GIL
 #  endif
 #  if defined(SWIG_PYTHON_USE_GIL) /* Use PyGILState threads calls */
 #    ifndef SWIG_PYTHON_INITIALIZE_THREADS
@@ -1139,30 +1055,13 @@ extern "C" {
 /* Constant information structure */
 typedef struct swig_const_info {
   int type;
-  char *name;
+  const char *name;
   long lvalue;
   double dvalue;
   void   *pvalue;
   swig_type_info **ptype;
 } swig_const_info;
 
-
-/* -----------------------------------------------------------------------------
- * Wrapper of PyInstanceMethod_New() used in Python 3
- * It is exported to the generated module, used for -fastproxy
- * ----------------------------------------------------------------------------- */
-#if PY_VERSION_HEX >= 0x03000000
-SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func)
-{
-  return PyInstanceMethod_New(func);
-}
-#else
-SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *SWIGUNUSEDPARM(func))
-{
-  return NULL;
-}
-#endif
-
 #ifdef __cplusplus
 }
 #endif
@@ -1177,6 +1076,14 @@ SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self),
  *
  * ----------------------------------------------------------------------------- */
 
+#if PY_VERSION_HEX < 0x02070000 /* 2.7.0 */
+# error "This version of SWIG only supports Python >= 2.7"
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000 && PY_VERSION_HEX < 0x03020000
+# error "This version of SWIG only supports Python 3 >= 3.2"
+#endif
+
 /* Common SWIG API */
 
 /* for raw pointers */
@@ -1260,11 +1167,7 @@ SwigPyBuiltin_AddPublicSymbol(PyObject *seq, const char *key) {
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *name, PyObject *obj) {   
-#if PY_VERSION_HEX < 0x02030000
-  PyDict_SetItemString(d, (char *)name, obj);
-#else
   PyDict_SetItemString(d, name, obj);
-#endif
   Py_DECREF(obj);
   if (public_interface)
     SwigPyBuiltin_AddPublicSymbol(public_interface, name);
@@ -1274,11 +1177,7 @@ SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *nam
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, const char *name, PyObject *obj) {   
-#if PY_VERSION_HEX < 0x02030000
-  PyDict_SetItemString(d, (char *)name, obj);
-#else
   PyDict_SetItemString(d, name, obj);
-#endif
   Py_DECREF(obj);                            
 }
 
@@ -1288,7 +1187,6 @@ SWIG_Python_SetConstant(PyObject *d, const char *name, PyObject *obj) {
 
 SWIGINTERN PyObject*
 SWIG_Python_AppendOutput(PyObject* result, PyObject* obj) {
-#if !defined(SWIG_PYTHON_OUTPUT_TUPLE)
   if (!result) {
     result = obj;
   } else if (result == Py_None) {
@@ -1304,29 +1202,6 @@ SWIG_Python_AppendOutput(PyObject* result, PyObject* obj) {
     Py_DECREF(obj);
   }
   return result;
-#else
-  PyObject*   o2;
-  PyObject*   o3;
-  if (!result) {
-    result = obj;
-  } else if (result == Py_None) {
-    Py_DECREF(result);
-    result = obj;
-  } else {
-    if (!PyTuple_Check(result)) {
-      o2 = result;
-      result = PyTuple_New(1);
-      PyTuple_SET_ITEM(result, 0, o2);
-    }
-    o3 = PyTuple_New(1);
-    PyTuple_SET_ITEM(o3, 0, obj);
-    o2 = result;
-    result = PySequence_Concat(o2, o3);
-    Py_DECREF(o2);
-    Py_DECREF(o3);
-  }
-  return result;
-#endif
 }
 
 /* Unpack the argument tuple */
@@ -1377,12 +1252,21 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
   }
 }
 
+SWIGINTERN int
+SWIG_Python_CheckNoKeywords(PyObject *kwargs, const char *name) {
+  int no_kwargs = 1;
+  if (kwargs) {
+    assert(PyDict_Check(kwargs));
+    if (PyDict_Size(kwargs) > 0) {
+      PyErr_Format(PyExc_TypeError, "%s() does not take keyword arguments", name);
+      no_kwargs = 0;
+    }
+  }
+  return no_kwargs;
+}
+
 /* A functor is a function object with one single object argument */
-#if PY_VERSION_HEX >= 0x02020000
 #define SWIG_Python_CallFunctor(functor, obj)	        PyObject_CallFunctionObjArgs(functor, obj, NULL);
-#else
-#define SWIG_Python_CallFunctor(functor, obj)	        PyObject_CallFunction(functor, "O", obj);
-#endif
 
 /*
   Helper for static pointer initialization for both C and C++ code, for example
@@ -1411,35 +1295,6 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
 extern "C" {
 #endif
 
-/*  How to access Py_None */
-#if defined(_WIN32) || defined(__WIN32__) || defined(__CYGWIN__)
-#  ifndef SWIG_PYTHON_NO_BUILD_NONE
-#    ifndef SWIG_PYTHON_BUILD_NONE
-#      define SWIG_PYTHON_BUILD_NONE
-#    endif
-#  endif
-#endif
-
-#ifdef SWIG_PYTHON_BUILD_NONE
-#  ifdef Py_None
-#   undef Py_None
-#   define Py_None SWIG_Py_None()
-#  endif
-SWIGRUNTIMEINLINE PyObject * 
-_SWIG_Py_None(void)
-{
-  PyObject *none = Py_BuildValue((char*)"");
-  Py_DECREF(none);
-  return none;
-}
-SWIGRUNTIME PyObject * 
-SWIG_Py_None(void)
-{
-  static PyObject *SWIG_STATIC_POINTER(none) = _SWIG_Py_None();
-  return none;
-}
-#endif
-
 /* The python void return value */
 
 SWIGRUNTIMEINLINE PyObject * 
@@ -1466,7 +1321,10 @@ SWIGRUNTIMEINLINE int
 SWIG_Python_CheckImplicit(swig_type_info *ty)
 {
   SwigPyClientData *data = (SwigPyClientData *)ty->clientdata;
-  return data ? data->implicitconv : 0;
+  int fail = data ? data->implicitconv : 0;
+  if (fail)
+    PyErr_SetString(PyExc_TypeError, "Implicit conversion is prohibited for explicit constructors.");
+  return fail;
 }
 
 SWIGRUNTIMEINLINE PyObject *
@@ -1493,11 +1351,7 @@ SwigPyClientData_New(PyObject* obj)
       data->newargs = obj;
       Py_INCREF(obj);
     } else {
-#if (PY_VERSION_HEX < 0x02020000)
-      data->newraw = 0;
-#else
-      data->newraw = PyObject_GetAttrString(data->klass, (char *)"__new__");
-#endif
+      data->newraw = PyObject_GetAttrString(data->klass, "__new__");
       if (data->newraw) {
 	Py_INCREF(data->newraw);
 	data->newargs = PyTuple_New(1);
@@ -1508,7 +1362,7 @@ SwigPyClientData_New(PyObject* obj)
       Py_INCREF(data->newargs);
     }
     /* the destroy method, aka as the C++ delete method */
-    data->destroy = PyObject_GetAttrString(data->klass, (char *)"__swig_destroy__");
+    data->destroy = PyObject_GetAttrString(data->klass, "__swig_destroy__");
     if (PyErr_Occurred()) {
       PyErr_Clear();
       data->destroy = 0;
@@ -1517,11 +1371,7 @@ SwigPyClientData_New(PyObject* obj)
       int flags;
       Py_INCREF(data->destroy);
       flags = PyCFunction_GET_FLAGS(data->destroy);
-#ifdef METH_O
       data->delargs = !(flags & (METH_O));
-#else
-      data->delargs = 0;
-#endif
     } else {
       data->delargs = 0;
     }
@@ -1609,20 +1459,12 @@ SwigPyObject_hex(SwigPyObject *v)
 }
 
 SWIGRUNTIME PyObject *
-#ifdef METH_NOARGS
 SwigPyObject_repr(SwigPyObject *v)
-#else
-SwigPyObject_repr(SwigPyObject *v, PyObject *args)
-#endif
 {
   const char *name = SWIG_TypePrettyName(v->ty);
   PyObject *repr = SWIG_Python_str_FromFormat("<Swig Object of type '%s' at %p>", (name ? name : "unknown"), (void *)v);
   if (v->next) {
-# ifdef METH_NOARGS
     PyObject *nrep = SwigPyObject_repr((SwigPyObject *)v->next);
-# else
-    PyObject *nrep = SwigPyObject_repr((SwigPyObject *)v->next, args);
-# endif
 # if PY_VERSION_HEX >= 0x03000000
     PyObject *joined = PyUnicode_Concat(repr, nrep);
     Py_DecRef(repr);
@@ -1635,6 +1477,14 @@ SwigPyObject_repr(SwigPyObject *v, PyObject *args)
   return repr;  
 }
 
+/* We need a version taking two PyObject* parameters so it's a valid
+ * PyCFunction to use in swigobject_methods[]. */
+SWIGRUNTIME PyObject *
+SwigPyObject_repr2(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
+{
+  return SwigPyObject_repr((SwigPyObject*)v);
+}
+
 SWIGRUNTIME int
 SwigPyObject_compare(SwigPyObject *v, SwigPyObject *w)
 {
@@ -1708,14 +1558,14 @@ SwigPyObject_dealloc(PyObject *v)
       PyObject *res;
 
       /* PyObject_CallFunction() has the potential to silently drop
-         the active active exception.  In cases of unnamed temporary
+         the active exception.  In cases of unnamed temporary
          variable or where we just finished iterating over a generator
          StopIteration will be active right now, and this needs to
          remain true upon return from SwigPyObject_dealloc.  So save
          and restore. */
       
-      PyObject *val = NULL, *type = NULL, *tb = NULL;
-      PyErr_Fetch(&val, &type, &tb);
+      PyObject *type = NULL, *value = NULL, *traceback = NULL;
+      PyErr_Fetch(&type, &value, &traceback);
 
       if (data->delargs) {
         /* we need to create a temporary object to carry the destroy operation */
@@ -1730,7 +1580,7 @@ SwigPyObject_dealloc(PyObject *v)
       if (!res)
         PyErr_WriteUnraisable(destroy);
 
-      PyErr_Restore(val, type, tb);
+      PyErr_Restore(type, value, traceback);
 
       Py_XDECREF(res);
     } 
@@ -1749,11 +1599,6 @@ SWIGRUNTIME PyObject*
 SwigPyObject_append(PyObject* v, PyObject* next)
 {
   SwigPyObject *sobj = (SwigPyObject *) v;
-#ifndef METH_O
-  PyObject *tmp = 0;
-  if (!PyArg_ParseTuple(next,(char *)"O:append", &tmp)) return NULL;
-  next = tmp;
-#endif
   if (!SwigPyObject_Check(next)) {
     PyErr_SetString(PyExc_TypeError, "Attempt to append a non SwigPyObject");
     return NULL;
@@ -1764,11 +1609,7 @@ SwigPyObject_append(PyObject* v, PyObject* next)
 }
 
 SWIGRUNTIME PyObject* 
-#ifdef METH_NOARGS
-SwigPyObject_next(PyObject* v)
-#else
 SwigPyObject_next(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
 {
   SwigPyObject *sobj = (SwigPyObject *) v;
   if (sobj->next) {    
@@ -1780,11 +1621,7 @@ SwigPyObject_next(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 }
 
 SWIGINTERN PyObject*
-#ifdef METH_NOARGS
-SwigPyObject_disown(PyObject *v)
-#else
 SwigPyObject_disown(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
 {
   SwigPyObject *sobj = (SwigPyObject *)v;
   sobj->own = 0;
@@ -1792,11 +1629,7 @@ SwigPyObject_disown(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 }
 
 SWIGINTERN PyObject*
-#ifdef METH_NOARGS
-SwigPyObject_acquire(PyObject *v)
-#else
 SwigPyObject_acquire(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
 {
   SwigPyObject *sobj = (SwigPyObject *)v;
   sobj->own = SWIG_POINTER_OWN;
@@ -1807,70 +1640,32 @@ SWIGINTERN PyObject*
 SwigPyObject_own(PyObject *v, PyObject *args)
 {
   PyObject *val = 0;
-#if (PY_VERSION_HEX < 0x02020000)
-  if (!PyArg_ParseTuple(args,(char *)"|O:own",&val))
-#elif (PY_VERSION_HEX < 0x02050000)
-  if (!PyArg_UnpackTuple(args, (char *)"own", 0, 1, &val)) 
-#else
-  if (!PyArg_UnpackTuple(args, "own", 0, 1, &val)) 
-#endif
-    {
-      return NULL;
+  if (!PyArg_UnpackTuple(args, "own", 0, 1, &val)) {
+    return NULL;
+  } else {
+    SwigPyObject *sobj = (SwigPyObject *)v;
+    PyObject *obj = PyBool_FromLong(sobj->own);
+    if (val) {
+      if (PyObject_IsTrue(val)) {
+        SwigPyObject_acquire(v,args);
+      } else {
+        SwigPyObject_disown(v,args);
+      }
     } 
-  else
-    {
-      SwigPyObject *sobj = (SwigPyObject *)v;
-      PyObject *obj = PyBool_FromLong(sobj->own);
-      if (val) {
-#ifdef METH_NOARGS
-	if (PyObject_IsTrue(val)) {
-	  SwigPyObject_acquire(v);
-	} else {
-	  SwigPyObject_disown(v);
-	}
-#else
-	if (PyObject_IsTrue(val)) {
-	  SwigPyObject_acquire(v,args);
-	} else {
-	  SwigPyObject_disown(v,args);
-	}
-#endif
-      } 
-      return obj;
-    }
+    return obj;
+  }
 }
 
-#ifdef METH_O
-static PyMethodDef
-swigobject_methods[] = {
-  {(char *)"disown",  (PyCFunction)SwigPyObject_disown,  METH_NOARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_NOARGS,  (char *)"acquires ownership of the pointer"},
-  {(char *)"own",     (PyCFunction)SwigPyObject_own,     METH_VARARGS, (char *)"returns/sets ownership of the pointer"},
-  {(char *)"append",  (PyCFunction)SwigPyObject_append,  METH_O,       (char *)"appends another 'this' object"},
-  {(char *)"next",    (PyCFunction)SwigPyObject_next,    METH_NOARGS,  (char *)"returns the next 'this' object"},
-  {(char *)"__repr__",(PyCFunction)SwigPyObject_repr,    METH_NOARGS,  (char *)"returns object representation"},
-  {0, 0, 0, 0}  
-};
-#else
 static PyMethodDef
 swigobject_methods[] = {
-  {(char *)"disown",  (PyCFunction)SwigPyObject_disown,  METH_VARARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_VARARGS,  (char *)"acquires ownership of the pointer"},
-  {(char *)"own",     (PyCFunction)SwigPyObject_own,     METH_VARARGS,  (char *)"returns/sets ownership of the pointer"},
-  {(char *)"append",  (PyCFunction)SwigPyObject_append,  METH_VARARGS,  (char *)"appends another 'this' object"},
-  {(char *)"next",    (PyCFunction)SwigPyObject_next,    METH_VARARGS,  (char *)"returns the next 'this' object"},
-  {(char *)"__repr__",(PyCFunction)SwigPyObject_repr,   METH_VARARGS,  (char *)"returns object representation"},
+  {"disown",  SwigPyObject_disown,  METH_NOARGS,  "releases ownership of the pointer"},
+  {"acquire", SwigPyObject_acquire, METH_NOARGS,  "acquires ownership of the pointer"},
+  {"own",     SwigPyObject_own,     METH_VARARGS, "returns/sets ownership of the pointer"},
+  {"append",  SwigPyObject_append,  METH_O,       "appends another 'this' object"},
+  {"next",    SwigPyObject_next,    METH_NOARGS,  "returns the next 'this' object"},
+  {"__repr__",SwigPyObject_repr2,   METH_NOARGS,  "returns object representation"},
   {0, 0, 0, 0}  
 };
-#endif
-
-#if PY_VERSION_HEX < 0x02020000
-SWIGINTERN PyObject *
-SwigPyObject_getattr(SwigPyObject *sobj,char *name)
-{
-  return Py_FindMethod(swigobject_methods, (PyObject *)sobj, name);
-}
-#endif
 
 SWIGRUNTIME PyTypeObject*
 SwigPyObject_TypeOnce(void) {
@@ -1915,12 +1710,8 @@ SwigPyObject_TypeOnce(void) {
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_matrix_multiply */
 #elif PY_VERSION_HEX >= 0x03000000 /* 3.0 */
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index, nb_inplace_divide removed */
-#elif PY_VERSION_HEX >= 0x02050000 /* 2.5.0 */
+#else
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index */
-#elif PY_VERSION_HEX >= 0x02020000 /* 2.2.0 */
-    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_true_divide */
-#elif PY_VERSION_HEX >= 0x02000000 /* 2.0.0 */
-    0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_or */
 #endif
   };
 
@@ -1928,26 +1719,21 @@ SwigPyObject_TypeOnce(void) {
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-      /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX >= 0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
 #else
       PyObject_HEAD_INIT(NULL)
       0,                                    /* ob_size */
 #endif
-      (char *)"SwigPyObject",               /* tp_name */
+      "SwigPyObject",                       /* tp_name */
       sizeof(SwigPyObject),                 /* tp_basicsize */
       0,                                    /* tp_itemsize */
       (destructor)SwigPyObject_dealloc,     /* tp_dealloc */
-      0,				    /* tp_print */
-#if PY_VERSION_HEX < 0x02020000
-      (getattrfunc)SwigPyObject_getattr,    /* tp_getattr */
-#else
+      0,                                    /* tp_print */
       (getattrfunc)0,                       /* tp_getattr */
-#endif
       (setattrfunc)0,                       /* tp_setattr */
 #if PY_VERSION_HEX >= 0x03000000
-    0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
+      0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
 #else
       (cmpfunc)SwigPyObject_compare,        /* tp_compare */
 #endif
@@ -1957,7 +1743,7 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_as_mapping */
       (hashfunc)0,                          /* tp_hash */
       (ternaryfunc)0,                       /* tp_call */
-      0,				    /* tp_str */
+      0,                                    /* tp_str */
       PyObject_GenericGetAttr,              /* tp_getattro */
       0,                                    /* tp_setattro */
       0,                                    /* tp_as_buffer */
@@ -1967,7 +1753,6 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_clear */
       (richcmpfunc)SwigPyObject_richcompare,/* tp_richcompare */
       0,                                    /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
       0,                                    /* tp_iter */
       0,                                    /* tp_iternext */
       swigobject_methods,                   /* tp_methods */
@@ -1988,34 +1773,29 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_cache */
       0,                                    /* tp_subclasses */
       0,                                    /* tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
       0,                                    /* tp_del */
-#endif
-#if PY_VERSION_HEX >= 0x02060000
       0,                                    /* tp_version_tag */
-#endif
 #if PY_VERSION_HEX >= 0x03040000
       0,                                    /* tp_finalize */
 #endif
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                    /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                    /* tp_print */
+#endif
 #ifdef COUNT_ALLOCS
       0,                                    /* tp_allocs */
       0,                                    /* tp_frees */
       0,                                    /* tp_maxalloc */
-#if PY_VERSION_HEX >= 0x02050000
       0,                                    /* tp_prev */
-#endif
       0                                     /* tp_next */
 #endif
     };
     swigpyobject_type = tmp;
     type_init = 1;
-#if PY_VERSION_HEX < 0x02020000
-    swigpyobject_type.ob_type = &PyType_Type;
-#else
     if (PyType_Ready(&swigpyobject_type) < 0)
       return NULL;
-#endif
   }
   return &swigpyobject_type;
 }
@@ -2044,20 +1824,6 @@ typedef struct {
   size_t size;
 } SwigPyPacked;
 
-SWIGRUNTIME int
-SwigPyPacked_print(SwigPyPacked *v, FILE *fp, int SWIGUNUSEDPARM(flags))
-{
-  char result[SWIG_BUFFER_SIZE];
-  fputs("<Swig Packed ", fp); 
-  if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))) {
-    fputs("at ", fp); 
-    fputs(result, fp); 
-  }
-  fputs(v->ty->name,fp); 
-  fputs(">", fp);
-  return 0; 
-}
-  
 SWIGRUNTIME PyObject *
 SwigPyPacked_repr(SwigPyPacked *v)
 {
@@ -2086,7 +1852,7 @@ SwigPyPacked_compare(SwigPyPacked *v, SwigPyPacked *w)
   size_t i = v->size;
   size_t j = w->size;
   int s = (i < j) ? -1 : ((i > j) ? 1 : 0);
-  return s ? s : strncmp((char *)v->pack, (char *)w->pack, 2*v->size);
+  return s ? s : strncmp((const char *)v->pack, (const char *)w->pack, 2*v->size);
 }
 
 SWIGRUNTIME PyTypeObject* SwigPyPacked_TypeOnce(void);
@@ -2120,18 +1886,17 @@ SwigPyPacked_TypeOnce(void) {
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-      /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX>=0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
 #else
       PyObject_HEAD_INIT(NULL)
       0,                                    /* ob_size */
 #endif
-      (char *)"SwigPyPacked",               /* tp_name */
+      "SwigPyPacked",                       /* tp_name */
       sizeof(SwigPyPacked),                 /* tp_basicsize */
       0,                                    /* tp_itemsize */
       (destructor)SwigPyPacked_dealloc,     /* tp_dealloc */
-      (printfunc)SwigPyPacked_print,        /* tp_print */
+      0,                                    /* tp_print */
       (getattrfunc)0,                       /* tp_getattr */
       (setattrfunc)0,                       /* tp_setattr */
 #if PY_VERSION_HEX>=0x03000000
@@ -2155,7 +1920,6 @@ SwigPyPacked_TypeOnce(void) {
       0,                                    /* tp_clear */
       0,                                    /* tp_richcompare */
       0,                                    /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
       0,                                    /* tp_iter */
       0,                                    /* tp_iternext */
       0,                                    /* tp_methods */
@@ -2176,34 +1940,29 @@ SwigPyPacked_TypeOnce(void) {
       0,                                    /* tp_cache */
       0,                                    /* tp_subclasses */
       0,                                    /* tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
       0,                                    /* tp_del */
-#endif
-#if PY_VERSION_HEX >= 0x02060000
       0,                                    /* tp_version_tag */
-#endif
 #if PY_VERSION_HEX >= 0x03040000
       0,                                    /* tp_finalize */
 #endif
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                    /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                    /* tp_print */
+#endif
 #ifdef COUNT_ALLOCS
       0,                                    /* tp_allocs */
       0,                                    /* tp_frees */
       0,                                    /* tp_maxalloc */
-#if PY_VERSION_HEX >= 0x02050000
       0,                                    /* tp_prev */
-#endif
       0                                     /* tp_next */
 #endif
     };
     swigpypacked_type = tmp;
     type_init = 1;
-#if PY_VERSION_HEX < 0x02020000
-    swigpypacked_type.ob_type = &PyType_Type;
-#else
     if (PyType_Ready(&swigpypacked_type) < 0)
       return NULL;
-#endif
   }
   return &swigpypacked_type;
 }
@@ -2244,20 +2003,14 @@ SwigPyPacked_UnpackData(PyObject *obj, void *ptr, size_t size)
  * pointers/data manipulation
  * ----------------------------------------------------------------------------- */
 
-SWIGRUNTIMEINLINE PyObject *
-_SWIG_This(void)
-{
-    return SWIG_Python_str_FromChar("this");
-}
-
-static PyObject *swig_this = NULL;
+static PyObject *Swig_This_global = NULL;
 
 SWIGRUNTIME PyObject *
 SWIG_This(void)
 {
-  if (swig_this == NULL)
-    swig_this = _SWIG_This();
-  return swig_this;
+  if (Swig_This_global == NULL)
+    Swig_This_global = SWIG_Python_str_FromChar("this");
+  return Swig_This_global;
 }
 
 /* #define SWIG_PYTHON_SLOW_GETSET_THIS */
@@ -2289,7 +2042,7 @@ SWIG_Python_GetSwigThis(PyObject *pyobj)
 
   obj = 0;
 
-#if (!defined(SWIG_PYTHON_SLOW_GETSET_THIS) && (PY_VERSION_HEX >= 0x02030000))
+#if !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
   if (PyInstance_Check(pyobj)) {
     obj = _PyInstance_Lookup(pyobj, SWIG_This());      
   } else {
@@ -2359,7 +2112,7 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
   if (obj == Py_None && !implicit_conv) {
     if (ptr)
       *ptr = 0;
-    return SWIG_OK;
+    return (flags & SWIG_POINTER_NO_NULL) ? SWIG_NullReferenceError : SWIG_OK;
   }
 
   res = SWIG_ERROR;
@@ -2439,13 +2192,13 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
           }
         }
       }
-    }
-    if (!SWIG_IsOK(res) && obj == Py_None) {
-      if (ptr)
-        *ptr = 0;
-      if (PyErr_Occurred())
-        PyErr_Clear();
-      res = SWIG_OK;
+      if (!SWIG_IsOK(res) && obj == Py_None) {
+        if (ptr)
+          *ptr = 0;
+        if (PyErr_Occurred())
+          PyErr_Clear();
+        res = SWIG_OK;
+      }
     }
   }
   return res;
@@ -2459,31 +2212,28 @@ SWIG_Python_ConvertFunctionPtr(PyObject *obj, void **ptr, swig_type_info *ty) {
     return SWIG_ConvertPtr(obj, ptr, ty, 0);
   } else {
     void *vptr = 0;
-    
+    swig_cast_info *tc;
+
     /* here we get the method pointer for callbacks */
     const char *doc = (((PyCFunctionObject *)obj) -> m_ml -> ml_doc);
     const char *desc = doc ? strstr(doc, "swig_ptr: ") : 0;
     if (desc)
       desc = ty ? SWIG_UnpackVoidPtr(desc + 10, &vptr, ty->name) : 0;
-    if (!desc) 
+    if (!desc)
       return SWIG_ERROR;
-    if (ty) {
-      swig_cast_info *tc = SWIG_TypeCheck(desc,ty);
-      if (tc) {
-        int newmemory = 0;
-        *ptr = SWIG_TypeCast(tc,vptr,&newmemory);
-        assert(!newmemory); /* newmemory handling not yet implemented */
-      } else {
-        return SWIG_ERROR;
-      }
+    tc = SWIG_TypeCheck(desc,ty);
+    if (tc) {
+      int newmemory = 0;
+      *ptr = SWIG_TypeCast(tc,vptr,&newmemory);
+      assert(!newmemory); /* newmemory handling not yet implemented */
     } else {
-      *ptr = vptr;
+      return SWIG_ERROR;
     }
     return SWIG_OK;
   }
 }
 
-/* Convert a packed value value */
+/* Convert a packed pointer value */
 
 SWIGRUNTIME int
 SWIG_Python_ConvertPacked(PyObject *obj, void *ptr, size_t sz, swig_type_info *ty) {
@@ -2511,7 +2261,6 @@ SWIG_Python_ConvertPacked(PyObject *obj, void *ptr, size_t sz, swig_type_info *t
 SWIGRUNTIME PyObject* 
 SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
 {
-#if (PY_VERSION_HEX >= 0x02020000)
   PyObject *inst = 0;
   PyObject *newraw = data->newraw;
   if (newraw) {
@@ -2528,16 +2277,30 @@ SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
 	}
       }
 #else
-      PyObject *key = SWIG_This();
-      PyObject_SetAttr(inst, key, swig_this);
+      if (PyObject_SetAttr(inst, SWIG_This(), swig_this) == -1) {
+        Py_DECREF(inst);
+        inst = 0;
+      }
 #endif
     }
   } else {
 #if PY_VERSION_HEX >= 0x03000000
-    inst = ((PyTypeObject*) data->newargs)->tp_new((PyTypeObject*) data->newargs, Py_None, Py_None);
-    if (inst) {
-      PyObject_SetAttr(inst, SWIG_This(), swig_this);
-      Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
+    PyObject *empty_args = PyTuple_New(0);
+    if (empty_args) {
+      PyObject *empty_kwargs = PyDict_New();
+      if (empty_kwargs) {
+        inst = ((PyTypeObject *)data->newargs)->tp_new((PyTypeObject *)data->newargs, empty_args, empty_kwargs);
+        Py_DECREF(empty_kwargs);
+        if (inst) {
+          if (PyObject_SetAttr(inst, SWIG_This(), swig_this) == -1) {
+            Py_DECREF(inst);
+            inst = 0;
+          } else {
+            Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
+          }
+        }
+      }
+      Py_DECREF(empty_args);
     }
 #else
     PyObject *dict = PyDict_New();
@@ -2549,59 +2312,23 @@ SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
 #endif
   }
   return inst;
-#else
-#if (PY_VERSION_HEX >= 0x02010000)
-  PyObject *inst = 0;
-  PyObject *dict = PyDict_New();
-  if (dict) {
-    PyDict_SetItem(dict, SWIG_This(), swig_this);
-    inst = PyInstance_NewRaw(data->newargs, dict);
-    Py_DECREF(dict);
-  }
-  return (PyObject *) inst;
-#else
-  PyInstanceObject *inst = PyObject_NEW(PyInstanceObject, &PyInstance_Type);
-  if (inst == NULL) {
-    return NULL;
-  }
-  inst->in_class = (PyClassObject *)data->newargs;
-  Py_INCREF(inst->in_class);
-  inst->in_dict = PyDict_New();
-  if (inst->in_dict == NULL) {
-    Py_DECREF(inst);
-    return NULL;
-  }
-#ifdef Py_TPFLAGS_HAVE_WEAKREFS
-  inst->in_weakreflist = NULL;
-#endif
-#ifdef Py_TPFLAGS_GC
-  PyObject_GC_Init(inst);
-#endif
-  PyDict_SetItem(inst->in_dict, SWIG_This(), swig_this);
-  return (PyObject *) inst;
-#endif
-#endif
 }
 
-SWIGRUNTIME void
+SWIGRUNTIME int
 SWIG_Python_SetSwigThis(PyObject *inst, PyObject *swig_this)
 {
- PyObject *dict;
-#if (PY_VERSION_HEX >= 0x02020000) && !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
- PyObject **dictptr = _PyObject_GetDictPtr(inst);
- if (dictptr != NULL) {
-   dict = *dictptr;
-   if (dict == NULL) {
-     dict = PyDict_New();
-     *dictptr = dict;
-   }
-   PyDict_SetItem(dict, SWIG_This(), swig_this);
-   return;
- }
+#if !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
+  PyObject **dictptr = _PyObject_GetDictPtr(inst);
+  if (dictptr != NULL) {
+    PyObject *dict = *dictptr;
+    if (dict == NULL) {
+      dict = PyDict_New();
+      *dictptr = dict;
+    }
+    return PyDict_SetItem(dict, SWIG_This(), swig_this);
+  }
 #endif
- dict = PyObject_GetAttrString(inst, (char*)"__dict__");
- PyDict_SetItem(dict, SWIG_This(), swig_this);
- Py_DECREF(dict);
+  return PyObject_SetAttr(inst, SWIG_This(), swig_this);
 } 
 
 
@@ -2615,7 +2342,8 @@ SWIG_Python_InitShadowInstance(PyObject *args) {
     if (sthis) {
       SwigPyObject_append((PyObject*) sthis, obj[1]);
     } else {
-      SWIG_Python_SetSwigThis(obj[0], obj[1]);
+      if (SWIG_Python_SetSwigThis(obj[0], obj[1]) != 0)
+        return NULL;
     }
     return SWIG_Py_Void();
   }
@@ -2698,12 +2426,7 @@ SWIG_Python_GetModule(void *SWIGUNUSEDPARM(clientdata)) {
 #ifdef SWIG_LINK_RUNTIME
     type_pointer = SWIG_ReturnGlobalTypeList((void *)0);
 #else
-# ifdef SWIGPY_USE_CAPSULE
     type_pointer = PyCapsule_Import(SWIGPY_CAPSULE_NAME, 0);
-# else
-    type_pointer = PyCObject_Import((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION,
-				    (char*)"type_pointer" SWIG_TYPE_TABLE_NAME);
-# endif
     if (PyErr_Occurred()) {
       PyErr_Clear();
       type_pointer = (void *)0;
@@ -2713,48 +2436,10 @@ SWIG_Python_GetModule(void *SWIGUNUSEDPARM(clientdata)) {
   return (swig_module_info *) type_pointer;
 }
 
-#if PY_MAJOR_VERSION < 2
-/* PyModule_AddObject function was introduced in Python 2.0.  The following function
-   is copied out of Python/modsupport.c in python version 2.3.4 */
-SWIGINTERN int
-PyModule_AddObject(PyObject *m, char *name, PyObject *o)
-{
-  PyObject *dict;
-  if (!PyModule_Check(m)) {
-    PyErr_SetString(PyExc_TypeError, "PyModule_AddObject() needs module as first arg");
-    return SWIG_ERROR;
-  }
-  if (!o) {
-    PyErr_SetString(PyExc_TypeError, "PyModule_AddObject() needs non-NULL value");
-    return SWIG_ERROR;
-  }
-  
-  dict = PyModule_GetDict(m);
-  if (dict == NULL) {
-    /* Internal error -- modules must have a dict! */
-    PyErr_Format(PyExc_SystemError, "module '%s' has no __dict__",
-		 PyModule_GetName(m));
-    return SWIG_ERROR;
-  }
-  if (PyDict_SetItemString(dict, name, o))
-    return SWIG_ERROR;
-  Py_DECREF(o);
-  return SWIG_OK;
-}
-#endif
-
 SWIGRUNTIME void
-#ifdef SWIGPY_USE_CAPSULE
 SWIG_Python_DestroyModule(PyObject *obj)
-#else
-SWIG_Python_DestroyModule(void *vptr)
-#endif
 {
-#ifdef SWIGPY_USE_CAPSULE
   swig_module_info *swig_module = (swig_module_info *) PyCapsule_GetPointer(obj, SWIGPY_CAPSULE_NAME);
-#else
-  swig_module_info *swig_module = (swig_module_info *) vptr;
-#endif
   swig_type_info **types = swig_module->types;
   size_t i;
   for (i =0; i < swig_module->size; ++i) {
@@ -2765,33 +2450,24 @@ SWIG_Python_DestroyModule(void *vptr)
     }
   }
   Py_DECREF(SWIG_This());
-  swig_this = NULL;
+  Swig_This_global = NULL;
 }
 
 SWIGRUNTIME void
 SWIG_Python_SetModule(swig_module_info *swig_module) {
 #if PY_VERSION_HEX >= 0x03000000
  /* Add a dummy module object into sys.modules */
-  PyObject *module = PyImport_AddModule((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION);
+  PyObject *module = PyImport_AddModule("swig_runtime_data" SWIG_RUNTIME_VERSION);
 #else
   static PyMethodDef swig_empty_runtime_method_table[] = { {NULL, NULL, 0, NULL} }; /* Sentinel */
-  PyObject *module = Py_InitModule((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION, swig_empty_runtime_method_table);
+  PyObject *module = Py_InitModule("swig_runtime_data" SWIG_RUNTIME_VERSION, swig_empty_runtime_method_table);
 #endif
-#ifdef SWIGPY_USE_CAPSULE
   PyObject *pointer = PyCapsule_New((void *) swig_module, SWIGPY_CAPSULE_NAME, SWIG_Python_DestroyModule);
   if (pointer && module) {
-    PyModule_AddObject(module, (char*)"type_pointer_capsule" SWIG_TYPE_TABLE_NAME, pointer);
-  } else {
-    Py_XDECREF(pointer);
-  }
-#else
-  PyObject *pointer = PyCObject_FromVoidPtr((void *) swig_module, SWIG_Python_DestroyModule);
-  if (pointer && module) {
-    PyModule_AddObject(module, (char*)"type_pointer" SWIG_TYPE_TABLE_NAME, pointer);
+    PyModule_AddObject(module, "type_pointer_capsule" SWIG_TYPE_TABLE_NAME, pointer);
   } else {
     Py_XDECREF(pointer);
   }
-#endif
 }
 
 /* The python cached type query */
@@ -2809,20 +2485,12 @@ SWIG_Python_TypeQuery(const char *type)
   PyObject *obj = PyDict_GetItem(cache, key);
   swig_type_info *descriptor;
   if (obj) {
-#ifdef SWIGPY_USE_CAPSULE
     descriptor = (swig_type_info *) PyCapsule_GetPointer(obj, NULL);
-#else
-    descriptor = (swig_type_info *) PyCObject_AsVoidPtr(obj);
-#endif
   } else {
     swig_module_info *swig_module = SWIG_GetModule(0);
     descriptor = SWIG_TypeQueryModule(swig_module, swig_module, type);
     if (descriptor) {
-#ifdef SWIGPY_USE_CAPSULE
       obj = PyCapsule_New((void*) descriptor, NULL, NULL);
-#else
-      obj = PyCObject_FromVoidPtr(descriptor, NULL);
-#endif
       PyDict_SetItem(cache, key, obj);
       Py_DECREF(obj);
     }
@@ -2847,14 +2515,15 @@ SWIG_Python_AddErrMesg(const char* mesg, int infront)
     PyObject *traceback = 0;
     PyErr_Fetch(&type, &value, &traceback);
     if (value) {
-      char *tmp;
       PyObject *old_str = PyObject_Str(value);
+      const char *tmp = SWIG_Python_str_AsChar(old_str);
+      const char *errmesg = tmp ? tmp : "Invalid error message";
       Py_XINCREF(type);
       PyErr_Clear();
       if (infront) {
-	PyErr_Format(type, "%s %s", mesg, tmp = SWIG_Python_str_AsChar(old_str));
+	PyErr_Format(type, "%s %s", mesg, errmesg);
       } else {
-	PyErr_Format(type, "%s %s", tmp = SWIG_Python_str_AsChar(old_str), mesg);
+	PyErr_Format(type, "%s %s", errmesg, mesg);
       }
       SWIG_Python_str_DelForPy3(tmp);
       Py_DECREF(old_str);
@@ -2980,6 +2649,8 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
       Py_INCREF(name);
     } else {
       encoded_name = PyUnicode_AsUTF8String(name);
+      if (!encoded_name)
+        return -1;
     }
     PyErr_Format(PyExc_AttributeError, "'%.100s' object has no attribute '%.200s'", tp->tp_name, PyString_AsString(encoded_name));
     Py_DECREF(encoded_name);
@@ -3006,34 +2677,45 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 
 
 
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Method creation and docstring support functions */
+
+SWIGINTERN PyMethodDef *SWIG_PythonGetProxyDoc(const char *name);
+SWIGINTERN PyObject *SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func);
+SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func);
+
+#ifdef __cplusplus
+}
+#endif
+
+
   #define SWIG_exception(code, msg) do { SWIG_Error(code, msg); SWIG_fail;; } while(0) 
 
 
 /* -------- TYPES TABLE (BEGIN) -------- */
 
-#define SWIGTYPE_p_char swig_types[0]
-#define SWIGTYPE_p_int swig_types[1]
-#define SWIGTYPE_p_jpeg2dct__common__band_info swig_types[2]
-#define SWIGTYPE_p_p_short swig_types[3]
-#define SWIGTYPE_p_short swig_types[4]
-static swig_type_info *swig_types[6];
-static swig_module_info swig_module = {swig_types, 5, 0, 0, 0, 0};
+#define SWIGTYPE_p_a_64__float swig_types[0]
+#define SWIGTYPE_p_char swig_types[1]
+#define SWIGTYPE_p_int swig_types[2]
+#define SWIGTYPE_p_jpeg2dct__common__band_format swig_types[3]
+#define SWIGTYPE_p_jpeg2dct__common__band_info swig_types[4]
+#define SWIGTYPE_p_jpeg2dct__common__coefficient_selection swig_types[5]
+#define SWIGTYPE_p_jpeg2dct__common__crop_window swig_types[6]
+#define SWIGTYPE_p_void swig_types[7]
+static swig_type_info *swig_types[9];
+static swig_module_info swig_module = {swig_types, 8, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
 /* -------- TYPES TABLE (END) -------- */
 
-#if (PY_VERSION_HEX <= 0x02000000)
-# if !defined(SWIG_PYTHON_CLASSIC)
-#  error "This python version requires swig to be run with the '-classic' option"
-# endif
-#endif
-#if (PY_VERSION_HEX <= 0x02020000)
-# error "This python version requires swig to be run with the '-nomodern' option"
-#endif
-#if (PY_VERSION_HEX <= 0x02020000)
-# error "This python version requires swig to be run with the '-nomodernargs' option"
+#ifdef SWIG_TypeQuery
+# undef SWIG_TypeQuery
 #endif
+#define SWIG_TypeQuery SWIG_Python_TypeQuery
 
 /*-----------------------------------------------
               @(target):= _dctfromjpg_wrapper.so
@@ -3047,7 +2729,7 @@ static swig_module_info swig_module = {swig_types, 5, 0, 0, 0, 0};
 #endif
 #define SWIG_name    "_dctfromjpg_wrapper"
 
-#define SWIGVERSION 0x030010 
+#define SWIGVERSION 0x040002 
 #define SWIG_VERSION SWIGVERSION
 
 
@@ -3129,7 +2811,16 @@ namespace swig {
 
 
 #define SWIG_FILE_WITH_INIT
+#include <algorithm>
+#include <cstring>
+#include <memory>
+#include <vector>
+#include "../common/buffer_pool.h"
 #include "../common/dctfromjpg.h"
+#include "../common/encode.h"
+#include "../common/mapped_file.h"
+#include "../common/sparse.h"
+#include "../common/stats.h"
 
 
 #ifndef SWIG_FILE_WITH_INIT
@@ -3143,6 +2834,13 @@ namespace swig {
 #include <complex> 
 
 
+SWIGINTERNINLINE PyObject*
+  SWIG_From_int  (int value)
+{
+  return PyInt_FromLong((long) value);
+}
+
+
 #include <limits.h>
 #if !defined(SWIG_NO_LLONG_MAX)
 # if !defined(LLONG_MAX) && defined(__GNUC__) && defined (__LONG_LONG_MAX__)
@@ -3162,7 +2860,7 @@ SWIG_AsVal_double (PyObject *obj, double *val)
     return SWIG_OK;
 #if PY_VERSION_HEX < 0x03000000
   } else if (PyInt_Check(obj)) {
-    if (val) *val = PyInt_AsLong(obj);
+    if (val) *val = (double) PyInt_AsLong(obj);
     return SWIG_OK;
 #endif
   } else if (PyLong_Check(obj)) {
@@ -3306,6 +3004,128 @@ SWIGINTERNINLINE PyObject*
 }
 
 
+SWIGINTERN int
+SWIG_AsVal_long (PyObject *obj, long* val)
+{
+#if PY_VERSION_HEX < 0x03000000
+  if (PyInt_Check(obj)) {
+    if (val) *val = PyInt_AsLong(obj);
+    return SWIG_OK;
+  } else
+#endif
+  if (PyLong_Check(obj)) {
+    long v = PyLong_AsLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_OK;
+    } else {
+      PyErr_Clear();
+      return SWIG_OverflowError;
+    }
+  }
+#ifdef SWIG_PYTHON_CAST_MODE
+  {
+    int dispatch = 0;
+    long v = PyInt_AsLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_AddCast(SWIG_OK);
+    } else {
+      PyErr_Clear();
+    }
+    if (!dispatch) {
+      double d;
+      int res = SWIG_AddCast(SWIG_AsVal_double (obj,&d));
+      if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, LONG_MIN, LONG_MAX)) {
+	if (val) *val = (long)(d);
+	return res;
+      }
+    }
+  }
+#endif
+  return SWIG_TypeError;
+}
+
+
+SWIGINTERN int
+SWIG_AsVal_int (PyObject * obj, int *val)
+{
+  long v;
+  int res = SWIG_AsVal_long (obj, &v);
+  if (SWIG_IsOK(res)) {
+    if ((v < INT_MIN || v > INT_MAX)) {
+      return SWIG_OverflowError;
+    } else {
+      if (val) *val = static_cast< int >(v);
+    }
+  }  
+  return res;
+}
+
+
+SWIGINTERN int
+SWIG_AsVal_bool (PyObject *obj, bool *val)
+{
+  int r;
+  if (!PyBool_Check(obj))
+    return SWIG_ERROR;
+  r = PyObject_IsTrue(obj);
+  if (r == -1)
+    return SWIG_ERROR;
+  if (val) *val = r ? true : false;
+  return SWIG_OK;
+}
+
+
+SWIGINTERNINLINE PyObject*
+  SWIG_From_bool  (bool value)
+{
+  return PyBool_FromLong(value ? 1 : 0);
+}
+
+
+  #define SWIG_From_long   PyInt_FromLong 
+
+
+SWIGINTERNINLINE PyObject* 
+SWIG_From_unsigned_SS_long  (unsigned long value)
+{
+  return (value > LONG_MAX) ?
+    PyLong_FromUnsignedLong(value) : PyInt_FromLong(static_cast< long >(value));
+}
+
+
+#if defined(LLONG_MAX) && !defined(SWIG_LONG_LONG_AVAILABLE)
+#  define SWIG_LONG_LONG_AVAILABLE
+#endif
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERNINLINE PyObject* 
+SWIG_From_unsigned_SS_long_SS_long  (unsigned long long value)
+{
+  return (value > LONG_MAX) ?
+    PyLong_FromUnsignedLongLong(value) : PyInt_FromLong(static_cast< long >(value));
+}
+#endif
+
+
+SWIGINTERNINLINE PyObject *
+SWIG_From_size_t  (size_t value)
+{    
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    return SWIG_From_unsigned_SS_long  (static_cast< unsigned long >(value));
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else {
+    /* assume sizeof(size_t) <= sizeof(unsigned long long) */
+    return SWIG_From_unsigned_SS_long_SS_long  (static_cast< unsigned long long >(value));
+  }
+#endif
+}
+
+
 SWIGINTERN swig_type_info*
 SWIG_pchar_descriptor(void)
 {
@@ -3333,6 +3153,7 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 #endif
   {
     char *cstr; Py_ssize_t len;
+    int ret = SWIG_OK;
 #if PY_VERSION_HEX>=0x03000000
 #if !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
     if (!alloc && cptr) {
@@ -3343,30 +3164,21 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
         return SWIG_RuntimeError;
     }
     obj = PyUnicode_AsUTF8String(obj);
-    if(alloc) *alloc = SWIG_NEWOBJ;
+    if (!obj)
+      return SWIG_TypeError;
+    if (alloc)
+      *alloc = SWIG_NEWOBJ;
 #endif
-    PyBytes_AsStringAndSize(obj, &cstr, &len);
+    if (PyBytes_AsStringAndSize(obj, &cstr, &len) == -1)
+      return SWIG_TypeError;
 #else
-    PyString_AsStringAndSize(obj, &cstr, &len);
+    if (PyString_AsStringAndSize(obj, &cstr, &len) == -1)
+      return SWIG_TypeError;
 #endif
     if (cptr) {
       if (alloc) {
-	/* 
-	   In python the user should not be able to modify the inner
-	   string representation. To warranty that, if you define
-	   SWIG_PYTHON_SAFE_CSTRINGS, a new/copy of the python string
-	   buffer is always returned.
-
-	   The default behavior is just to return the pointer value,
-	   so, be careful.
-	*/ 
-#if defined(SWIG_PYTHON_SAFE_CSTRINGS)
-	if (*alloc != SWIG_OLDOBJ) 
-#else
-	if (*alloc == SWIG_NEWOBJ) 
-#endif
-	{
-	  *cptr = reinterpret_cast< char* >(memcpy((new char[len + 1]), cstr, sizeof(char)*(len + 1)));
+	if (*alloc == SWIG_NEWOBJ) {
+	  *cptr = reinterpret_cast< char* >(memcpy(new char[len + 1], cstr, sizeof(char)*(len + 1)));
 	  *alloc = SWIG_NEWOBJ;
 	} else {
 	  *cptr = cstr;
@@ -3381,6 +3193,8 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 #endif
 #else
 	*cptr = SWIG_Python_str_AsChar(obj);
+        if (!*cptr)
+          ret = SWIG_TypeError;
 #endif
       }
     }
@@ -3388,7 +3202,7 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 #if PY_VERSION_HEX>=0x03000000 && !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
     Py_XDECREF(obj);
 #endif
-    return SWIG_OK;
+    return ret;
   } else {
 #if defined(SWIG_PYTHON_2_UNICODE)
 #if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
@@ -3401,10 +3215,12 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
         return SWIG_RuntimeError;
       }
       obj = PyUnicode_AsUTF8String(obj);
+      if (!obj)
+        return SWIG_TypeError;
       if (PyString_AsStringAndSize(obj, &cstr, &len) != -1) {
         if (cptr) {
           if (alloc) *alloc = SWIG_NEWOBJ;
-          *cptr = reinterpret_cast< char* >(memcpy((new char[len + 1]), cstr, sizeof(char)*(len + 1)));
+          *cptr = reinterpret_cast< char* >(memcpy(new char[len + 1], cstr, sizeof(char)*(len + 1)));
         }
         if (psize) *psize = len + 1;
 
@@ -3435,79 +3251,6 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 
 
 
-SWIGINTERN int
-SWIG_AsVal_long (PyObject *obj, long* val)
-{
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(obj)) {
-    if (val) *val = PyInt_AsLong(obj);
-    return SWIG_OK;
-  } else
-#endif
-  if (PyLong_Check(obj)) {
-    long v = PyLong_AsLong(obj);
-    if (!PyErr_Occurred()) {
-      if (val) *val = v;
-      return SWIG_OK;
-    } else {
-      PyErr_Clear();
-      return SWIG_OverflowError;
-    }
-  }
-#ifdef SWIG_PYTHON_CAST_MODE
-  {
-    int dispatch = 0;
-    long v = PyInt_AsLong(obj);
-    if (!PyErr_Occurred()) {
-      if (val) *val = v;
-      return SWIG_AddCast(SWIG_OK);
-    } else {
-      PyErr_Clear();
-    }
-    if (!dispatch) {
-      double d;
-      int res = SWIG_AddCast(SWIG_AsVal_double (obj,&d));
-      if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, LONG_MIN, LONG_MAX)) {
-	if (val) *val = (long)(d);
-	return res;
-      }
-    }
-  }
-#endif
-  return SWIG_TypeError;
-}
-
-
-SWIGINTERN int
-SWIG_AsVal_bool (PyObject *obj, bool *val)
-{
-  int r;
-  if (!PyBool_Check(obj))
-    return SWIG_ERROR;
-  r = PyObject_IsTrue(obj);
-  if (r == -1)
-    return SWIG_ERROR;
-  if (val) *val = r ? true : false;
-  return SWIG_OK;
-}
-
-
-SWIGINTERN int
-SWIG_AsVal_int (PyObject * obj, int *val)
-{
-  long v;
-  int res = SWIG_AsVal_long (obj, &v);
-  if (SWIG_IsOK(res)) {
-    if ((v < INT_MIN || v > INT_MAX)) {
-      return SWIG_OverflowError;
-    } else {
-      if (val) *val = static_cast< int >(v);
-    }
-  }  
-  return res;
-}
-
-
 #if NPY_API_VERSION < 0x00000007
 #define NPY_ARRAY_DEFAULT NPY_DEFAULT
 #define NPY_ARRAY_FARRAY  NPY_FARRAY
@@ -3515,6 +3258,39 @@ SWIG_AsVal_int (PyObject * obj, int *val)
 #endif
 
 
+/* Macros to extract array attributes.
+ */
+#if NPY_API_VERSION < 0x00000007
+#define is_array(a)            ((a) && PyArray_Check((PyArrayObject*)a))
+#define array_type(a)          (int)(PyArray_TYPE((PyArrayObject*)a))
+#define array_numdims(a)       (((PyArrayObject*)a)->nd)
+#define array_dimensions(a)    (((PyArrayObject*)a)->dimensions)
+#define array_size(a,i)        (((PyArrayObject*)a)->dimensions[i])
+#define array_strides(a)       (((PyArrayObject*)a)->strides)
+#define array_stride(a,i)      (((PyArrayObject*)a)->strides[i])
+#define array_data(a)          (((PyArrayObject*)a)->data)
+#define array_descr(a)         (((PyArrayObject*)a)->descr)
+#define array_flags(a)         (((PyArrayObject*)a)->flags)
+#define array_enableflags(a,f) (((PyArrayObject*)a)->flags) = f
+#define array_is_fortran(a)    (PyArray_ISFORTRAN((PyArrayObject*)a))
+#else
+#define is_array(a)            ((a) && PyArray_Check(a))
+#define array_type(a)          PyArray_TYPE((PyArrayObject*)a)
+#define array_numdims(a)       PyArray_NDIM((PyArrayObject*)a)
+#define array_dimensions(a)    PyArray_DIMS((PyArrayObject*)a)
+#define array_strides(a)       PyArray_STRIDES((PyArrayObject*)a)
+#define array_stride(a,i)      PyArray_STRIDE((PyArrayObject*)a,i)
+#define array_size(a,i)        PyArray_DIM((PyArrayObject*)a,i)
+#define array_data(a)          PyArray_DATA((PyArrayObject*)a)
+#define array_descr(a)         PyArray_DESCR((PyArrayObject*)a)
+#define array_flags(a)         PyArray_FLAGS((PyArrayObject*)a)
+#define array_enableflags(a,f) PyArray_ENABLEFLAGS((PyArrayObject*)a,f)
+#define array_is_fortran(a)    (PyArray_IS_F_CONTIGUOUS((PyArrayObject*)a))
+#endif
+#define array_is_contiguous(a) (PyArray_ISCONTIGUOUS((PyArrayObject*)a))
+#define array_is_native(a)     (PyArray_ISNOTSWAPPED((PyArrayObject*)a))
+
+
   /* Given a PyObject, return a string describing its type.
    */
   const char* pytype_string(PyObject* py_obj)
@@ -3588,343 +3364,6562 @@ SWIG_AsVal_int (PyObject * obj, int *val)
 
 
 
-#ifdef __cplusplus
-extern "C" {
-#endif
-SWIGINTERN PyObject *_wrap_band_info_dct_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  short *arg2 = (short *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  
-  if(!PyArg_UnpackTuple(args,(char *)"band_info_dct_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
-  }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_short, SWIG_POINTER_DISOWN |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "band_info_dct_set" "', argument " "2"" of type '" "short *""'"); 
-  }
-  arg2 = reinterpret_cast< short * >(argp2);
-  if (arg1) (arg1)->dct = arg2;
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
 
+  /* Given a PyObject pointer, cast it to a PyArrayObject pointer if
+   * legal.  If not, set the python error string appropriately and
+   * return NULL.
+   */
+  PyArrayObject* obj_to_array_no_conversion(PyObject* input,
+                                            int        typecode)
+  {
+    PyArrayObject* ary = NULL;
+    if (is_array(input) && (typecode == NPY_NOTYPE ||
+                            PyArray_EquivTypenums(array_type(input), typecode)))
+    {
+      ary = (PyArrayObject*) input;
+    }
+    else if is_array(input)
+    {
+      const char* desired_type = typecode_string(typecode);
+      const char* actual_type  = typecode_string(array_type(input));
+      PyErr_Format(PyExc_TypeError,
+                   "Array of type '%s' required.  Array of type '%s' given",
+                   desired_type, actual_type);
+      ary = NULL;
+    }
+    else
+    {
+      const char* desired_type = typecode_string(typecode);
+      const char* actual_type  = pytype_string(input);
+      PyErr_Format(PyExc_TypeError,
+                   "Array of type '%s' required.  A '%s' was given",
+                   desired_type,
+                   actual_type);
+      ary = NULL;
+    }
+    return ary;
+  }
 
-SWIGINTERN PyObject *_wrap_band_info_dct_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  void *argp1 = 0 ;
+  /* Convert the given PyObject to a NumPy array with the given
+   * typecode.  On success, return a valid PyArrayObject* with the
+   * correct type.  On failure, the python error string will be set and
+   * the routine returns NULL.
+   */
+  PyArrayObject* obj_to_array_allow_conversion(PyObject* input,
+                                               int       typecode,
+                                               int*      is_new_object)
+  {
+    PyArrayObject* ary = NULL;
+    PyObject*      py_obj;
+    if (is_array(input) && (typecode == NPY_NOTYPE ||
+                            PyArray_EquivTypenums(array_type(input),typecode)))
+    {
+      ary = (PyArrayObject*) input;
+      *is_new_object = 0;
+    }
+    else
+    {
+      py_obj = PyArray_FROMANY(input, typecode, 0, 0, NPY_ARRAY_DEFAULT);
+      /* If NULL, PyArray_FromObject will have set python error value.*/
+      ary = (PyArrayObject*) py_obj;
+      *is_new_object = 1;
+    }
+    return ary;
+  }
+
+  /* Given a PyArrayObject, check to see if it is contiguous.  If so,
+   * return the input pointer and flag it as not a new object.  If it is
+   * not contiguous, create a new PyArrayObject using the original data,
+   * flag it as a new object and return the pointer.
+   */
+  PyArrayObject* make_contiguous(PyArrayObject* ary,
+                                 int*           is_new_object,
+                                 int            min_dims,
+                                 int            max_dims)
+  {
+    PyArrayObject* result;
+    if (array_is_contiguous(ary))
+    {
+      result = ary;
+      *is_new_object = 0;
+    }
+    else
+    {
+      result = (PyArrayObject*) PyArray_ContiguousFromObject((PyObject*)ary,
+                                                              array_type(ary),
+                                                              min_dims,
+                                                              max_dims);
+      *is_new_object = 1;
+    }
+    return result;
+  }
+
+  /* Given a PyArrayObject, check to see if it is Fortran-contiguous.
+   * If so, return the input pointer, but do not flag it as not a new
+   * object.  If it is not Fortran-contiguous, create a new
+   * PyArrayObject using the original data, flag it as a new object
+   * and return the pointer.
+   */
+  PyArrayObject* make_fortran(PyArrayObject* ary,
+                              int*           is_new_object)
+  {
+    PyArrayObject* result;
+    if (array_is_fortran(ary))
+    {
+      result = ary;
+      *is_new_object = 0;
+    }
+    else
+    {
+      Py_INCREF(array_descr(ary));
+      result = (PyArrayObject*) PyArray_FromArray(ary,
+                                                  array_descr(ary),
+#if NPY_API_VERSION < 0x00000007
+                                                  NPY_FORTRANORDER);
+#else
+                                                  NPY_ARRAY_F_CONTIGUOUS);
+#endif
+      *is_new_object = 1;
+    }
+    return result;
+  }
+
+  /* Convert a given PyObject to a contiguous PyArrayObject of the
+   * specified type.  If the input object is not a contiguous
+   * PyArrayObject, a new one will be created and the new object flag
+   * will be set.
+   */
+  PyArrayObject* obj_to_array_contiguous_allow_conversion(PyObject* input,
+                                                          int       typecode,
+                                                          int*      is_new_object)
+  {
+    int is_new1 = 0;
+    int is_new2 = 0;
+    PyArrayObject* ary2;
+    PyArrayObject* ary1 = obj_to_array_allow_conversion(input,
+                                                        typecode,
+                                                        &is_new1);
+    if (ary1)
+    {
+      ary2 = make_contiguous(ary1, &is_new2, 0, 0);
+      if ( is_new1 && is_new2)
+      {
+        Py_DECREF(ary1);
+      }
+      ary1 = ary2;
+    }
+    *is_new_object = is_new1 || is_new2;
+    return ary1;
+  }
+
+  /* Convert a given PyObject to a Fortran-ordered PyArrayObject of the
+   * specified type.  If the input object is not a Fortran-ordered
+   * PyArrayObject, a new one will be created and the new object flag
+   * will be set.
+   */
+  PyArrayObject* obj_to_array_fortran_allow_conversion(PyObject* input,
+                                                       int       typecode,
+                                                       int*      is_new_object)
+  {
+    int is_new1 = 0;
+    int is_new2 = 0;
+    PyArrayObject* ary2;
+    PyArrayObject* ary1 = obj_to_array_allow_conversion(input,
+                                                        typecode,
+                                                        &is_new1);
+    if (ary1)
+    {
+      ary2 = make_fortran(ary1, &is_new2);
+      if (is_new1 && is_new2)
+      {
+        Py_DECREF(ary1);
+      }
+      ary1 = ary2;
+    }
+    *is_new_object = is_new1 || is_new2;
+    return ary1;
+  }
+
+
+  /* Test whether a python object is contiguous.  If array is
+   * contiguous, return 1.  Otherwise, set the python error string and
+   * return 0.
+   */
+  int require_contiguous(PyArrayObject* ary)
+  {
+    int contiguous = 1;
+    if (!array_is_contiguous(ary))
+    {
+      PyErr_SetString(PyExc_TypeError,
+                      "Array must be contiguous.  A non-contiguous array was given");
+      contiguous = 0;
+    }
+    return contiguous;
+  }
+
+  /* Test whether a python object is (C_ or F_) contiguous.  If array is
+   * contiguous, return 1.  Otherwise, set the python error string and
+   * return 0.
+   */
+  int require_c_or_f_contiguous(PyArrayObject* ary)
+  {
+    int contiguous = 1;
+    if (!(array_is_contiguous(ary) || array_is_fortran(ary)))
+    {
+      PyErr_SetString(PyExc_TypeError,
+                      "Array must be contiguous (C_ or F_).  A non-contiguous array was given");
+      contiguous = 0;
+    }
+    return contiguous;
+  }
+
+  /* Require that a numpy array is not byte-swapped.  If the array is
+   * not byte-swapped, return 1.  Otherwise, set the python error string
+   * and return 0.
+   */
+  int require_native(PyArrayObject* ary)
+  {
+    int native = 1;
+    if (!array_is_native(ary))
+    {
+      PyErr_SetString(PyExc_TypeError,
+                      "Array must have native byteorder.  "
+                      "A byte-swapped array was given");
+      native = 0;
+    }
+    return native;
+  }
+
+  /* Require the given PyArrayObject to have a specified number of
+   * dimensions.  If the array has the specified number of dimensions,
+   * return 1.  Otherwise, set the python error string and return 0.
+   */
+  int require_dimensions(PyArrayObject* ary,
+                         int            exact_dimensions)
+  {
+    int success = 1;
+    if (array_numdims(ary) != exact_dimensions)
+    {
+      PyErr_Format(PyExc_TypeError,
+                   "Array must have %d dimensions.  Given array has %d dimensions",
+                   exact_dimensions,
+                   array_numdims(ary));
+      success = 0;
+    }
+    return success;
+  }
+
+  /* Require the given PyArrayObject to have one of a list of specified
+   * number of dimensions.  If the array has one of the specified number
+   * of dimensions, return 1.  Otherwise, set the python error string
+   * and return 0.
+   */
+  int require_dimensions_n(PyArrayObject* ary,
+                           int*           exact_dimensions,
+                           int            n)
+  {
+    int success = 0;
+    int i;
+    char dims_str[255] = "";
+    char s[255];
+    for (i = 0; i < n && !success; i++)
+    {
+      if (array_numdims(ary) == exact_dimensions[i])
+      {
+        success = 1;
+      }
+    }
+    if (!success)
+    {
+      for (i = 0; i < n-1; i++)
+      {
+        sprintf(s, "%d, ", exact_dimensions[i]);
+        strcat(dims_str,s);
+      }
+      sprintf(s, " or %d", exact_dimensions[n-1]);
+      strcat(dims_str,s);
+      PyErr_Format(PyExc_TypeError,
+                   "Array must have %s dimensions.  Given array has %d dimensions",
+                   dims_str,
+                   array_numdims(ary));
+    }
+    return success;
+  }
+
+  /* Require the given PyArrayObject to have a specified shape.  If the
+   * array has the specified shape, return 1.  Otherwise, set the python
+   * error string and return 0.
+   */
+  int require_size(PyArrayObject* ary,
+                   npy_intp*      size,
+                   int            n)
+  {
+    int i;
+    int success = 1;
+    int len;
+    char desired_dims[255] = "[";
+    char s[255];
+    char actual_dims[255] = "[";
+    for(i=0; i < n;i++)
+    {
+      if (size[i] != -1 &&  size[i] != array_size(ary,i))
+      {
+        success = 0;
+      }
+    }
+    if (!success)
+    {
+      for (i = 0; i < n; i++)
+      {
+        if (size[i] == -1)
+        {
+          sprintf(s, "*,");
+        }
+        else
+        {
+          sprintf(s, "%ld,", (long int)size[i]);
+        }
+        strcat(desired_dims,s);
+      }
+      len = strlen(desired_dims);
+      desired_dims[len-1] = ']';
+      for (i = 0; i < n; i++)
+      {
+        sprintf(s, "%ld,", (long int)array_size(ary,i));
+        strcat(actual_dims,s);
+      }
+      len = strlen(actual_dims);
+      actual_dims[len-1] = ']';
+      PyErr_Format(PyExc_TypeError,
+                   "Array must have shape of %s.  Given array has shape of %s",
+                   desired_dims,
+                   actual_dims);
+    }
+    return success;
+  }
+
+  /* Require the given PyArrayObject to to be Fortran ordered.  If the
+   * the PyArrayObject is already Fortran ordered, do nothing.  Else,
+   * set the Fortran ordering flag and recompute the strides.
+   */
+  int require_fortran(PyArrayObject* ary)
+  {
+    int success = 1;
+    int nd = array_numdims(ary);
+    int i;
+    npy_intp * strides = array_strides(ary);
+    if (array_is_fortran(ary)) return success;
+    /* Set the Fortran ordered flag */
+    array_enableflags(ary,NPY_ARRAY_FARRAY);
+    /* Recompute the strides */
+    strides[0] = strides[nd-1];
+    for (i=1; i < nd; ++i)
+      strides[i] = strides[i-1] * array_size(ary,i-1);
+    return success;
+  }
+
+
+
+
+using namespace jpeg2dct::common;
+
+// holds the buffer protocol views on a Python sequence of bytes-like objects
+// for the duration of a native call
+struct buffer_list {
+  std::vector<Py_buffer> views;
+  std::vector<char *> data;
+  std::vector<unsigned long> lengths;
+
+  ~buffer_list() {
+    for (auto &view : views) {
+      PyBuffer_Release(&view);
+    }
+  }
+
+  bool acquire(PyObject *sequence) {
+    PyObject *items = PySequence_Fast(sequence, "expected a sequence of bytes");
+    if (items == NULL) {
+      return false;
+    }
+    Py_ssize_t nb_items = PySequence_Fast_GET_SIZE(items);
+    views.reserve(nb_items);
+    for (Py_ssize_t i = 0; i < nb_items; i++) {
+      Py_buffer view;
+      if (PyObject_GetBuffer(PySequence_Fast_GET_ITEM(items, i), &view,
+                             PyBUF_SIMPLE) != 0) {
+        Py_DECREF(items);
+        return false;
+      }
+      views.push_back(view);
+      data.push_back(static_cast<char *>(view.buf));
+      lengths.push_back(static_cast<unsigned long>(view.len));
+    }
+    Py_DECREF(items);
+    return true;
+  }
+};
+
+// a buffer pool shared by a Python object and the arrays of the bands it
+// allocated, which hand their memory back to it when they are released
+typedef std::shared_ptr<buffer_pool> shared_pool;
+
+static void delete_pool_capsule(PyObject *capsule) {
+  delete static_cast<shared_pool *>(
+      PyCapsule_GetPointer(capsule, "jpeg2dct.buffer_pool"));
+}
+
+// the pool of a capsule made by new_buffer_pool, null for None. Sets a Python
+// error and returns null for anything else.
+static shared_pool *get_pool(PyObject *capsule) {
+  if (capsule == Py_None) {
+    return NULL;
+  }
+  return static_cast<shared_pool *>(
+      PyCapsule_GetPointer(capsule, "jpeg2dct.buffer_pool"));
+}
+
+// where the buffer of an image goes back to
+struct pooled_image {
+  shared_pool pool;
+  size_t bytes;
+};
+
+static void delete_image_capsule(PyObject *capsule) {
+  char *memory =
+      static_cast<char *>(PyCapsule_GetPointer(capsule, "jpeg2dct.image"));
+  pooled_image *owner =
+      static_cast<pooled_image *>(PyCapsule_GetContext(capsule));
+  if (owner == NULL) {
+    free_aligned(memory);
+    return;
+  }
+  owner->pool->release(memory, owner->bytes);
+  delete owner;
+}
+
+// wrap the buffer holding the bands of an image in a uint8 numpy array which
+// takes ownership of it, handing it back to `pool` when the array is released
+// if the bands come from it
+static PyObject *image_to_buffer(band_info *bands, shared_pool *pool) {
+  size_t bytes = image_bytes(&bands[0], &bands[1], &bands[2]);
+  npy_intp dims[1] = {(npy_intp)bytes};
+  PyObject *buffer =
+      PyArray_SimpleNewFromData(1, dims, NPY_UINT8, bands[0].dct);
+  if (buffer == NULL) {
+    return NULL;
+  }
+  PyObject *capsule =
+      PyCapsule_New(bands[0].dct, "jpeg2dct.image", delete_image_capsule);
+  if (capsule == NULL) {
+    Py_DECREF(buffer);
+    return NULL;
+  }
+  if (pool != NULL) {
+    PyCapsule_SetContext(capsule, new pooled_image{*pool, bytes});
+  }
+  PyArray_SetBaseObject(reinterpret_cast<PyArrayObject *>(buffer), capsule);
+  for (int b = 0; b < 3; b++) {
+    bands[b].dct = nullptr;
+  }
+  return buffer;
+}
+
+// a numpy array viewing a band in the buffer of its image
+static PyObject *band_view(const band_info *band, char *data,
+                           PyObject *buffer) {
+  static const int typenums[] = {NPY_SHORT, NPY_HALF, NPY_FLOAT};
+  npy_intp dims[3] = {band->dct_h, band->dct_w, band->dct_b};
+  PyObject *array =
+      PyArray_SimpleNewFromData(3, dims, typenums[band->dtype], data);
+  if (array == NULL) {
+    return NULL;
+  }
+  Py_INCREF(buffer);
+  PyArray_SetBaseObject(reinterpret_cast<PyArrayObject *>(array), buffer);
+  return array;
+}
+
+// convert decoded images into a list of [band1, band2, band3] lists, None
+// for the images which failed to decode when `errors` is given. The bands of
+// an image are views of the uint8 array of its buffer, allocated from `pool`
+// when it is given.
+static PyObject *bands_to_list(std::vector<band_info> &bands,
+                               const std::vector<std::string> *errors = NULL,
+                               shared_pool *pool = NULL) {
+  Py_ssize_t nb_images = bands.size() / 3;
+  PyObject *result = PyList_New(nb_images);
+  for (Py_ssize_t i = 0; result != NULL && i < nb_images; i++) {
+    if (errors != NULL && !(*errors)[i].empty()) {
+      Py_INCREF(Py_None);
+      PyList_SET_ITEM(result, i, Py_None);
+      continue;
+    }
+    PyObject *image = PyList_New(3);
+    if (image == NULL) {
+      Py_CLEAR(result);
+      break;
+    }
+    PyList_SET_ITEM(result, i, image);
+    char *data[3];
+    for (int b = 0; b < 3; b++) {
+      data[b] = static_cast<char *>(bands[3 * i + b].dct);
+    }
+    PyObject *buffer = image_to_buffer(&bands[3 * i], pool);
+    if (buffer == NULL) {
+      Py_CLEAR(result);
+      break;
+    }
+    for (int b = 0; b < 3; b++) {
+      PyObject *array = band_view(&bands[3 * i + b], data[b], buffer);
+      if (array == NULL) {
+        Py_CLEAR(result);
+        break;
+      }
+      PyList_SET_ITEM(image, b, array);
+    }
+    Py_DECREF(buffer);
+  }
+  // release whatever has not been handed over to numpy
+  for (size_t i = 0; i < bands.size(); i += 3) {
+    release_image_bands(&bands[i], &bands[i + 1], &bands[i + 2]);
+  }
+  return result;
+}
+
+// the selection of the batched decoders, no index selecting all the
+// coefficients. Sets a Python error and returns NULL for too many indices.
+static const coefficient_selection *
+select_coefficients(int *coefficients, int nb_coefficients,
+                    coefficient_selection *selection) {
+  if (nb_coefficients == 0) {
+    return NULL;
+  }
+  if (nb_coefficients > 64) {
+    PyErr_SetString(PyExc_RuntimeError,
+                    "between 1 and 64 coefficients should be selected");
+    return NULL;
+  }
+  selection->count = nb_coefficients;
+  std::copy(coefficients, coefficients + nb_coefficients, selection->index);
+  return selection;
+}
+
+// the format of the batched decoders, null for int16 bands which are not
+// standardized, scaled nor on a target grid. `mean` and `std` are
+// 3 x nb_coefficients arrays, or empty. Sets a Python error and returns NULL
+// when they do not fit.
+static const band_format *make_band_format(int dtype, float *mean, int mean_h,
+                                           int mean_w, float *std, int std_h,
+                                           int std_w, int target_h,
+                                           int target_w, int crop_mode,
+                                           int pad_mode, int scale_denom,
+                                           band_format *format) {
+  bool standardize = mean_h * mean_w != 0 || std_h * std_w != 0;
+  if (dtype == DTYPE_INT16 && !standardize && target_h == 0 &&
+      target_w == 0 && scale_denom == 1) {
+    return NULL;
+  }
+  format->dtype = dtype;
+  format->standardize = standardize;
+  format->nb_coefficients = mean_w;
+  format->target_h = target_h;
+  format->target_w = target_w;
+  format->crop_mode = crop_mode;
+  format->pad_mode = pad_mode;
+  format->scale_denom = scale_denom;
+  if (standardize) {
+    if (mean_h != 3 || std_h != 3 || mean_w != std_w || mean_w > 64) {
+      PyErr_SetString(PyExc_RuntimeError,
+                      "mean and std should be 3 x nb_coefficients arrays");
+      return NULL;
+    }
+    for (int b = 0; b < 3; b++) {
+      std::copy(mean + b * mean_w, mean + (b + 1) * mean_w, format->mean[b]);
+      std::copy(std + b * std_w, std + (b + 1) * std_w, format->std[b]);
+    }
+  }
+  return format;
+}
+
+// the list of the error message of each image of a batch, None for the
+// decoded ones
+static PyObject *errors_to_list(const std::vector<std::string> &errors) {
+  PyObject *messages = PyList_New(errors.size());
+  for (size_t i = 0; messages != NULL && i < errors.size(); i++) {
+    PyObject *message = errors[i].empty()
+                            ? (Py_INCREF(Py_None), Py_None)
+                            : PyUnicode_DecodeUTF8(errors[i].data(),
+                                                   errors[i].size(), "replace");
+    if (message == NULL) {
+      Py_CLEAR(messages);
+      break;
+    }
+    PyList_SET_ITEM(messages, i, message);
+  }
+  return messages;
+}
+
+// the decoded images of a batch and the list of their error messages
+static PyObject *batch_to_tuple(std::vector<band_info> &bands,
+                                const std::vector<std::string> &errors,
+                                shared_pool *pool) {
+  PyObject *images = bands_to_list(bands, &errors, pool);
+  PyObject *messages = images != NULL ? errors_to_list(errors) : NULL;
+  if (messages == NULL) {
+    Py_XDECREF(images);
+    return NULL;
+  }
+  return Py_BuildValue("(NN)", images, messages);
+}
+
+// allocate the batched bands of a padded batch as numpy arrays, in `arrays`.
+// Called by the decoders without the GIL.
+static void allocate_batches(int nb_images, band_info *outputs,
+                             PyObject **arrays) {
+  static const int typenums[] = {NPY_SHORT, NPY_HALF, NPY_FLOAT};
+  PyGILState_STATE gil = PyGILState_Ensure();
+  bool failed = false;
+  for (int b = 0; b < 3 && !failed; b++) {
+    npy_intp dims[4] = {nb_images, outputs[b].dct_h, outputs[b].dct_w,
+                        outputs[b].dct_b};
+    arrays[b] = PyArray_SimpleNew(4, dims, typenums[outputs[b].dtype]);
+    failed = arrays[b] == NULL;
+    if (!failed) {
+      outputs[b].dct =
+          PyArray_DATA(reinterpret_cast<PyArrayObject *>(arrays[b]));
+    }
+  }
+  if (failed) {
+    PyErr_Clear();
+  }
+  PyGILState_Release(gil);
+  if (failed) {
+    throw std::runtime_error("cannot allocate the bands of the batch");
+  }
+}
+
+// the nb_images x channels x 2 int32 array of the block grid of each band
+static PyObject *band_sizes(const std::vector<band_info> &bands,
+                            int channels) {
+  npy_intp dims[3] = {(npy_intp)bands.size() / 3, channels, 2};
+  PyObject *sizes = PyArray_SimpleNew(3, dims, NPY_INT32);
+  if (sizes == NULL) {
+    return NULL;
+  }
+  int *data = static_cast<int *>(
+      PyArray_DATA(reinterpret_cast<PyArrayObject *>(sizes)));
+  for (npy_intp i = 0; i < dims[0]; i++) {
+    for (int c = 0; c < channels; c++) {
+      *data++ = bands[3 * i + c].dct_h;
+      *data++ = bands[3 * i + c].dct_w;
+    }
+  }
+  return sizes;
+}
+
+// describe a probed image as a dict
+static PyObject *image_info_to_dict(const image_info &info) {
+  static const char *decode_paths[] = {"direct", "resample", "transcode"};
+  PyObject *components = PyList_New(0);
+  for (int i = 0; components != NULL &&
+                  i < std::min(info.num_components, kMaxProbedComponents);
+       i++) {
+    npy_intp dims[1] = {64};
+    PyObject *table = PyArray_SimpleNew(1, dims, NPY_UINT16);
+    if (table == NULL) {
+      Py_CLEAR(components);
+      break;
+    }
+    std::memcpy(PyArray_DATA(reinterpret_cast<PyArrayObject *>(table)),
+                info.quant_table[i], sizeof(info.quant_table[i]));
+    PyObject *component = Py_BuildValue(
+        "{s:(II),s:(ii),s:N}", "blocks", info.block_h[i], info.block_w[i],
+        "sampling", info.h_samp[i], info.v_samp[i], "quant_table", table);
+    if (component == NULL || PyList_Append(components, component) != 0) {
+      Py_XDECREF(component);
+      Py_CLEAR(components);
+      break;
+    }
+    Py_DECREF(component);
+  }
+  if (components == NULL) {
+    return NULL;
+  }
+  return Py_BuildValue(
+      "{s:(II),s:i,s:O,s:s,s:N,s:[(III)(III)(III)]}", "size", info.image_h,
+      info.image_w, "num_components", info.num_components, "progressive",
+      info.progressive ? Py_True : Py_False, "decode_path",
+      decode_paths[info.decode_path], "components", components, "dct_shapes",
+      info.dct_h[0], info.dct_w[0], 64, info.dct_h[1], info.dct_w[1], 64,
+      info.dct_h[2], info.dct_w[2], 64);
+}
+
+static const char *phase_names[kNumPhases] = {"header", "coefficients", "copy",
+                                              "resample", "transcode"};
+
+// the trace of a decoded image as a dict, see jpeg2dct.numpy.set_trace_hook
+static PyObject *trace_to_dict(const decode_trace *trace) {
+  static const char *decode_paths[] = {"direct", "resample", "transcode"};
+  PyObject *seconds = PyDict_New();
+  for (int i = 0; seconds != NULL && i <= kNumPhases; i++) {
+    long long ns = i < kNumPhases ? trace->phase_ns[i].load() : trace->total_ns;
+    PyObject *value = PyFloat_FromDouble(ns * 1e-9);
+    if (value == NULL ||
+        PyDict_SetItemString(seconds, i < kNumPhases ? phase_names[i] : "total",
+                             value) != 0) {
+      Py_XDECREF(value);
+      Py_CLEAR(seconds);
+      break;
+    }
+    Py_DECREF(value);
+  }
+  if (seconds == NULL) {
+    return NULL;
+  }
+  const char *path = trace->decode_path >= 0 && trace->decode_path < 3
+                         ? decode_paths[trace->decode_path]
+                         : NULL;
+  return Py_BuildValue(
+      "{s:k,s:(II),s:i,s:O,s:z,s:O,s:O,s:z,s:N}", "bytes", trace->bytes,
+      "size", trace->image_h, trace->image_w, "num_components",
+      trace->num_components, "progressive",
+      trace->progressive ? Py_True : Py_False, "decode_path", path,
+      "segmented", trace->segmented ? Py_True : Py_False, "cropped",
+      trace->cropped ? Py_True : Py_False, "error", trace->error, "seconds",
+      seconds);
+}
+
+// the Python trace hook, only accessed with the GIL held
+static PyObject *trace_callback = NULL;
+
+// called on the decoding threads, which do not hold the GIL
+static void call_trace_callback(const decode_trace *trace) {
+  if (!Py_IsInitialized()) {
+    return;
+  }
+  PyGILState_STATE gil = PyGILState_Ensure();
+  PyObject *callback = trace_callback;
+  if (callback != NULL) {
+    Py_INCREF(callback);
+    PyObject *info = trace_to_dict(trace);
+    PyObject *result =
+        info != NULL ? PyObject_CallFunctionObjArgs(callback, info, NULL)
+                     : NULL;
+    if (result == NULL) {
+      PyErr_WriteUnraisable(callback);
+    }
+    Py_XDECREF(result);
+    Py_XDECREF(info);
+    Py_DECREF(callback);
+  }
+  PyGILState_Release(gil);
+}
+
+
+PyObject *read_dct_coefficients_from_buffers(
+    PyObject *buffers, bool normalized, int channels, int crop_y, int crop_x,
+    int crop_h, int crop_w, int *coefficients, int nb_coefficients, int dtype,
+    float *mean, int mean_h, int mean_w, float *std, int std_h, int std_w,
+    int target_h, int target_w, int target_crop, int target_pad,
+    int scale_denom, int num_threads, bool skip_failures, PyObject *pool) {
+  shared_pool *bands_pool = get_pool(pool);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  buffer_list inputs;
+  if (!inputs.acquire(buffers)) {
+    return NULL;
+  }
+  crop_window crop = {crop_y, crop_x, crop_h, crop_w};
+  coefficient_selection selection;
+  const coefficient_selection *selected =
+      select_coefficients(coefficients, nb_coefficients, &selection);
+  if (selected == NULL && nb_coefficients != 0) {
+    return NULL;
+  }
+  band_format format;
+  const band_format *formatted =
+      make_band_format(dtype, mean, mean_h, mean_w, std, std_h, std_w,
+                       target_h, target_w, target_crop, target_pad, scale_denom,
+                       &format);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  std::vector<band_info> bands(3 * inputs.data.size());
+  std::vector<std::string> errors(inputs.data.size());
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    pool_scope scope(bands_pool != NULL ? bands_pool->get() : NULL);
+    read_dct_coefficients_from_buffers_(
+        inputs.data.data(), inputs.lengths.data(), (int)inputs.data.size(),
+        normalized, channels, bands.data(), num_threads,
+        crop_h == 0 && crop_w == 0 ? NULL : &crop, selected, formatted,
+        skip_failures ? errors.data() : NULL);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return batch_to_tuple(bands, errors, bands_pool);
+}
+
+PyObject *read_dct_coefficients_from_files(
+    PyObject *filenames, bool normalized, int channels, int crop_y,
+    int crop_x, int crop_h, int crop_w, int *coefficients,
+    int nb_coefficients, int dtype, float *mean, int mean_h, int mean_w,
+    float *std, int std_h, int std_w, int target_h, int target_w,
+    int target_crop, int target_pad, int scale_denom, int num_threads,
+    bool skip_failures, PyObject *pool) {
+  shared_pool *bands_pool = get_pool(pool);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  buffer_list inputs;
+  if (!inputs.acquire(filenames)) {
+    return NULL;
+  }
+  // the filenames are handed to open and need to be null terminated
+  std::vector<std::vector<char>> paths;
+  std::vector<char *> path_ptrs;
+  for (size_t i = 0; i < inputs.data.size(); i++) {
+    paths.emplace_back(inputs.data[i], inputs.data[i] + inputs.lengths[i]);
+    paths.back().push_back('\0');
+  }
+  for (auto &path : paths) {
+    path_ptrs.push_back(path.data());
+  }
+  crop_window crop = {crop_y, crop_x, crop_h, crop_w};
+  coefficient_selection selection;
+  const coefficient_selection *selected =
+      select_coefficients(coefficients, nb_coefficients, &selection);
+  if (selected == NULL && nb_coefficients != 0) {
+    return NULL;
+  }
+  band_format format;
+  const band_format *formatted =
+      make_band_format(dtype, mean, mean_h, mean_w, std, std_h, std_w,
+                       target_h, target_w, target_crop, target_pad, scale_denom,
+                       &format);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  std::vector<band_info> bands(3 * paths.size());
+  std::vector<std::string> errors(paths.size());
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    pool_scope scope(bands_pool != NULL ? bands_pool->get() : NULL);
+    read_dct_coefficients_from_files_(
+        path_ptrs.data(), (int)path_ptrs.size(), normalized, channels,
+        bands.data(), num_threads, crop_h == 0 && crop_w == 0 ? NULL : &crop,
+        selected, formatted, skip_failures ? errors.data() : NULL);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return batch_to_tuple(bands, errors, bands_pool);
+}
+
+PyObject *read_dct_coefficients_from_buffers_padded(
+    PyObject *buffers, bool normalized, int channels, int crop_y, int crop_x,
+    int crop_h, int crop_w, int *coefficients, int nb_coefficients, int dtype,
+    float *mean, int mean_h, int mean_w, float *std, int std_h, int std_w,
+    int target_h, int target_w, int target_crop, int target_pad,
+    int scale_denom, int num_threads, bool skip_failures, PyObject *pool) {
+  shared_pool *bands_pool = get_pool(pool);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  buffer_list inputs;
+  if (!inputs.acquire(buffers)) {
+    return NULL;
+  }
+  crop_window crop = {crop_y, crop_x, crop_h, crop_w};
+  coefficient_selection selection;
+  const coefficient_selection *selected =
+      select_coefficients(coefficients, nb_coefficients, &selection);
+  if (selected == NULL && nb_coefficients != 0) {
+    return NULL;
+  }
+  band_format format;
+  const band_format *formatted =
+      make_band_format(dtype, mean, mean_h, mean_w, std, std_h, std_w,
+                       target_h, target_w, target_crop, target_pad, scale_denom,
+                       &format);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  int nb_images = (int)inputs.data.size();
+  std::vector<band_info> bands(3 * nb_images);
+  std::vector<std::string> errors(nb_images);
+  band_info outputs[3];
+  PyObject *arrays[3] = {NULL, NULL, NULL};
+  try {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    pool_scope scope(bands_pool != NULL ? bands_pool->get() : NULL);
+    read_dct_coefficients_from_buffers_padded_(
+        inputs.data.data(), inputs.lengths.data(), nb_images, normalized,
+        channels, bands.data(), outputs,
+        [&](band_info *outputs) {
+          allocate_batches(nb_images, outputs, arrays);
+        },
+        num_threads, crop_h == 0 && crop_w == 0 ? NULL : &crop, selected,
+        formatted, skip_failures ? errors.data() : NULL);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  } catch (...) {
+    for (int b = 0; b < 3; b++) {
+      Py_XDECREF(arrays[b]);
+    }
+    throw;
+  }
+  PyObject *sizes = band_sizes(bands, channels);
+  PyObject *messages = sizes != NULL ? errors_to_list(errors) : NULL;
+  if (messages == NULL) {
+    Py_XDECREF(sizes);
+    for (int b = 0; b < 3; b++) {
+      Py_DECREF(arrays[b]);
+    }
+    return NULL;
+  }
+  return Py_BuildValue("([NNN]NN)", arrays[0], arrays[1], arrays[2], sizes,
+                       messages);
+}
+
+// decode an image into `image`, a writable buffer receiving its bands laid out
+// as the buffers of the decoded images. Returns the list of the shapes of the
+// bands, or None when they do not fit and `image` is left untouched.
+PyObject *read_dct_coefficients_from_buffer_into_image(
+    PyObject *buffer, PyObject *image, bool normalized, int channels,
+    int crop_y, int crop_x, int crop_h, int crop_w, int *coefficients,
+    int nb_coefficients, int dtype, float *mean, int mean_h, int mean_w,
+    float *std, int std_h, int std_w, int target_h, int target_w,
+    int target_crop, int target_pad, int scale_denom) {
+  crop_window crop = {crop_y, crop_x, crop_h, crop_w};
+  coefficient_selection selection;
+  const coefficient_selection *selected =
+      select_coefficients(coefficients, nb_coefficients, &selection);
+  if (selected == NULL && nb_coefficients != 0) {
+    return NULL;
+  }
+  band_format format;
+  const band_format *formatted =
+      make_band_format(dtype, mean, mean_h, mean_w, std, std_h, std_w,
+                       target_h, target_w, target_crop, target_pad, scale_denom,
+                       &format);
+  if (PyErr_Occurred()) {
+    return NULL;
+  }
+  Py_buffer input, output;
+  if (PyObject_GetBuffer(buffer, &input, PyBUF_SIMPLE) != 0) {
+    return NULL;
+  }
+  if (PyObject_GetBuffer(image, &output, PyBUF_WRITABLE) != 0) {
+    PyBuffer_Release(&input);
+    return NULL;
+  }
+  band_info bands[3];
+  bool fits = false;
+  try {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    char *data = static_cast<char *>(input.buf);
+    unsigned long length = static_cast<unsigned long>(input.len);
+    const crop_window *window = crop_h == 0 && crop_w == 0 ? NULL : &crop;
+    read_dct_dimensions_from_buffer_(data, length, channels, &bands[0],
+                                     &bands[1], &bands[2], window, selected,
+                                     formatted);
+    fits = image_bytes(&bands[0], &bands[1], &bands[2]) <=
+           static_cast<size_t>(output.len);
+    if (fits) {
+      place_image_bands(static_cast<char *>(output.buf), &bands[0], &bands[1],
+                        &bands[2]);
+      read_dct_coefficients_from_buffer_into_(data, length, normalized,
+                                              channels, &bands[0], &bands[1],
+                                              &bands[2], window, selected,
+                                              formatted);
+    }
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  } catch (...) {
+    PyBuffer_Release(&output);
+    PyBuffer_Release(&input);
+    throw;
+  }
+  PyBuffer_Release(&output);
+  PyBuffer_Release(&input);
+  if (!fits) {
+    Py_RETURN_NONE;
+  }
+  PyObject *shapes = PyList_New(channels);
+  for (int b = 0; shapes != NULL && b < channels; b++) {
+    PyObject *shape = Py_BuildValue("(III)", bands[b].dct_h, bands[b].dct_w,
+                                    bands[b].dct_b);
+    if (shape == NULL) {
+      Py_CLEAR(shapes);
+      break;
+    }
+    PyList_SET_ITEM(shapes, b, shape);
+  }
+  return shapes;
+}
+
+// whether `capsule` owns the buffer of a decoded image, see image_to_buffer
+bool is_image_capsule(PyObject *capsule) {
+  return PyCapsule_IsValid(capsule, "jpeg2dct.image") != 0;
+}
+
+PyObject *new_buffer_pool(unsigned long max_bytes) {
+  return PyCapsule_New(new shared_pool(new buffer_pool(max_bytes)),
+                       "jpeg2dct.buffer_pool", delete_pool_capsule);
+}
+
+PyObject *buffer_pool_stats(PyObject *pool) {
+  shared_pool *bands_pool = get_pool(pool);
+  if (bands_pool == NULL) {
+    if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_ValueError, "a buffer pool is expected");
+    }
+    return NULL;
+  }
+  return Py_BuildValue("(nnn)", (Py_ssize_t)(*bands_pool)->hits(),
+                       (Py_ssize_t)(*bands_pool)->misses(),
+                       (Py_ssize_t)(*bands_pool)->free_bytes());
+}
+
+PyObject *probe_buffers(PyObject *buffers, int num_threads) {
+  buffer_list inputs;
+  if (!inputs.acquire(buffers)) {
+    return NULL;
+  }
+  std::vector<image_info> infos(inputs.data.size());
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    probe_buffers_(inputs.data.data(), inputs.lengths.data(),
+                   (int)inputs.data.size(), infos.data(), num_threads);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  PyObject *result = PyList_New(infos.size());
+  for (size_t i = 0; result != NULL && i < infos.size(); i++) {
+    PyObject *info = image_info_to_dict(infos[i]);
+    if (info == NULL) {
+      Py_CLEAR(result);
+      break;
+    }
+    PyList_SET_ITEM(result, i, info);
+  }
+  return result;
+}
+
+// the decoder statistics as the list of the counters and the list of the
+// seconds spent in each phase followed by the total
+PyObject *get_stats(bool reset) {
+  decoder_stats stats;
+  get_decoder_stats(reset, &stats);
+  PyObject *counters = PyList_New(kNumCounters);
+  PyObject *seconds = PyList_New(kNumPhases + 1);
+  if (counters == NULL || seconds == NULL) {
+    Py_XDECREF(counters);
+    Py_XDECREF(seconds);
+    return NULL;
+  }
+  for (int i = 0; i < kNumCounters; i++) {
+    PyList_SET_ITEM(counters, i, PyLong_FromLongLong(stats.counters[i]));
+  }
+  for (int i = 0; i <= kNumPhases; i++) {
+    long long ns = i < kNumPhases ? stats.phase_ns[i] : stats.total_ns;
+    PyList_SET_ITEM(seconds, i, PyFloat_FromDouble(ns * 1e-9));
+  }
+  return Py_BuildValue("(NN)", counters, seconds);
+}
+
+// install a callable called with the trace of every decoded image, None
+// removes it
+PyObject *set_trace_callback(PyObject *callback) {
+  PyObject *previous = trace_callback;
+  if (callback == Py_None) {
+    set_trace_hook(nullptr);
+    trace_callback = NULL;
+  } else {
+    Py_INCREF(callback);
+    trace_callback = callback;
+    set_trace_hook(call_trace_callback);
+  }
+  Py_XDECREF(previous);
+  Py_RETURN_NONE;
+}
+
+PyObject *add_restart_markers(char *buffer, unsigned long buffer_len,
+                              int restart_rows) {
+  std::string output;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    add_restart_markers_(buffer, buffer_len, restart_rows, &output);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return PyBytes_FromStringAndSize(output.data(), output.size());
+}
+
+PyObject *encode_dct_coefficients(unsigned char *pixels, int height,
+                                  int width, int components, bool bgr,
+                                  int quality, bool normalized, int channels) {
+  std::vector<band_info> bands(3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    encode_dct_coefficients_(pixels, height, width, components, bgr, quality,
+                             normalized, channels, &bands[0], &bands[1],
+                             &bands[2]);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  PyObject *images = bands_to_list(bands);
+  if (images == NULL) {
+    return NULL;
+  }
+  PyObject *image = PyList_GetItem(images, 0);
+  Py_INCREF(image);
+  Py_DECREF(images);
+  return image;
+}
+
+PyObject *encode_jpeg(unsigned char *pixels, int height, int width,
+                      int components, bool bgr, int quality, int h_samp,
+                      int v_samp, bool progressive, int restart_rows) {
+  std::string output;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    encode_jpeg_(pixels, height, width, components, bgr, quality, &output,
+                 h_samp, v_samp, progressive, restart_rows);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return PyBytes_FromStringAndSize(output.data(), output.size());
+}
+
+// the luminance and chrominance quantization tables of a quality, as a 2 x 64
+// array
+PyObject *quality_quant_tables(int quality) {
+  npy_intp dims[2] = {2, 64};
+  PyObject *tables = PyArray_SimpleNew(2, dims, NPY_UINT16);
+  if (tables == NULL) {
+    return NULL;
+  }
+  quality_quant_tables_(quality, static_cast<unsigned short *>(PyArray_DATA(
+                                     reinterpret_cast<PyArrayObject *>(tables))));
+  return tables;
+}
+
+PyObject *pack_sparse(int channels, short *band1, int band1_h, int band1_w,
+                      int band1_b, short *band2, int band2_h, int band2_w,
+                      int band2_b, short *band3, int band3_h, int band3_w,
+                      int band3_b, unsigned short *quant, int quant_h,
+                      int quant_w) {
+  if (quant_h != channels || quant_w != 64) {
+    PyErr_SetString(PyExc_RuntimeError,
+                    "quant should be a channels x 64 array");
+    return NULL;
+  }
+  band_info bands[3] = {
+      {band1, (unsigned)band1_h, (unsigned)band1_w, (unsigned)band1_b,
+       DTYPE_INT16},
+      {band2, (unsigned)band2_h, (unsigned)band2_w, (unsigned)band2_b,
+       DTYPE_INT16},
+      {band3, (unsigned)band3_h, (unsigned)band3_w, (unsigned)band3_b,
+       DTYPE_INT16}};
+  std::string output;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    pack_sparse_(bands, channels, quant, &output);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  return PyBytes_FromStringAndSize(output.data(), output.size());
+}
+
+PyObject *unpack_sparse(char *buffer, unsigned long buffer_len,
+                        bool normalized) {
+  std::vector<band_info> bands(3);
+  int nb_bands;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    unpack_sparse_(buffer, buffer_len, normalized, &bands[0], &bands[1],
+                   &bands[2], &nb_bands);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  PyObject *images = bands_to_list(bands);
+  if (images == NULL) {
+    return NULL;
+  }
+  PyObject *image = PyList_GetSlice(PyList_GET_ITEM(images, 0), 0, nb_bands);
+  Py_DECREF(images);
+  return image;
+}
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+SWIGINTERN PyObject *_wrap_band_info_dct_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  void *arg2 = (void *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_info_dct_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, SWIG_POINTER_DISOWN);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "band_info_dct_set" "', argument " "2"" of type '" "void *""'"); 
+  }
+  if (arg1) (arg1)->dct = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dct_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  void *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  result = (void *) ((arg1)->dct);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dct_h_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_info_dct_h_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_h_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_info_dct_h_set" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  if (arg1) (arg1)->dct_h = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dct_h_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_h_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  result = (unsigned int) ((arg1)->dct_h);
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dct_w_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_info_dct_w_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_w_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_info_dct_w_set" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  if (arg1) (arg1)->dct_w = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dct_w_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_w_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  result = (unsigned int) ((arg1)->dct_w);
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dct_b_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_info_dct_b_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_b_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_info_dct_b_set" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  if (arg1) (arg1)->dct_b = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dct_b_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_b_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  result = (unsigned int) ((arg1)->dct_b);
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dtype_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_info_dtype_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dtype_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_info_dtype_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->dtype = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_info_dtype_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dtype_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  result = (int) ((arg1)->dtype);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_band_info(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_band_info", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (jpeg2dct::common::band_info *)new jpeg2dct::common::band_info();
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_jpeg2dct__common__band_info, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_band_info(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_band_info" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *band_info_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_jpeg2dct__common__band_info, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *band_info_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_crop_window_y_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "crop_window_y_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "crop_window_y_set" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "crop_window_y_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->y = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_crop_window_y_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "crop_window_y_get" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  result = (int) ((arg1)->y);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_crop_window_x_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "crop_window_x_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "crop_window_x_set" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "crop_window_x_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->x = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_crop_window_x_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "crop_window_x_get" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  result = (int) ((arg1)->x);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_crop_window_h_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "crop_window_h_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "crop_window_h_set" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "crop_window_h_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->h = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_crop_window_h_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "crop_window_h_get" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  result = (int) ((arg1)->h);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_crop_window_w_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "crop_window_w_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "crop_window_w_set" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "crop_window_w_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->w = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_crop_window_w_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "crop_window_w_get" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  result = (int) ((arg1)->w);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_crop_window(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_crop_window", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (jpeg2dct::common::crop_window *)new jpeg2dct::common::crop_window();
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_jpeg2dct__common__crop_window, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_crop_window(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::crop_window *arg1 = (jpeg2dct::common::crop_window *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__crop_window, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_crop_window" "', argument " "1"" of type '" "jpeg2dct::common::crop_window *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *crop_window_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_jpeg2dct__common__crop_window, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *crop_window_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_coefficient_selection_count_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::coefficient_selection *arg1 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "coefficient_selection_count_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "coefficient_selection_count_set" "', argument " "1"" of type '" "jpeg2dct::common::coefficient_selection *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "coefficient_selection_count_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->count = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_coefficient_selection_count_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::coefficient_selection *arg1 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "coefficient_selection_count_get" "', argument " "1"" of type '" "jpeg2dct::common::coefficient_selection *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp1);
+  result = (int) ((arg1)->count);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_coefficient_selection_index_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::coefficient_selection *arg1 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  int *arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "coefficient_selection_index_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "coefficient_selection_index_set" "', argument " "1"" of type '" "jpeg2dct::common::coefficient_selection *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "coefficient_selection_index_set" "', argument " "2"" of type '" "int [64]""'"); 
+  } 
+  arg2 = reinterpret_cast< int * >(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)64; ++ii) *(int *)&arg1->index[ii] = *((int *)arg2 + ii);
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""index""' of type '""int [64]""'");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_coefficient_selection_index_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::coefficient_selection *arg1 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "coefficient_selection_index_get" "', argument " "1"" of type '" "jpeg2dct::common::coefficient_selection *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp1);
+  result = (int *)(int *) ((arg1)->index);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_coefficient_selection(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::coefficient_selection *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_coefficient_selection", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (jpeg2dct::common::coefficient_selection *)new jpeg2dct::common::coefficient_selection();
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_jpeg2dct__common__coefficient_selection, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_coefficient_selection(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::coefficient_selection *arg1 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_coefficient_selection" "', argument " "1"" of type '" "jpeg2dct::common::coefficient_selection *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *coefficient_selection_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_jpeg2dct__common__coefficient_selection, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *coefficient_selection_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_band_format_dtype_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_dtype_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_dtype_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_format_dtype_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->dtype = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_dtype_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_dtype_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (int) ((arg1)->dtype);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_standardize_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  bool arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_standardize_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_standardize_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_format_standardize_set" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  if (arg1) (arg1)->standardize = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_standardize_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  bool result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_standardize_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (bool) ((arg1)->standardize);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_nb_coefficients_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_nb_coefficients_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_nb_coefficients_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_format_nb_coefficients_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->nb_coefficients = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_nb_coefficients_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_nb_coefficients_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (int) ((arg1)->nb_coefficients);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_mean_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  float (*arg2)[64] ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_mean_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_mean_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_a_64__float, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "band_format_mean_set" "', argument " "2"" of type '" "float [3][64]""'"); 
+  } 
+  arg2 = reinterpret_cast< float (*)[64] >(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)3; ++ii) {
+        if (arg2[ii]) {
+          size_t jj = 0;
+          for (; jj < (size_t)64; ++jj) arg1->mean[ii][jj] = arg2[ii][jj];
+        } else {
+          SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""mean""' of type '""float [3][64]""'");
+        }
+      }
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""mean""' of type '""float [3][64]""'");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_mean_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  float (*result)[64] = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_mean_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (float (*)[64])(float (*)[64]) ((arg1)->mean);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_a_64__float, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_std_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  float (*arg2)[64] ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_std_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_std_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_a_64__float, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "band_format_std_set" "', argument " "2"" of type '" "float [3][64]""'"); 
+  } 
+  arg2 = reinterpret_cast< float (*)[64] >(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)3; ++ii) {
+        if (arg2[ii]) {
+          size_t jj = 0;
+          for (; jj < (size_t)64; ++jj) arg1->std[ii][jj] = arg2[ii][jj];
+        } else {
+          SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""std""' of type '""float [3][64]""'");
+        }
+      }
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""std""' of type '""float [3][64]""'");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_std_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  float (*result)[64] = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_std_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (float (*)[64])(float (*)[64]) ((arg1)->std);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_a_64__float, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_target_h_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_target_h_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_target_h_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_format_target_h_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->target_h = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_target_h_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_target_h_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (int) ((arg1)->target_h);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_target_w_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_target_w_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_target_w_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_format_target_w_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->target_w = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_target_w_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_target_w_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (int) ((arg1)->target_w);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_crop_mode_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_crop_mode_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_crop_mode_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_format_crop_mode_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->crop_mode = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_crop_mode_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_crop_mode_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (int) ((arg1)->crop_mode);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_pad_mode_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_pad_mode_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_pad_mode_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_format_pad_mode_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->pad_mode = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_pad_mode_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_pad_mode_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (int) ((arg1)->pad_mode);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_scale_denom_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "band_format_scale_denom_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_scale_denom_set" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_format_scale_denom_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->scale_denom = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_band_format_scale_denom_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_format_scale_denom_get" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  result = (int) ((arg1)->scale_denom);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_band_format(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_band_format", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (jpeg2dct::common::band_format *)new jpeg2dct::common::band_format();
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_jpeg2dct__common__band_format, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_band_format(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  jpeg2dct::common::band_format *arg1 = (jpeg2dct::common::band_format *) 0 ;
+  void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  short *result = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_jpeg2dct__common__band_format, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_band_format" "', argument " "1"" of type '" "jpeg2dct::common::band_format *""'"); 
+  }
+  arg1 = reinterpret_cast< jpeg2dct::common::band_format * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *band_format_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_jpeg2dct__common__band_format, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *band_format_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN int Swig_var_kBandAlignment_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable kBandAlignment is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_kBandAlignment_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_size_t(static_cast< size_t >(jpeg2dct::common::kBandAlignment));
+  return pyobj;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_file___SWIG_0(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  bool arg2 ;
+  int arg3 ;
+  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg7 = (jpeg2dct::common::crop_window *) 0 ;
+  jpeg2dct::common::coefficient_selection *arg8 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  jpeg2dct::common::band_format *arg9 = (jpeg2dct::common::band_format *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  
+  if ((nobjs < 9) || (nobjs > 9)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_file_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_file_" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_file_" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_coefficients_from_file_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_file_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_file_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_file_" "', argument " "7"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_coefficients_from_file_" "', argument " "8"" of type '" "jpeg2dct::common::coefficient_selection const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "read_dct_coefficients_from_file_" "', argument " "9"" of type '" "jpeg2dct::common::band_format const *""'"); 
+  }
+  arg9 = reinterpret_cast< jpeg2dct::common::band_format * >(argp9);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_file_(arg1,arg2,arg3,arg4,arg5,arg6,(jpeg2dct::common::crop_window const *)arg7,(jpeg2dct::common::coefficient_selection const *)arg8,(jpeg2dct::common::band_format const *)arg9);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_file___SWIG_1(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  bool arg2 ;
+  int arg3 ;
+  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg7 = (jpeg2dct::common::crop_window *) 0 ;
+  jpeg2dct::common::coefficient_selection *arg8 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  
+  if ((nobjs < 8) || (nobjs > 8)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_file_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_file_" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_file_" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_coefficients_from_file_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_file_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_file_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_file_" "', argument " "7"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_coefficients_from_file_" "', argument " "8"" of type '" "jpeg2dct::common::coefficient_selection const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp8);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_file_(arg1,arg2,arg3,arg4,arg5,arg6,(jpeg2dct::common::crop_window const *)arg7,(jpeg2dct::common::coefficient_selection const *)arg8);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_file___SWIG_2(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  bool arg2 ;
+  int arg3 ;
+  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg7 = (jpeg2dct::common::crop_window *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  
+  if ((nobjs < 7) || (nobjs > 7)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_file_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_file_" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_file_" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_coefficients_from_file_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_file_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_file_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_file_" "', argument " "7"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp7);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_file_(arg1,arg2,arg3,arg4,arg5,arg6,(jpeg2dct::common::crop_window const *)arg7);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_file___SWIG_3(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  bool arg2 ;
+  int arg3 ;
+  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  
+  if ((nobjs < 6) || (nobjs > 6)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_file_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_file_" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_file_" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_coefficients_from_file_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_file_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_file_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_file_(arg1,arg2,arg3,arg4,arg5,arg6);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_file_(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[10] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "read_dct_coefficients_from_file_", 0, 9, argv))) SWIG_fail;
+  --argc;
+  if (argc == 6) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_bool(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                return _wrap_read_dct_coefficients_from_file___SWIG_3(self, argc, argv);
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 7) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_bool(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  return _wrap_read_dct_coefficients_from_file___SWIG_2(self, argc, argv);
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 8) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_bool(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    return _wrap_read_dct_coefficients_from_file___SWIG_1(self, argc, argv);
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 9) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_bool(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    void *vptr = 0;
+                    int res = SWIG_ConvertPtr(argv[8], &vptr, SWIGTYPE_p_jpeg2dct__common__band_format, 0);
+                    _v = SWIG_CheckState(res);
+                    if (_v) {
+                      return _wrap_read_dct_coefficients_from_file___SWIG_0(self, argc, argv);
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'read_dct_coefficients_from_file_'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_file_(char *,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *,jpeg2dct::common::coefficient_selection const *,jpeg2dct::common::band_format const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_file_(char *,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *,jpeg2dct::common::coefficient_selection const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_file_(char *,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_file_(char *,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer___SWIG_0(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg8 = (jpeg2dct::common::crop_window *) 0 ;
+  jpeg2dct::common::coefficient_selection *arg9 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  jpeg2dct::common::band_format *arg10 = (jpeg2dct::common::band_format *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  void *argp10 = 0 ;
+  int res10 = 0 ;
+  
+  if ((nobjs < 10) || (nobjs > 10)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "8"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "9"" of type '" "jpeg2dct::common::coefficient_selection const *""'"); 
+  }
+  arg9 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp9);
+  res10 = SWIG_ConvertPtr(swig_obj[9], &argp10,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res10)) {
+    SWIG_exception_fail(SWIG_ArgError(res10), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "10"" of type '" "jpeg2dct::common::band_format const *""'"); 
+  }
+  arg10 = reinterpret_cast< jpeg2dct::common::band_format * >(argp10);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6,arg7,(jpeg2dct::common::crop_window const *)arg8,(jpeg2dct::common::coefficient_selection const *)arg9,(jpeg2dct::common::band_format const *)arg10);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer___SWIG_1(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg8 = (jpeg2dct::common::crop_window *) 0 ;
+  jpeg2dct::common::coefficient_selection *arg9 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  
+  if ((nobjs < 9) || (nobjs > 9)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "8"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "9"" of type '" "jpeg2dct::common::coefficient_selection const *""'"); 
+  }
+  arg9 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp9);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6,arg7,(jpeg2dct::common::crop_window const *)arg8,(jpeg2dct::common::coefficient_selection const *)arg9);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer___SWIG_2(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg8 = (jpeg2dct::common::crop_window *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  
+  if ((nobjs < 8) || (nobjs > 8)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "8"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp8);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6,arg7,(jpeg2dct::common::crop_window const *)arg8);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer___SWIG_3(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  
+  if ((nobjs < 7) || (nobjs > 7)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6,arg7);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[11] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "read_dct_coefficients_from_buffer_", 0, 10, argv))) SWIG_fail;
+  --argc;
+  if (argc == 7) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  return _wrap_read_dct_coefficients_from_buffer___SWIG_3(self, argc, argv);
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 8) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    return _wrap_read_dct_coefficients_from_buffer___SWIG_2(self, argc, argv);
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 9) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    void *vptr = 0;
+                    int res = SWIG_ConvertPtr(argv[8], &vptr, SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0);
+                    _v = SWIG_CheckState(res);
+                    if (_v) {
+                      return _wrap_read_dct_coefficients_from_buffer___SWIG_1(self, argc, argv);
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 10) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    void *vptr = 0;
+                    int res = SWIG_ConvertPtr(argv[8], &vptr, SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0);
+                    _v = SWIG_CheckState(res);
+                    if (_v) {
+                      void *vptr = 0;
+                      int res = SWIG_ConvertPtr(argv[9], &vptr, SWIGTYPE_p_jpeg2dct__common__band_format, 0);
+                      _v = SWIG_CheckState(res);
+                      if (_v) {
+                        return _wrap_read_dct_coefficients_from_buffer___SWIG_0(self, argc, argv);
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'read_dct_coefficients_from_buffer_'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_buffer_(char *,unsigned long,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *,jpeg2dct::common::coefficient_selection const *,jpeg2dct::common::band_format const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_buffer_(char *,unsigned long,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *,jpeg2dct::common::coefficient_selection const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_buffer_(char *,unsigned long,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_buffer_(char *,unsigned long,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_set_chroma_resampling(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  bool arg1 ;
+  bool val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_bool(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "set_chroma_resampling" "', argument " "1"" of type '" "bool""'");
+  } 
+  arg1 = static_cast< bool >(val1);
+  {
+    try {
+      jpeg2dct::common::set_chroma_resampling(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_get_chroma_resampling(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  bool result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "get_chroma_resampling", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (bool)jpeg2dct::common::get_chroma_resampling();
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_set_accept_truncated(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  bool arg1 ;
+  bool val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_bool(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "set_accept_truncated" "', argument " "1"" of type '" "bool""'");
+  } 
+  arg1 = static_cast< bool >(val1);
+  {
+    try {
+      jpeg2dct::common::set_accept_truncated(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_get_accept_truncated(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  bool result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "get_accept_truncated", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (bool)jpeg2dct::common::get_accept_truncated();
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_set_segment_threads(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "set_segment_threads" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = static_cast< int >(val1);
+  {
+    try {
+      jpeg2dct::common::set_segment_threads(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_dimensions_from_buffer___SWIG_0(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  int arg3 ;
+  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg7 = (jpeg2dct::common::crop_window *) 0 ;
+  jpeg2dct::common::coefficient_selection *arg8 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  jpeg2dct::common::band_format *arg9 = (jpeg2dct::common::band_format *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  
+  if ((nobjs < 9) || (nobjs > 9)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "7"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "8"" of type '" "jpeg2dct::common::coefficient_selection const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "9"" of type '" "jpeg2dct::common::band_format const *""'"); 
+  }
+  arg9 = reinterpret_cast< jpeg2dct::common::band_format * >(argp9);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_dimensions_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6,(jpeg2dct::common::crop_window const *)arg7,(jpeg2dct::common::coefficient_selection const *)arg8,(jpeg2dct::common::band_format const *)arg9);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_dimensions_from_buffer___SWIG_1(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  int arg3 ;
+  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg7 = (jpeg2dct::common::crop_window *) 0 ;
+  jpeg2dct::common::coefficient_selection *arg8 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  
+  if ((nobjs < 8) || (nobjs > 8)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "7"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "8"" of type '" "jpeg2dct::common::coefficient_selection const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp8);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_dimensions_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6,(jpeg2dct::common::crop_window const *)arg7,(jpeg2dct::common::coefficient_selection const *)arg8);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_dimensions_from_buffer___SWIG_2(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  int arg3 ;
+  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg7 = (jpeg2dct::common::crop_window *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  
+  if ((nobjs < 7) || (nobjs > 7)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "7"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp7);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_dimensions_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6,(jpeg2dct::common::crop_window const *)arg7);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_dimensions_from_buffer___SWIG_3(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  int arg3 ;
+  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  
+  if ((nobjs < 6) || (nobjs > 6)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_dimensions_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_dimensions_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_dimensions_from_buffer_(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[10] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "read_dct_dimensions_from_buffer_", 0, 9, argv))) SWIG_fail;
+  --argc;
+  if (argc == 6) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                return _wrap_read_dct_dimensions_from_buffer___SWIG_3(self, argc, argv);
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 7) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  return _wrap_read_dct_dimensions_from_buffer___SWIG_2(self, argc, argv);
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 8) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    return _wrap_read_dct_dimensions_from_buffer___SWIG_1(self, argc, argv);
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 9) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    void *vptr = 0;
+                    int res = SWIG_ConvertPtr(argv[8], &vptr, SWIGTYPE_p_jpeg2dct__common__band_format, 0);
+                    _v = SWIG_CheckState(res);
+                    if (_v) {
+                      return _wrap_read_dct_dimensions_from_buffer___SWIG_0(self, argc, argv);
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'read_dct_dimensions_from_buffer_'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    jpeg2dct::common::read_dct_dimensions_from_buffer_(char *,unsigned long,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *,jpeg2dct::common::coefficient_selection const *,jpeg2dct::common::band_format const *)\n"
+    "    jpeg2dct::common::read_dct_dimensions_from_buffer_(char *,unsigned long,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *,jpeg2dct::common::coefficient_selection const *)\n"
+    "    jpeg2dct::common::read_dct_dimensions_from_buffer_(char *,unsigned long,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *)\n"
+    "    jpeg2dct::common::read_dct_dimensions_from_buffer_(char *,unsigned long,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_dimensions_from_buffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  int arg3 ;
+  int arg4 ;
+  int arg5 ;
+  int arg6 ;
+  int arg7 ;
+  int *arg8 = (int *) 0 ;
+  int arg9 ;
+  int *arg10 = (int *) 0 ;
+  int *arg11 = (int *) 0 ;
+  int *arg12 = (int *) 0 ;
+  int *arg13 = (int *) 0 ;
+  int *arg14 = (int *) 0 ;
+  int *arg15 = (int *) 0 ;
+  int *arg16 = (int *) 0 ;
+  int *arg17 = (int *) 0 ;
+  int *arg18 = (int *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
+  int val7 ;
+  int ecode7 = 0 ;
+  PyArrayObject *array8 = NULL ;
+  int is_new_object8 = 0 ;
+  int temp10 ;
+  int res10 = SWIG_TMPOBJ ;
+  int temp11 ;
+  int res11 = SWIG_TMPOBJ ;
+  int temp12 ;
+  int res12 = SWIG_TMPOBJ ;
+  int temp13 ;
+  int res13 = SWIG_TMPOBJ ;
+  int temp14 ;
+  int res14 = SWIG_TMPOBJ ;
+  int temp15 ;
+  int res15 = SWIG_TMPOBJ ;
+  int temp16 ;
+  int res16 = SWIG_TMPOBJ ;
+  int temp17 ;
+  int res17 = SWIG_TMPOBJ ;
+  int temp18 ;
+  int res18 = SWIG_TMPOBJ ;
+  PyObject *swig_obj[8] ;
+  
+  arg10 = &temp10;
+  arg11 = &temp11;
+  arg12 = &temp12;
+  arg13 = &temp13;
+  arg14 = &temp14;
+  arg15 = &temp15;
+  arg16 = &temp16;
+  arg17 = &temp17;
+  arg18 = &temp18;
+  if (!SWIG_Python_UnpackTuple(args, "read_dct_dimensions_from_buffer", 8, 8, swig_obj)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_dimensions_from_buffer" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_dimensions_from_buffer" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_dimensions_from_buffer" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_dimensions_from_buffer" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "read_dct_dimensions_from_buffer" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = static_cast< int >(val5);
+  ecode6 = SWIG_AsVal_int(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "read_dct_dimensions_from_buffer" "', argument " "6"" of type '" "int""'");
+  } 
+  arg6 = static_cast< int >(val6);
+  ecode7 = SWIG_AsVal_int(swig_obj[6], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "read_dct_dimensions_from_buffer" "', argument " "7"" of type '" "int""'");
+  } 
+  arg7 = static_cast< int >(val7);
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array8 = obj_to_array_contiguous_allow_conversion(swig_obj[7],
+      NPY_INT,
+      &is_new_object8);
+    if (!array8 || !require_dimensions(array8, 1) ||
+      !require_size(array8, size, 1)) SWIG_fail;
+    arg8 = (int*) array_data(array8);
+    arg9 = (int) array_size(array8,0);
+  }
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_dimensions_from_buffer(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15,arg16,arg17,arg18);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsTmpObj(res10)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg10)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res10) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg10), SWIGTYPE_p_int, new_flags));
+  }
+  if (SWIG_IsTmpObj(res11)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg11)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res11) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg11), SWIGTYPE_p_int, new_flags));
+  }
+  if (SWIG_IsTmpObj(res12)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg12)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res12) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg12), SWIGTYPE_p_int, new_flags));
+  }
+  if (SWIG_IsTmpObj(res13)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg13)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res13) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg13), SWIGTYPE_p_int, new_flags));
+  }
+  if (SWIG_IsTmpObj(res14)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg14)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res14) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg14), SWIGTYPE_p_int, new_flags));
+  }
+  if (SWIG_IsTmpObj(res15)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg15)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res15) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg15), SWIGTYPE_p_int, new_flags));
+  }
+  if (SWIG_IsTmpObj(res16)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg16)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res16) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg16), SWIGTYPE_p_int, new_flags));
+  }
+  if (SWIG_IsTmpObj(res17)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg17)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res17) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg17), SWIGTYPE_p_int, new_flags));
+  }
+  if (SWIG_IsTmpObj(res18)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_int((*arg18)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res18) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg18), SWIGTYPE_p_int, new_flags));
+  }
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  {
+    if (is_new_object8 && array8)
+    {
+      Py_DECREF(array8); 
+    }
+  }
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  {
+    if (is_new_object8 && array8)
+    {
+      Py_DECREF(array8); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_into___SWIG_0(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg8 = (jpeg2dct::common::crop_window *) 0 ;
+  jpeg2dct::common::coefficient_selection *arg9 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  jpeg2dct::common::band_format *arg10 = (jpeg2dct::common::band_format *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  void *argp10 = 0 ;
+  int res10 = 0 ;
+  
+  if ((nobjs < 10) || (nobjs > 10)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "8"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "9"" of type '" "jpeg2dct::common::coefficient_selection const *""'"); 
+  }
+  arg9 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp9);
+  res10 = SWIG_ConvertPtr(swig_obj[9], &argp10,SWIGTYPE_p_jpeg2dct__common__band_format, 0 |  0 );
+  if (!SWIG_IsOK(res10)) {
+    SWIG_exception_fail(SWIG_ArgError(res10), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "10"" of type '" "jpeg2dct::common::band_format const *""'"); 
+  }
+  arg10 = reinterpret_cast< jpeg2dct::common::band_format * >(argp10);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_into_(arg1,arg2,arg3,arg4,arg5,arg6,arg7,(jpeg2dct::common::crop_window const *)arg8,(jpeg2dct::common::coefficient_selection const *)arg9,(jpeg2dct::common::band_format const *)arg10);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_into___SWIG_1(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg8 = (jpeg2dct::common::crop_window *) 0 ;
+  jpeg2dct::common::coefficient_selection *arg9 = (jpeg2dct::common::coefficient_selection *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  
+  if ((nobjs < 9) || (nobjs > 9)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "8"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "9"" of type '" "jpeg2dct::common::coefficient_selection const *""'"); 
+  }
+  arg9 = reinterpret_cast< jpeg2dct::common::coefficient_selection * >(argp9);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_into_(arg1,arg2,arg3,arg4,arg5,arg6,arg7,(jpeg2dct::common::crop_window const *)arg8,(jpeg2dct::common::coefficient_selection const *)arg9);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_into___SWIG_2(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::crop_window *arg8 = (jpeg2dct::common::crop_window *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  
+  if ((nobjs < 8) || (nobjs > 8)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_jpeg2dct__common__crop_window, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "8"" of type '" "jpeg2dct::common::crop_window const *""'"); 
+  }
+  arg8 = reinterpret_cast< jpeg2dct::common::crop_window * >(argp8);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_into_(arg1,arg2,arg3,arg4,arg5,arg6,arg7,(jpeg2dct::common::crop_window const *)arg8);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_into___SWIG_3(PyObject *SWIGUNUSEDPARM(self), Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
+  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  
+  if ((nobjs < 7) || (nobjs > 7)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_into_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  }
+  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_into_(arg1,arg2,arg3,arg4,arg5,arg6,arg7);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_into_(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[11] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "read_dct_coefficients_from_buffer_into_", 0, 10, argv))) SWIG_fail;
+  --argc;
+  if (argc == 7) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  return _wrap_read_dct_coefficients_from_buffer_into___SWIG_3(self, argc, argv);
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 8) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    return _wrap_read_dct_coefficients_from_buffer_into___SWIG_2(self, argc, argv);
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 9) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    void *vptr = 0;
+                    int res = SWIG_ConvertPtr(argv[8], &vptr, SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0);
+                    _v = SWIG_CheckState(res);
+                    if (_v) {
+                      return _wrap_read_dct_coefficients_from_buffer_into___SWIG_1(self, argc, argv);
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  if (argc == 10) {
+    int _v;
+    int res = SWIG_AsCharPtrAndSize(argv[0], 0, NULL, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_unsigned_SS_long(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            void *vptr = 0;
+            int res = SWIG_ConvertPtr(argv[4], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              void *vptr = 0;
+              int res = SWIG_ConvertPtr(argv[5], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+              _v = SWIG_CheckState(res);
+              if (_v) {
+                void *vptr = 0;
+                int res = SWIG_ConvertPtr(argv[6], &vptr, SWIGTYPE_p_jpeg2dct__common__band_info, 0);
+                _v = SWIG_CheckState(res);
+                if (_v) {
+                  void *vptr = 0;
+                  int res = SWIG_ConvertPtr(argv[7], &vptr, SWIGTYPE_p_jpeg2dct__common__crop_window, 0);
+                  _v = SWIG_CheckState(res);
+                  if (_v) {
+                    void *vptr = 0;
+                    int res = SWIG_ConvertPtr(argv[8], &vptr, SWIGTYPE_p_jpeg2dct__common__coefficient_selection, 0);
+                    _v = SWIG_CheckState(res);
+                    if (_v) {
+                      void *vptr = 0;
+                      int res = SWIG_ConvertPtr(argv[9], &vptr, SWIGTYPE_p_jpeg2dct__common__band_format, 0);
+                      _v = SWIG_CheckState(res);
+                      if (_v) {
+                        return _wrap_read_dct_coefficients_from_buffer_into___SWIG_0(self, argc, argv);
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'read_dct_coefficients_from_buffer_into_'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_buffer_into_(char *,unsigned long,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *,jpeg2dct::common::coefficient_selection const *,jpeg2dct::common::band_format const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_buffer_into_(char *,unsigned long,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *,jpeg2dct::common::coefficient_selection const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_buffer_into_(char *,unsigned long,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::crop_window const *)\n"
+    "    jpeg2dct::common::read_dct_coefficients_from_buffer_into_(char *,unsigned long,bool,int,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *,jpeg2dct::common::band_info *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_into(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  unsigned long arg2 ;
+  bool arg3 ;
+  int arg4 ;
+  int arg5 ;
+  int arg6 ;
+  int arg7 ;
+  int arg8 ;
+  int *arg9 = (int *) 0 ;
+  int arg10 ;
+  short *arg11 = (short *) 0 ;
+  int arg12 ;
+  int arg13 ;
+  int arg14 ;
+  short *arg15 = (short *) 0 ;
+  int arg16 ;
+  int arg17 ;
+  int arg18 ;
+  short *arg19 = (short *) 0 ;
+  int arg20 ;
+  int arg21 ;
+  int arg22 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
+  int val7 ;
+  int ecode7 = 0 ;
+  int val8 ;
+  int ecode8 = 0 ;
+  PyArrayObject *array9 = NULL ;
+  int is_new_object9 = 0 ;
+  PyArrayObject *array11 = NULL ;
+  PyArrayObject *array15 = NULL ;
+  PyArrayObject *array19 = NULL ;
+  PyObject *swig_obj[12] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "read_dct_coefficients_from_buffer_into", 12, 12, swig_obj)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_into" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_into" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_into" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_into" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "read_dct_coefficients_from_buffer_into" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = static_cast< int >(val5);
+  ecode6 = SWIG_AsVal_int(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "read_dct_coefficients_from_buffer_into" "', argument " "6"" of type '" "int""'");
+  } 
+  arg6 = static_cast< int >(val6);
+  ecode7 = SWIG_AsVal_int(swig_obj[6], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "read_dct_coefficients_from_buffer_into" "', argument " "7"" of type '" "int""'");
+  } 
+  arg7 = static_cast< int >(val7);
+  ecode8 = SWIG_AsVal_int(swig_obj[7], &val8);
+  if (!SWIG_IsOK(ecode8)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode8), "in method '" "read_dct_coefficients_from_buffer_into" "', argument " "8"" of type '" "int""'");
+  } 
+  arg8 = static_cast< int >(val8);
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array9 = obj_to_array_contiguous_allow_conversion(swig_obj[8],
+      NPY_INT,
+      &is_new_object9);
+    if (!array9 || !require_dimensions(array9, 1) ||
+      !require_size(array9, size, 1)) SWIG_fail;
+    arg9 = (int*) array_data(array9);
+    arg10 = (int) array_size(array9,0);
+  }
+  {
+    array11 = obj_to_array_no_conversion(swig_obj[9], NPY_SHORT);
+    if (!array11 || !require_dimensions(array11,3) || !require_contiguous(array11) ||
+      !require_native(array11)) SWIG_fail;
+    arg11 = (short*) array_data(array11);
+    arg12 = (int) array_size(array11,0);
+    arg13 = (int) array_size(array11,1);
+    arg14 = (int) array_size(array11,2);
+  }
+  {
+    array15 = obj_to_array_no_conversion(swig_obj[10], NPY_SHORT);
+    if (!array15 || !require_dimensions(array15,3) || !require_contiguous(array15) ||
+      !require_native(array15)) SWIG_fail;
+    arg15 = (short*) array_data(array15);
+    arg16 = (int) array_size(array15,0);
+    arg17 = (int) array_size(array15,1);
+    arg18 = (int) array_size(array15,2);
+  }
+  {
+    array19 = obj_to_array_no_conversion(swig_obj[11], NPY_SHORT);
+    if (!array19 || !require_dimensions(array19,3) || !require_contiguous(array19) ||
+      !require_native(array19)) SWIG_fail;
+    arg19 = (short*) array_data(array19);
+    arg20 = (int) array_size(array19,0);
+    arg21 = (int) array_size(array19,1);
+    arg22 = (int) array_size(array19,2);
+  }
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        jpeg2dct::common::read_dct_coefficients_from_buffer_into(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15,arg16,arg17,arg18,arg19,arg20,arg21,arg22);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  {
+    if (is_new_object9 && array9)
+    {
+      Py_DECREF(array9); 
+    }
+  }
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  {
+    if (is_new_object9 && array9)
+    {
+      Py_DECREF(array9); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN int Swig_var_kMaxProbedComponents_set(PyObject *) {
+  SWIG_Error(SWIG_AttributeError,"Variable kMaxProbedComponents is read-only.");
+  return 1;
+}
+
+
+SWIGINTERN PyObject *Swig_var_kMaxProbedComponents_get(void) {
+  PyObject *pyobj = 0;
+  
+  pyobj = SWIG_From_int(static_cast< int >(jpeg2dct::common::kMaxProbedComponents));
+  return pyobj;
+}
+
+
+SWIGINTERN PyObject *_wrap_prefetch_file(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "prefetch_file" "', argument " "1"" of type '" "char const *""'");
+  }
+  arg1 = reinterpret_cast< char * >(buf1);
+  {
+    try {
+      {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        prefetch_file((char const *)arg1);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffers(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PyObject *arg1 = (PyObject *) 0 ;
+  bool arg2 ;
+  int arg3 ;
+  int arg4 ;
+  int arg5 ;
+  int arg6 ;
+  int arg7 ;
+  int *arg8 = (int *) 0 ;
+  int arg9 ;
+  int arg10 ;
+  float *arg11 = (float *) 0 ;
+  int arg12 ;
+  int arg13 ;
+  float *arg14 = (float *) 0 ;
+  int arg15 ;
+  int arg16 ;
+  int arg17 ;
+  int arg18 ;
+  int arg19 ;
+  int arg20 ;
+  int arg21 ;
+  int arg22 ;
+  bool arg23 ;
+  PyObject *arg24 = (PyObject *) 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
+  int val7 ;
+  int ecode7 = 0 ;
+  PyArrayObject *array8 = NULL ;
+  int is_new_object8 = 0 ;
+  int val10 ;
+  int ecode10 = 0 ;
+  PyArrayObject *array11 = NULL ;
+  int is_new_object11 = 0 ;
+  PyArrayObject *array14 = NULL ;
+  int is_new_object14 = 0 ;
+  int val17 ;
+  int ecode17 = 0 ;
+  int val18 ;
+  int ecode18 = 0 ;
+  int val19 ;
+  int ecode19 = 0 ;
+  int val20 ;
+  int ecode20 = 0 ;
+  int val21 ;
+  int ecode21 = 0 ;
+  int val22 ;
+  int ecode22 = 0 ;
+  bool val23 ;
+  int ecode23 = 0 ;
+  PyObject *swig_obj[19] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "read_dct_coefficients_from_buffers", 19, 19, swig_obj)) SWIG_fail;
+  arg1 = swig_obj[0];
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffers" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffers" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffers" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "read_dct_coefficients_from_buffers" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = static_cast< int >(val5);
+  ecode6 = SWIG_AsVal_int(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "read_dct_coefficients_from_buffers" "', argument " "6"" of type '" "int""'");
+  } 
+  arg6 = static_cast< int >(val6);
+  ecode7 = SWIG_AsVal_int(swig_obj[6], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "read_dct_coefficients_from_buffers" "', argument " "7"" of type '" "int""'");
+  } 
+  arg7 = static_cast< int >(val7);
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array8 = obj_to_array_contiguous_allow_conversion(swig_obj[7],
+      NPY_INT,
+      &is_new_object8);
+    if (!array8 || !require_dimensions(array8, 1) ||
+      !require_size(array8, size, 1)) SWIG_fail;
+    arg8 = (int*) array_data(array8);
+    arg9 = (int) array_size(array8,0);
+  }
+  ecode10 = SWIG_AsVal_int(swig_obj[8], &val10);
+  if (!SWIG_IsOK(ecode10)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode10), "in method '" "read_dct_coefficients_from_buffers" "', argument " "10"" of type '" "int""'");
+  } 
+  arg10 = static_cast< int >(val10);
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array11 = obj_to_array_contiguous_allow_conversion(swig_obj[9], NPY_FLOAT,
+      &is_new_object11);
+    if (!array11 || !require_dimensions(array11, 2) ||
+      !require_size(array11, size, 2)) SWIG_fail;
+    arg11 = (float*) array_data(array11);
+    arg12 = (int) array_size(array11,0);
+    arg13 = (int) array_size(array11,1);
+  }
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array14 = obj_to_array_contiguous_allow_conversion(swig_obj[10], NPY_FLOAT,
+      &is_new_object14);
+    if (!array14 || !require_dimensions(array14, 2) ||
+      !require_size(array14, size, 2)) SWIG_fail;
+    arg14 = (float*) array_data(array14);
+    arg15 = (int) array_size(array14,0);
+    arg16 = (int) array_size(array14,1);
+  }
+  ecode17 = SWIG_AsVal_int(swig_obj[11], &val17);
+  if (!SWIG_IsOK(ecode17)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode17), "in method '" "read_dct_coefficients_from_buffers" "', argument " "17"" of type '" "int""'");
+  } 
+  arg17 = static_cast< int >(val17);
+  ecode18 = SWIG_AsVal_int(swig_obj[12], &val18);
+  if (!SWIG_IsOK(ecode18)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode18), "in method '" "read_dct_coefficients_from_buffers" "', argument " "18"" of type '" "int""'");
+  } 
+  arg18 = static_cast< int >(val18);
+  ecode19 = SWIG_AsVal_int(swig_obj[13], &val19);
+  if (!SWIG_IsOK(ecode19)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode19), "in method '" "read_dct_coefficients_from_buffers" "', argument " "19"" of type '" "int""'");
+  } 
+  arg19 = static_cast< int >(val19);
+  ecode20 = SWIG_AsVal_int(swig_obj[14], &val20);
+  if (!SWIG_IsOK(ecode20)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode20), "in method '" "read_dct_coefficients_from_buffers" "', argument " "20"" of type '" "int""'");
+  } 
+  arg20 = static_cast< int >(val20);
+  ecode21 = SWIG_AsVal_int(swig_obj[15], &val21);
+  if (!SWIG_IsOK(ecode21)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode21), "in method '" "read_dct_coefficients_from_buffers" "', argument " "21"" of type '" "int""'");
+  } 
+  arg21 = static_cast< int >(val21);
+  ecode22 = SWIG_AsVal_int(swig_obj[16], &val22);
+  if (!SWIG_IsOK(ecode22)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode22), "in method '" "read_dct_coefficients_from_buffers" "', argument " "22"" of type '" "int""'");
+  } 
+  arg22 = static_cast< int >(val22);
+  ecode23 = SWIG_AsVal_bool(swig_obj[17], &val23);
+  if (!SWIG_IsOK(ecode23)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode23), "in method '" "read_dct_coefficients_from_buffers" "', argument " "23"" of type '" "bool""'");
+  } 
+  arg23 = static_cast< bool >(val23);
+  arg24 = swig_obj[18];
+  {
+    try {
+      result = (PyObject *)read_dct_coefficients_from_buffers(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15,arg16,arg17,arg18,arg19,arg20,arg21,arg22,arg23,arg24);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = result;
+  {
+    if (is_new_object8 && array8)
+    {
+      Py_DECREF(array8); 
+    }
+  }
+  {
+    if (is_new_object11 && array11)
+    {
+      Py_DECREF(array11); 
+    }
+  }
+  {
+    if (is_new_object14 && array14)
+    {
+      Py_DECREF(array14); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object8 && array8)
+    {
+      Py_DECREF(array8); 
+    }
+  }
+  {
+    if (is_new_object11 && array11)
+    {
+      Py_DECREF(array11); 
+    }
+  }
+  {
+    if (is_new_object14 && array14)
+    {
+      Py_DECREF(array14); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_files(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PyObject *arg1 = (PyObject *) 0 ;
+  bool arg2 ;
+  int arg3 ;
+  int arg4 ;
+  int arg5 ;
+  int arg6 ;
+  int arg7 ;
+  int *arg8 = (int *) 0 ;
+  int arg9 ;
+  int arg10 ;
+  float *arg11 = (float *) 0 ;
+  int arg12 ;
+  int arg13 ;
+  float *arg14 = (float *) 0 ;
+  int arg15 ;
+  int arg16 ;
+  int arg17 ;
+  int arg18 ;
+  int arg19 ;
+  int arg20 ;
+  int arg21 ;
+  int arg22 ;
+  bool arg23 ;
+  PyObject *arg24 = (PyObject *) 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
+  int val7 ;
+  int ecode7 = 0 ;
+  PyArrayObject *array8 = NULL ;
+  int is_new_object8 = 0 ;
+  int val10 ;
+  int ecode10 = 0 ;
+  PyArrayObject *array11 = NULL ;
+  int is_new_object11 = 0 ;
+  PyArrayObject *array14 = NULL ;
+  int is_new_object14 = 0 ;
+  int val17 ;
+  int ecode17 = 0 ;
+  int val18 ;
+  int ecode18 = 0 ;
+  int val19 ;
+  int ecode19 = 0 ;
+  int val20 ;
+  int ecode20 = 0 ;
+  int val21 ;
+  int ecode21 = 0 ;
+  int val22 ;
+  int ecode22 = 0 ;
+  bool val23 ;
+  int ecode23 = 0 ;
+  PyObject *swig_obj[19] ;
+  PyObject *result = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"band_info_dct_get",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  if (!SWIG_Python_UnpackTuple(args, "read_dct_coefficients_from_files", 19, 19, swig_obj)) SWIG_fail;
+  arg1 = swig_obj[0];
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_files" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_files" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_files" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "read_dct_coefficients_from_files" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = static_cast< int >(val5);
+  ecode6 = SWIG_AsVal_int(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "read_dct_coefficients_from_files" "', argument " "6"" of type '" "int""'");
+  } 
+  arg6 = static_cast< int >(val6);
+  ecode7 = SWIG_AsVal_int(swig_obj[6], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "read_dct_coefficients_from_files" "', argument " "7"" of type '" "int""'");
+  } 
+  arg7 = static_cast< int >(val7);
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array8 = obj_to_array_contiguous_allow_conversion(swig_obj[7],
+      NPY_INT,
+      &is_new_object8);
+    if (!array8 || !require_dimensions(array8, 1) ||
+      !require_size(array8, size, 1)) SWIG_fail;
+    arg8 = (int*) array_data(array8);
+    arg9 = (int) array_size(array8,0);
+  }
+  ecode10 = SWIG_AsVal_int(swig_obj[8], &val10);
+  if (!SWIG_IsOK(ecode10)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode10), "in method '" "read_dct_coefficients_from_files" "', argument " "10"" of type '" "int""'");
+  } 
+  arg10 = static_cast< int >(val10);
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array11 = obj_to_array_contiguous_allow_conversion(swig_obj[9], NPY_FLOAT,
+      &is_new_object11);
+    if (!array11 || !require_dimensions(array11, 2) ||
+      !require_size(array11, size, 2)) SWIG_fail;
+    arg11 = (float*) array_data(array11);
+    arg12 = (int) array_size(array11,0);
+    arg13 = (int) array_size(array11,1);
+  }
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array14 = obj_to_array_contiguous_allow_conversion(swig_obj[10], NPY_FLOAT,
+      &is_new_object14);
+    if (!array14 || !require_dimensions(array14, 2) ||
+      !require_size(array14, size, 2)) SWIG_fail;
+    arg14 = (float*) array_data(array14);
+    arg15 = (int) array_size(array14,0);
+    arg16 = (int) array_size(array14,1);
+  }
+  ecode17 = SWIG_AsVal_int(swig_obj[11], &val17);
+  if (!SWIG_IsOK(ecode17)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode17), "in method '" "read_dct_coefficients_from_files" "', argument " "17"" of type '" "int""'");
+  } 
+  arg17 = static_cast< int >(val17);
+  ecode18 = SWIG_AsVal_int(swig_obj[12], &val18);
+  if (!SWIG_IsOK(ecode18)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode18), "in method '" "read_dct_coefficients_from_files" "', argument " "18"" of type '" "int""'");
+  } 
+  arg18 = static_cast< int >(val18);
+  ecode19 = SWIG_AsVal_int(swig_obj[13], &val19);
+  if (!SWIG_IsOK(ecode19)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode19), "in method '" "read_dct_coefficients_from_files" "', argument " "19"" of type '" "int""'");
+  } 
+  arg19 = static_cast< int >(val19);
+  ecode20 = SWIG_AsVal_int(swig_obj[14], &val20);
+  if (!SWIG_IsOK(ecode20)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode20), "in method '" "read_dct_coefficients_from_files" "', argument " "20"" of type '" "int""'");
+  } 
+  arg20 = static_cast< int >(val20);
+  ecode21 = SWIG_AsVal_int(swig_obj[15], &val21);
+  if (!SWIG_IsOK(ecode21)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode21), "in method '" "read_dct_coefficients_from_files" "', argument " "21"" of type '" "int""'");
+  } 
+  arg21 = static_cast< int >(val21);
+  ecode22 = SWIG_AsVal_int(swig_obj[16], &val22);
+  if (!SWIG_IsOK(ecode22)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode22), "in method '" "read_dct_coefficients_from_files" "', argument " "22"" of type '" "int""'");
+  } 
+  arg22 = static_cast< int >(val22);
+  ecode23 = SWIG_AsVal_bool(swig_obj[17], &val23);
+  if (!SWIG_IsOK(ecode23)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode23), "in method '" "read_dct_coefficients_from_files" "', argument " "23"" of type '" "bool""'");
+  } 
+  arg23 = static_cast< bool >(val23);
+  arg24 = swig_obj[18];
+  {
+    try {
+      result = (PyObject *)read_dct_coefficients_from_files(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15,arg16,arg17,arg18,arg19,arg20,arg21,arg22,arg23,arg24);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = result;
+  {
+    if (is_new_object8 && array8)
+    {
+      Py_DECREF(array8); 
+    }
+  }
+  {
+    if (is_new_object11 && array11)
+    {
+      Py_DECREF(array11); 
+    }
+  }
+  {
+    if (is_new_object14 && array14)
+    {
+      Py_DECREF(array14); 
+    }
   }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
-  result = (short *) ((arg1)->dct);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_short, 0 |  0 );
   return resultobj;
 fail:
+  {
+    if (is_new_object8 && array8)
+    {
+      Py_DECREF(array8); 
+    }
+  }
+  {
+    if (is_new_object11 && array11)
+    {
+      Py_DECREF(array11); 
+    }
+  }
+  {
+    if (is_new_object14 && array14)
+    {
+      Py_DECREF(array14); 
+    }
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_band_info_dct_h_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffers_padded(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  unsigned int arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  unsigned int val2 ;
+  PyObject *arg1 = (PyObject *) 0 ;
+  bool arg2 ;
+  int arg3 ;
+  int arg4 ;
+  int arg5 ;
+  int arg6 ;
+  int arg7 ;
+  int *arg8 = (int *) 0 ;
+  int arg9 ;
+  int arg10 ;
+  float *arg11 = (float *) 0 ;
+  int arg12 ;
+  int arg13 ;
+  float *arg14 = (float *) 0 ;
+  int arg15 ;
+  int arg16 ;
+  int arg17 ;
+  int arg18 ;
+  int arg19 ;
+  int arg20 ;
+  int arg21 ;
+  int arg22 ;
+  bool arg23 ;
+  PyObject *arg24 = (PyObject *) 0 ;
+  bool val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
+  int val7 ;
+  int ecode7 = 0 ;
+  PyArrayObject *array8 = NULL ;
+  int is_new_object8 = 0 ;
+  int val10 ;
+  int ecode10 = 0 ;
+  PyArrayObject *array11 = NULL ;
+  int is_new_object11 = 0 ;
+  PyArrayObject *array14 = NULL ;
+  int is_new_object14 = 0 ;
+  int val17 ;
+  int ecode17 = 0 ;
+  int val18 ;
+  int ecode18 = 0 ;
+  int val19 ;
+  int ecode19 = 0 ;
+  int val20 ;
+  int ecode20 = 0 ;
+  int val21 ;
+  int ecode21 = 0 ;
+  int val22 ;
+  int ecode22 = 0 ;
+  bool val23 ;
+  int ecode23 = 0 ;
+  PyObject *swig_obj[19] ;
+  PyObject *result = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"band_info_dct_h_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_h_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  if (!SWIG_Python_UnpackTuple(args, "read_dct_coefficients_from_buffers_padded", 19, 19, swig_obj)) SWIG_fail;
+  arg1 = swig_obj[0];
+  ecode2 = SWIG_AsVal_bool(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = static_cast< int >(val5);
+  ecode6 = SWIG_AsVal_int(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "6"" of type '" "int""'");
+  } 
+  arg6 = static_cast< int >(val6);
+  ecode7 = SWIG_AsVal_int(swig_obj[6], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "7"" of type '" "int""'");
+  } 
+  arg7 = static_cast< int >(val7);
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array8 = obj_to_array_contiguous_allow_conversion(swig_obj[7],
+      NPY_INT,
+      &is_new_object8);
+    if (!array8 || !require_dimensions(array8, 1) ||
+      !require_size(array8, size, 1)) SWIG_fail;
+    arg8 = (int*) array_data(array8);
+    arg9 = (int) array_size(array8,0);
+  }
+  ecode10 = SWIG_AsVal_int(swig_obj[8], &val10);
+  if (!SWIG_IsOK(ecode10)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode10), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "10"" of type '" "int""'");
+  } 
+  arg10 = static_cast< int >(val10);
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array11 = obj_to_array_contiguous_allow_conversion(swig_obj[9], NPY_FLOAT,
+      &is_new_object11);
+    if (!array11 || !require_dimensions(array11, 2) ||
+      !require_size(array11, size, 2)) SWIG_fail;
+    arg11 = (float*) array_data(array11);
+    arg12 = (int) array_size(array11,0);
+    arg13 = (int) array_size(array11,1);
+  }
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array14 = obj_to_array_contiguous_allow_conversion(swig_obj[10], NPY_FLOAT,
+      &is_new_object14);
+    if (!array14 || !require_dimensions(array14, 2) ||
+      !require_size(array14, size, 2)) SWIG_fail;
+    arg14 = (float*) array_data(array14);
+    arg15 = (int) array_size(array14,0);
+    arg16 = (int) array_size(array14,1);
+  }
+  ecode17 = SWIG_AsVal_int(swig_obj[11], &val17);
+  if (!SWIG_IsOK(ecode17)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode17), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "17"" of type '" "int""'");
+  } 
+  arg17 = static_cast< int >(val17);
+  ecode18 = SWIG_AsVal_int(swig_obj[12], &val18);
+  if (!SWIG_IsOK(ecode18)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode18), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "18"" of type '" "int""'");
+  } 
+  arg18 = static_cast< int >(val18);
+  ecode19 = SWIG_AsVal_int(swig_obj[13], &val19);
+  if (!SWIG_IsOK(ecode19)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode19), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "19"" of type '" "int""'");
+  } 
+  arg19 = static_cast< int >(val19);
+  ecode20 = SWIG_AsVal_int(swig_obj[14], &val20);
+  if (!SWIG_IsOK(ecode20)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode20), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "20"" of type '" "int""'");
+  } 
+  arg20 = static_cast< int >(val20);
+  ecode21 = SWIG_AsVal_int(swig_obj[15], &val21);
+  if (!SWIG_IsOK(ecode21)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode21), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "21"" of type '" "int""'");
+  } 
+  arg21 = static_cast< int >(val21);
+  ecode22 = SWIG_AsVal_int(swig_obj[16], &val22);
+  if (!SWIG_IsOK(ecode22)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode22), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "22"" of type '" "int""'");
+  } 
+  arg22 = static_cast< int >(val22);
+  ecode23 = SWIG_AsVal_bool(swig_obj[17], &val23);
+  if (!SWIG_IsOK(ecode23)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode23), "in method '" "read_dct_coefficients_from_buffers_padded" "', argument " "23"" of type '" "bool""'");
+  } 
+  arg23 = static_cast< bool >(val23);
+  arg24 = swig_obj[18];
+  {
+    try {
+      result = (PyObject *)read_dct_coefficients_from_buffers_padded(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15,arg16,arg17,arg18,arg19,arg20,arg21,arg22,arg23,arg24);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = result;
+  {
+    if (is_new_object8 && array8)
+    {
+      Py_DECREF(array8); 
+    }
+  }
+  {
+    if (is_new_object11 && array11)
+    {
+      Py_DECREF(array11); 
+    }
+  }
+  {
+    if (is_new_object14 && array14)
+    {
+      Py_DECREF(array14); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object8 && array8)
+    {
+      Py_DECREF(array8); 
+    }
+  }
+  {
+    if (is_new_object11 && array11)
+    {
+      Py_DECREF(array11); 
+    }
+  }
+  {
+    if (is_new_object14 && array14)
+    {
+      Py_DECREF(array14); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_into_image(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PyObject *arg1 = (PyObject *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  bool arg3 ;
+  int arg4 ;
+  int arg5 ;
+  int arg6 ;
+  int arg7 ;
+  int arg8 ;
+  int *arg9 = (int *) 0 ;
+  int arg10 ;
+  int arg11 ;
+  float *arg12 = (float *) 0 ;
+  int arg13 ;
+  int arg14 ;
+  float *arg15 = (float *) 0 ;
+  int arg16 ;
+  int arg17 ;
+  int arg18 ;
+  int arg19 ;
+  int arg20 ;
+  int arg21 ;
+  int arg22 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
+  int val7 ;
+  int ecode7 = 0 ;
+  int val8 ;
+  int ecode8 = 0 ;
+  PyArrayObject *array9 = NULL ;
+  int is_new_object9 = 0 ;
+  int val11 ;
+  int ecode11 = 0 ;
+  PyArrayObject *array12 = NULL ;
+  int is_new_object12 = 0 ;
+  PyArrayObject *array15 = NULL ;
+  int is_new_object15 = 0 ;
+  int val18 ;
+  int ecode18 = 0 ;
+  int val19 ;
+  int ecode19 = 0 ;
+  int val20 ;
+  int ecode20 = 0 ;
+  int val21 ;
+  int ecode21 = 0 ;
+  int val22 ;
+  int ecode22 = 0 ;
+  PyObject *swig_obj[17] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "read_dct_coefficients_from_buffer_into_image", 17, 17, swig_obj)) SWIG_fail;
+  arg1 = swig_obj[0];
+  arg2 = swig_obj[1];
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = static_cast< int >(val4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = static_cast< int >(val5);
+  ecode6 = SWIG_AsVal_int(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "6"" of type '" "int""'");
+  } 
+  arg6 = static_cast< int >(val6);
+  ecode7 = SWIG_AsVal_int(swig_obj[6], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "7"" of type '" "int""'");
+  } 
+  arg7 = static_cast< int >(val7);
+  ecode8 = SWIG_AsVal_int(swig_obj[7], &val8);
+  if (!SWIG_IsOK(ecode8)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode8), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "8"" of type '" "int""'");
+  } 
+  arg8 = static_cast< int >(val8);
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array9 = obj_to_array_contiguous_allow_conversion(swig_obj[8],
+      NPY_INT,
+      &is_new_object9);
+    if (!array9 || !require_dimensions(array9, 1) ||
+      !require_size(array9, size, 1)) SWIG_fail;
+    arg9 = (int*) array_data(array9);
+    arg10 = (int) array_size(array9,0);
+  }
+  ecode11 = SWIG_AsVal_int(swig_obj[9], &val11);
+  if (!SWIG_IsOK(ecode11)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode11), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "11"" of type '" "int""'");
+  } 
+  arg11 = static_cast< int >(val11);
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array12 = obj_to_array_contiguous_allow_conversion(swig_obj[10], NPY_FLOAT,
+      &is_new_object12);
+    if (!array12 || !require_dimensions(array12, 2) ||
+      !require_size(array12, size, 2)) SWIG_fail;
+    arg12 = (float*) array_data(array12);
+    arg13 = (int) array_size(array12,0);
+    arg14 = (int) array_size(array12,1);
+  }
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array15 = obj_to_array_contiguous_allow_conversion(swig_obj[11], NPY_FLOAT,
+      &is_new_object15);
+    if (!array15 || !require_dimensions(array15, 2) ||
+      !require_size(array15, size, 2)) SWIG_fail;
+    arg15 = (float*) array_data(array15);
+    arg16 = (int) array_size(array15,0);
+    arg17 = (int) array_size(array15,1);
+  }
+  ecode18 = SWIG_AsVal_int(swig_obj[12], &val18);
+  if (!SWIG_IsOK(ecode18)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode18), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "18"" of type '" "int""'");
+  } 
+  arg18 = static_cast< int >(val18);
+  ecode19 = SWIG_AsVal_int(swig_obj[13], &val19);
+  if (!SWIG_IsOK(ecode19)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode19), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "19"" of type '" "int""'");
+  } 
+  arg19 = static_cast< int >(val19);
+  ecode20 = SWIG_AsVal_int(swig_obj[14], &val20);
+  if (!SWIG_IsOK(ecode20)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode20), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "20"" of type '" "int""'");
+  } 
+  arg20 = static_cast< int >(val20);
+  ecode21 = SWIG_AsVal_int(swig_obj[15], &val21);
+  if (!SWIG_IsOK(ecode21)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode21), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "21"" of type '" "int""'");
+  } 
+  arg21 = static_cast< int >(val21);
+  ecode22 = SWIG_AsVal_int(swig_obj[16], &val22);
+  if (!SWIG_IsOK(ecode22)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode22), "in method '" "read_dct_coefficients_from_buffer_into_image" "', argument " "22"" of type '" "int""'");
+  } 
+  arg22 = static_cast< int >(val22);
+  {
+    try {
+      result = (PyObject *)read_dct_coefficients_from_buffer_into_image(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15,arg16,arg17,arg18,arg19,arg20,arg21,arg22);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = result;
+  {
+    if (is_new_object9 && array9)
+    {
+      Py_DECREF(array9); 
+    }
+  }
+  {
+    if (is_new_object12 && array12)
+    {
+      Py_DECREF(array12); 
+    }
+  }
+  {
+    if (is_new_object15 && array15)
+    {
+      Py_DECREF(array15); 
+    }
   }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_info_dct_h_set" "', argument " "2"" of type '" "unsigned int""'");
-  } 
-  arg2 = static_cast< unsigned int >(val2);
-  if (arg1) (arg1)->dct_h = arg2;
-  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
+  {
+    if (is_new_object9 && array9)
+    {
+      Py_DECREF(array9); 
+    }
+  }
+  {
+    if (is_new_object12 && array12)
+    {
+      Py_DECREF(array12); 
+    }
+  }
+  {
+    if (is_new_object15 && array15)
+    {
+      Py_DECREF(array15); 
+    }
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_band_info_dct_h_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_is_image_capsule(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  unsigned int result;
+  PyObject *arg1 = (PyObject *) 0 ;
+  PyObject *swig_obj[1] ;
+  bool result;
   
-  if(!PyArg_UnpackTuple(args,(char *)"band_info_dct_h_get",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_h_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  arg1 = swig_obj[0];
+  {
+    try {
+      result = (bool)is_image_capsule(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
   }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
-  result = (unsigned int) ((arg1)->dct_h);
-  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_band_info_dct_w_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_buffer_pool(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  unsigned int arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  unsigned int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  unsigned long arg1 ;
+  unsigned long val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"band_info_dct_w_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_w_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
-  }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_info_dct_w_set" "', argument " "2"" of type '" "unsigned int""'");
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_unsigned_SS_long(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_buffer_pool" "', argument " "1"" of type '" "unsigned long""'");
   } 
-  arg2 = static_cast< unsigned int >(val2);
-  if (arg1) (arg1)->dct_w = arg2;
-  resultobj = SWIG_Py_Void();
+  arg1 = static_cast< unsigned long >(val1);
+  {
+    try {
+      result = (PyObject *)new_buffer_pool(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_band_info_dct_w_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_buffer_pool_stats(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  unsigned int result;
+  PyObject *arg1 = (PyObject *) 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"band_info_dct_w_get",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_w_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  arg1 = swig_obj[0];
+  {
+    try {
+      result = (PyObject *)buffer_pool_stats(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
   }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
-  result = (unsigned int) ((arg1)->dct_w);
-  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_band_info_dct_b_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_probe_buffers(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  unsigned int arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  unsigned int val2 ;
+  PyObject *arg1 = (PyObject *) 0 ;
+  int arg2 ;
+  int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"band_info_dct_b_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_b_set" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
-  }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_int(obj1, &val2);
+  if (!SWIG_Python_UnpackTuple(args, "probe_buffers", 2, 2, swig_obj)) SWIG_fail;
+  arg1 = swig_obj[0];
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "band_info_dct_b_set" "', argument " "2"" of type '" "unsigned int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "probe_buffers" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = static_cast< unsigned int >(val2);
-  if (arg1) (arg1)->dct_b = arg2;
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_band_info_dct_b_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  unsigned int result;
-  
-  if(!PyArg_UnpackTuple(args,(char *)"band_info_dct_b_get",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "band_info_dct_b_get" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
+  arg2 = static_cast< int >(val2);
+  {
+    try {
+      result = (PyObject *)probe_buffers(arg1,arg2);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
   }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
-  result = (unsigned int) ((arg1)->dct_b);
-  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_band_info(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_get_stats(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *result = 0 ;
+  bool arg1 ;
+  bool val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"new_band_info",0,0)) SWIG_fail;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_bool(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "get_stats" "', argument " "1"" of type '" "bool""'");
+  } 
+  arg1 = static_cast< bool >(val1);
   {
     try {
-      result = (jpeg2dct::common::band_info *)new jpeg2dct::common::band_info();
+      result = (PyObject *)get_stats(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
     } catch (std::runtime_error &e) {
       SWIG_exception(SWIG_RuntimeError, e.what());
     } catch (...) {
       SWIG_exception(SWIG_RuntimeError, "unknown exception");
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_jpeg2dct__common__band_info, SWIG_POINTER_NEW |  0 );
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_band_info(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_set_trace_callback(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  jpeg2dct::common::band_info *arg1 = (jpeg2dct::common::band_info *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *arg1 = (PyObject *) 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"delete_band_info",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_jpeg2dct__common__band_info, SWIG_POINTER_DISOWN |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_band_info" "', argument " "1"" of type '" "jpeg2dct::common::band_info *""'"); 
-  }
-  arg1 = reinterpret_cast< jpeg2dct::common::band_info * >(argp1);
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  arg1 = swig_obj[0];
   {
     try {
-      delete arg1;
+      result = (PyObject *)set_trace_callback(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
     } catch (std::runtime_error &e) {
       SWIG_exception(SWIG_RuntimeError, e.what());
     } catch (...) {
       SWIG_exception(SWIG_RuntimeError, "unknown exception");
     }
   }
-  resultobj = SWIG_Py_Void();
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *band_info_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_UnpackTuple(args,(char*)"swigregister", 1, 1,&obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_jpeg2dct__common__band_info, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_file_(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_add_restart_markers(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   char *arg1 = (char *) 0 ;
-  bool arg2 ;
+  unsigned long arg2 ;
   int arg3 ;
-  jpeg2dct::common::band_info *arg4 = (jpeg2dct::common::band_info *) 0 ;
-  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
-  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
   int res1 ;
   char *buf1 = 0 ;
   int alloc1 = 0 ;
-  bool val2 ;
+  unsigned long val2 ;
   int ecode2 = 0 ;
   int val3 ;
   int ecode3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  void *argp6 = 0 ;
-  int res6 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
-  PyObject * obj5 = 0 ;
-  
-  if(!PyArg_UnpackTuple(args,(char *)"read_dct_coefficients_from_file_",6,6,&obj0,&obj1,&obj2,&obj3,&obj4,&obj5)) SWIG_fail;
-  res1 = SWIG_AsCharPtrAndSize(obj0, &buf1, NULL, &alloc1);
+  PyObject *swig_obj[3] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "add_restart_markers", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_file_" "', argument " "1"" of type '" "char *""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "add_restart_markers" "', argument " "1"" of type '" "char *""'");
   }
   arg1 = reinterpret_cast< char * >(buf1);
-  ecode2 = SWIG_AsVal_bool(obj1, &val2);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_file_" "', argument " "2"" of type '" "bool""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "add_restart_markers" "', argument " "2"" of type '" "unsigned long""'");
   } 
-  arg2 = static_cast< bool >(val2);
-  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  arg2 = static_cast< unsigned long >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
   if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_file_" "', argument " "3"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "add_restart_markers" "', argument " "3"" of type '" "int""'");
   } 
   arg3 = static_cast< int >(val3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "read_dct_coefficients_from_file_" "', argument " "4"" of type '" "jpeg2dct::common::band_info *""'"); 
-  }
-  arg4 = reinterpret_cast< jpeg2dct::common::band_info * >(argp4);
-  res5 = SWIG_ConvertPtr(obj4, &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_file_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
-  }
-  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
-  res6 = SWIG_ConvertPtr(obj5, &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res6)) {
-    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_file_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
-  }
-  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
   {
     try {
-      jpeg2dct::common::read_dct_coefficients_from_file_(arg1,arg2,arg3,arg4,arg5,arg6);
+      result = (PyObject *)add_restart_markers(arg1,arg2,arg3);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
     } catch (std::runtime_error &e) {
       SWIG_exception(SWIG_RuntimeError, e.what());
     } catch (...) {
       SWIG_exception(SWIG_RuntimeError, "unknown exception");
     }
   }
-  resultobj = SWIG_Py_Void();
+  resultobj = result;
   if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
   return resultobj;
 fail:
@@ -3933,271 +9928,388 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_file(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_encode_dct_coefficients(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  char *arg1 = (char *) 0 ;
-  bool arg2 ;
+  unsigned char *arg1 = (unsigned char *) 0 ;
+  int arg2 ;
   int arg3 ;
-  short **arg4 = (short **) 0 ;
-  int *arg5 = (int *) 0 ;
-  int *arg6 = (int *) 0 ;
-  int *arg7 = (int *) 0 ;
-  short **arg8 = (short **) 0 ;
-  int *arg9 = (int *) 0 ;
-  int *arg10 = (int *) 0 ;
-  int *arg11 = (int *) 0 ;
-  short **arg12 = (short **) 0 ;
-  int *arg13 = (int *) 0 ;
-  int *arg14 = (int *) 0 ;
-  int *arg15 = (int *) 0 ;
-  int res1 ;
-  char *buf1 = 0 ;
-  int alloc1 = 0 ;
-  bool val2 ;
-  int ecode2 = 0 ;
-  int val3 ;
-  int ecode3 = 0 ;
-  short *data_temp4 = NULL ;
-  int dim1_temp4 ;
-  int dim2_temp4 ;
-  int dim3_temp4 ;
-  short *data_temp8 = NULL ;
-  int dim1_temp8 ;
-  int dim2_temp8 ;
-  int dim3_temp8 ;
-  short *data_temp12 = NULL ;
-  int dim1_temp12 ;
-  int dim2_temp12 ;
-  int dim3_temp12 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  
-  {
-    arg4 = &data_temp4;
-    arg5 = &dim1_temp4;
-    arg6 = &dim2_temp4;
-    arg7 = &dim3_temp4;
-  }
-  {
-    arg8 = &data_temp8;
-    arg9 = &dim1_temp8;
-    arg10 = &dim2_temp8;
-    arg11 = &dim3_temp8;
-  }
-  {
-    arg12 = &data_temp12;
-    arg13 = &dim1_temp12;
-    arg14 = &dim2_temp12;
-    arg15 = &dim3_temp12;
-  }
-  if(!PyArg_UnpackTuple(args,(char *)"read_dct_coefficients_from_file",3,3,&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_AsCharPtrAndSize(obj0, &buf1, NULL, &alloc1);
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_file" "', argument " "1"" of type '" "char *""'");
+  int arg4 ;
+  bool arg5 ;
+  int arg6 ;
+  bool arg7 ;
+  int arg8 ;
+  PyArrayObject *array1 = NULL ;
+  int is_new_object1 = 0 ;
+  bool val5 ;
+  int ecode5 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
+  bool val7 ;
+  int ecode7 = 0 ;
+  int val8 ;
+  int ecode8 = 0 ;
+  PyObject *swig_obj[5] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "encode_dct_coefficients", 5, 5, swig_obj)) SWIG_fail;
+  {
+    npy_intp size[3] = {
+      -1, -1, -1 
+    };
+    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0], NPY_UBYTE,
+      &is_new_object1);
+    if (!array1 || !require_dimensions(array1, 3) ||
+      !require_size(array1, size, 3)) SWIG_fail;
+    arg1 = (unsigned char*) array_data(array1);
+    arg2 = (int) array_size(array1,0);
+    arg3 = (int) array_size(array1,1);
+    arg4 = (int) array_size(array1,2);
+  }
+  ecode5 = SWIG_AsVal_bool(swig_obj[1], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "encode_dct_coefficients" "', argument " "5"" of type '" "bool""'");
+  } 
+  arg5 = static_cast< bool >(val5);
+  ecode6 = SWIG_AsVal_int(swig_obj[2], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "encode_dct_coefficients" "', argument " "6"" of type '" "int""'");
+  } 
+  arg6 = static_cast< int >(val6);
+  ecode7 = SWIG_AsVal_bool(swig_obj[3], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "encode_dct_coefficients" "', argument " "7"" of type '" "bool""'");
+  } 
+  arg7 = static_cast< bool >(val7);
+  ecode8 = SWIG_AsVal_int(swig_obj[4], &val8);
+  if (!SWIG_IsOK(ecode8)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode8), "in method '" "encode_dct_coefficients" "', argument " "8"" of type '" "int""'");
+  } 
+  arg8 = static_cast< int >(val8);
+  {
+    try {
+      result = (PyObject *)encode_dct_coefficients(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
   }
-  arg1 = reinterpret_cast< char * >(buf1);
-  ecode2 = SWIG_AsVal_bool(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_file" "', argument " "2"" of type '" "bool""'");
+  resultobj = result;
+  {
+    if (is_new_object1 && array1)
+    {
+      Py_DECREF(array1); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object1 && array1)
+    {
+      Py_DECREF(array1); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_encode_jpeg(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  unsigned char *arg1 = (unsigned char *) 0 ;
+  int arg2 ;
+  int arg3 ;
+  int arg4 ;
+  bool arg5 ;
+  int arg6 ;
+  int arg7 ;
+  int arg8 ;
+  bool arg9 ;
+  int arg10 ;
+  PyArrayObject *array1 = NULL ;
+  int is_new_object1 = 0 ;
+  bool val5 ;
+  int ecode5 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
+  int val7 ;
+  int ecode7 = 0 ;
+  int val8 ;
+  int ecode8 = 0 ;
+  bool val9 ;
+  int ecode9 = 0 ;
+  int val10 ;
+  int ecode10 = 0 ;
+  PyObject *swig_obj[7] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "encode_jpeg", 7, 7, swig_obj)) SWIG_fail;
+  {
+    npy_intp size[3] = {
+      -1, -1, -1 
+    };
+    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0], NPY_UBYTE,
+      &is_new_object1);
+    if (!array1 || !require_dimensions(array1, 3) ||
+      !require_size(array1, size, 3)) SWIG_fail;
+    arg1 = (unsigned char*) array_data(array1);
+    arg2 = (int) array_size(array1,0);
+    arg3 = (int) array_size(array1,1);
+    arg4 = (int) array_size(array1,2);
+  }
+  ecode5 = SWIG_AsVal_bool(swig_obj[1], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "encode_jpeg" "', argument " "5"" of type '" "bool""'");
   } 
-  arg2 = static_cast< bool >(val2);
-  ecode3 = SWIG_AsVal_int(obj2, &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_file" "', argument " "3"" of type '" "int""'");
+  arg5 = static_cast< bool >(val5);
+  ecode6 = SWIG_AsVal_int(swig_obj[2], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "encode_jpeg" "', argument " "6"" of type '" "int""'");
+  } 
+  arg6 = static_cast< int >(val6);
+  ecode7 = SWIG_AsVal_int(swig_obj[3], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "encode_jpeg" "', argument " "7"" of type '" "int""'");
+  } 
+  arg7 = static_cast< int >(val7);
+  ecode8 = SWIG_AsVal_int(swig_obj[4], &val8);
+  if (!SWIG_IsOK(ecode8)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode8), "in method '" "encode_jpeg" "', argument " "8"" of type '" "int""'");
+  } 
+  arg8 = static_cast< int >(val8);
+  ecode9 = SWIG_AsVal_bool(swig_obj[5], &val9);
+  if (!SWIG_IsOK(ecode9)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode9), "in method '" "encode_jpeg" "', argument " "9"" of type '" "bool""'");
+  } 
+  arg9 = static_cast< bool >(val9);
+  ecode10 = SWIG_AsVal_int(swig_obj[6], &val10);
+  if (!SWIG_IsOK(ecode10)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode10), "in method '" "encode_jpeg" "', argument " "10"" of type '" "int""'");
+  } 
+  arg10 = static_cast< int >(val10);
+  {
+    try {
+      result = (PyObject *)encode_jpeg(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
+    } catch (std::runtime_error &e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch (...) {
+      SWIG_exception(SWIG_RuntimeError, "unknown exception");
+    }
+  }
+  resultobj = result;
+  {
+    if (is_new_object1 && array1)
+    {
+      Py_DECREF(array1); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object1 && array1)
+    {
+      Py_DECREF(array1); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_quality_quant_tables(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "quality_quant_tables" "', argument " "1"" of type '" "int""'");
   } 
-  arg3 = static_cast< int >(val3);
+  arg1 = static_cast< int >(val1);
   {
     try {
-      jpeg2dct::common::read_dct_coefficients_from_file(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15);
+      result = (PyObject *)quality_quant_tables(arg1);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
     } catch (std::runtime_error &e) {
       SWIG_exception(SWIG_RuntimeError, e.what());
     } catch (...) {
       SWIG_exception(SWIG_RuntimeError, "unknown exception");
     }
   }
-  resultobj = SWIG_Py_Void();
-  {
-    npy_intp dims[3] = {
-      *arg5, *arg6, *arg7 
-    };
-    PyObject* obj = PyArray_SimpleNewFromData(3, dims, NPY_SHORT, (void*)(*arg4));
-    PyArrayObject* array = (PyArrayObject*) obj;
-    
-    if (!array) SWIG_fail;
-    
-#ifdef SWIGPY_USE_CAPSULE
-    PyObject* cap = PyCapsule_New((void*)(*arg4), SWIGPY_CAPSULE_NAME, free_cap);
-#else
-    PyObject* cap = PyCObject_FromVoidPtr((void*)(*arg4), free);
-#endif
-    
-#if NPY_API_VERSION < 0x00000007
-    PyArray_BASE(array) = cap;
-#else
-    PyArray_SetBaseObject(array,cap);
-#endif
-    
-    resultobj = SWIG_Python_AppendOutput(resultobj,obj);
-  }
-  {
-    npy_intp dims[3] = {
-      *arg9, *arg10, *arg11 
-    };
-    PyObject* obj = PyArray_SimpleNewFromData(3, dims, NPY_SHORT, (void*)(*arg8));
-    PyArrayObject* array = (PyArrayObject*) obj;
-    
-    if (!array) SWIG_fail;
-    
-#ifdef SWIGPY_USE_CAPSULE
-    PyObject* cap = PyCapsule_New((void*)(*arg8), SWIGPY_CAPSULE_NAME, free_cap);
-#else
-    PyObject* cap = PyCObject_FromVoidPtr((void*)(*arg8), free);
-#endif
-    
-#if NPY_API_VERSION < 0x00000007
-    PyArray_BASE(array) = cap;
-#else
-    PyArray_SetBaseObject(array,cap);
-#endif
-    
-    resultobj = SWIG_Python_AppendOutput(resultobj,obj);
-  }
-  {
-    npy_intp dims[3] = {
-      *arg13, *arg14, *arg15 
-    };
-    PyObject* obj = PyArray_SimpleNewFromData(3, dims, NPY_SHORT, (void*)(*arg12));
-    PyArrayObject* array = (PyArrayObject*) obj;
-    
-    if (!array) SWIG_fail;
-    
-#ifdef SWIGPY_USE_CAPSULE
-    PyObject* cap = PyCapsule_New((void*)(*arg12), SWIGPY_CAPSULE_NAME, free_cap);
-#else
-    PyObject* cap = PyCObject_FromVoidPtr((void*)(*arg12), free);
-#endif
-    
-#if NPY_API_VERSION < 0x00000007
-    PyArray_BASE(array) = cap;
-#else
-    PyArray_SetBaseObject(array,cap);
-#endif
-    
-    resultobj = SWIG_Python_AppendOutput(resultobj,obj);
-  }
-  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  resultobj = result;
   return resultobj;
 fail:
-  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer_(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_pack_sparse(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  char *arg1 = (char *) 0 ;
-  unsigned long arg2 ;
-  bool arg3 ;
+  int arg1 ;
+  short *arg2 = (short *) 0 ;
+  int arg3 ;
   int arg4 ;
-  jpeg2dct::common::band_info *arg5 = (jpeg2dct::common::band_info *) 0 ;
-  jpeg2dct::common::band_info *arg6 = (jpeg2dct::common::band_info *) 0 ;
-  jpeg2dct::common::band_info *arg7 = (jpeg2dct::common::band_info *) 0 ;
-  int res1 ;
-  char *buf1 = 0 ;
-  int alloc1 = 0 ;
-  unsigned long val2 ;
-  int ecode2 = 0 ;
-  bool val3 ;
-  int ecode3 = 0 ;
-  int val4 ;
-  int ecode4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  void *argp6 = 0 ;
-  int res6 = 0 ;
-  void *argp7 = 0 ;
-  int res7 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
-  PyObject * obj5 = 0 ;
-  PyObject * obj6 = 0 ;
-  
-  if(!PyArg_UnpackTuple(args,(char *)"read_dct_coefficients_from_buffer_",7,7,&obj0,&obj1,&obj2,&obj3,&obj4,&obj5,&obj6)) SWIG_fail;
-  res1 = SWIG_AsCharPtrAndSize(obj0, &buf1, NULL, &alloc1);
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "1"" of type '" "char *""'");
-  }
-  arg1 = reinterpret_cast< char * >(buf1);
-  ecode2 = SWIG_AsVal_unsigned_SS_long(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "2"" of type '" "unsigned long""'");
-  } 
-  arg2 = static_cast< unsigned long >(val2);
-  ecode3 = SWIG_AsVal_bool(obj2, &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "3"" of type '" "bool""'");
-  } 
-  arg3 = static_cast< bool >(val3);
-  ecode4 = SWIG_AsVal_int(obj3, &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "4"" of type '" "int""'");
+  int arg5 ;
+  short *arg6 = (short *) 0 ;
+  int arg7 ;
+  int arg8 ;
+  int arg9 ;
+  short *arg10 = (short *) 0 ;
+  int arg11 ;
+  int arg12 ;
+  int arg13 ;
+  unsigned short *arg14 = (unsigned short *) 0 ;
+  int arg15 ;
+  int arg16 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  PyArrayObject *array6 = NULL ;
+  int is_new_object6 = 0 ;
+  PyArrayObject *array10 = NULL ;
+  int is_new_object10 = 0 ;
+  PyArrayObject *array14 = NULL ;
+  int is_new_object14 = 0 ;
+  PyObject *swig_obj[5] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "pack_sparse", 5, 5, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "pack_sparse" "', argument " "1"" of type '" "int""'");
   } 
-  arg4 = static_cast< int >(val4);
-  res5 = SWIG_ConvertPtr(obj4, &argp5,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "5"" of type '" "jpeg2dct::common::band_info *""'"); 
+  arg1 = static_cast< int >(val1);
+  {
+    npy_intp size[3] = {
+      -1, -1, -1 
+    };
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1], NPY_SHORT,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 3) ||
+      !require_size(array2, size, 3)) SWIG_fail;
+    arg2 = (short*) array_data(array2);
+    arg3 = (int) array_size(array2,0);
+    arg4 = (int) array_size(array2,1);
+    arg5 = (int) array_size(array2,2);
   }
-  arg5 = reinterpret_cast< jpeg2dct::common::band_info * >(argp5);
-  res6 = SWIG_ConvertPtr(obj5, &argp6,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res6)) {
-    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "6"" of type '" "jpeg2dct::common::band_info *""'"); 
+  {
+    npy_intp size[3] = {
+      -1, -1, -1 
+    };
+    array6 = obj_to_array_contiguous_allow_conversion(swig_obj[2], NPY_SHORT,
+      &is_new_object6);
+    if (!array6 || !require_dimensions(array6, 3) ||
+      !require_size(array6, size, 3)) SWIG_fail;
+    arg6 = (short*) array_data(array6);
+    arg7 = (int) array_size(array6,0);
+    arg8 = (int) array_size(array6,1);
+    arg9 = (int) array_size(array6,2);
   }
-  arg6 = reinterpret_cast< jpeg2dct::common::band_info * >(argp6);
-  res7 = SWIG_ConvertPtr(obj6, &argp7,SWIGTYPE_p_jpeg2dct__common__band_info, 0 |  0 );
-  if (!SWIG_IsOK(res7)) {
-    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "read_dct_coefficients_from_buffer_" "', argument " "7"" of type '" "jpeg2dct::common::band_info *""'"); 
+  {
+    npy_intp size[3] = {
+      -1, -1, -1 
+    };
+    array10 = obj_to_array_contiguous_allow_conversion(swig_obj[3], NPY_SHORT,
+      &is_new_object10);
+    if (!array10 || !require_dimensions(array10, 3) ||
+      !require_size(array10, size, 3)) SWIG_fail;
+    arg10 = (short*) array_data(array10);
+    arg11 = (int) array_size(array10,0);
+    arg12 = (int) array_size(array10,1);
+    arg13 = (int) array_size(array10,2);
+  }
+  {
+    npy_intp size[2] = {
+      -1, -1 
+    };
+    array14 = obj_to_array_contiguous_allow_conversion(swig_obj[4], NPY_USHORT,
+      &is_new_object14);
+    if (!array14 || !require_dimensions(array14, 2) ||
+      !require_size(array14, size, 2)) SWIG_fail;
+    arg14 = (unsigned short*) array_data(array14);
+    arg15 = (int) array_size(array14,0);
+    arg16 = (int) array_size(array14,1);
   }
-  arg7 = reinterpret_cast< jpeg2dct::common::band_info * >(argp7);
   {
     try {
-      jpeg2dct::common::read_dct_coefficients_from_buffer_(arg1,arg2,arg3,arg4,arg5,arg6,arg7);
+      result = (PyObject *)pack_sparse(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15,arg16);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
     } catch (std::runtime_error &e) {
       SWIG_exception(SWIG_RuntimeError, e.what());
     } catch (...) {
       SWIG_exception(SWIG_RuntimeError, "unknown exception");
     }
   }
-  resultobj = SWIG_Py_Void();
-  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  resultobj = result;
+  {
+    if (is_new_object2 && array2)
+    {
+      Py_DECREF(array2); 
+    }
+  }
+  {
+    if (is_new_object6 && array6)
+    {
+      Py_DECREF(array6); 
+    }
+  }
+  {
+    if (is_new_object10 && array10)
+    {
+      Py_DECREF(array10); 
+    }
+  }
+  {
+    if (is_new_object14 && array14)
+    {
+      Py_DECREF(array14); 
+    }
+  }
   return resultobj;
 fail:
-  if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
+  {
+    if (is_new_object2 && array2)
+    {
+      Py_DECREF(array2); 
+    }
+  }
+  {
+    if (is_new_object6 && array6)
+    {
+      Py_DECREF(array6); 
+    }
+  }
+  {
+    if (is_new_object10 && array10)
+    {
+      Py_DECREF(array10); 
+    }
+  }
+  {
+    if (is_new_object14 && array14)
+    {
+      Py_DECREF(array14); 
+    }
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_unpack_sparse(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   char *arg1 = (char *) 0 ;
   unsigned long arg2 ;
   bool arg3 ;
-  int arg4 ;
-  short **arg5 = (short **) 0 ;
-  int *arg6 = (int *) 0 ;
-  int *arg7 = (int *) 0 ;
-  int *arg8 = (int *) 0 ;
-  short **arg9 = (short **) 0 ;
-  int *arg10 = (int *) 0 ;
-  int *arg11 = (int *) 0 ;
-  int *arg12 = (int *) 0 ;
-  short **arg13 = (short **) 0 ;
-  int *arg14 = (int *) 0 ;
-  int *arg15 = (int *) 0 ;
-  int *arg16 = (int *) 0 ;
   int res1 ;
   char *buf1 = 0 ;
   int alloc1 = 0 ;
@@ -4205,143 +10317,37 @@ SWIGINTERN PyObject *_wrap_read_dct_coefficients_from_buffer(PyObject *SWIGUNUSE
   int ecode2 = 0 ;
   bool val3 ;
   int ecode3 = 0 ;
-  int val4 ;
-  int ecode4 = 0 ;
-  short *data_temp5 = NULL ;
-  int dim1_temp5 ;
-  int dim2_temp5 ;
-  int dim3_temp5 ;
-  short *data_temp9 = NULL ;
-  int dim1_temp9 ;
-  int dim2_temp9 ;
-  int dim3_temp9 ;
-  short *data_temp13 = NULL ;
-  int dim1_temp13 ;
-  int dim2_temp13 ;
-  int dim3_temp13 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  
-  {
-    arg5 = &data_temp5;
-    arg6 = &dim1_temp5;
-    arg7 = &dim2_temp5;
-    arg8 = &dim3_temp5;
-  }
-  {
-    arg9 = &data_temp9;
-    arg10 = &dim1_temp9;
-    arg11 = &dim2_temp9;
-    arg12 = &dim3_temp9;
-  }
-  {
-    arg13 = &data_temp13;
-    arg14 = &dim1_temp13;
-    arg15 = &dim2_temp13;
-    arg16 = &dim3_temp13;
-  }
-  if(!PyArg_UnpackTuple(args,(char *)"read_dct_coefficients_from_buffer",4,4,&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_AsCharPtrAndSize(obj0, &buf1, NULL, &alloc1);
+  PyObject *swig_obj[3] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "unpack_sparse", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "read_dct_coefficients_from_buffer" "', argument " "1"" of type '" "char *""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "unpack_sparse" "', argument " "1"" of type '" "char *""'");
   }
   arg1 = reinterpret_cast< char * >(buf1);
-  ecode2 = SWIG_AsVal_unsigned_SS_long(obj1, &val2);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "read_dct_coefficients_from_buffer" "', argument " "2"" of type '" "unsigned long""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "unpack_sparse" "', argument " "2"" of type '" "unsigned long""'");
   } 
   arg2 = static_cast< unsigned long >(val2);
-  ecode3 = SWIG_AsVal_bool(obj2, &val3);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
   if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "read_dct_coefficients_from_buffer" "', argument " "3"" of type '" "bool""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "unpack_sparse" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  ecode4 = SWIG_AsVal_int(obj3, &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "read_dct_coefficients_from_buffer" "', argument " "4"" of type '" "int""'");
-  } 
-  arg4 = static_cast< int >(val4);
   {
     try {
-      jpeg2dct::common::read_dct_coefficients_from_buffer(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15,arg16);
+      result = (PyObject *)unpack_sparse(arg1,arg2,arg3);
+    } catch (file_error &e) {
+      SWIG_exception(SWIG_IOError, e.what());
     } catch (std::runtime_error &e) {
       SWIG_exception(SWIG_RuntimeError, e.what());
     } catch (...) {
       SWIG_exception(SWIG_RuntimeError, "unknown exception");
     }
   }
-  resultobj = SWIG_Py_Void();
-  {
-    npy_intp dims[3] = {
-      *arg6, *arg7, *arg8 
-    };
-    PyObject* obj = PyArray_SimpleNewFromData(3, dims, NPY_SHORT, (void*)(*arg5));
-    PyArrayObject* array = (PyArrayObject*) obj;
-    
-    if (!array) SWIG_fail;
-    
-#ifdef SWIGPY_USE_CAPSULE
-    PyObject* cap = PyCapsule_New((void*)(*arg5), SWIGPY_CAPSULE_NAME, free_cap);
-#else
-    PyObject* cap = PyCObject_FromVoidPtr((void*)(*arg5), free);
-#endif
-    
-#if NPY_API_VERSION < 0x00000007
-    PyArray_BASE(array) = cap;
-#else
-    PyArray_SetBaseObject(array,cap);
-#endif
-    
-    resultobj = SWIG_Python_AppendOutput(resultobj,obj);
-  }
-  {
-    npy_intp dims[3] = {
-      *arg10, *arg11, *arg12 
-    };
-    PyObject* obj = PyArray_SimpleNewFromData(3, dims, NPY_SHORT, (void*)(*arg9));
-    PyArrayObject* array = (PyArrayObject*) obj;
-    
-    if (!array) SWIG_fail;
-    
-#ifdef SWIGPY_USE_CAPSULE
-    PyObject* cap = PyCapsule_New((void*)(*arg9), SWIGPY_CAPSULE_NAME, free_cap);
-#else
-    PyObject* cap = PyCObject_FromVoidPtr((void*)(*arg9), free);
-#endif
-    
-#if NPY_API_VERSION < 0x00000007
-    PyArray_BASE(array) = cap;
-#else
-    PyArray_SetBaseObject(array,cap);
-#endif
-    
-    resultobj = SWIG_Python_AppendOutput(resultobj,obj);
-  }
-  {
-    npy_intp dims[3] = {
-      *arg14, *arg15, *arg16 
-    };
-    PyObject* obj = PyArray_SimpleNewFromData(3, dims, NPY_SHORT, (void*)(*arg13));
-    PyArrayObject* array = (PyArrayObject*) obj;
-    
-    if (!array) SWIG_fail;
-    
-#ifdef SWIGPY_USE_CAPSULE
-    PyObject* cap = PyCapsule_New((void*)(*arg13), SWIGPY_CAPSULE_NAME, free_cap);
-#else
-    PyObject* cap = PyCObject_FromVoidPtr((void*)(*arg13), free);
-#endif
-    
-#if NPY_API_VERSION < 0x00000007
-    PyArray_BASE(array) = cap;
-#else
-    PyArray_SetBaseObject(array,cap);
-#endif
-    
-    resultobj = SWIG_Python_AppendOutput(resultobj,obj);
-  }
+  resultobj = result;
   if (alloc1 == SWIG_NEWOBJ) delete[] buf1;
   return resultobj;
 fail:
@@ -4351,54 +10357,141 @@ fail:
 
 
 static PyMethodDef SwigMethods[] = {
-	 { (char *)"SWIG_PyInstanceMethod_New", (PyCFunction)SWIG_PyInstanceMethod_New, METH_O, NULL},
-	 { (char *)"band_info_dct_set", _wrap_band_info_dct_set, METH_VARARGS, NULL},
-	 { (char *)"band_info_dct_get", _wrap_band_info_dct_get, METH_VARARGS, NULL},
-	 { (char *)"band_info_dct_h_set", _wrap_band_info_dct_h_set, METH_VARARGS, NULL},
-	 { (char *)"band_info_dct_h_get", _wrap_band_info_dct_h_get, METH_VARARGS, NULL},
-	 { (char *)"band_info_dct_w_set", _wrap_band_info_dct_w_set, METH_VARARGS, NULL},
-	 { (char *)"band_info_dct_w_get", _wrap_band_info_dct_w_get, METH_VARARGS, NULL},
-	 { (char *)"band_info_dct_b_set", _wrap_band_info_dct_b_set, METH_VARARGS, NULL},
-	 { (char *)"band_info_dct_b_get", _wrap_band_info_dct_b_get, METH_VARARGS, NULL},
-	 { (char *)"new_band_info", _wrap_new_band_info, METH_VARARGS, NULL},
-	 { (char *)"delete_band_info", _wrap_delete_band_info, METH_VARARGS, NULL},
-	 { (char *)"band_info_swigregister", band_info_swigregister, METH_VARARGS, NULL},
-	 { (char *)"read_dct_coefficients_from_file_", _wrap_read_dct_coefficients_from_file_, METH_VARARGS, NULL},
-	 { (char *)"read_dct_coefficients_from_file", _wrap_read_dct_coefficients_from_file, METH_VARARGS, NULL},
-	 { (char *)"read_dct_coefficients_from_buffer_", _wrap_read_dct_coefficients_from_buffer_, METH_VARARGS, NULL},
-	 { (char *)"read_dct_coefficients_from_buffer", _wrap_read_dct_coefficients_from_buffer, METH_VARARGS, NULL},
+	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
+	 { "band_info_dct_set", _wrap_band_info_dct_set, METH_VARARGS, NULL},
+	 { "band_info_dct_get", _wrap_band_info_dct_get, METH_O, NULL},
+	 { "band_info_dct_h_set", _wrap_band_info_dct_h_set, METH_VARARGS, NULL},
+	 { "band_info_dct_h_get", _wrap_band_info_dct_h_get, METH_O, NULL},
+	 { "band_info_dct_w_set", _wrap_band_info_dct_w_set, METH_VARARGS, NULL},
+	 { "band_info_dct_w_get", _wrap_band_info_dct_w_get, METH_O, NULL},
+	 { "band_info_dct_b_set", _wrap_band_info_dct_b_set, METH_VARARGS, NULL},
+	 { "band_info_dct_b_get", _wrap_band_info_dct_b_get, METH_O, NULL},
+	 { "band_info_dtype_set", _wrap_band_info_dtype_set, METH_VARARGS, NULL},
+	 { "band_info_dtype_get", _wrap_band_info_dtype_get, METH_O, NULL},
+	 { "new_band_info", _wrap_new_band_info, METH_NOARGS, NULL},
+	 { "delete_band_info", _wrap_delete_band_info, METH_O, NULL},
+	 { "band_info_swigregister", band_info_swigregister, METH_O, NULL},
+	 { "band_info_swiginit", band_info_swiginit, METH_VARARGS, NULL},
+	 { "crop_window_y_set", _wrap_crop_window_y_set, METH_VARARGS, NULL},
+	 { "crop_window_y_get", _wrap_crop_window_y_get, METH_O, NULL},
+	 { "crop_window_x_set", _wrap_crop_window_x_set, METH_VARARGS, NULL},
+	 { "crop_window_x_get", _wrap_crop_window_x_get, METH_O, NULL},
+	 { "crop_window_h_set", _wrap_crop_window_h_set, METH_VARARGS, NULL},
+	 { "crop_window_h_get", _wrap_crop_window_h_get, METH_O, NULL},
+	 { "crop_window_w_set", _wrap_crop_window_w_set, METH_VARARGS, NULL},
+	 { "crop_window_w_get", _wrap_crop_window_w_get, METH_O, NULL},
+	 { "new_crop_window", _wrap_new_crop_window, METH_NOARGS, NULL},
+	 { "delete_crop_window", _wrap_delete_crop_window, METH_O, NULL},
+	 { "crop_window_swigregister", crop_window_swigregister, METH_O, NULL},
+	 { "crop_window_swiginit", crop_window_swiginit, METH_VARARGS, NULL},
+	 { "coefficient_selection_count_set", _wrap_coefficient_selection_count_set, METH_VARARGS, NULL},
+	 { "coefficient_selection_count_get", _wrap_coefficient_selection_count_get, METH_O, NULL},
+	 { "coefficient_selection_index_set", _wrap_coefficient_selection_index_set, METH_VARARGS, NULL},
+	 { "coefficient_selection_index_get", _wrap_coefficient_selection_index_get, METH_O, NULL},
+	 { "new_coefficient_selection", _wrap_new_coefficient_selection, METH_NOARGS, NULL},
+	 { "delete_coefficient_selection", _wrap_delete_coefficient_selection, METH_O, NULL},
+	 { "coefficient_selection_swigregister", coefficient_selection_swigregister, METH_O, NULL},
+	 { "coefficient_selection_swiginit", coefficient_selection_swiginit, METH_VARARGS, NULL},
+	 { "band_format_dtype_set", _wrap_band_format_dtype_set, METH_VARARGS, NULL},
+	 { "band_format_dtype_get", _wrap_band_format_dtype_get, METH_O, NULL},
+	 { "band_format_standardize_set", _wrap_band_format_standardize_set, METH_VARARGS, NULL},
+	 { "band_format_standardize_get", _wrap_band_format_standardize_get, METH_O, NULL},
+	 { "band_format_nb_coefficients_set", _wrap_band_format_nb_coefficients_set, METH_VARARGS, NULL},
+	 { "band_format_nb_coefficients_get", _wrap_band_format_nb_coefficients_get, METH_O, NULL},
+	 { "band_format_mean_set", _wrap_band_format_mean_set, METH_VARARGS, NULL},
+	 { "band_format_mean_get", _wrap_band_format_mean_get, METH_O, NULL},
+	 { "band_format_std_set", _wrap_band_format_std_set, METH_VARARGS, NULL},
+	 { "band_format_std_get", _wrap_band_format_std_get, METH_O, NULL},
+	 { "band_format_target_h_set", _wrap_band_format_target_h_set, METH_VARARGS, NULL},
+	 { "band_format_target_h_get", _wrap_band_format_target_h_get, METH_O, NULL},
+	 { "band_format_target_w_set", _wrap_band_format_target_w_set, METH_VARARGS, NULL},
+	 { "band_format_target_w_get", _wrap_band_format_target_w_get, METH_O, NULL},
+	 { "band_format_crop_mode_set", _wrap_band_format_crop_mode_set, METH_VARARGS, NULL},
+	 { "band_format_crop_mode_get", _wrap_band_format_crop_mode_get, METH_O, NULL},
+	 { "band_format_pad_mode_set", _wrap_band_format_pad_mode_set, METH_VARARGS, NULL},
+	 { "band_format_pad_mode_get", _wrap_band_format_pad_mode_get, METH_O, NULL},
+	 { "band_format_scale_denom_set", _wrap_band_format_scale_denom_set, METH_VARARGS, NULL},
+	 { "band_format_scale_denom_get", _wrap_band_format_scale_denom_get, METH_O, NULL},
+	 { "new_band_format", _wrap_new_band_format, METH_NOARGS, NULL},
+	 { "delete_band_format", _wrap_delete_band_format, METH_O, NULL},
+	 { "band_format_swigregister", band_format_swigregister, METH_O, NULL},
+	 { "band_format_swiginit", band_format_swiginit, METH_VARARGS, NULL},
+	 { "read_dct_coefficients_from_file_", _wrap_read_dct_coefficients_from_file_, METH_VARARGS, NULL},
+	 { "read_dct_coefficients_from_buffer_", _wrap_read_dct_coefficients_from_buffer_, METH_VARARGS, NULL},
+	 { "set_chroma_resampling", _wrap_set_chroma_resampling, METH_O, NULL},
+	 { "get_chroma_resampling", _wrap_get_chroma_resampling, METH_NOARGS, NULL},
+	 { "set_accept_truncated", _wrap_set_accept_truncated, METH_O, NULL},
+	 { "get_accept_truncated", _wrap_get_accept_truncated, METH_NOARGS, NULL},
+	 { "set_segment_threads", _wrap_set_segment_threads, METH_O, NULL},
+	 { "read_dct_dimensions_from_buffer_", _wrap_read_dct_dimensions_from_buffer_, METH_VARARGS, NULL},
+	 { "read_dct_dimensions_from_buffer", _wrap_read_dct_dimensions_from_buffer, METH_VARARGS, NULL},
+	 { "read_dct_coefficients_from_buffer_into_", _wrap_read_dct_coefficients_from_buffer_into_, METH_VARARGS, NULL},
+	 { "read_dct_coefficients_from_buffer_into", _wrap_read_dct_coefficients_from_buffer_into, METH_VARARGS, NULL},
+	 { "prefetch_file", _wrap_prefetch_file, METH_O, NULL},
+	 { "read_dct_coefficients_from_buffers", _wrap_read_dct_coefficients_from_buffers, METH_VARARGS, NULL},
+	 { "read_dct_coefficients_from_files", _wrap_read_dct_coefficients_from_files, METH_VARARGS, NULL},
+	 { "read_dct_coefficients_from_buffers_padded", _wrap_read_dct_coefficients_from_buffers_padded, METH_VARARGS, NULL},
+	 { "read_dct_coefficients_from_buffer_into_image", _wrap_read_dct_coefficients_from_buffer_into_image, METH_VARARGS, NULL},
+	 { "is_image_capsule", _wrap_is_image_capsule, METH_O, NULL},
+	 { "new_buffer_pool", _wrap_new_buffer_pool, METH_O, NULL},
+	 { "buffer_pool_stats", _wrap_buffer_pool_stats, METH_O, NULL},
+	 { "probe_buffers", _wrap_probe_buffers, METH_VARARGS, NULL},
+	 { "get_stats", _wrap_get_stats, METH_O, NULL},
+	 { "set_trace_callback", _wrap_set_trace_callback, METH_O, NULL},
+	 { "add_restart_markers", _wrap_add_restart_markers, METH_VARARGS, NULL},
+	 { "encode_dct_coefficients", _wrap_encode_dct_coefficients, METH_VARARGS, NULL},
+	 { "encode_jpeg", _wrap_encode_jpeg, METH_VARARGS, NULL},
+	 { "quality_quant_tables", _wrap_quality_quant_tables, METH_O, NULL},
+	 { "pack_sparse", _wrap_pack_sparse, METH_VARARGS, NULL},
+	 { "unpack_sparse", _wrap_unpack_sparse, METH_VARARGS, NULL},
+	 { NULL, NULL, 0, NULL }
+};
+
+static PyMethodDef SwigMethods_proxydocs[] = {
 	 { NULL, NULL, 0, NULL }
 };
 
 
 /* -------- TYPE CONVERSION AND EQUIVALENCE RULES (BEGIN) -------- */
 
+static swig_type_info _swigt__p_a_64__float = {"_p_a_64__float", "float (*)[64]", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_int = {"_p_int", "int *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_jpeg2dct__common__band_format = {"_p_jpeg2dct__common__band_format", "jpeg2dct::common::band_format *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_jpeg2dct__common__band_info = {"_p_jpeg2dct__common__band_info", "jpeg2dct::common::band_info *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_p_short = {"_p_p_short", "short **", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_short = {"_p_short", "short *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_jpeg2dct__common__coefficient_selection = {"_p_jpeg2dct__common__coefficient_selection", "jpeg2dct::common::coefficient_selection *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_jpeg2dct__common__crop_window = {"_p_jpeg2dct__common__crop_window", "jpeg2dct::common::crop_window *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_void = {"_p_void", "void *", 0, 0, (void*)0, 0};
 
 static swig_type_info *swig_type_initial[] = {
+  &_swigt__p_a_64__float,
   &_swigt__p_char,
   &_swigt__p_int,
+  &_swigt__p_jpeg2dct__common__band_format,
   &_swigt__p_jpeg2dct__common__band_info,
-  &_swigt__p_p_short,
-  &_swigt__p_short,
+  &_swigt__p_jpeg2dct__common__coefficient_selection,
+  &_swigt__p_jpeg2dct__common__crop_window,
+  &_swigt__p_void,
 };
 
+static swig_cast_info _swigc__p_a_64__float[] = {  {&_swigt__p_a_64__float, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_int[] = {  {&_swigt__p_int, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_jpeg2dct__common__band_format[] = {  {&_swigt__p_jpeg2dct__common__band_format, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_jpeg2dct__common__band_info[] = {  {&_swigt__p_jpeg2dct__common__band_info, 0, 0, 0},{0, 0, 0, 0}};
-static swig_cast_info _swigc__p_p_short[] = {  {&_swigt__p_p_short, 0, 0, 0},{0, 0, 0, 0}};
-static swig_cast_info _swigc__p_short[] = {  {&_swigt__p_short, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_jpeg2dct__common__coefficient_selection[] = {  {&_swigt__p_jpeg2dct__common__coefficient_selection, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_jpeg2dct__common__crop_window[] = {  {&_swigt__p_jpeg2dct__common__crop_window, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_void[] = {  {&_swigt__p_void, 0, 0, 0},{0, 0, 0, 0}};
 
 static swig_cast_info *swig_cast_initial[] = {
+  _swigc__p_a_64__float,
   _swigc__p_char,
   _swigc__p_int,
+  _swigc__p_jpeg2dct__common__band_format,
   _swigc__p_jpeg2dct__common__band_info,
-  _swigc__p_p_short,
-  _swigc__p_short,
+  _swigc__p_jpeg2dct__common__coefficient_selection,
+  _swigc__p_jpeg2dct__common__crop_window,
+  _swigc__p_void,
 };
 
 
@@ -4510,7 +10603,7 @@ SWIG_InitializeModule(void *clientdata) {
   
   /* Now work on filling in swig_module.types */
 #ifdef SWIGRUNTIME_DEBUG
-  printf("SWIG_InitializeModule: size %d\n", swig_module.size);
+  printf("SWIG_InitializeModule: size %lu\n", (unsigned long)swig_module.size);
 #endif
   for (i = 0; i < swig_module.size; ++i) {
     swig_type_info *type = 0;
@@ -4518,7 +10611,7 @@ SWIG_InitializeModule(void *clientdata) {
     swig_cast_info *cast;
     
 #ifdef SWIGRUNTIME_DEBUG
-    printf("SWIG_InitializeModule: type %d %s\n", i, swig_module.type_initial[i]->name);
+    printf("SWIG_InitializeModule: type %lu %s\n", (unsigned long)i, swig_module.type_initial[i]->name);
 #endif
     
     /* if there is another module already loaded */
@@ -4593,7 +10686,7 @@ SWIG_InitializeModule(void *clientdata) {
   for (i = 0; i < swig_module.size; ++i) {
     int j = 0;
     swig_cast_info *cast = swig_module.cast_initial[i];
-    printf("SWIG_InitializeModule: type %d %s\n", i, swig_module.type_initial[i]->name);
+    printf("SWIG_InitializeModule: type %lu %s\n", (unsigned long)i, swig_module.type_initial[i]->name);
     while (cast->type) {
       printf("SWIG_InitializeModule: cast type %s\n", cast->type->name);
       cast++;
@@ -4715,17 +10808,6 @@ extern "C" {
     return str;
   }
   
-  SWIGINTERN int
-  swig_varlink_print(swig_varlinkobject *v, FILE *fp, int SWIGUNUSEDPARM(flags)) {
-    char *tmp;
-    PyObject *str = swig_varlink_str(v);
-    fprintf(fp,"Swig global variables ");
-    fprintf(fp,"%s\n", tmp = SWIG_Python_str_AsChar(str));
-    SWIG_Python_str_DelForPy3(tmp);
-    Py_DECREF(str);
-    return 0;
-  }
-  
   SWIGINTERN void
   swig_varlink_dealloc(swig_varlinkobject *v) {
     swig_globalvar *var = v->vars;
@@ -4778,18 +10860,17 @@ extern "C" {
     static int type_init = 0;
     if (!type_init) {
       const PyTypeObject tmp = {
-        /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX >= 0x03000000
         PyVarObject_HEAD_INIT(NULL, 0)
 #else
         PyObject_HEAD_INIT(NULL)
         0,                                  /* ob_size */
 #endif
-        (char *)"swigvarlink",              /* tp_name */
+        "swigvarlink",                      /* tp_name */
         sizeof(swig_varlinkobject),         /* tp_basicsize */
         0,                                  /* tp_itemsize */
         (destructor) swig_varlink_dealloc,  /* tp_dealloc */
-        (printfunc) swig_varlink_print,     /* tp_print */
+        0,                                  /* tp_print */
         (getattrfunc) swig_varlink_getattr, /* tp_getattr */
         (setattrfunc) swig_varlink_setattr, /* tp_setattr */
         0,                                  /* tp_compare */
@@ -4809,36 +10890,30 @@ extern "C" {
         0,                                  /* tp_clear */
         0,                                  /* tp_richcompare */
         0,                                  /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
         0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0, /* tp_iter -> tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
         0,                                  /* tp_del */
-#endif
-#if PY_VERSION_HEX >= 0x02060000
         0,                                  /* tp_version_tag */
-#endif
 #if PY_VERSION_HEX >= 0x03040000
         0,                                  /* tp_finalize */
 #endif
+#if PY_VERSION_HEX >= 0x03080000
+        0,                                  /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+        0,                                  /* tp_print */
+#endif
 #ifdef COUNT_ALLOCS
         0,                                  /* tp_allocs */
         0,                                  /* tp_frees */
         0,                                  /* tp_maxalloc */
-#if PY_VERSION_HEX >= 0x02050000
         0,                                  /* tp_prev */
-#endif
         0                                   /* tp_next */
 #endif
       };
       varlink_type = tmp;
       type_init = 1;
-#if PY_VERSION_HEX < 0x02020000
-      varlink_type.ob_type = &PyType_Type;
-#else
       if (PyType_Ready(&varlink_type) < 0)
       return NULL;
-#endif
     }
     return &varlink_type;
   }
@@ -4854,14 +10929,14 @@ extern "C" {
   }
   
   SWIGINTERN void 
-  SWIG_Python_addvarlink(PyObject *p, char *name, PyObject *(*get_attr)(void), int (*set_attr)(PyObject *p)) {
+  SWIG_Python_addvarlink(PyObject *p, const char *name, PyObject *(*get_attr)(void), int (*set_attr)(PyObject *p)) {
     swig_varlinkobject *v = (swig_varlinkobject *) p;
     swig_globalvar *gv = (swig_globalvar *) malloc(sizeof(swig_globalvar));
     if (gv) {
       size_t size = strlen(name)+1;
       gv->name = (char *)malloc(size);
       if (gv->name) {
-        strncpy(gv->name,name,size);
+        memcpy(gv->name, name, size);
         gv->get_attr = get_attr;
         gv->set_attr = set_attr;
         gv->next = v->vars;
@@ -4872,9 +10947,11 @@ extern "C" {
   
   SWIGINTERN PyObject *
   SWIG_globals(void) {
-    static PyObject *_SWIG_globals = 0; 
-    if (!_SWIG_globals) _SWIG_globals = SWIG_newvarlink();  
-    return _SWIG_globals;
+    static PyObject *globals = 0;
+    if (!globals) {
+      globals = SWIG_newvarlink();
+    }
+    return globals;
   }
   
   /* -----------------------------------------------------------------------------
@@ -4940,9 +11017,9 @@ extern "C" {
             char *ndoc = (char*)malloc(ldoc + lptr + 10);
             if (ndoc) {
               char *buff = ndoc;
-              strncpy(buff, methods[i].ml_doc, ldoc);
+              memcpy(buff, methods[i].ml_doc, ldoc);
               buff += ldoc;
-              strncpy(buff, "swig_ptr: ", 10);
+              memcpy(buff, "swig_ptr: ", 10);
               buff += 10;
               SWIG_PackVoidPtr(buff, ptr, ty->name, lptr);
               methods[i].ml_doc = ndoc;
@@ -4953,6 +11030,64 @@ extern "C" {
     }
   } 
   
+  /* -----------------------------------------------------------------------------
+   * Method creation and docstring support functions
+   * ----------------------------------------------------------------------------- */
+  
+  /* -----------------------------------------------------------------------------
+   * Function to find the method definition with the correct docstring for the
+   * proxy module as opposed to the low-level API
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyMethodDef *SWIG_PythonGetProxyDoc(const char *name) {
+    /* Find the function in the modified method table */
+    size_t offset = 0;
+    int found = 0;
+    while (SwigMethods_proxydocs[offset].ml_meth != NULL) {
+      if (strcmp(SwigMethods_proxydocs[offset].ml_name, name) == 0) {
+        found = 1;
+        break;
+      }
+      offset++;
+    }
+    /* Use the copy with the modified docstring if available */
+    return found ? &SwigMethods_proxydocs[offset] : NULL;
+  }
+  
+  /* -----------------------------------------------------------------------------
+   * Wrapper of PyInstanceMethod_New() used in Python 3
+   * It is exported to the generated module, used for -fastproxy
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyObject *SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func) {
+    if (PyCFunction_Check(func)) {
+      PyCFunctionObject *funcobj = (PyCFunctionObject *)func;
+      PyMethodDef *ml = SWIG_PythonGetProxyDoc(funcobj->m_ml->ml_name);
+      if (ml)
+      func = PyCFunction_NewEx(ml, funcobj->m_self, funcobj->m_module);
+    }
+#if PY_VERSION_HEX >= 0x03000000
+    return PyInstanceMethod_New(func);
+#else
+    return PyMethod_New(func, NULL, NULL);
+#endif
+  }
+  
+  /* -----------------------------------------------------------------------------
+   * Wrapper of PyStaticMethod_New()
+   * It is exported to the generated module, used for -fastproxy
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func) {
+    if (PyCFunction_Check(func)) {
+      PyCFunctionObject *funcobj = (PyCFunctionObject *)func;
+      PyMethodDef *ml = SWIG_PythonGetProxyDoc(funcobj->m_ml->ml_name);
+      if (ml)
+      func = PyCFunction_NewEx(ml, funcobj->m_self, funcobj->m_module);
+    }
+    return PyStaticMethod_New(func);
+  }
+  
 #ifdef __cplusplus
 }
 #endif
@@ -4972,20 +11107,12 @@ PyObject*
 void
 #endif
 SWIG_init(void) {
-  PyObject *m, *d, *md;
+  PyObject *m, *d, *md, *globals;
+  
 #if PY_VERSION_HEX >= 0x03000000
   static struct PyModuleDef SWIG_module = {
-# if PY_VERSION_HEX >= 0x03020000
     PyModuleDef_HEAD_INIT,
-# else
-    {
-      PyObject_HEAD_INIT(NULL)
-      NULL, /* m_init */
-      0,    /* m_index */
-      NULL, /* m_copy */
-    },
-# endif
-    (char *) SWIG_name,
+    SWIG_name,
     NULL,
     -1,
     SwigMethods,
@@ -5004,19 +11131,19 @@ SWIG_init(void) {
     (char *)"this", &SwigPyBuiltin_ThisClosure, NULL, NULL, NULL
   };
   static SwigPyGetSet thisown_getset_closure = {
-    (PyCFunction) SwigPyObject_own,
-    (PyCFunction) SwigPyObject_own
+    SwigPyObject_own,
+    SwigPyObject_own
   };
   static PyGetSetDef thisown_getset_def = {
     (char *)"thisown", SwigPyBuiltin_GetterClosure, SwigPyBuiltin_SetterClosure, NULL, &thisown_getset_closure
   };
-  PyObject *metatype_args;
   PyTypeObject *builtin_pytype;
   int builtin_base_count;
   swig_type_info *builtin_basetype;
   PyObject *tuple;
   PyGetSetDescrObject *static_getset;
   PyTypeObject *metatype;
+  PyTypeObject *swigpyobject;
   SwigPyClientData *cd;
   PyObject *public_interface, *public_symbol;
   PyObject *this_descr;
@@ -5031,14 +11158,19 @@ SWIG_init(void) {
   (void)static_getset;
   (void)self;
   
-  /* metatype is used to implement static member variables. */
-  metatype_args = Py_BuildValue("(s(O){})", "SwigPyObjectType", &PyType_Type);
-  assert(metatype_args);
-  metatype = (PyTypeObject *) PyType_Type.tp_call((PyObject *) &PyType_Type, metatype_args, NULL);
+  /* Metaclass is used to implement static member variables */
+  metatype = SwigPyObjectType();
   assert(metatype);
-  Py_DECREF(metatype_args);
-  metatype->tp_setattro = (setattrofunc) &SwigPyObjectType_setattro;
-  assert(PyType_Ready(metatype) >= 0);
+#endif
+  
+  (void)globals;
+  
+  /* Create singletons now to avoid potential deadlocks with multi-threaded usage after module initialization */
+  SWIG_This();
+  SWIG_Python_TypeCache();
+  SwigPyPacked_type();
+#ifndef SWIGPYTHON_BUILTIN
+  SwigPyObject_type();
 #endif
   
   /* Fix SwigMethods to carry the callback ptrs when needed */
@@ -5047,7 +11179,7 @@ SWIG_init(void) {
 #if PY_VERSION_HEX >= 0x03000000
   m = PyModule_Create(&SWIG_module);
 #else
-  m = Py_InitModule((char *) SWIG_name, SwigMethods);
+  m = Py_InitModule(SWIG_name, SwigMethods);
 #endif
   
   md = d = PyModule_GetDict(m);
@@ -5056,13 +11188,15 @@ SWIG_init(void) {
   SWIG_InitializeModule(0);
   
 #ifdef SWIGPYTHON_BUILTIN
+  swigpyobject = SwigPyObject_TypeOnce();
+  
   SwigPyObject_stype = SWIG_MangledTypeQuery("_p_SwigPyObject");
   assert(SwigPyObject_stype);
   cd = (SwigPyClientData*) SwigPyObject_stype->clientdata;
   if (!cd) {
     SwigPyObject_stype->clientdata = &SwigPyObject_clientdata;
-    SwigPyObject_clientdata.pytype = SwigPyObject_TypeOnce();
-  } else if (SwigPyObject_TypeOnce()->tp_basicsize != cd->pytype->tp_basicsize) {
+    SwigPyObject_clientdata.pytype = swigpyobject;
+  } else if (swigpyobject->tp_basicsize != cd->pytype->tp_basicsize) {
     PyErr_SetString(PyExc_RuntimeError, "Import error: attempted to load two incompatible swig-generated modules.");
 # if PY_VERSION_HEX >= 0x03000000
     return NULL;
@@ -5096,6 +11230,33 @@ SWIG_init(void) {
   
   import_array();
   
+  SWIG_Python_SetConstant(d, "DTYPE_INT16",SWIG_From_int(static_cast< int >(jpeg2dct::common::DTYPE_INT16)));
+  SWIG_Python_SetConstant(d, "DTYPE_FLOAT16",SWIG_From_int(static_cast< int >(jpeg2dct::common::DTYPE_FLOAT16)));
+  SWIG_Python_SetConstant(d, "DTYPE_FLOAT32",SWIG_From_int(static_cast< int >(jpeg2dct::common::DTYPE_FLOAT32)));
+  SWIG_Python_SetConstant(d, "TARGET_CROP_TOP_LEFT",SWIG_From_int(static_cast< int >(jpeg2dct::common::TARGET_CROP_TOP_LEFT)));
+  SWIG_Python_SetConstant(d, "TARGET_CROP_CENTER",SWIG_From_int(static_cast< int >(jpeg2dct::common::TARGET_CROP_CENTER)));
+  SWIG_Python_SetConstant(d, "TARGET_CROP_RANDOM",SWIG_From_int(static_cast< int >(jpeg2dct::common::TARGET_CROP_RANDOM)));
+  SWIG_Python_SetConstant(d, "TARGET_PAD_ZERO",SWIG_From_int(static_cast< int >(jpeg2dct::common::TARGET_PAD_ZERO)));
+  SWIG_Python_SetConstant(d, "TARGET_PAD_EDGE",SWIG_From_int(static_cast< int >(jpeg2dct::common::TARGET_PAD_EDGE)));
+  globals = SWIG_globals();
+  if (!globals) {
+    PyErr_SetString(PyExc_TypeError, "Failure to create SWIG globals.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  PyDict_SetItemString(md, "cvar", globals);
+  Py_DECREF(globals);
+  SWIG_addvarlink(globals, "kBandAlignment", Swig_var_kBandAlignment_get, Swig_var_kBandAlignment_set);
+  SWIG_Python_SetConstant(d, "DECODE_DIRECT",SWIG_From_int(static_cast< int >(jpeg2dct::common::DECODE_DIRECT)));
+  SWIG_Python_SetConstant(d, "DECODE_RESAMPLE",SWIG_From_int(static_cast< int >(jpeg2dct::common::DECODE_RESAMPLE)));
+  SWIG_Python_SetConstant(d, "DECODE_TRANSCODE",SWIG_From_int(static_cast< int >(jpeg2dct::common::DECODE_TRANSCODE)));
+  SWIG_addvarlink(globals, "kMaxProbedComponents", Swig_var_kMaxProbedComponents_get, Swig_var_kMaxProbedComponents_set);
+  
+  /* Initialize threading */
+  SWIG_PYTHON_INITIALIZE_THREADS;
 #if PY_VERSION_HEX >= 0x03000000
   return m;
 #else
@@ -1,90 +1,26 @@
-# Command: swig -python -modern -c++ -o dctfromjpg_wrap.cc dctfromjpg.i
+# Command: swig -python -c++ -o dctfromjpg_wrap.cc dctfromjpg.i
 # ==============================================================================
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 3.0.10
+# Version 4.0.2
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
 
-
 from sys import version_info as _swig_python_version_info
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
 
-if _swig_python_version_info >= (2, 7, 0):
-    def swig_import_helper():
-        import importlib
-        pkg = __name__.rpartition('.')[0]
-        mname = '.'.join((pkg, '_dctfromjpg_wrapper')).lstrip('.')
-        try:
-            return importlib.import_module(mname)
-        except ImportError:
-            return importlib.import_module('_dctfromjpg_wrapper')
-
-
-    _dctfromjpg_wrapper = swig_import_helper()
-    del swig_import_helper
-elif _swig_python_version_info >= (2, 6, 0):
-    def swig_import_helper():
-        from os.path import dirname
-        import imp
-        fp = None
-        try:
-            fp, pathname, description = imp.find_module('_dctfromjpg_wrapper', [dirname(__file__)])
-        except ImportError:
-            import _dctfromjpg_wrapper
-            return _dctfromjpg_wrapper
-        if fp is not None:
-            try:
-                _mod = imp.load_module('_dctfromjpg_wrapper', fp, pathname, description)
-            finally:
-                fp.close()
-            return _mod
-
-
-    _dctfromjpg_wrapper = swig_import_helper()
-    del swig_import_helper
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _dctfromjpg_wrapper
 else:
     import _dctfromjpg_wrapper
-del _swig_python_version_info
-try:
-    _swig_property = property
-except NameError:
-    pass  # Python < 2.2 doesn't have 'property'.
 
 try:
     import builtins as __builtin__
 except ImportError:
     import __builtin__
 
-
-def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
-    if (name == "thisown"):
-        return self.this.own(value)
-    if (name == "this"):
-        if type(value).__name__ == 'SwigPyObject':
-            self.__dict__[name] = value
-            return
-    method = class_type.__swig_setmethods__.get(name, None)
-    if method:
-        return method(self, value)
-    if (not static):
-        object.__setattr__(self, name, value)
-    else:
-        raise AttributeError("You cannot add attributes to %s" % self)
-
-
-def _swig_setattr(self, class_type, name, value):
-    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
-
-
-def _swig_getattr(self, class_type, name):
-    if (name == "thisown"):
-        return self.this.own()
-    method = class_type.__swig_getmethods__.get(name, None)
-    if method:
-        return method(self)
-    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
-
-
 def _swig_repr(self):
     try:
         strthis = "proxy of " + self.this.__repr__()
@@ -93,65 +29,202 @@ def _swig_repr(self):
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
 
-def _swig_setattr_nondynamic_method(set):
-    def set_attr(self, name, value):
-        if (name == "thisown"):
-            return self.this.own(value)
-        if hasattr(self, name) or (name == "this"):
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
             set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
         else:
-            raise AttributeError("You cannot add attributes to %s" % self)
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
 
-    return set_attr
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
 
 
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+DTYPE_INT16 = _dctfromjpg_wrapper.DTYPE_INT16
+DTYPE_FLOAT16 = _dctfromjpg_wrapper.DTYPE_FLOAT16
+DTYPE_FLOAT32 = _dctfromjpg_wrapper.DTYPE_FLOAT32
 class band_info(object):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
-    dct = _swig_property(_dctfromjpg_wrapper.band_info_dct_get, _dctfromjpg_wrapper.band_info_dct_set)
-    dct_h = _swig_property(_dctfromjpg_wrapper.band_info_dct_h_get, _dctfromjpg_wrapper.band_info_dct_h_set)
-    dct_w = _swig_property(_dctfromjpg_wrapper.band_info_dct_w_get, _dctfromjpg_wrapper.band_info_dct_w_set)
-    dct_b = _swig_property(_dctfromjpg_wrapper.band_info_dct_b_get, _dctfromjpg_wrapper.band_info_dct_b_set)
+    dct = property(_dctfromjpg_wrapper.band_info_dct_get, _dctfromjpg_wrapper.band_info_dct_set)
+    dct_h = property(_dctfromjpg_wrapper.band_info_dct_h_get, _dctfromjpg_wrapper.band_info_dct_h_set)
+    dct_w = property(_dctfromjpg_wrapper.band_info_dct_w_get, _dctfromjpg_wrapper.band_info_dct_w_set)
+    dct_b = property(_dctfromjpg_wrapper.band_info_dct_b_get, _dctfromjpg_wrapper.band_info_dct_b_set)
+    dtype = property(_dctfromjpg_wrapper.band_info_dtype_get, _dctfromjpg_wrapper.band_info_dtype_set)
 
     def __init__(self):
-        this = _dctfromjpg_wrapper.new_band_info()
-        try:
-            self.this.append(this)
-        except __builtin__.Exception:
-            self.this = this
-
+        _dctfromjpg_wrapper.band_info_swiginit(self, _dctfromjpg_wrapper.new_band_info())
     __swig_destroy__ = _dctfromjpg_wrapper.delete_band_info
-    __del__ = lambda self: None
 
+# Register band_info in _dctfromjpg_wrapper:
+_dctfromjpg_wrapper.band_info_swigregister(band_info)
+
+class crop_window(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    y = property(_dctfromjpg_wrapper.crop_window_y_get, _dctfromjpg_wrapper.crop_window_y_set)
+    x = property(_dctfromjpg_wrapper.crop_window_x_get, _dctfromjpg_wrapper.crop_window_x_set)
+    h = property(_dctfromjpg_wrapper.crop_window_h_get, _dctfromjpg_wrapper.crop_window_h_set)
+    w = property(_dctfromjpg_wrapper.crop_window_w_get, _dctfromjpg_wrapper.crop_window_w_set)
+
+    def __init__(self):
+        _dctfromjpg_wrapper.crop_window_swiginit(self, _dctfromjpg_wrapper.new_crop_window())
+    __swig_destroy__ = _dctfromjpg_wrapper.delete_crop_window
+
+# Register crop_window in _dctfromjpg_wrapper:
+_dctfromjpg_wrapper.crop_window_swigregister(crop_window)
+
+class coefficient_selection(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    count = property(_dctfromjpg_wrapper.coefficient_selection_count_get, _dctfromjpg_wrapper.coefficient_selection_count_set)
+    index = property(_dctfromjpg_wrapper.coefficient_selection_index_get, _dctfromjpg_wrapper.coefficient_selection_index_set)
+
+    def __init__(self):
+        _dctfromjpg_wrapper.coefficient_selection_swiginit(self, _dctfromjpg_wrapper.new_coefficient_selection())
+    __swig_destroy__ = _dctfromjpg_wrapper.delete_coefficient_selection
+
+# Register coefficient_selection in _dctfromjpg_wrapper:
+_dctfromjpg_wrapper.coefficient_selection_swigregister(coefficient_selection)
+
+TARGET_CROP_TOP_LEFT = _dctfromjpg_wrapper.TARGET_CROP_TOP_LEFT
+TARGET_CROP_CENTER = _dctfromjpg_wrapper.TARGET_CROP_CENTER
+TARGET_CROP_RANDOM = _dctfromjpg_wrapper.TARGET_CROP_RANDOM
+TARGET_PAD_ZERO = _dctfromjpg_wrapper.TARGET_PAD_ZERO
+TARGET_PAD_EDGE = _dctfromjpg_wrapper.TARGET_PAD_EDGE
+class band_format(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    dtype = property(_dctfromjpg_wrapper.band_format_dtype_get, _dctfromjpg_wrapper.band_format_dtype_set)
+    standardize = property(_dctfromjpg_wrapper.band_format_standardize_get, _dctfromjpg_wrapper.band_format_standardize_set)
+    nb_coefficients = property(_dctfromjpg_wrapper.band_format_nb_coefficients_get, _dctfromjpg_wrapper.band_format_nb_coefficients_set)
+    mean = property(_dctfromjpg_wrapper.band_format_mean_get, _dctfromjpg_wrapper.band_format_mean_set)
+    std = property(_dctfromjpg_wrapper.band_format_std_get, _dctfromjpg_wrapper.band_format_std_set)
+    target_h = property(_dctfromjpg_wrapper.band_format_target_h_get, _dctfromjpg_wrapper.band_format_target_h_set)
+    target_w = property(_dctfromjpg_wrapper.band_format_target_w_get, _dctfromjpg_wrapper.band_format_target_w_set)
+    crop_mode = property(_dctfromjpg_wrapper.band_format_crop_mode_get, _dctfromjpg_wrapper.band_format_crop_mode_set)
+    pad_mode = property(_dctfromjpg_wrapper.band_format_pad_mode_get, _dctfromjpg_wrapper.band_format_pad_mode_set)
+    scale_denom = property(_dctfromjpg_wrapper.band_format_scale_denom_get, _dctfromjpg_wrapper.band_format_scale_denom_set)
+
+    def __init__(self):
+        _dctfromjpg_wrapper.band_format_swiginit(self, _dctfromjpg_wrapper.new_band_format())
+    __swig_destroy__ = _dctfromjpg_wrapper.delete_band_format
+
+# Register band_format in _dctfromjpg_wrapper:
+_dctfromjpg_wrapper.band_format_swigregister(band_format)
+
+
+def read_dct_coefficients_from_file_(filename, normalized, channels, band1, band2, band3, crop=None, coefficients=None, format=None):
+    return _dctfromjpg_wrapper.read_dct_coefficients_from_file_(filename, normalized, channels, band1, band2, band3, crop, coefficients, format)
+
+def read_dct_coefficients_from_buffer_(buffer, buffer_len, normalized, channels, band1, band2, band3, crop=None, coefficients=None, format=None):
+    return _dctfromjpg_wrapper.read_dct_coefficients_from_buffer_(buffer, buffer_len, normalized, channels, band1, band2, band3, crop, coefficients, format)
+
+def set_chroma_resampling(enabled):
+    return _dctfromjpg_wrapper.set_chroma_resampling(enabled)
+
+def get_chroma_resampling():
+    return _dctfromjpg_wrapper.get_chroma_resampling()
+
+def set_accept_truncated(enabled):
+    return _dctfromjpg_wrapper.set_accept_truncated(enabled)
+
+def get_accept_truncated():
+    return _dctfromjpg_wrapper.get_accept_truncated()
+
+def set_segment_threads(num_threads):
+    return _dctfromjpg_wrapper.set_segment_threads(num_threads)
+
+def read_dct_dimensions_from_buffer_(buffer, buffer_len, channels, band1, band2, band3, crop=None, coefficients=None, format=None):
+    return _dctfromjpg_wrapper.read_dct_dimensions_from_buffer_(buffer, buffer_len, channels, band1, band2, band3, crop, coefficients, format)
+
+def read_dct_dimensions_from_buffer(buffer, buffer_len, channels, crop_y, crop_x, crop_h, crop_w, coefficients):
+    return _dctfromjpg_wrapper.read_dct_dimensions_from_buffer(buffer, buffer_len, channels, crop_y, crop_x, crop_h, crop_w, coefficients)
+
+def read_dct_coefficients_from_buffer_into_(buffer, buffer_len, normalized, channels, band1, band2, band3, crop=None, coefficients=None, format=None):
+    return _dctfromjpg_wrapper.read_dct_coefficients_from_buffer_into_(buffer, buffer_len, normalized, channels, band1, band2, band3, crop, coefficients, format)
+
+def read_dct_coefficients_from_buffer_into(buffer, buffer_len, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, band1_dct, band2_dct, band3_dct):
+    return _dctfromjpg_wrapper.read_dct_coefficients_from_buffer_into(buffer, buffer_len, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, band1_dct, band2_dct, band3_dct)
+DECODE_DIRECT = _dctfromjpg_wrapper.DECODE_DIRECT
+DECODE_RESAMPLE = _dctfromjpg_wrapper.DECODE_RESAMPLE
+DECODE_TRANSCODE = _dctfromjpg_wrapper.DECODE_TRANSCODE
+
+def prefetch_file(filename):
+    return _dctfromjpg_wrapper.prefetch_file(filename)
+
+def read_dct_coefficients_from_buffers(buffers, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, dtype, mean, std, target_h, target_w, target_crop, target_pad, scale_denom, num_threads, skip_failures, pool):
+    return _dctfromjpg_wrapper.read_dct_coefficients_from_buffers(buffers, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, dtype, mean, std, target_h, target_w, target_crop, target_pad, scale_denom, num_threads, skip_failures, pool)
 
-band_info_swigregister = _dctfromjpg_wrapper.band_info_swigregister
-band_info_swigregister(band_info)
+def read_dct_coefficients_from_files(filenames, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, dtype, mean, std, target_h, target_w, target_crop, target_pad, scale_denom, num_threads, skip_failures, pool):
+    return _dctfromjpg_wrapper.read_dct_coefficients_from_files(filenames, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, dtype, mean, std, target_h, target_w, target_crop, target_pad, scale_denom, num_threads, skip_failures, pool)
 
+def read_dct_coefficients_from_buffers_padded(buffers, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, dtype, mean, std, target_h, target_w, target_crop, target_pad, scale_denom, num_threads, skip_failures, pool):
+    return _dctfromjpg_wrapper.read_dct_coefficients_from_buffers_padded(buffers, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, dtype, mean, std, target_h, target_w, target_crop, target_pad, scale_denom, num_threads, skip_failures, pool)
 
-def read_dct_coefficients_from_file_(filename, normalized, channels, band1, band2, band3):
-    return _dctfromjpg_wrapper.read_dct_coefficients_from_file_(filename, normalized, channels, band1, band2, band3)
+def read_dct_coefficients_from_buffer_into_image(buffer, image, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, dtype, mean, std, target_h, target_w, target_crop, target_pad, scale_denom):
+    return _dctfromjpg_wrapper.read_dct_coefficients_from_buffer_into_image(buffer, image, normalized, channels, crop_y, crop_x, crop_h, crop_w, coefficients, dtype, mean, std, target_h, target_w, target_crop, target_pad, scale_denom)
 
+def is_image_capsule(capsule):
+    return _dctfromjpg_wrapper.is_image_capsule(capsule)
 
-read_dct_coefficients_from_file_ = _dctfromjpg_wrapper.read_dct_coefficients_from_file_
+def new_buffer_pool(max_bytes):
+    return _dctfromjpg_wrapper.new_buffer_pool(max_bytes)
 
+def buffer_pool_stats(pool):
+    return _dctfromjpg_wrapper.buffer_pool_stats(pool)
 
-def read_dct_coefficients_from_file(filename, normalized, channels):
-    return _dctfromjpg_wrapper.read_dct_coefficients_from_file(filename, normalized, channels)
+def probe_buffers(buffers, num_threads):
+    return _dctfromjpg_wrapper.probe_buffers(buffers, num_threads)
 
+def get_stats(reset):
+    return _dctfromjpg_wrapper.get_stats(reset)
 
-read_dct_coefficients_from_file = _dctfromjpg_wrapper.read_dct_coefficients_from_file
+def set_trace_callback(callback):
+    return _dctfromjpg_wrapper.set_trace_callback(callback)
 
+def add_restart_markers(buffer, buffer_len, restart_rows):
+    return _dctfromjpg_wrapper.add_restart_markers(buffer, buffer_len, restart_rows)
 
-def read_dct_coefficients_from_buffer_(buffer, buffer_len, normalized, channels, band1, band2, band3):
-    return _dctfromjpg_wrapper.read_dct_coefficients_from_buffer_(buffer, buffer_len, normalized, channels, band1,
-                                                                  band2, band3)
+def encode_dct_coefficients(pixels, bgr, quality, normalized, channels):
+    return _dctfromjpg_wrapper.encode_dct_coefficients(pixels, bgr, quality, normalized, channels)
 
+def encode_jpeg(pixels, bgr, quality, h_samp, v_samp, progressive, restart_rows):
+    return _dctfromjpg_wrapper.encode_jpeg(pixels, bgr, quality, h_samp, v_samp, progressive, restart_rows)
 
-read_dct_coefficients_from_buffer_ = _dctfromjpg_wrapper.read_dct_coefficients_from_buffer_
+def quality_quant_tables(quality):
+    return _dctfromjpg_wrapper.quality_quant_tables(quality)
 
+def pack_sparse(channels, band1, band2, band3, quant):
+    return _dctfromjpg_wrapper.pack_sparse(channels, band1, band2, band3, quant)
 
-def read_dct_coefficients_from_buffer(buffer, buffer_len, normalized, channels):
-    return _dctfromjpg_wrapper.read_dct_coefficients_from_buffer(buffer, buffer_len, normalized, channels)
+def unpack_sparse(buffer, buffer_len, normalized):
+    return _dctfromjpg_wrapper.unpack_sparse(buffer, buffer_len, normalized)
 
+cvar = _dctfromjpg_wrapper.cvar
+kBandAlignment = cvar.kBandAlignment
+kMaxProbedComponents = cvar.kMaxProbedComponents
 
-read_dct_coefficients_from_buffer = _dctfromjpg_wrapper.read_dct_coefficients_from_buffer
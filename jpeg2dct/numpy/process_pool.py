@@ -0,0 +1,355 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import multiprocessing
+import os
+import signal
+import threading
+import weakref
+from multiprocessing import connection, shared_memory
+
+import numpy as np
+
+from jpeg2dct.numpy import Decoder, bands_from_buffer
+
+# the alignment of the bands in a slot, as in the buffers of jpeg2dct.numpy.image_buffer
+_ALIGNMENT = 64
+# how often the consumer checks that the workers are alive while waiting for them
+_POLL_SECONDS = 1.0
+# the shared memory of the closed pools whose bands the consumer still holds, closed by the next pools
+_detached = []
+
+
+class ProcessPool(object):
+    """
+    Pool of worker processes decoding jpeg images into a ring of slots in shared memory.
+
+    The decoded bands are numpy views of a slot, handed to the consumer without pickling nor copying. A slot goes
+    back to the ring once the consumer has released every view of it, and at most as many images as there are slots
+    are being decoded or held by the consumer at any time, which bounds the memory of a producer running ahead of
+    its consumer. Images larger than a slot are sent through the pipe of their worker instead. A worker which
+    crashes is replaced: the image it was decoding fails and the images queued behind it are decoded again.
+
+    Usage:
+        with ProcessPool(num_workers=4, max_size=(512, 512), num_coefficients=16) as pool:
+            for index, (dct_y, dct_cb, dct_cr) in pool.imap(jpeg_files):
+                ...
+        print(pool.restarts)
+    """
+
+    def __init__(self, num_workers=0, slots=0, max_size=(1024, 1024), normalized=True, channels=3, crop=None,
+                 num_coefficients=None, coefficients=None, dtype=np.int16, mean=None, std=None, errors='raise',
+                 start_method=None):
+        """
+        :param num_workers: number of worker processes, 0 for one per core
+        :param slots: number of slots of the ring, 0 for 4 per worker. It bounds the images being decoded plus the
+            images whose bands the consumer holds.
+        :param max_size: (height, width) in pixels of the largest image decoded in a slot, which sizes the slots
+        :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+        :param channels: number of color channels for the decoded images
+        :param crop: (y, x, h, w) window of the luminance blocks to decode, see jpeg2dct.numpy.loads
+        :param num_coefficients: number of dct coefficients kept in zigzag order, see jpeg2dct.numpy.loads
+        :param coefficients: indices of the dct coefficients kept, see jpeg2dct.numpy.loads
+        :param dtype: type of the returned arrays, see jpeg2dct.numpy.loads
+        :param mean: per coefficient mean subtracted from floating point bands, see jpeg2dct.numpy.loads
+        :param std: per coefficient standard deviation dividing floating point bands, see jpeg2dct.numpy.loads
+        :param errors: what to do with the images which fail to decode, crashes included: 'raise' raises a
+            RuntimeError at their position, 'drop' leaves them out
+        :param start_method: multiprocessing start method of the workers, None for the default of the platform
+        """
+        if errors not in ('raise', 'drop'):
+            raise ValueError("errors should be 'raise' or 'drop'")
+        if len(max_size) != 2 or min(max_size) <= 0:
+            raise ValueError('max_size should be a positive (height, width)')
+        options = dict(normalized=normalized, channels=channels, crop=crop, num_coefficients=num_coefficients,
+                       coefficients=coefficients, dtype=dtype, mean=mean, std=std)
+        # checks the options before starting anything
+        Decoder(pool_bytes=0, **options)
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.num_slots = slots or 4 * self.num_workers
+        self.slot_bytes = _slot_bytes(max_size, channels, crop, num_coefficients, coefficients, dtype)
+        self.errors = errors
+        self.restarts = 0
+        self.oversized = 0
+        self._options = options
+        self._dtype = np.dtype(dtype)
+        self._context = multiprocessing.get_context(start_method)
+        _close_detached()
+        self._memory = shared_memory.SharedMemory(create=True, size=self.num_slots * self.slot_bytes)
+        # slots are handed back by the finalizers of their views, from any thread
+        self._free_slots = collections.deque(range(self.num_slots))
+        self._lock = threading.Lock()
+        self._workers = []
+        self._shutdown = weakref.finalize(self, _shutdown, self._workers, self._memory)
+        self._workers.extend(self._start_worker() for _ in range(self.num_workers))
+        self._next_task = 0
+        self._running = False
+
+    def imap(self, sources, ordered=True):
+        """
+        decode images in the worker processes
+        :param sources: iterable of jpg file names or of strings of bytes representing jpeg images, consumed as slots
+            become free
+        :param ordered: yield the images in the order of the sources when True, as soon as they are decoded otherwise
+        :return: generator of (index, bands) pairs, index being the position of the image in sources and bands the
+            [dct_y, dct_c, dct_r] views of its slot, [dct_y] for a single channel. Copy the bands to keep them
+            beyond the lifetime of the pool.
+        """
+        if not self._shutdown.alive:
+            raise ValueError('the pool is closed')
+        if self._running:
+            raise RuntimeError('the pool decodes one iterable of sources at a time')
+        self._running = True
+        try:
+            for result in self._imap(enumerate(sources), ordered):
+                yield result
+        finally:
+            self._drain()
+            self._running = False
+
+    def close(self):
+        """stop the workers and release the shared memory, which stays mapped while views of it exist. Also done
+        when the pool is garbage collected."""
+        self._shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _start_worker(self):
+        conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main,
+                                         args=(child_conn, self._memory.name, self.slot_bytes, self._options),
+                                         daemon=True)
+        process.start()
+        child_conn.close()
+        return _Worker(process, conn)
+
+    def _imap(self, sources, ordered):
+        # task id -> (index, slot) of the tasks sent to the workers
+        pending = {}
+        # decoded or failed images waiting for their turn, when ordered
+        done = {}
+        next_index = 0
+        exhausted = False
+        while True:
+            # hand out the sources to the least loaded workers, within the free slots
+            while not exhausted:
+                slot = self._acquire_slot()
+                if slot is None:
+                    break
+                try:
+                    index, source = next(sources)
+                except StopIteration:
+                    self._release_slot(slot)
+                    exhausted = True
+                    break
+                task = self._next_task
+                self._next_task += 1
+                pending[task] = (index, slot)
+                self._send(min(self._workers, key=lambda worker: len(worker.tasks)), (task, source, slot))
+            if exhausted and not pending and not done:
+                return
+            if not pending and not done:
+                raise RuntimeError('all the {} slots are held by the consumer, copy the bands or add slots'.format(
+                    self.num_slots))
+
+            for task, bands, error in self._receive(pending and not (ordered and next_index in done)):
+                index, slot = pending.pop(task)
+                done[index] = (bands, error)
+            while done:
+                index = next_index if ordered else min(done)
+                if index not in done:
+                    break
+                bands, error = done.pop(index)
+                next_index = index + 1
+                if error is None:
+                    yield index, bands
+                elif self.errors == 'raise':
+                    raise RuntimeError('image {}: {}'.format(index, error))
+
+    def _receive(self, block):
+        """:return: the (task, bands, error) of the images decoded by the workers, waiting for one when block"""
+        results = []
+        while True:
+            conns = [worker.conn for worker in self._workers]
+            sentinels = [worker.process.sentinel for worker in self._workers]
+            ready = connection.wait(conns + sentinels, timeout=_POLL_SECONDS if block else 0)
+            for worker in list(self._workers):
+                if worker.conn in ready or worker.process.sentinel in ready or not worker.process.is_alive():
+                    results.extend(self._collect(worker))
+            if results or not block:
+                return results
+
+    def _collect(self, worker):
+        """:return: the results sent by a worker, and the failure of its current image if it crashed"""
+        results = []
+        try:
+            while worker.conn.poll():
+                results.append(self._result(worker, worker.conn.recv()))
+        except (EOFError, OSError):
+            pass
+        # what the worker sent before exiting is answered first
+        if not worker.process.is_alive():
+            results.extend(self._replace(worker))
+        return results
+
+    def _result(self, worker, message):
+        task, slot, shapes, payload = message
+        worker.tasks.popleft()
+        if shapes is None:
+            self._release_slot(slot)
+            return task, None, payload
+        if payload is not None:
+            # too large for its slot
+            self._release_slot(slot)
+            self.oversized += 1
+            return task, payload, None
+        start = slot * self.slot_bytes
+        data = np.frombuffer(self._memory.buf, dtype=np.uint8, count=self.slot_bytes, offset=start)
+        # the finalizer does not keep the pool alive
+        weakref.finalize(data, _release_slot, self._free_slots, self._lock, slot)
+        return task, bands_from_buffer(data, shapes, self._dtype), None
+
+    def _replace(self, worker):
+        """replace a crashed worker: its current image fails and the next ones are handed to the new worker"""
+        worker.process.join()
+        worker.conn.close()
+        new_worker = self._start_worker()
+        self._workers[self._workers.index(worker)] = new_worker
+        self.restarts += 1
+        failures = []
+        if worker.tasks:
+            task, _, slot = worker.tasks.popleft()
+            self._release_slot(slot)
+            failures.append((task, None, 'the worker decoding the image exited with code {}'.format(
+                worker.process.exitcode)))
+        for message in worker.tasks:
+            self._send(new_worker, message)
+        return failures
+
+    def _send(self, worker, message):
+        worker.tasks.append(message)
+        try:
+            worker.conn.send(message)
+        except (OSError, ValueError):
+            # the worker is gone, it is replaced on the next receive
+            pass
+
+    def _drain(self):
+        """wait for the images still being decoded, left behind by a consumer which stopped early"""
+        while any(worker.tasks for worker in self._workers):
+            self._receive(True)
+
+    def _acquire_slot(self):
+        with self._lock:
+            return self._free_slots.popleft() if self._free_slots else None
+
+    def _release_slot(self, slot):
+        _release_slot(self._free_slots, self._lock, slot)
+
+
+class _Worker(object):
+    """a worker process, its pipe and the (task, source, slot) it was sent and has not answered yet, in order"""
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.tasks = collections.deque()
+
+
+def _release_slot(free_slots, lock, slot):
+    with lock:
+        free_slots.append(slot)
+
+
+def _shutdown(workers, memory):
+    """stop the workers of a pool and release its shared memory"""
+    for worker in workers:
+        try:
+            worker.conn.send(None)
+        except (OSError, ValueError):
+            pass
+    for worker in workers:
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join()
+        worker.conn.close()
+    del workers[:]
+    memory.unlink()
+    _detached.append(memory)
+    _close_detached()
+
+
+def _close_detached():
+    """close the shared memory of the closed pools, once the consumer has released their bands"""
+    for memory in list(_detached):
+        try:
+            memory.close()
+        except BufferError:
+            continue
+        _detached.remove(memory)
+
+
+def _slot_bytes(max_size, channels, crop, num_coefficients, coefficients, dtype):
+    """:return: the size of the slots holding the bands of the images up to max_size pixels, see image_bytes"""
+    height, width = [-(-int(value) // 8) for value in max_size]
+    if crop is not None:
+        height, width = min(height, int(crop[2])), min(width, int(crop[3]))
+    nb_coefficients = len(coefficients) if coefficients is not None else num_coefficients or 64
+    shapes = [(height, width, nb_coefficients)]
+    if channels == 3:
+        # the chroma bands have half the luminance blocks, rounded up, whatever the subsampling of the image
+        shapes += [((height + 1) // 2, (width + 1) // 2, nb_coefficients)] * 2
+    return _image_bytes(shapes, np.dtype(dtype).itemsize)
+
+
+def _image_bytes(shapes, itemsize):
+    """:return: the size of bands of the given shapes laid out as in the buffers of image_buffer, rounded up to a
+        multiple of the alignment"""
+    return sum(-(-int(np.prod(shape)) * itemsize // _ALIGNMENT) * _ALIGNMENT for shape in shapes)
+
+
+def _worker_main(conn, memory_name, slot_bytes, options):
+    """decode the (task, source, slot) sent by the pool into the slots, until None"""
+    # interrupts are for the parent, which stops the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    memory = shared_memory.SharedMemory(name=memory_name)
+    decoder = Decoder(**options)
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            task, source, slot = message
+            slot_data = np.frombuffer(memory.buf, dtype=np.uint8, count=slot_bytes, offset=slot * slot_bytes)
+            try:
+                conn.send((task, slot) + _decode(source, slot_data, decoder))
+            except Exception as e:
+                conn.send((task, slot, None, str(e) or type(e).__name__))
+            del slot_data
+    finally:
+        memory.close()
+
+
+def _decode(source, slot_data, decoder):
+    """:return: the shapes of the bands decoded straight into slot_data and None, or their shapes and the bands
+        themselves when they do not fit"""
+    if isinstance(source, str):
+        with open(source, 'rb') as src:
+            source = src.read()
+    bands = decoder.loads_into_buffer(source, slot_data)
+    if bands is not None:
+        return [band.shape for band in bands], None
+    bands = decoder.loads(source)
+    return [band.shape for band in bands], [np.array(band) for band in bands]
@@ -1,5 +1,5 @@
 
-from jpeg2dct.numpy import loads
+from jpeg2dct.numpy import encode_jpeg, loads, loads_sparse, pixels_to_sparse
 
 try:
     import cv2
@@ -9,35 +9,28 @@ except:
 
 
 class Jpeg2DCTNumpyCodec(object):
-    def __init__(self, quality=80, is_rgb=False, normalized=True, channels=3):
+    def __init__(self, quality=80, is_rgb=False, normalized=True, channels=3, force_420=False):
         """Jpeg2DCTCodec would compress images into jpeg, but decompress into DCT coefficients
         :param quality: used when using jpeg lossy compression
         :param is_rgb: boolean indicating if image comes as rgb
         :param normalized: boolean. If True, dct coefficients are normalized with quantification tables.
             If False, no normalization is performed.
         :param channels: number of color channels for the decoded image
+        :param force_420: boolean. If True, images are compressed by libjpeg with 4:2:0 chroma subsampling, which
+            is read without resampling nor transcoding the chroma, instead of by OpenCV.
         """
         self._image_codec = '.jpeg'
         self._quality = quality
         self._is_rgb = is_rgb
         self._normalized = normalized
         self._channels = channels
+        self._force_420 = force_420
 
     def encode(self, unischema_field, array):
-        """Encode the image using OpenCV"""
-        if unischema_field.numpy_dtype != array.dtype:
-            raise ValueError("Unexpected type of {} feature, expected {}, got {}".format(
-                unischema_field.name, unischema_field.numpy_dtype, array.dtype
-            ))
-
-        if not _is_compliant_shape(array.shape, unischema_field.shape):
-            raise ValueError("Unexpected dimensions of {} feature, expected {}, got {}".format(
-                unischema_field.name, unischema_field.shape, array.shape
-            ))
-
-        if not (len(array.shape) == 2) and not (len(array.shape) == 3 and array.shape[2] == 3):
-            raise ValueError('Unexpected image dimensions. Supported dimensions are (H, W) or (H, W, 3). '
-                             'Got {}'.format(array.shape))
+        """Encode the image using OpenCV, or libjpeg when forcing 4:2:0 chroma subsampling"""
+        _check_image(unischema_field, array)
+        if self._force_420:
+            return bytearray(encode_jpeg(array, self._quality, self._is_rgb))
 
         image_bgr_or_gray = array
         if self._is_rgb:
@@ -61,6 +54,45 @@ class Jpeg2DCTNumpyCodec(object):
         return BinaryType()
 
 
+class Jpeg2DCTSparseCodec(Jpeg2DCTNumpyCodec):
+    def __init__(self, quality=80, is_rgb=False, normalized=True, channels=3):
+        """Jpeg2DCTSparseCodec computes the quantized DCT coefficients of images as jpeg compression would, without
+        compressing them, and stores them in a compact sparse form which decodes several times faster than jpeg, for
+        about twice its size. The chroma is always subsampled 4:2:0.
+        See Jpeg2DCTNumpyCodec for the parameters.
+        """
+        super(Jpeg2DCTSparseCodec, self).__init__(quality, is_rgb, normalized, channels)
+
+    def encode(self, unischema_field, array):
+        """Compute the DCT coefficients of the image and store them"""
+        _check_image(unischema_field, array)
+        return bytearray(pixels_to_sparse(array, self._quality, self._is_rgb, self._channels))
+
+    def decode(self, unischema_field, value):
+        """read/load the dct coefficients stored by encode
+        :param unischema_field: not used, interface compatibility
+        :param value: sparse coefficients bytes
+        """
+        return tuple(loads_sparse(value, self._normalized))
+
+
+def _check_image(unischema_field, array):
+    """Raise a ValueError when the image does not match the field or is not a grayscale or 3 channels image"""
+    if unischema_field.numpy_dtype != array.dtype:
+        raise ValueError("Unexpected type of {} feature, expected {}, got {}".format(
+            unischema_field.name, unischema_field.numpy_dtype, array.dtype
+        ))
+
+    if not _is_compliant_shape(array.shape, unischema_field.shape):
+        raise ValueError("Unexpected dimensions of {} feature, expected {}, got {}".format(
+            unischema_field.name, unischema_field.shape, array.shape
+        ))
+
+    if not (len(array.shape) == 2) and not (len(array.shape) == 3 and array.shape[2] == 3):
+        raise ValueError('Unexpected image dimensions. Supported dimensions are (H, W) or (H, W, 3). '
+                         'Got {}'.format(array.shape))
+
+
 def _is_compliant_shape(a, b):
     """Compares shapes of two arguments.
     If size of a dimensions is None, this dimension size is ignored.
@@ -13,14 +13,27 @@ from __future__ import print_function
 
 import sysconfig
 
-from tensorflow import map_fn, int16
+from tensorflow.python.data.experimental.ops import error_ops
+from tensorflow.python.data.experimental.ops import grouping
+from tensorflow.python.data.experimental.ops import optimization
+from tensorflow.python.data.ops import dataset_ops
+from tensorflow.python.data.ops import readers
+from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import load_library
 from tensorflow.python.framework import ops
+from tensorflow.python.framework import tensor_shape
+from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import io_ops
+from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import parsing_ops
 from tensorflow.python.platform import resource_loader
+from tensorflow.python.util import nest
 
 
 # make sure common library is loaded
 import jpeg2dct.common
+from jpeg2dct.common import band_statistics, coefficient_indices, format_stats
 
 def get_ext_suffix():
     """Determine library extension for various versions of Python."""
@@ -60,10 +73,38 @@ def _load_library(name, op_list=None):
     return library
 
 
-TF_LIB = _load_library('tf_lib' + get_ext_suffix(), ['DecodeJpeg2dct'])
+TF_LIB = _load_library('tf_lib' + get_ext_suffix(), ['DecodeJpeg2dct', 'DecodeJpeg2dctCrop', 'DecodeJpeg2dctBatch',
+                                                 'ProbeJpeg2dct', 'Jpeg2dctStats'])
 
 
-def decode(buffer, normalized=True, channels=3, name=None):
+def _format_attrs(channels, coefficients, dtype, mean, std, target_blocks=None, target_crop='center',
+                  target_pad='zero', scale=1):
+    """:return: the coefficients, dtype, mean, std, target grid and scale attrs of the decoding ops"""
+    dtype = dtypes.as_dtype(dtype)
+    if dtype not in {dtypes.int16, dtypes.float16, dtypes.float32}:
+        raise ValueError('dtype should be int16, float16 or float32')
+    if dtype == dtypes.int16 and (mean is not None or std is not None):
+        raise ValueError('only floating point bands can be standardized')
+    if target_crop not in ('center', 'top_left', 'random'):
+        raise ValueError("target_crop should be 'center', 'top_left' or 'random'")
+    if target_pad not in ('zero', 'edge'):
+        raise ValueError("target_pad should be 'zero' or 'edge'")
+    target = []
+    if target_blocks is not None:
+        target = [int(value) for value in target_blocks]
+        if len(target) != 2 or target[0] <= 0 or target[1] <= 0:
+            raise ValueError('target_blocks should be a positive (h, w) grid of luminance blocks')
+    scale_denom = int(round(1 / scale)) if scale > 0 else 0
+    if scale_denom not in (1, 2, 4, 8) or abs(scale * scale_denom - 1) > 1e-6:
+        raise ValueError('scale should be 1, 1/2, 1/4 or 1/8')
+    mean, std = band_statistics(mean, std, channels, len(coefficients) or 64)
+    return dict(coefficients=coefficients, dtype=dtype, mean=mean.ravel().tolist(), std=std.ravel().tolist(),
+                target_blocks=target, target_crop=target_crop, target_pad=target_pad, scale_denom=scale_denom)
+
+
+def decode(buffer, normalized=True, channels=3, crop_window=None, num_coefficients=None, coefficients=None,
+           dtype=dtypes.int16, mean=None, std=None, target_blocks=None, target_crop='center', target_pad='zero',
+           scale=1, name=None):
     """
     Read/load the DCT coefficients from a string of bytes representing a JPEG image.
 
@@ -72,41 +113,245 @@ def decode(buffer, normalized=True, channels=3, name=None):
         normalized: boolean. If True, dct coefficients are normalized with quantification tables.
                     If False, no normalization is performed.
         channels: number of color channels for the decoded image.
+        crop_window: optional int32 Tensor (y, x, h, w), window of the luminance blocks to decode.
+                     The chroma bands hold the blocks covering it.
+        num_coefficients: only keep the first num_coefficients dct coefficients of each block in zigzag order.
+        coefficients: only keep the dct coefficients of each block at these indices, in the natural (row major)
+                      order of a block. Exclusive with num_coefficients, all the coefficients are kept when both
+                      are None.
+        dtype: tf.int16, tf.float16 or tf.float32. Floating point bands are dequantized while decoding when
+               normalized is True.
+        mean: per coefficient mean subtracted from floating point bands, of shape (nb dct coef,) or
+              (channels, nb dct coef). None for no standardization.
+        std: per coefficient standard deviation dividing floating point bands, of the shapes of mean.
+        target_blocks: (h, w) luminance block grid of every decoded image, which gives the outputs a static shape.
+                       The window of the image, crop_window if any, is cropped to it where it is larger and padded
+                       on the bottom and right where it is smaller, the chroma bands getting half of it rounded up.
+                       None keeps the block grid of each image.
+        target_crop: where the window of the target grid is taken in larger images, 'center', 'top_left', or
+                     'random' for a window drawn for each image.
+        target_pad: what the blocks of the target grid past smaller images hold, 'zero' for zeros or 'edge' for
+                    copies of the last block of each row and of the last row.
+        scale: 1, 1/2, 1/4 or 1/8. The bands are those of the image downscaled by it, 8x8 blocks of coefficients
+               computed from the decoded ones in the DCT domain, their block grids being divided by 1 / scale and
+               rounded up. crop_window and target_blocks are in blocks of the downscaled image.
 
     Output
        output: (dct_y, dct_c, dct_r) as Tensors of size h x w x nb dct coef.
                given an image of size 512 x 512 x 64, the dct_y will be 64 x 64 x 64 and
                dct_c, dct_r will be 32 x 32 x 64
     """
-    return TF_LIB.decode_jpeg2dct(buffer, normalized=normalized, channels=channels, name=name)
+    attrs = _format_attrs(channels, coefficient_indices(num_coefficients, coefficients), dtype, mean, std,
+                          target_blocks, target_crop, target_pad, scale)
+    if crop_window is not None:
+        return TF_LIB.decode_jpeg2dct_crop(buffer, crop_window, normalized=normalized, channels=channels, name=name,
+                                           **attrs)
+    return TF_LIB.decode_jpeg2dct(buffer, normalized=normalized, channels=channels, name=name, **attrs)
 
 
 ops.NotDifferentiable('DecodeJpeg2dct')
+ops.NotDifferentiable('DecodeJpeg2dctCrop')
 
 
-def batch_decode(buffers, normalized=True, channels=3, name=None):
+def batch_decode(buffers, normalized=True, channels=3, pad=False, num_coefficients=None, coefficients=None,
+                 dtype=dtypes.int16, mean=None, std=None, errors='raise', target_blocks=None, target_crop='center',
+                 target_pad='zero', scale=1, name=None):
     """
     Read/load the DCT coefficients from a batch of string bytes representing JPEG images.
+    The images are decoded in parallel by a single op.
 
     Arguments
         buffers: the batched tensor of JPEG buffers (batch_size,) of type tf.string
         normalized: boolean. If True, dct coefficients are normalized with quantification tables.
                     If False, no normalization is performed.
         channels: number of color channels for the decoded image.
+        pad: boolean. If True, images of different sizes are zero padded to the largest block grid of the
+             batch and the valid block grid of every band is returned as well.
+        num_coefficients: only keep the first num_coefficients dct coefficients of each block, see decode.
+        coefficients: only keep the dct coefficients of each block at these indices, see decode.
+        dtype: tf.int16, tf.float16 or tf.float32, see decode.
+        mean: per coefficient mean subtracted from floating point bands, see decode.
+        std: per coefficient standard deviation dividing floating point bands, see decode.
+        errors: what to do with the images which fail to decode: 'raise' fails the op, 'zero' zero fills their
+                slots, with a 0x0 valid block grid when pad is True, and 'drop' leaves them out of the outputs.
+                The shapes of the decoded images only are checked when pad is False.
+        target_blocks: (h, w) luminance block grid of every image, which gives the outputs a static shape, see
+                       decode.
+        target_crop: where the window of the target grid is taken in larger images, see decode.
+        target_pad: what the blocks of the target grid past smaller images hold, see decode.
+        scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see decode.
 
     Output
-       output: (batch_size, dct_y, dct_c, dct_r) as Tensors of size h x w x nb dct coef.
+       output: (dct_y, dct_c, dct_r) as Tensors of size batch_size x h x w x nb dct coef.
                given images of size 512 x 512 x 64 batched in b strings, the dct_y will be b x 64 x 64 x 64 and
                dct_c, dct_r will be b x 32 x 32 x 64
+               if pad is True, a Tensor of size batch_size x channels x 2 holds the valid (h, w) of each band
+               if errors is not 'raise', two last Tensors of size batch_size tell whether each input was decoded
+               (tf.bool) and its error message (tf.string, empty for the decoded ones)
+    """
+    if errors not in ('raise', 'zero', 'drop'):
+        raise ValueError("errors should be 'raise', 'zero' or 'drop'")
+    attrs = _format_attrs(channels, coefficient_indices(num_coefficients, coefficients), dtype, mean, std,
+                          target_blocks, target_crop, target_pad, scale)
+    bands, sizes, ok, messages = TF_LIB.decode_jpeg2dct_batch(buffers, normalized=normalized, channels=channels,
+                                                              pad=pad, skip_failures=errors != 'raise', name=name,
+                                                              **attrs)
+    outputs = tuple(bands) + ((sizes,) if pad else ())
+    if errors == 'drop':
+        outputs = tuple(array_ops.boolean_mask(output, ok) for output in outputs)
+    if errors != 'raise':
+        outputs += (ok, messages)
+    return outputs
+
+
+ops.NotDifferentiable('DecodeJpeg2dctBatch')
+
+
+def probe(buffers, name=None):
+    """
+    Read what the headers of JPEG images tell, without decoding them.
+
+    Arguments
+        buffers: tf.string Tensor of JPEG buffers, of any shape
+
+    Output
+       output: a dict of Tensors whose leading dimensions are the shape of buffers
+               size: (height, width) in pixels
+               num_components: number of color components
+               progressive: whether the image is progressive
+               decode_path: 0 when the coefficients are copied, 1 when the chroma coefficients are resampled and 2 when
+                            the image is transcoded through the pixel domain
+               blocks: (h, w) block grid of the first 3 components, zeros for missing components
+               sampling: (h, v) sampling factors of the first 3 components
+               quant_tables: the 64 quantization steps of the first 3 components, in the order of the dct coefficients
+               dct_shapes: (h, w) block grid of the 3 bands returned by decode
+    """
+    outputs = TF_LIB.probe_jpeg2dct(buffers, name=name)
+    return dict(zip(['size', 'num_components', 'progressive', 'decode_path', 'blocks', 'sampling', 'quant_tables',
+                     'dct_shapes'], outputs))
+
+
+ops.NotDifferentiable('ProbeJpeg2dct')
+
+
+def make_dataset(sources, batch_size, labels=None, record_key=None, record_features=None, normalized=True, channels=3,
+                 num_coefficients=None, coefficients=None, dtype=dtypes.int16, mean=None, std=None, bucket_blocks=8,
+                 shuffle_buffer_size=0, drop_remainder=False, errors='raise', num_parallel_calls=optimization.AUTOTUNE,
+                 seed=None, target_blocks=None, target_crop='center', target_pad='zero', scale=1):
+    """
+    Make a tf.data input pipeline decoding batches of JPEG images read from files or from TFRecords.
+
+    The block grid of every image is read from its header, and the images are grouped by block grid so that the
+    images of a batch are of similar sizes. Each batch is decoded by a single padded batch_decode op, the files, the
+    headers and the batches being read and decoded with autotuned parallelism.
+
+    Arguments
+        sources: the JPEG file names, or the TFRecord file names when record_key is given
+        batch_size: number of images of a batch
+        labels: optional labels of the images of the files, of the length of sources
+        record_key: the feature of the TFRecords holding the encoded images, None when sources are JPEG files
+        record_features: optional dict of the other features of the TFRecords to parse and batch along with the images,
+                         as given to tf.io.parse_single_example
+        normalized, channels, num_coefficients, coefficients, dtype, mean, std: see batch_decode.
+        bucket_blocks: the images whose block grids round up to the same multiple of bucket_blocks blocks are batched
+                       together, so that a batch pads each image by less than bucket_blocks blocks per dimension.
+                       1 batches images of the same block grid only.
+        shuffle_buffer_size: number of images shuffled together before being grouped, 0 to keep the order
+        drop_remainder: boolean. If True, the last incomplete batch of each group is dropped and the batch dimension
+                        of the outputs is static.
+        errors: what to do with the images which fail to be read or decoded: 'raise' fails the pipeline, 'drop'
+                leaves them out of their batch.
+        num_parallel_calls: number of files, headers and batches read or decoded in parallel, autotuned by default
+        seed: seed of the shuffling
+        target_blocks, target_crop, target_pad: fixed block grid of every image, see batch_decode. The images are then
+                                                batched in the order they come, and the bands have static shapes.
+        scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see decode. The images are grouped by their
+               downscaled block grids.
+
+    Output
+       output: a dataset of (dct_y, dct_c, dct_r, sizes) batches as returned by batch_decode with pad=True,
+               (dct_y, sizes) for a single channel, paired with the batched labels or record features when given:
+               ((dct_y, dct_c, dct_r, sizes), labels)
+    """
+    if errors not in ('raise', 'drop'):
+        raise ValueError("errors should be 'raise' or 'drop'")
+    if batch_size <= 0 or bucket_blocks <= 0:
+        raise ValueError('batch_size and bucket_blocks should be positive')
+    attrs = dict(normalized=normalized, channels=channels, num_coefficients=num_coefficients,
+                 coefficients=coefficients, dtype=dtype, mean=mean, std=std, target_blocks=target_blocks,
+                 target_crop=target_crop, target_pad=target_pad, scale=scale)
+    # checks the options before building the pipeline
+    scale_denom = _format_attrs(channels, coefficient_indices(num_coefficients, coefficients), dtype, mean, std,
+                                target_blocks, target_crop, target_pad, scale)['scale_denom']
+
+    # every element is an (image, extras...) tuple
+    if record_key is None:
+        dataset = dataset_ops.Dataset.from_tensor_slices((sources,) if labels is None else (sources, labels))
+        if shuffle_buffer_size:
+            dataset = dataset.shuffle(shuffle_buffer_size, seed=seed)
+        dataset = dataset.map(lambda source, *extras: (io_ops.read_file(source),) + extras,
+                              num_parallel_calls=num_parallel_calls)
+    else:
+        features = dict(record_features or {})
+        features[record_key] = parsing_ops.FixedLenFeature([], dtypes.string)
+
+        def parse(record):
+            parsed = parsing_ops.parse_single_example(record, features)
+            image = parsed.pop(record_key)
+            return (image, parsed) if record_features else (image,)
+
+        dataset = readers.TFRecordDataset(sources, num_parallel_reads=num_parallel_calls)
+        if shuffle_buffer_size:
+            dataset = dataset.shuffle(shuffle_buffer_size, seed=seed)
+        dataset = dataset.map(parse, num_parallel_calls=num_parallel_calls)
+
+    def with_bucket(image, *extras):
+        if target_blocks is not None:
+            # every image gets the target grid
+            return (constant_op.constant(0, dtypes.int64), image) + extras
+        blocks = (probe(image)['dct_shapes'][0] + scale_denom - 1) // scale_denom
+        buckets = math_ops.cast((blocks + bucket_blocks - 1) // bucket_blocks, dtypes.int64)
+        return (buckets[0] * (1 << 32) + buckets[1], image) + extras
+
+    dataset = dataset.map(with_bucket, num_parallel_calls=num_parallel_calls)
+    if errors == 'drop':
+        # the unreadable files and headers
+        dataset = dataset.apply(error_ops.ignore_errors())
+    dataset = dataset.apply(grouping.group_by_window(
+        key_func=lambda bucket, *_: bucket,
+        reduce_func=lambda _, window: window.batch(batch_size, drop_remainder=drop_remainder),
+        window_size=batch_size))
+
+    def decode_batch(_, images, *extras):
+        outputs = batch_decode(images, pad=True, errors=errors, **attrs)
+        bands = outputs[:channels + 1]
+        if errors == 'drop':
+            ok = outputs[channels + 1]
+            extras = nest.map_structure(lambda extra: array_ops.boolean_mask(extra, ok), extras)
+        elif drop_remainder:
+            for output in bands:
+                output.set_shape(tensor_shape.TensorShape([batch_size]).concatenate(output.shape[1:]))
+        if not extras:
+            return bands
+        return bands, extras[0]
+
+    dataset = dataset.map(decode_batch, num_parallel_calls=num_parallel_calls)
+    return dataset.prefetch(optimization.AUTOTUNE)
+
+
+def stats(reset=False, name=None):
+    """
+    Read the counters and cumulative timings of the decoders, for instance to write them as summaries.
+    They cover every image decoded in the process, by the ops and by jpeg2dct.numpy.
+
+    Arguments
+        reset: boolean. If True, the statistics are reset to zero each time the op runs.
+
+    Output
+       output: the dict of jpeg2dct.stats, whose values are scalar Tensors: int64 counters and float64 seconds
     """
-    def _decode(buffers):
-        dct_y, dct_cb, dct_cr = decode(buffers, normalized=normalized, channels=channels, name=name)
-        return dct_y, dct_cb, dct_cr
+    counters, seconds = TF_LIB.jpeg2dct_stats(reset=reset, name=name)
+    return format_stats(array_ops.unstack(counters), array_ops.unstack(seconds))
 
-    dct_y_batch, dct_c_batch, dct_r_batch = map_fn(
-        fn=_decode,
-        elems=buffers,
-        dtype=(int16, int16, int16)
-    )
 
-    return dct_y_batch, dct_c_batch, dct_r_batch
+ops.NotDifferentiable('Jpeg2dctStats')
@@ -7,11 +7,16 @@
 //See the License for the specific language governing permissions and
 //limitations under the License.
 
+#include <algorithm>
+
 #include "tensorflow/core/framework/op.h"
 #include "tensorflow/core/framework/op_kernel.h"
 #include "tensorflow/core/framework/shape_inference.h"
+#include "tensorflow/core/util/work_sharder.h"
 
+#include "../common/buffer_pool.h"
 #include "../common/dctfromjpg.h"
+#include "../common/stats.h"
 
 using namespace tensorflow;
 
@@ -20,45 +25,196 @@ namespace tensorflow {
 
 using namespace jpeg2dct::common;
 
+// read the `coefficients` attr of the decoding ops into `selection`, null
+// when every coefficient is kept
+Status GetCoefficientSelection(OpKernelConstruction *context,
+                               coefficient_selection *selection,
+                               const coefficient_selection **coefficients) {
+  std::vector<int32> indices;
+  TF_RETURN_IF_ERROR(context->GetAttr("coefficients", &indices));
+  *coefficients = nullptr;
+  if (indices.empty()) {
+    return Status::OK();
+  }
+  if (indices.size() > 64) {
+    return errors::InvalidArgument(
+        "between 1 and 64 coefficients should be selected, got ",
+        indices.size());
+  }
+  selection->count = indices.size();
+  for (size_t c = 0; c < indices.size(); c++) {
+    if (indices[c] < 0 || indices[c] >= 64) {
+      return errors::InvalidArgument("coefficient index ", indices[c],
+                                     " is out of [0, 64)");
+    }
+    selection->index[c] = indices[c];
+  }
+  *coefficients = selection;
+  return Status::OK();
+}
+
+// read the `dtype`, `mean`, `std`, target grid and scale attrs of the decoding
+// ops into `storage`, `mean` and `std` hold the statistics of the 3 bands one
+// after the other
+Status GetBandFormat(OpKernelConstruction *context, band_format *storage,
+                     const band_format **format) {
+  DataType dtype;
+  std::vector<float> mean, std;
+  std::vector<int32> target;
+  string target_crop, target_pad;
+  int32 scale_denom;
+  TF_RETURN_IF_ERROR(context->GetAttr("dtype", &dtype));
+  TF_RETURN_IF_ERROR(context->GetAttr("mean", &mean));
+  TF_RETURN_IF_ERROR(context->GetAttr("std", &std));
+  TF_RETURN_IF_ERROR(context->GetAttr("target_blocks", &target));
+  TF_RETURN_IF_ERROR(context->GetAttr("target_crop", &target_crop));
+  TF_RETURN_IF_ERROR(context->GetAttr("target_pad", &target_pad));
+  TF_RETURN_IF_ERROR(context->GetAttr("scale_denom", &scale_denom));
+  *format = nullptr;
+  storage->dtype = dtype == DT_HALF    ? DTYPE_FLOAT16
+                   : dtype == DT_FLOAT ? DTYPE_FLOAT32
+                                       : DTYPE_INT16;
+  storage->standardize = !mean.empty() || !std.empty();
+  storage->nb_coefficients = 0;
+  if (storage->standardize) {
+    if (mean.size() != std.size() || mean.size() % 3 != 0 ||
+        mean.size() > 3 * 64) {
+      return errors::InvalidArgument(
+          "mean and std should hold 3 x nb dct coef values, got ",
+          mean.size(), " and ", std.size());
+    }
+    storage->nb_coefficients = mean.size() / 3;
+    for (int i = 0; i < 3; i++) {
+      for (int c = 0; c < storage->nb_coefficients; c++) {
+        storage->mean[i][c] = mean[i * storage->nb_coefficients + c];
+        storage->std[i][c] = std[i * storage->nb_coefficients + c];
+      }
+    }
+  }
+  if (!target.empty() &&
+      (target.size() != 2 || target[0] <= 0 || target[1] <= 0)) {
+    return errors::InvalidArgument(
+        "target_blocks should be a positive (h, w) grid of blocks");
+  }
+  storage->target_h = target.empty() ? 0 : target[0];
+  storage->target_w = target.empty() ? 0 : target[1];
+  storage->crop_mode = target_crop == "top_left" ? TARGET_CROP_TOP_LEFT
+                       : target_crop == "random" ? TARGET_CROP_RANDOM
+                                                 : TARGET_CROP_CENTER;
+  storage->pad_mode = target_pad == "edge" ? TARGET_PAD_EDGE : TARGET_PAD_ZERO;
+  if (scale_denom != 1 && scale_denom != 2 && scale_denom != 4 &&
+      scale_denom != 8) {
+    return errors::InvalidArgument(
+        "scale_denom should be 1, 2, 4 or 8, got ", scale_denom);
+  }
+  storage->scale_denom = scale_denom;
+  if (storage->dtype != DTYPE_INT16 || storage->standardize ||
+      !target.empty() || scale_denom != 1) {
+    *format = storage;
+  }
+  return Status::OK();
+}
+
+// the static number of coefficients per block of the decoded bands
+Status CoefficientDim(shape_inference::InferenceContext *c, int64 *dim) {
+  std::vector<int32> indices;
+  TF_RETURN_IF_ERROR(c->GetAttr("coefficients", &indices));
+  *dim = indices.empty() ? 64 : indices.size();
+  return Status::OK();
+}
+
+// the static block grid of the band `band` of the decoded images, which is
+// known when they have a target grid: the target grid for the luminance band
+// and half of it rounded up for the chroma bands
+Status BandDims(shape_inference::InferenceContext *c, int band,
+                shape_inference::DimensionHandle *height,
+                shape_inference::DimensionHandle *width) {
+  std::vector<int32> target;
+  TF_RETURN_IF_ERROR(c->GetAttr("target_blocks", &target));
+  if (target.size() != 2) {
+    *height = *width = c->UnknownDim();
+    return Status::OK();
+  }
+  int64 target_h = target[0], target_w = target[1];
+  if (band > 0) {
+    target_h = (target_h + 1) / 2;
+    target_w = (target_w + 1) / 2;
+  }
+  *height = c->MakeDim(target_h);
+  *width = c->MakeDim(target_w);
+  return Status::OK();
+}
+
 class DecodeJpeg2dctOp : public OpKernel {
 public:
   explicit DecodeJpeg2dctOp(OpKernelConstruction *context) : OpKernel(context) {
     OP_REQUIRES_OK(context, context->GetAttr("normalized", &normalized_));
     OP_REQUIRES_OK(context, context->GetAttr("channels", &channels_));
+    OP_REQUIRES_OK(context, GetCoefficientSelection(context, &selection_,
+                                                    &coefficients_));
+    OP_REQUIRES_OK(context, GetBandFormat(context, &band_format_, &format_));
   }
 
   void Compute(OpKernelContext *context) override {
     auto &tensor = context->input(0);
     const StringPiece input = tensor.scalar<string>()();
+    char *buffer = const_cast<char *>(input.data());
+
+    // DecodeJpeg2dctCrop takes the crop window as a second input
+    crop_window window;
+    const crop_window *crop = nullptr;
+    if (context->num_inputs() > 1) {
+      auto &crop_tensor = context->input(1);
+      OP_REQUIRES(context,
+                  TensorShapeUtils::IsVector(crop_tensor.shape()) &&
+                      crop_tensor.NumElements() == 4,
+                  errors::InvalidArgument(
+                      "crop_window must be a vector of 4 elements, got shape ",
+                      crop_tensor.shape().DebugString()));
+      auto values = crop_tensor.vec<int32>();
+      window.y = values(0);
+      window.x = values(1);
+      window.h = values(2);
+      window.w = values(3);
+      crop = &window;
+    }
+
     band_info bands[3];
     try {
-      read_dct_coefficients_from_buffer_(
-          const_cast<char *>(input.data()), input.size(), normalized_,
-          (int)channels_, &bands[0], &bands[1], &bands[2]);
+      read_dct_dimensions_from_buffer_(buffer, input.size(), (int)channels_,
+                                       &bands[0], &bands[1], &bands[2], crop,
+                                       coefficients_, format_);
     } catch (std::runtime_error &e) {
       context->CtxFailure(errors::Unknown(e.what()));
       return;
     }
+    // decode straight into the output tensors
     for (int i = 0; i < channels_; i++) {
       auto &band = bands[i];
       auto band_shape = {int64(band.dct_h), int64(band.dct_w),
                          int64(band.dct_b)};
       Tensor *band_tensor;
-      auto status =
-          context->allocate_output(i, TensorShape(band_shape), &band_tensor);
-      std::memcpy((void *)band_tensor->tensor_data().data(),
-                  (const void *)band.dct, band_tensor->tensor_data().size());
-      delete [] band.dct;
-      if (!status.ok()) {
-        context->CtxFailure(status);
-        return;
-      }
+      OP_REQUIRES_OK(context, context->allocate_output(
+                                  i, TensorShape(band_shape), &band_tensor));
+      band.dct = const_cast<char *>(band_tensor->tensor_data().data());
+    }
+    try {
+      read_dct_coefficients_from_buffer_into_(
+          buffer, input.size(), normalized_, (int)channels_, &bands[0],
+          &bands[1], &bands[2], crop, coefficients_, format_);
+    } catch (std::runtime_error &e) {
+      context->CtxFailure(errors::Unknown(e.what()));
+      return;
     }
   }
 
 private:
   bool normalized_;
   int64 channels_;
+  coefficient_selection selection_;
+  const coefficient_selection *coefficients_;
+  band_format band_format_;
+  const band_format *format_;
 };
 
 REGISTER_KERNEL_BUILDER(Name("DecodeJpeg2dct").Device(DEVICE_CPU),
@@ -67,16 +223,27 @@ REGISTER_KERNEL_BUILDER(Name("DecodeJpeg2dct").Device(DEVICE_CPU),
 REGISTER_OP("DecodeJpeg2dct")
     .Attr("normalized: bool = true")
     .Attr("channels: int >= 1 = 3")
+    .Attr("coefficients: list(int) = []")
+    .Attr("dtype: {int16, half, float} = DT_INT16")
+    .Attr("mean: list(float) = []")
+    .Attr("std: list(float) = []")
+    .Attr("target_blocks: list(int) = []")
+    .Attr("target_crop: {'center', 'top_left', 'random'} = 'center'")
+    .Attr("target_pad: {'zero', 'edge'} = 'zero'")
+    .Attr("scale_denom: int = 1")
     .Input("tensor: string")
-    .Output("output: channels * int16")
+    .Output("output: channels * dtype")
     .SetShapeFn([](shape_inference::InferenceContext *c) {
-      int64 channels;
+      int64 channels, nb_coefficients;
       TF_RETURN_IF_ERROR(c->GetAttr("channels", &channels));
       if (channels != 3 && channels != 1) {
         return errors::InvalidArgument("channels should be 3 or 1");
       }
+      TF_RETURN_IF_ERROR(CoefficientDim(c, &nb_coefficients));
       for (int i = 0; i < channels; i++) {
-        c->set_output(i, c->MakeShape({c->UnknownDim(), c->UnknownDim(), 64}));
+        shape_inference::DimensionHandle height, width;
+        TF_RETURN_IF_ERROR(BandDims(c, i, &height, &width));
+        c->set_output(i, c->MakeShape({height, width, nb_coefficients}));
       }
       return Status::OK();
     })
@@ -88,6 +255,22 @@ Arguments
     normalized: boolean. If True, dct coefficients are normalized with quantification tables.
                 If False, no normalization is performed.
     channels: number of color channels for the decoded image.
+    coefficients: indices of the dct coefficients kept for each block, in the natural (row major)
+                  order of a block. Empty keeps all of them.
+    dtype: int16, float16 or float32. Floating point bands are dequantized when normalized is True.
+    mean, std: per coefficient statistics of the 3 bands, one band after the other, to standardize
+               floating point bands with. Empty for no standardization.
+    target_blocks: (h, w) luminance block grid of every decoded image, which gives the outputs a
+                   static shape. The window of the image is cropped to it where it is larger and
+                   padded on the bottom and right where it is smaller, the chroma bands getting half
+                   of it rounded up. Empty keeps the block grid of each image.
+    target_crop: where the window of the target grid is taken in larger images, 'center',
+                 'top_left', or 'random' for a window drawn for each image.
+    target_pad: what the blocks of the target grid past smaller images hold, 'zero' for zeros
+                or 'edge' for copies of the last block of each row and of the last row.
+    scale_denom: 1, 2, 4 or 8. The bands are those of the image downscaled by it, computed in
+                 the DCT domain, crop windows and target grids being in blocks of the
+                 downscaled image.
 
 Output
    output: (dct_y, dct_c, dct_r) as Tensors of size h x w x nb dct coef.
@@ -95,5 +278,577 @@ Output
            dct_c, dct_r will be 32 x 32 x 64
 )doc");
 
+REGISTER_KERNEL_BUILDER(Name("DecodeJpeg2dctCrop").Device(DEVICE_CPU),
+                        DecodeJpeg2dctOp);
+
+REGISTER_OP("DecodeJpeg2dctCrop")
+    .Attr("normalized: bool = true")
+    .Attr("channels: int >= 1 = 3")
+    .Attr("coefficients: list(int) = []")
+    .Attr("dtype: {int16, half, float} = DT_INT16")
+    .Attr("mean: list(float) = []")
+    .Attr("std: list(float) = []")
+    .Attr("target_blocks: list(int) = []")
+    .Attr("target_crop: {'center', 'top_left', 'random'} = 'center'")
+    .Attr("target_pad: {'zero', 'edge'} = 'zero'")
+    .Attr("scale_denom: int = 1")
+    .Input("tensor: string")
+    .Input("crop_window: int32")
+    .Output("output: channels * dtype")
+    .SetShapeFn([](shape_inference::InferenceContext *c) {
+      int64 channels, nb_coefficients;
+      TF_RETURN_IF_ERROR(c->GetAttr("channels", &channels));
+      if (channels != 3 && channels != 1) {
+        return errors::InvalidArgument("channels should be 3 or 1");
+      }
+      TF_RETURN_IF_ERROR(CoefficientDim(c, &nb_coefficients));
+      shape_inference::ShapeHandle crop_window;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(1), 1, &crop_window));
+      shape_inference::DimensionHandle unused;
+      TF_RETURN_IF_ERROR(c->WithValue(c->Dim(crop_window, 0), 4, &unused));
+      for (int i = 0; i < channels; i++) {
+        shape_inference::DimensionHandle height, width;
+        TF_RETURN_IF_ERROR(BandDims(c, i, &height, &width));
+        c->set_output(i, c->MakeShape({height, width, nb_coefficients}));
+      }
+      return Status::OK();
+    })
+    .Doc(R"doc(
+Read/load the DCT coefficients of a block-aligned window of a JPEG image.
+Only the rows of blocks up to the window are decoded when the image has a single scan.
+
+Arguments
+    buffer: the JPEG file buffer
+    crop_window: (y, x, h, w) window of the luminance blocks. The chroma bands hold the
+                 blocks covering it.
+    normalized: boolean. If True, dct coefficients are normalized with quantification tables.
+                If False, no normalization is performed.
+    channels: number of color channels for the decoded image.
+    coefficients: indices of the dct coefficients kept for each block, in the natural (row major)
+                  order of a block. Empty keeps all of them.
+    dtype: int16, float16 or float32. Floating point bands are dequantized when normalized is True.
+    mean, std: per coefficient statistics of the 3 bands, one band after the other, to standardize
+               floating point bands with. Empty for no standardization.
+    target_blocks: (h, w) luminance block grid of every decoded image, which gives the outputs a
+                   static shape. The window of the image is cropped to it where it is larger and
+                   padded on the bottom and right where it is smaller, the chroma bands getting half
+                   of it rounded up. Empty keeps the block grid of each image.
+    target_crop: where the window of the target grid is taken in larger images, 'center',
+                 'top_left', or 'random' for a window drawn for each image.
+    target_pad: what the blocks of the target grid past smaller images hold, 'zero' for zeros
+                or 'edge' for copies of the last block of each row and of the last row.
+    scale_denom: 1, 2, 4 or 8. The bands are those of the image downscaled by it, computed in
+                 the DCT domain, crop windows and target grids being in blocks of the
+                 downscaled image.
+
+Output
+   output: (dct_y, dct_c, dct_r) as Tensors of size h x w x nb dct coef.
+)doc");
+
+class DecodeJpeg2dctBatchOp : public OpKernel {
+public:
+  explicit DecodeJpeg2dctBatchOp(OpKernelConstruction *context)
+      : OpKernel(context), pool_(kPoolBytes) {
+    OP_REQUIRES_OK(context, context->GetAttr("normalized", &normalized_));
+    OP_REQUIRES_OK(context, context->GetAttr("channels", &channels_));
+    OP_REQUIRES_OK(context, context->GetAttr("pad", &pad_));
+    OP_REQUIRES_OK(context, context->GetAttr("skip_failures", &skip_failures_));
+    OP_REQUIRES_OK(context, GetCoefficientSelection(context, &selection_,
+                                                    &coefficients_));
+    OP_REQUIRES_OK(context, GetBandFormat(context, &band_format_, &format_));
+  }
+
+  void Compute(OpKernelContext *context) override {
+    auto &tensor = context->input(0);
+    OP_REQUIRES(context, TensorShapeUtils::IsVector(tensor.shape()),
+                errors::InvalidArgument("tensor must be 1-D, got shape ",
+                                        tensor.shape().DebugString()));
+    auto buffers = tensor.vec<string>();
+    const int64 batch_size = buffers.dimension(0);
+    auto worker_threads = context->device()->tensorflow_cpu_worker_threads();
+    std::vector<band_info> bands(3 * batch_size);
+    std::vector<string> failures(batch_size);
+
+    // read the block grids from the headers to size the outputs
+    Shard(worker_threads->num_threads, worker_threads->workers, batch_size,
+          kHeaderCost, [&](int64 start, int64 limit) {
+            for (int64 i = start; i < limit; i++) {
+              const string &input = buffers(i);
+              try {
+                read_dct_dimensions_from_buffer_(
+                    const_cast<char *>(input.data()), input.size(),
+                    (int)channels_, &bands[3 * i], &bands[3 * i + 1],
+                    &bands[3 * i + 2], nullptr, coefficients_, format_);
+              } catch (std::runtime_error &e) {
+                failures[i] = e.what();
+                // failed images take no room in the outputs
+                for (int c = 0; c < 3; c++) {
+                  bands[3 * i + c].dct_h = bands[3 * i + c].dct_w = 0;
+                }
+              }
+            }
+          });
+    if (!skip_failures_) {
+      OP_REQUIRES_OK(context, CheckFailures(failures));
+    }
+
+    band_info outputs[3];
+    OP_REQUIRES_OK(context, AllocateOutputs(context, bands, failures, outputs));
+
+    // decode every image straight into its slot of the outputs
+    Shard(worker_threads->num_threads, worker_threads->workers, batch_size,
+          kDecodeCost, [&](int64 start, int64 limit) {
+            for (int64 i = start; i < limit; i++) {
+              const string &input = buffers(i);
+              if (!failures[i].empty()) {
+                ZeroImage(i, outputs);
+                continue;
+              }
+              try {
+                DecodeImage(const_cast<char *>(input.data()), input.size(), i,
+                            &bands[3 * i], outputs);
+              } catch (std::runtime_error &e) {
+                failures[i] = e.what();
+                // the slot may have been partially written
+                ZeroImage(i, outputs);
+              }
+            }
+          });
+    if (!skip_failures_) {
+      OP_REQUIRES_OK(context, CheckFailures(failures));
+    }
+    OP_REQUIRES_OK(context, OutputStatus(context, failures));
+  }
+
+private:
+  // rough costs of reading a header and decoding an image, so that the
+  // sharder gives each thread a few images instead of tiny shards
+  static const int64 kHeaderCost = 10000;
+  static const int64 kDecodeCost = 1000000;
+  // bound on the memory kept by the pool of the padded images. The decoders
+  // themselves are kept from one image to the next by the worker threads.
+  static const size_t kPoolBytes = 64 << 20;
+
+  static Status CheckFailures(const std::vector<string> &failures) {
+    for (size_t i = 0; i < failures.size(); i++) {
+      if (!failures[i].empty()) {
+        return errors::Unknown("image ", i, ": ", failures[i]);
+      }
+    }
+    return Status::OK();
+  }
+
+  // allocate the batched band outputs and the valid sizes output, `outputs`
+  // receives the data pointer and the block grid of every batched band. The
+  // images which failed are left out of the block grid check.
+  Status AllocateOutputs(OpKernelContext *context,
+                         const std::vector<band_info> &bands,
+                         const std::vector<string> &failures,
+                         band_info *outputs) {
+    const int64 batch_size = bands.size() / 3;
+    Tensor *sizes_tensor;
+    TF_RETURN_IF_ERROR(context->allocate_output(
+        channels_, TensorShape({batch_size, channels_, 2}), &sizes_tensor));
+    auto sizes = sizes_tensor->tensor<int32, 3>();
+
+    for (int c = 0; c < channels_; c++) {
+      band_info &output = outputs[c];
+      output.dct_h = output.dct_w = 0;
+      output.dct_b = coefficients_ != nullptr ? coefficients_->count : 64;
+      bool first = true;
+      for (int64 i = 0; i < batch_size; i++) {
+        const band_info &band = bands[3 * i + c];
+        sizes(i, c, 0) = band.dct_h;
+        sizes(i, c, 1) = band.dct_w;
+        if (!failures[i].empty()) {
+          continue;
+        }
+        if (!pad_ && !first &&
+            (band.dct_h != output.dct_h || band.dct_w != output.dct_w)) {
+          return errors::InvalidArgument(
+              "image ", i, " has a ", band.dct_h, "x", band.dct_w,
+              " block grid while previous images have ", output.dct_h, "x",
+              output.dct_w,
+              ", use pad=True to batch images of different sizes");
+        }
+        first = false;
+        output.dct_h = std::max(output.dct_h, band.dct_h);
+        output.dct_w = std::max(output.dct_w, band.dct_w);
+      }
+
+      Tensor *band_tensor;
+      TF_RETURN_IF_ERROR(context->allocate_output(
+          c,
+          TensorShape({batch_size, int64(output.dct_h), int64(output.dct_w),
+                       int64(output.dct_b)}),
+          &band_tensor));
+      output.dct = const_cast<char *>(band_tensor->tensor_data().data());
+    }
+    return Status::OK();
+  }
+
+  // whether each image was decoded, and the error message of each image. The
+  // images which failed while being decoded get a 0x0 valid block grid too.
+  Status OutputStatus(OpKernelContext *context,
+                      const std::vector<string> &failures) {
+    const int64 batch_size = failures.size();
+    auto sizes = context->mutable_output(channels_)->tensor<int32, 3>();
+    Tensor *ok_tensor, *errors_tensor;
+    TF_RETURN_IF_ERROR(context->allocate_output(
+        channels_ + 1, TensorShape({batch_size}), &ok_tensor));
+    TF_RETURN_IF_ERROR(context->allocate_output(
+        channels_ + 2, TensorShape({batch_size}), &errors_tensor));
+    auto ok = ok_tensor->vec<bool>();
+    auto messages = errors_tensor->vec<string>();
+    for (int64 i = 0; i < batch_size; i++) {
+      ok(i) = failures[i].empty();
+      messages(i) = failures[i];
+      for (int c = 0; !ok(i) && c < channels_; c++) {
+        sizes(i, c, 0) = sizes(i, c, 1) = 0;
+      }
+    }
+    return Status::OK();
+  }
+
+  int64 ElementSize() const {
+    return format_ != nullptr && format_->dtype == DTYPE_FLOAT32 ? 4 : 2;
+  }
+
+  // zero fill the slot of an image in the outputs
+  void ZeroImage(int64 index, const band_info *outputs) {
+    for (int c = 0; c < channels_; c++) {
+      const int64 image_bytes = int64(outputs[c].dct_h) * outputs[c].dct_w *
+                                outputs[c].dct_b * ElementSize();
+      std::memset(static_cast<char *>(outputs[c].dct) + index * image_bytes, 0,
+                  image_bytes);
+    }
+  }
+
+  void DecodeImage(char *buffer, size_t buffer_len, int64 index,
+                   band_info *bands, const band_info *outputs) {
+    const int64 element_size = ElementSize();
+    bool padded = false;
+    for (int c = 0; c < channels_; c++) {
+      padded |= bands[c].dct_h != outputs[c].dct_h ||
+                bands[c].dct_w != outputs[c].dct_w;
+    }
+    if (!padded) {
+      for (int c = 0; c < channels_; c++) {
+        bands[c].dct = static_cast<char *>(outputs[c].dct) +
+                       index * outputs[c].dct_h * outputs[c].dct_w *
+                           outputs[c].dct_b * element_size;
+      }
+      read_dct_coefficients_from_buffer_into_(
+          buffer, buffer_len, normalized_, (int)channels_, &bands[0],
+          &bands[1], &bands[2], nullptr, coefficients_, format_);
+      return;
+    }
+
+    // smaller images are decoded aside, in buffers recycled from one batch
+    // to the next, and copied row by row, zero filling the padded area
+    {
+      pool_scope scope(&pool_);
+      read_dct_coefficients_from_buffer_(buffer, buffer_len, normalized_,
+                                         (int)channels_, &bands[0], &bands[1],
+                                         &bands[2], nullptr, coefficients_,
+                                         format_);
+    }
+    for (int c = 0; c < channels_; c++) {
+      const band_info &band = bands[c];
+      const int64 row_bytes =
+          int64(outputs[c].dct_w) * outputs[c].dct_b * element_size;
+      const int64 band_row_bytes = int64(band.dct_w) * band.dct_b * element_size;
+      char *image_output = static_cast<char *>(outputs[c].dct) +
+                           index * outputs[c].dct_h * row_bytes;
+      const char *band_data = static_cast<const char *>(band.dct);
+      for (int64 row = 0; row < outputs[c].dct_h; row++) {
+        char *row_output = image_output + row * row_bytes;
+        int64 copied = 0;
+        if (row < band.dct_h) {
+          std::memcpy(row_output, band_data + row * band_row_bytes,
+                      band_row_bytes);
+          copied = band_row_bytes;
+        }
+        std::memset(row_output + copied, 0, row_bytes - copied);
+      }
+    }
+    pool_.release(static_cast<char *>(bands[0].dct),
+                  image_bytes(&bands[0], &bands[1], &bands[2]));
+  }
+
+  bool normalized_;
+  int64 channels_;
+  bool pad_;
+  bool skip_failures_;
+  buffer_pool pool_;
+  coefficient_selection selection_;
+  const coefficient_selection *coefficients_;
+  band_format band_format_;
+  const band_format *format_;
+};
+
+REGISTER_KERNEL_BUILDER(Name("DecodeJpeg2dctBatch").Device(DEVICE_CPU),
+                        DecodeJpeg2dctBatchOp);
+
+REGISTER_OP("DecodeJpeg2dctBatch")
+    .Attr("normalized: bool = true")
+    .Attr("channels: int >= 1 = 3")
+    .Attr("pad: bool = false")
+    .Attr("skip_failures: bool = false")
+    .Attr("coefficients: list(int) = []")
+    .Attr("dtype: {int16, half, float} = DT_INT16")
+    .Attr("mean: list(float) = []")
+    .Attr("std: list(float) = []")
+    .Attr("target_blocks: list(int) = []")
+    .Attr("target_crop: {'center', 'top_left', 'random'} = 'center'")
+    .Attr("target_pad: {'zero', 'edge'} = 'zero'")
+    .Attr("scale_denom: int = 1")
+    .Input("tensor: string")
+    .Output("output: channels * dtype")
+    .Output("sizes: int32")
+    .Output("ok: bool")
+    .Output("errors: string")
+    .SetShapeFn([](shape_inference::InferenceContext *c) {
+      int64 channels, nb_coefficients;
+      TF_RETURN_IF_ERROR(c->GetAttr("channels", &channels));
+      if (channels != 3 && channels != 1) {
+        return errors::InvalidArgument("channels should be 3 or 1");
+      }
+      TF_RETURN_IF_ERROR(CoefficientDim(c, &nb_coefficients));
+      shape_inference::ShapeHandle input;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(0), 1, &input));
+      auto batch_size = c->Dim(input, 0);
+      for (int i = 0; i < channels; i++) {
+        shape_inference::DimensionHandle height, width;
+        TF_RETURN_IF_ERROR(BandDims(c, i, &height, &width));
+        c->set_output(i,
+                      c->MakeShape({batch_size, height, width, nb_coefficients}));
+      }
+      c->set_output(channels, c->MakeShape({batch_size, channels, 2}));
+      c->set_output(channels + 1, c->Vector(batch_size));
+      c->set_output(channels + 2, c->Vector(batch_size));
+      return Status::OK();
+    })
+    .Doc(R"doc(
+Read/load the DCT coefficients from a batch of strings of bytes representing JPEG images.
+The images are decoded in parallel on the intra-op thread pool.
+
+Arguments
+    tensor: the batched JPEG file buffers (batch_size,)
+    normalized: boolean. If True, dct coefficients are normalized with quantification tables.
+                If False, no normalization is performed.
+    channels: number of color channels for the decoded images.
+    pad: boolean. If True, images of different sizes are zero padded to the largest block grid
+         of the batch. If False, all images must have the same block grid.
+    skip_failures: boolean. If True, the images which fail to decode are zero filled, with a 0x0
+                   valid block grid, instead of failing the op.
+    coefficients: indices of the dct coefficients kept for each block, in the natural (row major)
+                  order of a block. Empty keeps all of them.
+    dtype: int16, float16 or float32. Floating point bands are dequantized when normalized is True.
+    mean, std: per coefficient statistics of the 3 bands, one band after the other, to standardize
+               floating point bands with. Empty for no standardization.
+    target_blocks: (h, w) luminance block grid of every decoded image, which gives the outputs a
+                   static shape. The window of the image is cropped to it where it is larger and
+                   padded on the bottom and right where it is smaller, the chroma bands getting half
+                   of it rounded up. Empty keeps the block grid of each image.
+    target_crop: where the window of the target grid is taken in larger images, 'center',
+                 'top_left', or 'random' for a window drawn for each image.
+    target_pad: what the blocks of the target grid past smaller images hold, 'zero' for zeros
+                or 'edge' for copies of the last block of each row and of the last row.
+    scale_denom: 1, 2, 4 or 8. The bands are those of the image downscaled by it, computed in
+                 the DCT domain, crop windows and target grids being in blocks of the
+                 downscaled image.
+
+Output
+   output: (dct_y, dct_c, dct_r) as Tensors of size batch_size x h x w x nb dct coef.
+   sizes: valid block grid (h, w) of every band of every image, of size batch_size x channels x 2.
+   ok: whether each image was decoded, of size batch_size.
+   errors: the error message of each image, empty for the decoded ones, of size batch_size.
+)doc");
+
+class ProbeJpeg2dctOp : public OpKernel {
+public:
+  explicit ProbeJpeg2dctOp(OpKernelConstruction *context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext *context) override {
+    auto &tensor = context->input(0);
+    auto buffers = tensor.flat<string>();
+    const int64 nb_images = buffers.size();
+    auto worker_threads = context->device()->tensorflow_cpu_worker_threads();
+    std::vector<image_info> infos(nb_images);
+    std::vector<string> failures(nb_images);
+    Shard(worker_threads->num_threads, worker_threads->workers, nb_images,
+          kProbeCost, [&](int64 start, int64 limit) {
+            for (int64 i = start; i < limit; i++) {
+              const string &input = buffers(i);
+              try {
+                probe_buffer_(const_cast<char *>(input.data()), input.size(),
+                              &infos[i]);
+              } catch (std::runtime_error &e) {
+                failures[i] = e.what();
+              }
+            }
+          });
+    for (int64 i = 0; i < nb_images; i++) {
+      OP_REQUIRES(context, failures[i].empty(),
+                  errors::Unknown("image ", i, ": ", failures[i]));
+    }
+
+    // every output has the shape of the input followed by its own dimensions
+    Tensor *outputs[kNumOutputs];
+    for (int k = 0; k < kNumOutputs; k++) {
+      TensorShape shape = tensor.shape();
+      for (int64 dim : OutputDims(k)) {
+        shape.AddDim(dim);
+      }
+      OP_REQUIRES_OK(context, context->allocate_output(k, shape, &outputs[k]));
+    }
+
+    auto size_values = outputs[0]->flat_inner_dims<int32>();
+    auto num_components = outputs[1]->flat<int32>();
+    auto progressive = outputs[2]->flat<bool>();
+    auto decode_path = outputs[3]->flat<int32>();
+    auto blocks_values = outputs[4]->flat_inner_dims<int32, 3>();
+    auto sampling_values = outputs[5]->flat_inner_dims<int32, 3>();
+    auto quant_values = outputs[6]->flat_inner_dims<int32, 3>();
+    auto shape_values = outputs[7]->flat_inner_dims<int32, 3>();
+    for (int64 i = 0; i < nb_images; i++) {
+      const image_info &info = infos[i];
+      size_values(i, 0) = info.image_h;
+      size_values(i, 1) = info.image_w;
+      num_components(i) = info.num_components;
+      progressive(i) = info.progressive;
+      decode_path(i) = info.decode_path;
+      // components past the third are left out, missing ones are zeros
+      for (int c = 0; c < 3; c++) {
+        blocks_values(i, c, 0) = info.block_h[c];
+        blocks_values(i, c, 1) = info.block_w[c];
+        sampling_values(i, c, 0) = info.h_samp[c];
+        sampling_values(i, c, 1) = info.v_samp[c];
+        for (int k = 0; k < 64; k++) {
+          quant_values(i, c, k) = info.quant_table[c][k];
+        }
+        shape_values(i, c, 0) = info.dct_h[c];
+        shape_values(i, c, 1) = info.dct_w[c];
+      }
+    }
+  }
+
+  static const int kNumOutputs = 8;
+
+  // dimensions of output `index` following the shape of the input
+  static std::vector<int64> OutputDims(int index) {
+    static const std::vector<int64> dims[kNumOutputs] = {
+        {2}, {}, {}, {}, {3, 2}, {3, 2}, {3, 64}, {3, 2}};
+    return dims[index];
+  }
+
+private:
+  static const int64 kProbeCost = 10000;
+};
+
+REGISTER_KERNEL_BUILDER(Name("ProbeJpeg2dct").Device(DEVICE_CPU),
+                        ProbeJpeg2dctOp);
+
+REGISTER_OP("ProbeJpeg2dct")
+    .Input("tensor: string")
+    .Output("size: int32")
+    .Output("num_components: int32")
+    .Output("progressive: bool")
+    .Output("decode_path: int32")
+    .Output("blocks: int32")
+    .Output("sampling: int32")
+    .Output("quant_tables: int32")
+    .Output("dct_shapes: int32")
+    .SetShapeFn([](shape_inference::InferenceContext *c) {
+      for (int k = 0; k < ProbeJpeg2dctOp::kNumOutputs; k++) {
+        std::vector<shape_inference::DimensionOrConstant> inner;
+        for (int64 dim : ProbeJpeg2dctOp::OutputDims(k)) {
+          inner.push_back(dim);
+        }
+        shape_inference::ShapeHandle shape;
+        TF_RETURN_IF_ERROR(
+            c->Concatenate(c->input(0), c->MakeShape(inner), &shape));
+        c->set_output(k, shape);
+      }
+      return Status::OK();
+    })
+    .Doc(R"doc(
+Read what the headers of JPEG images tell, without decoding them.
+The headers are read in parallel on the intra-op thread pool.
+
+Arguments
+    tensor: the JPEG file buffers, of any shape
+
+Output
+   size: (height, width) of each image in pixels.
+   num_components: number of color components of each image.
+   progressive: whether each image is progressive.
+   decode_path: how the bands are produced, 0 copies the coefficients, 1 resamples the chroma
+                coefficients and 2 transcodes the image through the pixel domain.
+   blocks: (h, w) block grid of the first 3 components of each image, zeros for missing components.
+   sampling: (h, v) sampling factors of the first 3 components of each image.
+   quant_tables: quantization steps of the first 3 components of each image, in the order of the
+                 dct coefficients.
+   dct_shapes: (h, w) block grid of the 3 bands returned by DecodeJpeg2dct for each image.
+)doc");
+
+class Jpeg2dctStatsOp : public OpKernel {
+public:
+  explicit Jpeg2dctStatsOp(OpKernelConstruction *context) : OpKernel(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("reset", &reset_));
+  }
+
+  void Compute(OpKernelContext *context) override {
+    decoder_stats stats;
+    get_decoder_stats(reset_, &stats);
+    Tensor *counters, *seconds;
+    OP_REQUIRES_OK(context, context->allocate_output(
+                                0, TensorShape({kNumCounters}), &counters));
+    OP_REQUIRES_OK(context, context->allocate_output(
+                                1, TensorShape({kNumPhases + 1}), &seconds));
+    auto counter_values = counters->vec<int64>();
+    for (int i = 0; i < kNumCounters; i++) {
+      counter_values(i) = stats.counters[i];
+    }
+    auto second_values = seconds->vec<double>();
+    for (int i = 0; i < kNumPhases; i++) {
+      second_values(i) = stats.phase_ns[i] * 1e-9;
+    }
+    second_values(kNumPhases) = stats.total_ns * 1e-9;
+  }
+
+private:
+  bool reset_;
+};
+
+REGISTER_KERNEL_BUILDER(Name("Jpeg2dctStats").Device(DEVICE_CPU),
+                        Jpeg2dctStatsOp);
+
+REGISTER_OP("Jpeg2dctStats")
+    .Attr("reset: bool = false")
+    .Output("counters: int64")
+    .Output("seconds: double")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext *c) {
+      c->set_output(0, c->Vector(kNumCounters));
+      c->set_output(1, c->Vector(kNumPhases + 1));
+      return Status::OK();
+    })
+    .Doc(R"doc(
+Read the counters and cumulative timings of the decoders, which cover every image decoded in the
+process by the ops and by jpeg2dct.numpy.
+
+Arguments
+    reset: boolean. If True, the statistics are reset to zero as they are read.
+
+Output
+   counters: images, failures, bytes, direct, resample, transcode, segmented, progressive and
+             cropped counts, see jpeg2dct.stats.
+   seconds: header, coefficients, copy, resample and transcode seconds, summed over the decoding
+            threads, followed by the total wall time of the decoding calls.
+)doc");
+
 } // namespace tensorflow
 } // namespace jpeg2dct
@@ -0,0 +1,223 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset, IterableDataset, Sampler, get_worker_info
+from torch.utils.data.dataloader import default_collate
+
+from jpeg2dct.numpy import Decoder, probe_batch
+
+
+class JpegDataset(Dataset):
+    """
+    Map-style dataset of jpeg images, returning the bytes of the images so that DCTCollate decodes each batch with a
+    single native call.
+
+    Usage:
+        dataset = JpegDataset(jpeg_files, labels)
+        loader = DataLoader(dataset, batch_sampler=BucketBatchSampler(dataset.block_grids(), 64),
+                            collate_fn=DCTCollate(num_coefficients=16), num_workers=4)
+        for dct_y, dct_cb, dct_cr, sizes, labels in loader:
+            ...
+    """
+
+    def __init__(self, sources, targets=None):
+        """
+        :param sources: list of jpg file names or of strings of bytes representing jpeg images
+        :param targets: optional list of the targets of the images, returned along with them
+        """
+        if targets is not None and len(targets) != len(sources):
+            raise ValueError('sources and targets should have the same length')
+        self.sources = sources
+        self.targets = targets
+
+    def __len__(self):
+        return len(self.sources)
+
+    def __getitem__(self, index):
+        """:return: the bytes of the image, and its target when the dataset has targets"""
+        buffer = _read(self.sources[index])
+        if self.targets is None:
+            return buffer
+        return buffer, self.targets[index]
+
+    def block_grids(self, num_threads=0, chunk_size=1024):
+        """
+        read the luminance block grid of every image from its header, to batch images of similar sizes together
+        :param num_threads: number of native threads, 0 uses all available cores
+        :param chunk_size: number of images read at once
+        :return: the int32 array of the (h, w) block grid of dct_y for each image
+        """
+        grids = np.zeros((len(self.sources), 2), dtype=np.int32)
+        for start in range(0, len(self.sources), chunk_size):
+            buffers = [_read(source) for source in self.sources[start:start + chunk_size]]
+            for i, info in enumerate(probe_batch(buffers, num_threads)):
+                grids[start + i] = info['dct_shapes'][0][:2]
+        return grids
+
+
+class IterableJpegDataset(IterableDataset):
+    """
+    Iterable dataset of jpeg images read from a stream of records, returning the bytes of the images so that
+    DCTCollate decodes each batch with a single native call. Each DataLoader worker takes every num_workers-th record.
+    """
+
+    def __init__(self, records):
+        """
+        :param records: iterable of jpg file names, of strings of bytes representing jpeg images, or of (image,
+            target) pairs of them. It is iterated over by every worker, once per epoch.
+        """
+        self.records = records
+
+    def __iter__(self):
+        worker = get_worker_info()
+        for i, record in enumerate(self.records):
+            if worker is not None and i % worker.num_workers != worker.id:
+                continue
+            if isinstance(record, tuple):
+                yield (_read(record[0]),) + record[1:]
+            else:
+                yield _read(record)
+
+
+class DCTCollate(object):
+    """
+    Collate function of the jpeg datasets, decoding a batch of images with a single native call into one batched
+    tensor per band.
+
+    The bands are decoded into numpy arrays shared with the returned tensors, of size n x nb dct coef x h x w in
+    channels last memory format, the images smaller than the largest block grid of the batch being zero padded. The
+    images of the largest block grid are decoded in place and the others copied once.
+    """
+
+    def __init__(self, normalized=True, channels=3, num_coefficients=None, coefficients=None, dtype=np.int16,
+                 mean=None, std=None, num_threads=0, errors='raise', pool_bytes=64 * 1024 ** 2, target_blocks=None,
+                 target_crop='center', target_pad='zero', scale=1):
+        """
+        :param normalized: boolean. If True, dct coefficients are normalized with quantification tables. If False, no normalization is performed.
+        :param channels: number of color channels for the decoded images
+        :param num_coefficients: number of dct coefficients kept in zigzag order, see jpeg2dct.numpy.loads
+        :param coefficients: indices of the dct coefficients kept, see jpeg2dct.numpy.loads
+        :param dtype: type of the bands, see jpeg2dct.numpy.loads
+        :param mean: per coefficient mean subtracted from floating point bands, see jpeg2dct.numpy.loads
+        :param std: per coefficient standard deviation dividing floating point bands, see jpeg2dct.numpy.loads
+        :param num_threads: number of native decoding threads, 0 uses all available cores. 1 suits DataLoaders with
+            several workers.
+        :param errors: what to do with the images which fail to decode, see jpeg2dct.numpy.loads_batch_padded. Their
+            targets are dropped along with them.
+        :param pool_bytes: bound on the memory kept to decode the padded images, see jpeg2dct.numpy.Decoder
+        :param target_blocks: (h, w) luminance block grid of every image, which gives every batch the same shape,
+            see jpeg2dct.numpy.loads
+        :param target_crop: where the window of the target grid is taken in larger images, see jpeg2dct.numpy.loads
+        :param target_pad: what the blocks of the target grid past smaller images hold, see jpeg2dct.numpy.loads
+        :param scale: 1, 1/2, 1/4 or 1/8, the scale of the decoded images, see jpeg2dct.numpy.loads
+        """
+        self._options = dict(normalized=normalized, channels=channels, num_coefficients=num_coefficients,
+                             coefficients=coefficients, dtype=dtype, mean=mean, std=std, pool_bytes=pool_bytes,
+                             target_blocks=target_blocks, target_crop=target_crop, target_pad=target_pad,
+                             scale=scale)
+        self._decoder = Decoder(**self._options)
+        self.num_threads = num_threads
+        self.errors = errors
+
+    def __getstate__(self):
+        # the decoder is created again in the worker processes
+        state = dict(self.__dict__)
+        state['_decoder'] = None
+        return state
+
+    def __call__(self, samples):
+        """
+        :param samples: the images returned by a jpeg dataset, (image, target...) tuples when it has targets
+        :return: (dct_y, dct_c, dct_r, sizes) as tensors, dct_y being of size n x nb dct coef x h x w and sizes the
+            n x channels x 2 int32 tensor of the valid (h, w) block grid of each band, (dct_y, sizes) for a single
+            channel. The collated targets follow when the samples have targets, then ok and messages when errors is
+            not 'raise', see jpeg2dct.numpy.loads_batch_padded.
+        """
+        if self._decoder is None:
+            self._decoder = Decoder(**self._options)
+        with_targets = len(samples) > 0 and isinstance(samples[0], tuple)
+        buffers = [sample[0] for sample in samples] if with_targets else samples
+        outputs = self._decoder.loads_batch_padded(buffers, self.num_threads, self.errors)
+        channels = self._decoder.channels
+        bands = [torch.from_numpy(band).permute(0, 3, 1, 2) for band in outputs[:channels]]
+        result = tuple(bands) + (torch.from_numpy(outputs[channels]),)
+        if with_targets:
+            if self.errors == 'drop':
+                ok = outputs[channels + 1]
+                samples = [sample for sample, decoded in zip(samples, ok) if decoded]
+            targets = default_collate([sample[1:] for sample in samples]) if samples else []
+            result += tuple(targets)
+        if self.errors != 'raise':
+            result += (torch.from_numpy(outputs[channels + 1]), outputs[channels + 2])
+        return result
+
+
+class BucketBatchSampler(Sampler):
+    """
+    Batch sampler grouping images of similar block grids, so that padding each batch to its largest image costs
+    little. The shuffled indices are split into pools of pool_batches batches, each pool is sorted by block grid and
+    cut into batches, and the batches are shuffled.
+    """
+
+    def __init__(self, block_grids, batch_size, shuffle=True, drop_last=False, pool_batches=100, seed=0):
+        """
+        :param block_grids: the (h, w) block grid of each image of the dataset, see JpegDataset.block_grids
+        :param batch_size: number of images of a batch
+        :param shuffle: boolean. If True, the images and batches are shuffled at each epoch, otherwise the images are
+            sorted within each pool in the order of the dataset
+        :param drop_last: boolean. If True, the last batch is dropped when it is smaller than batch_size
+        :param pool_batches: number of batches of a pool, larger pools pad less but mix the sizes less
+        :param seed: seed of the shuffling, combined with the epoch
+        """
+        if batch_size <= 0 or pool_batches <= 0:
+            raise ValueError('batch_size and pool_batches should be positive')
+        self.block_grids = np.asarray(block_grids, dtype=np.int64).reshape(-1, 2)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.pool_batches = pool_batches
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch):
+        """set the epoch of the next iteration, which is incremented after each one"""
+        self.epoch = epoch
+
+    def __iter__(self):
+        random = np.random.RandomState((self.seed + self.epoch) % 2 ** 32)
+        self.epoch += 1
+        indices = random.permutation(len(self.block_grids)) if self.shuffle else np.arange(len(self.block_grids))
+        pool_size = self.batch_size * self.pool_batches
+        batches = []
+        for start in range(0, len(indices), pool_size):
+            pool = indices[start:start + pool_size]
+            grids = self.block_grids[pool]
+            pool = pool[np.lexsort((grids[:, 1], grids[:, 0]))]
+            batches.extend(pool[i:i + self.batch_size] for i in range(0, len(pool), self.batch_size))
+        if self.drop_last and batches and len(batches[-1]) < self.batch_size:
+            batches.pop()
+        if self.shuffle:
+            random.shuffle(batches)
+        for batch in batches:
+            yield batch.tolist()
+
+    def __len__(self):
+        if self.drop_last:
+            return len(self.block_grids) // self.batch_size
+        return -(-len(self.block_grids) // self.batch_size)
+
+
+def _read(source):
+    """:return: the bytes of a jpg file, or source itself when it is not a file name"""
+    if isinstance(source, str):
+        with open(source, 'rb') as src:
+            return src.read()
+    return source
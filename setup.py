@@ -42,7 +42,7 @@ def check_tf_version():
 
 def get_cpp_flags(build_ext):
     last_err = None
-    default_flags = ['-std=c++11', '-fPIC', '-O2']
+    default_flags = ['-std=c++11', '-fPIC', '-O2', '-pthread']
     if sys.platform == 'darwin':
         # Darwin most likely will have Clang, which has libc++.
         flags_to_try = [default_flags + ['-stdlib=libc++'], default_flags]
@@ -198,7 +198,7 @@ def get_common_options(build_ext):
     INCLUDES = [] + get_conda_include_dir()
     SOURCES = []
     COMPILE_FLAGS = cpp_flags
-    LINK_FLAGS = []
+    LINK_FLAGS = ['-pthread']
     LIBRARY_DIRS = []
     LIBRARIES = []
 
@@ -214,7 +214,15 @@ def get_common_options(build_ext):
 def build_common_extension(build_ext, options, abi_compile_flags):
     common_lib.define_macros = options['MACROS']
     common_lib.include_dirs = options['INCLUDES']
-    common_lib.sources = options['SOURCES'] + ['jpeg2dct/common/dctfromjpg.cc']
+    common_lib.sources = options['SOURCES'] + ['jpeg2dct/common/buffer_pool.cc',
+                                               'jpeg2dct/common/dctfromjpg.cc',
+                                               'jpeg2dct/common/encode.cc',
+                                               'jpeg2dct/common/mapped_file.cc',
+                                               'jpeg2dct/common/parallel.cc',
+                                               'jpeg2dct/common/resample.cc',
+                                               'jpeg2dct/common/restart.cc',
+                                               'jpeg2dct/common/sparse.cc',
+                                               'jpeg2dct/common/stats.cc']
     common_lib.extra_compile_args = options['COMPILE_FLAGS'] + \
                                    abi_compile_flags
     common_lib.extra_link_args = options['LINK_FLAGS']
@@ -0,0 +1,77 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from jpeg2dct.numpy import load, set_chroma_resampling
+from jpeg2dct.numpy.cache import DCTCache
+
+
+class TestCache(TestCase):
+    def setUp(self):
+        cur_dir = os.path.dirname(os.path.realpath(__file__))
+        self.jpeg_file = os.path.join(cur_dir, '..', 'data', 'DCT_16_16.jpg')
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hit_and_miss(self):
+        cache = DCTCache(self.directory, max_bytes=1 << 30)
+        expected = load(self.jpeg_file)
+        for _ in range(2):
+            bands = cache.load(self.jpeg_file)
+            for band, expected_band in zip(bands, expected):
+                np.testing.assert_array_equal(band, expected_band)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsInstance(bands[0], np.memmap)
+        self.assertFalse(bands[0].flags.writeable)
+
+        # the settings are part of the key
+        dct_y, = cache.load(self.jpeg_file, channels=1)
+        np.testing.assert_array_equal(dct_y, expected[0])
+        cache.load(self.jpeg_file, normalized=False)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+        # the store is shared with other instances
+        other = DCTCache(self.directory, max_bytes=1 << 30)
+        other.load(self.jpeg_file, channels=1)
+        self.assertEqual((other.hits, other.misses), (1, 0))
+
+        # so are the process wide settings changing the coefficients
+        set_chroma_resampling(False)
+        try:
+            other.load(self.jpeg_file, channels=1)
+        finally:
+            set_chroma_resampling(True)
+        other.load(self.jpeg_file, channels=1)
+        self.assertEqual((other.hits, other.misses), (2, 1))
+
+    def test_eviction(self):
+        cache = DCTCache(self.directory, max_bytes=1 << 30)
+        cache.load(self.jpeg_file)
+        cache.clear()
+        self.assertEqual(os.listdir(self.directory), [])
+
+        # room for a single entry, normalized and unnormalized coefficients have the same size
+        cache.load(self.jpeg_file)
+        entry_size = sum(os.path.getsize(os.path.join(self.directory, name))
+                         for name in os.listdir(self.directory) if name.endswith('.dct'))
+        cache = DCTCache(self.directory, max_bytes=int(1.5 * entry_size))
+        cache.load(self.jpeg_file, normalized=False)
+        self.assertEqual(cache.evictions, 1)
+        cache.load(self.jpeg_file, normalized=False)
+        cache.load(self.jpeg_file)
+        self.assertEqual(cache.evictions, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
@@ -8,9 +8,23 @@
 # limitations under the License.
 
 import os
+import re
+import shutil
+import tarfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
-from jpeg2dct.numpy import load, loads
+import numpy as np
+
+import jpeg2dct
+from jpeg2dct.common import ZIGZAG_ORDER
+from jpeg2dct.numpy import (load, loads, load_many, load_dir, iter_decode,
+                            jpeg_to_sparse, loads_sparse, pixels_to_dct, pixels_to_sparse, encode_jpeg,
+                            load_batch, loads_batch, loads_batch_padded, Decoder,
+                            dct_shapes, loads_into, image_buffer, bands_from_buffer,
+                            probe, probe_batch,
+                            set_chroma_resampling, set_segment_threads, add_restart_markers, set_accept_truncated)
 
 
 class TestLoad(TestCase):
@@ -24,6 +38,9 @@ class TestLoad(TestCase):
         self.jpeg_file_440 = os.path.join(cur_dir, '..', 'data', 'DCT_16_16_440.jpg')
         self.jpeg_file_444 = os.path.join(cur_dir, '..', 'data', 'DCT_16_16_444.jpg')
 
+        self.color_files = {sampling: os.path.join(cur_dir, '..', 'data', 'color_{}.jpg'.format(sampling))
+                            for sampling in ['411', '420', '422', '440', '444']}
+
     def test_load(self):
         dct_y, dct_c, dct_r = load(self.jpeg_file)
         self.assertEqual(dct_y.shape, (205, 205, 64), "wrong dct shape")
@@ -42,6 +59,109 @@ class TestLoad(TestCase):
                             unnormalized_range[1] <= normalized_range[1],
                             "normalized shall produce large range of values")
 
+    def test_load_many(self):
+        jpeg_files = [self.jpeg_file, self.jpeg_file_420, self.color_files['422']]
+        for prefetch in [0, 1, 8]:
+            images = list(load_many(jpeg_files, prefetch=prefetch, num_coefficients=4))
+            self.assertEqual(len(images), 3)
+            for image, jpeg_file in zip(images, jpeg_files):
+                for band, expected_band in zip(image, load(jpeg_file, num_coefficients=4)):
+                    np.testing.assert_array_equal(band, expected_band)
+        # the options are those of load
+        options = dict(target_blocks=(16, 24), target_pad='edge', scale=0.5, dtype=np.float32)
+        for image, jpeg_file in zip(load_many(jpeg_files, **options), jpeg_files):
+            for band, expected_band in zip(image, load(jpeg_file, **options)):
+                np.testing.assert_array_equal(band, expected_band)
+
+        directory = tempfile.mkdtemp()
+        try:
+            for name in ['b.JPG', 'a.jpeg', 'c.png']:
+                shutil.copy(self.color_files['420'], os.path.join(directory, name))
+            images = list(load_dir(directory, channels=1))
+            self.assertEqual([os.path.basename(filename) for filename, _ in images], ['a.jpeg', 'b.JPG'])
+            self.assertEqual(images[0][1][0].shape, (19, 26, 64))
+            images = list(load_dir(directory, channels=1, scale=0.25))
+            self.assertEqual(images[0][1][0].shape, (5, 7, 64))
+        finally:
+            shutil.rmtree(directory)
+
+        with self.assertRaises(ValueError):
+            load_many(jpeg_files, channels=2)
+        with self.assertRaises(ValueError):
+            load_dir(os.path.dirname(self.jpeg_file), scale=0.3)
+        with self.assertRaises(IOError):
+            list(load_many([self.jpeg_file, self.jpeg_file + '.missing']))
+        with self.assertRaises(IOError):
+            load(self.jpeg_file + '.missing')
+        with self.assertRaises(IOError):
+            load(os.path.dirname(self.jpeg_file))
+
+    def test_iter_decode(self):
+        jpeg_files = [self.jpeg_file_420] + [self.color_files[sampling] for sampling in sorted(self.color_files)]
+        expected = [load(jpeg_file, num_coefficients=8) for jpeg_file in jpeg_files]
+        for workers in [1, 4]:
+            images = list(iter_decode(jpeg_files, prefetch=2, workers=workers, num_coefficients=8))
+            self.assertEqual([image[0] for image in images], jpeg_files)
+            for image, expected_bands in zip(images, expected):
+                for band, expected_band in zip(image[1:], expected_bands):
+                    np.testing.assert_array_equal(band, expected_band)
+
+        # the options are those of load
+        options = dict(target_blocks=(12, 16), target_crop='top_left', scale=0.5, dtype=np.float16)
+        for image, jpeg_file in zip(iter_decode(jpeg_files, workers=2, **options), jpeg_files):
+            for band, expected_band in zip(image[1:], load(jpeg_file, **options)):
+                np.testing.assert_array_equal(band, expected_band)
+
+        pattern = os.path.join(os.path.dirname(self.jpeg_file), 'color_*.jpg')
+        self.assertEqual([key for key, _ in iter_decode(pattern, channels=1)], jpeg_files[1:])
+
+        directory = tempfile.mkdtemp()
+        try:
+            # WebDataset layout, the labels are skipped
+            shard_file = os.path.join(directory, 'shard-000.tar')
+            with tarfile.open(shard_file, 'w') as shard:
+                for i, jpeg_file in enumerate(jpeg_files):
+                    shard.add(jpeg_file, 'train/{:04d}.jpg'.format(i))
+                    label_file = os.path.join(directory, 'label')
+                    with open(label_file, 'w') as label:
+                        label.write(str(i))
+                    shard.add(label_file, 'train/{:04d}.cls'.format(i))
+            images = list(iter_decode([shard_file, self.jpeg_file_420], workers=2, num_coefficients=8))
+            self.assertEqual([image[0] for image in images],
+                             ['train/{:04d}'.format(i) for i in range(len(jpeg_files))] + [self.jpeg_file_420])
+            for image, expected_bands in zip(images, expected + expected[:1]):
+                np.testing.assert_array_equal(image[1], expected_bands[0])
+
+            # decoding errors name their image
+            bad_file = os.path.join(directory, 'bad.jpg')
+            with open(bad_file, 'wb') as bad:
+                bad.write(b'not a jpeg')
+            with tarfile.open(shard_file, 'w') as shard:
+                shard.add(bad_file, 'train/bad.jpg')
+            with self.assertRaisesRegex(RuntimeError, '^train/bad: Not a JPEG file'):
+                list(iter_decode(shard_file))
+            with self.assertRaisesRegex(RuntimeError, '^{}: Not a JPEG file'.format(re.escape(bad_file))):
+                list(load_dir(directory))
+        finally:
+            shutil.rmtree(directory)
+
+        # stopping early does not wait for the whole dataset
+        images = iter_decode(jpeg_files * 100, prefetch=2)
+        next(images)
+        images.close()
+
+        with self.assertRaises(IOError):
+            list(iter_decode([self.jpeg_file_420, self.jpeg_file + '.missing']))
+        # the errors of a single image are those of the decoder, without an index
+        with self.assertRaisesRegex(RuntimeError, '^Not a JPEG file'):
+            loads(b'not a jpeg')
+        with self.assertRaisesRegex(RuntimeError, '^Not a JPEG file'):
+            Decoder().loads(b'not a jpeg')
+        with self.assertRaises(ValueError):
+            iter_decode(jpeg_files, prefetch=0)
+        with self.assertRaises(ValueError):
+            iter_decode(jpeg_files, target_blocks=(0, 4))
+
     def test_loads(self):
         with open(self.jpeg_file, 'rb') as src:
             buffer = src.read()
@@ -93,3 +213,618 @@ class TestLoad(TestCase):
         self.assertEqual(dct_c.shape, (25, 38, 64), "wrong dct shape")
         self.assertEqual(dct_r.shape, (25, 38, 64), "wrong dct shape")
 
+    def test_chroma_resampling(self):
+        ref_y, ref_c, ref_r = load(self.color_files['420'])
+        for sampling in ['411', '422', '440', '444']:
+            for enabled in [True, False]:
+                set_chroma_resampling(enabled)
+                try:
+                    dct_y, dct_c, dct_r = load(self.color_files[sampling])
+                finally:
+                    set_chroma_resampling(True)
+                self.assertEqual(dct_y.shape, (19, 26, 64), "wrong dct shape")
+                self.assertEqual(dct_c.shape, (10, 13, 64), "wrong dct shape")
+                self.assertEqual(dct_r.shape, (10, 13, 64), "wrong dct shape")
+                if enabled:
+                    # the luminance is left untouched and the chroma is close to a native 4:2:0 encoding
+                    np.testing.assert_array_equal(dct_y, ref_y)
+                    for dct, ref in [(dct_c, ref_c), (dct_r, ref_r)]:
+                        self.assertLess(np.abs(dct.astype(np.float32) - ref).mean(), 2.0,
+                                        "resampled chroma too far from 4:2:0 chroma")
+
+    def test_crop(self):
+        for jpeg_file in [self.jpeg_file, self.color_files['420'], self.color_files['444']]:
+            with open(jpeg_file, 'rb') as src:
+                buffer = src.read()
+            dct_y, dct_c, dct_r = loads(buffer)
+            for y, x, h, w in [(0, 0, 4, 6), (5, 3, 8, 7), (2, 2, dct_y.shape[0] - 2, dct_y.shape[1] - 2)]:
+                crop = (y, x, h, w)
+                crop_y, crop_c, crop_r = loads(buffer, crop=crop)
+                self.assertEqual([band.shape for band in (crop_y, crop_c, crop_r)],
+                                 dct_shapes(buffer, crop=crop), "wrong dct shape")
+                np.testing.assert_array_equal(crop_y, dct_y[y:y + h, x:x + w])
+                chroma = slice(y // 2, (y + h + 1) // 2), slice(x // 2, (x + w + 1) // 2)
+                np.testing.assert_array_equal(crop_c, dct_c[chroma])
+                np.testing.assert_array_equal(crop_r, dct_r[chroma])
+
+        crop_y, = load(self.jpeg_file, channels=1, crop=(10, 20, 30, 40))
+        self.assertEqual(crop_y.shape, (30, 40, 64), "wrong dct shape")
+        with self.assertRaises(RuntimeError):
+            load(self.jpeg_file, crop=(200, 0, 10, 10))
+        with self.assertRaises(ValueError):
+            load(self.jpeg_file, crop=(0, 0, 0, 10))
+
+        # the decoder cached by the thread is reusable after the error
+        expected = load(self.jpeg_file_420)
+        for _ in range(3):
+            with self.assertRaises(RuntimeError):
+                load(self.jpeg_file_420, crop=(0, 100, 10, 10))
+            for band, expected_band in zip(load(self.jpeg_file_420), expected):
+                np.testing.assert_array_equal(band, expected_band)
+
+    def test_target_blocks(self):
+        for jpeg_file in [self.jpeg_file, self.color_files['420'], self.color_files['422']]:
+            with open(jpeg_file, 'rb') as src:
+                buffer = src.read()
+            dct_y, dct_c, dct_r = loads(buffer)
+            height, width = dct_y.shape[:2]
+            # cropped along the height and padded along the width
+            target = (height - 5, width + 3)
+            for target_crop, y in [('top_left', 0), ('center', 2)]:
+                for target_pad in ['zero', 'edge']:
+                    bands = loads(buffer, target_blocks=target, target_crop=target_crop, target_pad=target_pad)
+                    self.assertEqual([band.shape for band in bands],
+                                     [target + (64,)] + [((target[0] + 1) // 2, (target[1] + 1) // 2, 64)] * 2)
+                    chroma_rows = slice(y // 2, (y + target[0] + 1) // 2)
+                    for band, full_band, rows in zip(bands, (dct_y, dct_c, dct_r),
+                                                     (slice(y, y + target[0]), chroma_rows, chroma_rows)):
+                        expected_band = full_band[rows][:band.shape[0]]
+                        h, w = expected_band.shape[:2]
+                        np.testing.assert_array_equal(band[:h, :w], expected_band)
+                        if target_pad == 'zero':
+                            self.assertFalse(band[:, w:].any() or band[h:].any())
+                        else:
+                            np.testing.assert_array_equal(band[:h, w:], np.repeat(expected_band[:, -1:],
+                                                                                 band.shape[1] - w, axis=1))
+                            np.testing.assert_array_equal(band[h:], np.repeat(band[h - 1:h], band.shape[0] - h,
+                                                                              axis=0))
+
+        # within a crop window, in any format
+        crop_y, = load(self.jpeg_file, channels=1, crop=(10, 20, 30, 40), target_blocks=(16, 16),
+                       target_crop='center', dtype=np.float32, num_coefficients=8)
+        np.testing.assert_array_equal(crop_y, load(self.jpeg_file, channels=1, crop=(17, 32, 16, 16),
+                                                   dtype=np.float32, num_coefficients=8)[0])
+        # random windows stay within the image
+        dct_y, = load(self.jpeg_file, channels=1)
+        for _ in range(5):
+            crop_y, = load(self.jpeg_file, channels=1, target_blocks=(200, 200), target_crop='random')
+            self.assertTrue(any(np.array_equal(crop_y, dct_y[y:y + 200, x:x + 200])
+                                for y in range(6) for x in range(6)))
+
+        # every image of a batch gets the target grid, and padded batches decode in place
+        buffers = []
+        for jpeg_file in [self.jpeg_file, self.jpeg_file_420]:
+            with open(jpeg_file, 'rb') as src:
+                buffers.append(src.read())
+        dct_y, dct_c, dct_r = loads_batch(buffers, target_blocks=(64, 64), num_threads=2)
+        self.assertEqual(dct_y.shape, (2, 64, 64, 64), "wrong dct shape")
+        self.assertEqual(dct_c.shape, (2, 32, 32, 64), "wrong dct shape")
+        for i, buffer in enumerate(buffers):
+            np.testing.assert_array_equal(dct_y[i], loads(buffer, target_blocks=(64, 64))[0])
+        padded_y, _, _, sizes = Decoder(target_blocks=(64, 64)).loads_batch_padded(buffers)
+        np.testing.assert_array_equal(padded_y, dct_y)
+        self.assertEqual(sizes[:, 0].tolist(), [[64, 64]] * 2)
+
+        with self.assertRaises(ValueError):
+            loads(buffers[0], target_blocks=(0, 10))
+        with self.assertRaises(ValueError):
+            loads(buffers[0], target_blocks=(10, 10), target_crop='bottom')
+        with self.assertRaises(ValueError):
+            loads(buffers[0], target_blocks=(10, 10), target_pad='reflect')
+
+    def test_scale(self):
+        for jpeg_file in [self.jpeg_file, self.color_files['420'], self.color_files['422']]:
+            dct_y, dct_c, dct_r = load(jpeg_file)
+            for denom in [2, 4, 8]:
+                bands = load(jpeg_file, scale=1.0 / denom)
+                for band, full_band in zip(bands, (dct_y, dct_c, dct_r)):
+                    self.assertEqual(band.shape[:2], tuple(-(-size // denom) for size in full_band.shape[:2]),
+                                     "wrong dct shape")
+                # the dc coefficient of a block is the mean of those of the full blocks it covers
+                h, w = bands[0].shape[0] - 1, bands[0].shape[1] - 1
+                expected_dc = dct_y[:h * denom, :w * denom, 0].reshape(h, denom, w, denom).mean(axis=(1, 3))
+                self.assertLess(np.abs(bands[0][:h, :w, 0] - expected_dc).max(), 2)
+
+        # crop windows are in blocks of the downscaled image
+        dct_y, dct_c, _ = load(self.jpeg_file_420, scale=0.5)
+        crop_y, crop_c, _ = load(self.jpeg_file_420, scale=0.5, crop=(4, 6, 10, 12))
+        np.testing.assert_array_equal(crop_y, dct_y[4:14, 6:18])
+        np.testing.assert_array_equal(crop_c, dct_c[2:7, 3:9])
+        target_y, = load(self.jpeg_file, channels=1, scale=0.25, target_blocks=(32, 64))
+        self.assertEqual(target_y.shape, (32, 64, 64), "wrong dct shape")
+
+        with self.assertRaises(ValueError):
+            load(self.jpeg_file, scale=0.3)
+
+    def test_restart_segments(self):
+        for jpeg_file in [self.jpeg_file, self.color_files['420']]:
+            with open(jpeg_file, 'rb') as src:
+                buffer = src.read()
+            expected = loads(buffer)
+            for restart_rows in [1, 3]:
+                restarted = add_restart_markers(buffer, restart_rows)
+                self.assertIn(b'\xff\xd0', restarted, "restart markers expected")
+                for num_threads in [1, 4]:
+                    set_segment_threads(num_threads)
+                    try:
+                        bands = loads(restarted)
+                        dct_y, = loads(restarted, channels=1)
+                    finally:
+                        set_segment_threads(1)
+                    for band, expected_band in zip(bands, expected):
+                        np.testing.assert_array_equal(band, expected_band)
+                    np.testing.assert_array_equal(dct_y, expected[0])
+
+    def test_probe(self):
+        buffers = []
+        for jpeg_file in [self.jpeg_file, self.color_files['420'], self.color_files['444']]:
+            with open(jpeg_file, 'rb') as src:
+                buffers.append(src.read())
+        infos = probe_batch(buffers, num_threads=2)
+        self.assertEqual([info['size'] for info in infos], [probe(buffer)['size'] for buffer in buffers])
+        self.assertEqual([info['decode_path'] for info in infos], ['direct', 'direct', 'resample'])
+        self.assertEqual([info['num_components'] for info in infos], [1, 3, 3])
+
+        info = infos[1]
+        self.assertEqual(info['size'], (147, 203))
+        self.assertFalse(info['progressive'])
+        self.assertEqual([component['sampling'] for component in info['components']], [(2, 2), (1, 1), (1, 1)])
+        self.assertEqual([component['blocks'] for component in info['components']], [(19, 26), (10, 13), (10, 13)])
+
+        for buffer, info in zip(buffers, infos):
+            self.assertEqual(info['dct_shapes'], dct_shapes(buffer))
+            # the quantization tables are in the order of the coefficients
+            dct_y = loads(buffer, channels=1)[0]
+            unnormalized_y = loads(buffer, normalized=False, channels=1)[0]
+            np.testing.assert_array_equal(dct_y, unnormalized_y * info['components'][0]['quant_table'].astype(np.int16))
+
+        with self.assertRaises(RuntimeError):
+            probe(b'not a jpeg')
+
+        # an undefined quantization table selector in the frame header is only caught when decoding
+        corrupted = bytearray(encode_jpeg(np.zeros((32, 32, 3), dtype=np.uint8)))
+        corrupted[corrupted.index(b'\xff\xc0') + 12] = 0xef
+        corrupted = bytes(corrupted)
+        for info in (probe(corrupted), probe_batch([corrupted])[0]):
+            self.assertEqual(info['size'], (32, 32))
+            self.assertFalse(info['components'][0]['quant_table'].any())
+        with self.assertRaises(RuntimeError):
+            loads(corrupted)
+
+    def test_stats(self):
+        buffers = {}
+        for sampling in ['420', '422']:
+            with open(self.color_files[sampling], 'rb') as src:
+                buffers[sampling] = src.read()
+        traces = []
+        jpeg2dct.reset_stats()
+        jpeg2dct.set_trace_hook(traces.append)
+        try:
+            loads(buffers['420'])
+            loads(buffers['422'], crop=(0, 0, 2, 2))
+            loads_batch([buffers['420']] * 3, num_threads=2)
+            with self.assertRaises(RuntimeError):
+                loads(b'not a jpeg')
+        finally:
+            jpeg2dct.set_trace_hook(None)
+
+        stats = jpeg2dct.stats(reset=True)
+        self.assertEqual(stats['images'], 5)
+        self.assertEqual(stats['failures'], 1)
+        self.assertEqual(stats['bytes'], 4 * len(buffers['420']) + len(buffers['422']) + len(b'not a jpeg'))
+        self.assertEqual(stats['decode_paths'], {'direct': 4, 'resample': 1, 'transcode': 0})
+        self.assertEqual(stats['cropped'], 1)
+        self.assertEqual(stats['progressive'], 0)
+        for phase in ['header', 'coefficients', 'copy', 'resample', 'total']:
+            self.assertGreater(stats['seconds'][phase], 0, phase)
+        self.assertEqual(jpeg2dct.stats()['images'], 0)
+
+        self.assertEqual(len(traces), 6)
+        self.assertEqual([trace['decode_path'] for trace in traces[:2]], ['direct', 'resample'])
+        self.assertEqual(traces[0]['size'], (147, 203))
+        self.assertEqual(traces[0]['bytes'], len(buffers['420']))
+        self.assertIsNone(traces[0]['error'])
+        self.assertTrue(traces[1]['cropped'])
+        self.assertGreater(traces[1]['seconds']['resample'], 0)
+        self.assertIsNone(traces[-1]['decode_path'])
+        self.assertIn('Not a JPEG file', traces[-1]['error'])
+
+        with self.assertRaises(ValueError):
+            jpeg2dct.set_trace_hook(1)
+
+    def test_coefficient_subset(self):
+        for jpeg_file in [self.jpeg_file, self.color_files['420'], self.color_files['422']]:
+            with open(jpeg_file, 'rb') as src:
+                buffer = src.read()
+            expected = loads(buffer, normalized=False)
+            for num_coefficients in [1, 16, 32]:
+                bands = loads(buffer, normalized=False, num_coefficients=num_coefficients)
+                self.assertEqual([band.shape for band in bands],
+                                 dct_shapes(buffer, num_coefficients=num_coefficients))
+                for band, expected_band in zip(bands, expected):
+                    self.assertEqual(band.shape, expected_band.shape[:2] + (num_coefficients,))
+                    np.testing.assert_array_equal(band, expected_band[..., ZIGZAG_ORDER[:num_coefficients]])
+
+            # explicit indices, in any order, also with a crop
+            indices = [9, 0, 1, 8]
+            expected = loads(buffer, crop=(1, 2, 3, 4))
+            for band, expected_band in zip(loads(buffer, crop=(1, 2, 3, 4), coefficients=indices), expected):
+                np.testing.assert_array_equal(band, expected_band[..., indices])
+
+        [dct_y] = load(self.jpeg_file, channels=1, num_coefficients=8)
+        self.assertEqual(dct_y.shape, (205, 205, 8))
+        with self.assertRaises(ValueError):
+            loads(buffer, num_coefficients=65)
+        with self.assertRaises(ValueError):
+            loads(buffer, coefficients=[0, 64])
+        with self.assertRaises(ValueError):
+            loads(buffer, num_coefficients=4, coefficients=[0, 1, 8, 16])
+
+    def test_dtype(self):
+        with open(self.color_files['420'], 'rb') as src:
+            buffer = src.read()
+        expected = loads(buffer)
+        for dtype in [np.float16, np.float32]:
+            bands = loads(buffer, dtype=dtype)
+            for band, expected_band in zip(bands, expected):
+                self.assertEqual(band.dtype, dtype)
+                np.testing.assert_array_equal(band, expected_band.astype(dtype))
+        [dct_y] = load(self.jpeg_file, channels=1, dtype=np.float32, num_coefficients=4)
+        self.assertEqual(dct_y.shape, (205, 205, 4))
+
+        # standardization, per band or shared by the bands
+        mean = np.arange(3 * 16, dtype=np.float32).reshape(3, 16)
+        std = np.linspace(1, 10, 3 * 16, dtype=np.float32).reshape(3, 16)
+        expected = loads(buffer, crop=(1, 2, 3, 4), num_coefficients=16)
+        bands = loads(buffer, crop=(1, 2, 3, 4), num_coefficients=16, dtype=np.float32, mean=mean, std=std)
+        for band, expected_band, band_mean, band_std in zip(bands, expected, mean, std):
+            np.testing.assert_allclose(band, (expected_band - band_mean) / band_std, rtol=1e-6, atol=1e-5)
+        [dct_y] = loads(buffer, channels=1, dtype=np.float32, mean=np.ones(64))
+        np.testing.assert_array_equal(dct_y, loads(buffer, channels=1)[0] - np.float32(1))
+
+        with self.assertRaises(ValueError):
+            loads(buffer, dtype=np.int32)
+        with self.assertRaises(ValueError):
+            loads(buffer, mean=np.zeros(64))
+        with self.assertRaises(ValueError):
+            loads(buffer, dtype=np.float32, mean=np.zeros(16))
+        with self.assertRaises(ValueError):
+            loads(buffer, dtype=np.float32, std=np.zeros(64))
+
+    def test_sparse(self):
+        # direct, resampled and single channel images
+        for jpeg_file in [self.jpeg_file, self.color_files['420'], self.color_files['422']]:
+            with open(jpeg_file, 'rb') as src:
+                buffer = src.read()
+            for channels in [3, 1]:
+                sparse = jpeg_to_sparse(buffer, channels)
+                for normalized in [True, False]:
+                    bands = loads_sparse(sparse, normalized)
+                    expected = loads(buffer, normalized, channels)
+                    self.assertEqual(len(bands), channels)
+                    for band, expected_band in zip(bands, expected):
+                        self.assertEqual(band.shape, expected_band.shape)
+                        np.testing.assert_array_equal(band, expected_band)
+        self.assertEqual(len(loads_sparse(bytearray(sparse))), 1)
+
+        with self.assertRaises(RuntimeError):
+            loads_sparse(sparse[:-1])
+        with self.assertRaises(RuntimeError):
+            loads_sparse(sparse + b'0')
+        with self.assertRaises(RuntimeError):
+            loads_sparse(buffer)
+
+    def test_pixels_to_dct(self):
+        rng = np.random.RandomState(0)
+        noise = rng.randint(0, 256, size=(37, 53, 3)).astype(np.uint8)
+        yy, xx = np.mgrid[0:70, 0:45]
+        gradient = np.stack([yy * 3, xx * 5, 255 - yy - xx], axis=-1).astype(np.uint8)
+        # color and grayscale images whose sizes are not multiples of the blocks
+        for image in [noise, gradient, gradient[:, :, 0]]:
+            for quality in [10, 80, 100]:
+                buffer = encode_jpeg(image, quality)
+                self.assertEqual(probe(buffer)['decode_path'], 'direct')
+                for channels in [3, 1]:
+                    for normalized in [True, False]:
+                        bands = pixels_to_dct(image, quality, normalized=normalized, channels=channels)
+                        expected = loads(buffer, normalized, channels)
+                        self.assertEqual(len(bands), channels)
+                        for band, expected_band in zip(bands, expected):
+                            self.assertEqual(band.shape, expected_band.shape)
+                            np.testing.assert_array_equal(band, expected_band)
+                    self.assertEqual(pixels_to_sparse(image, quality, channels=channels),
+                                     jpeg_to_sparse(buffer, channels))
+
+        # bgr images
+        expected = loads(encode_jpeg(noise))
+        for band, expected_band in zip(pixels_to_dct(noise[:, :, ::-1], is_rgb=False), expected):
+            np.testing.assert_array_equal(band, expected_band)
+        np.testing.assert_array_equal(loads(encode_jpeg(noise[:, :, ::-1], is_rgb=False))[0], expected[0])
+
+        with self.assertRaises(ValueError):
+            pixels_to_dct(noise.astype(np.float32))
+        with self.assertRaises(ValueError):
+            pixels_to_dct(noise[:, :, :2])
+
+    def test_encode_jpeg_options(self):
+        image = np.random.RandomState(0).randint(0, 256, size=(61, 90, 3)).astype(np.uint8)
+        samplings = {'444': (1, 1), '422': (2, 1), '420': (2, 2), '440': (1, 2), '411': (4, 1)}
+        for sampling, factors in samplings.items():
+            for progressive in [False, True]:
+                buffer = encode_jpeg(image, 90, sampling=sampling, progressive=progressive, restart_rows=2)
+                info = probe(buffer)
+                self.assertEqual(info['progressive'], progressive)
+                self.assertEqual([c['sampling'] for c in info['components']], [factors, (1, 1), (1, 1)])
+                self.assertEqual(info['decode_path'], 'direct' if sampling == '420' else 'resample')
+                self.assertIn(b'\xff\xd0', buffer)
+                dct_y, dct_c, dct_r = loads(buffer)
+                self.assertEqual(dct_y.shape, (8, 12, 64))
+                self.assertEqual(dct_c.shape, (4, 6, 64))
+        self.assertNotIn(b'\xff\xd0', encode_jpeg(image))
+
+        with self.assertRaises(ValueError):
+            encode_jpeg(image, sampling='410')
+
+    def test_loads_batch(self):
+        with open(self.jpeg_file, 'rb') as src:
+            buffer = src.read()
+        batch_size = 4
+        dct_y, dct_c, dct_r = loads_batch([buffer] * batch_size, num_threads=2)
+        self.assertEqual(dct_y.shape, (batch_size, 205, 205, 64), "wrong dct shape")
+        self.assertEqual(dct_c.shape, (batch_size, 103, 103, 64), "wrong dct shape")
+        self.assertEqual(dct_r.shape, (batch_size, 103, 103, 64), "wrong dct shape")
+
+        expected = loads(buffer)
+        for i in range(batch_size):
+            for band, expected_band in zip((dct_y, dct_c, dct_r), expected):
+                np.testing.assert_array_equal(band[i], expected_band)
+
+        [dct_y] = loads_batch([buffer] * batch_size, channels=1)
+        self.assertEqual(dct_y.shape, (batch_size, 205, 205, 64), "wrong dct shape")
+
+        with self.assertRaises(RuntimeError):
+            loads_batch([buffer, b'not a jpeg'])
+
+        # the decoding threads are kept from one batch to the next
+        if os.path.isdir('/proc/self/task'):
+            loads_batch([buffer] * batch_size, num_threads=batch_size)
+            nb_threads = len(os.listdir('/proc/self/task'))
+            for _ in range(3):
+                loads_batch([buffer] * batch_size, num_threads=batch_size)
+                self.assertEqual(len(os.listdir('/proc/self/task')), nb_threads)
+
+    def test_decode_errors(self):
+        with open(self.jpeg_file, 'rb') as src:
+            buffer = src.read()
+        truncated = buffer[:len(buffer) // 2]
+        buffers = [buffer, b'not a jpeg', truncated, buffer]
+
+        (dct_y, dct_c, dct_r), ok, messages = loads_batch(buffers, errors='zero')
+        self.assertEqual(ok.tolist(), [True, False, False, True])
+        self.assertEqual(messages[0], None)
+        self.assertIn('Premature end of JPEG file', messages[2])
+        self.assertEqual(dct_y.shape, (4, 205, 205, 64), "wrong dct shape")
+        self.assertEqual(dct_c.shape, (4, 103, 103, 64), "wrong dct shape")
+        self.assertFalse(dct_y[1:3].any(), "failed images shall be zero")
+        np.testing.assert_array_equal(dct_y[3], loads(buffer)[0])
+
+        (dct_y,), ok, messages = loads_batch(buffers, channels=1, dtype=np.float32, errors='drop')
+        self.assertEqual(dct_y.shape, (2, 205, 205, 64), "wrong dct shape")
+        self.assertEqual(ok.tolist(), [True, False, False, True])
+
+        (dct_y,), ok, _ = loads_batch([b'not a jpeg'], channels=1, num_coefficients=8, errors='zero')
+        self.assertEqual(dct_y.shape, (1, 0, 0, 8), "wrong dct shape")
+
+        (dct_y, _, _), ok, messages = load_batch([self.jpeg_file + '.missing', self.jpeg_file], errors='zero')
+        self.assertEqual(ok.tolist(), [False, True])
+        self.assertEqual(dct_y.shape, (2, 205, 205, 64), "wrong dct shape")
+        with self.assertRaises(ValueError):
+            loads_batch(buffers, errors='ignore')
+
+        # truncated images decode with their missing blocks zero filled once accepted, and images only missing their
+        # end of image marker always decode
+        with self.assertRaises(RuntimeError):
+            loads(truncated)
+        np.testing.assert_array_equal(loads(buffer[:-2])[0], loads(buffer)[0])
+        set_accept_truncated(True)
+        try:
+            dct_y = loads(truncated)[0]
+        finally:
+            set_accept_truncated(False)
+        self.assertEqual(dct_y.shape, (205, 205, 64), "wrong dct shape")
+        self.assertFalse(dct_y[-1].any(), "missing blocks shall be zero")
+
+        # the streaming decoders drop the failed images
+        directory = tempfile.mkdtemp()
+        try:
+            for name, data in (('a.jpg', buffer), ('b.jpg', truncated), ('c.jpg', buffer)):
+                with open(os.path.join(directory, name), 'wb') as dst:
+                    dst.write(data)
+            keys = [key for key, _, _, _ in iter_decode(os.path.join(directory, '*.jpg'), errors='drop')]
+            self.assertEqual([os.path.basename(key) for key in keys], ['a.jpg', 'c.jpg'])
+            with self.assertRaises(RuntimeError):
+                list(iter_decode(os.path.join(directory, '*.jpg')))
+            names = [name for name, _ in load_dir(directory, errors='drop')]
+            self.assertEqual([os.path.basename(name) for name in names], ['a.jpg', 'c.jpg'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_loads_batch_padded(self):
+        buffers = []
+        for jpeg_file in [self.jpeg_file_420, self.jpeg_file, self.color_files['422']]:
+            with open(jpeg_file, 'rb') as src:
+                buffers.append(src.read())
+        dct_y, dct_c, dct_r, sizes = loads_batch_padded(buffers, num_threads=2)
+        self.assertEqual(dct_y.shape, (3, 205, 205, 64), "wrong dct shape")
+        self.assertEqual(dct_c.shape, (3, 103, 103, 64), "wrong dct shape")
+        self.assertEqual(sizes.shape, (3, 3, 2))
+        for i, buffer in enumerate(buffers):
+            for band, size, expected_band in zip((dct_y, dct_c, dct_r), sizes[i], loads(buffer)):
+                self.assertEqual(tuple(size), expected_band.shape[:2])
+                np.testing.assert_array_equal(band[i, :size[0], :size[1]], expected_band)
+                # zero padded
+                self.assertFalse(band[i, size[0]:].any() or band[i, :, size[1]:].any())
+
+        decoder = Decoder(channels=1, num_coefficients=8, dtype=np.float32)
+        dct_y, sizes, ok, messages = decoder.loads_batch_padded(buffers[:1] + [b'not a jpeg'], errors='zero')
+        self.assertEqual(dct_y.shape, (2, 50, 75, 8), "wrong dct shape")
+        self.assertEqual(ok.tolist(), [True, False])
+        self.assertIsNotNone(messages[1])
+        self.assertEqual(sizes[1].tolist(), [[0, 0]])
+        self.assertFalse(dct_y[1].any())
+        np.testing.assert_array_equal(dct_y[0], decoder.loads(buffers[0])[0])
+
+        dct_y, _, _, sizes, ok, _ = loads_batch_padded([b'not a jpeg'] + buffers[:1], errors='drop')
+        self.assertEqual(dct_y.shape, (1, 50, 75, 64), "wrong dct shape")
+        self.assertEqual(ok.tolist(), [False, True])
+        with self.assertRaises(RuntimeError):
+            loads_batch_padded([b'not a jpeg'])
+
+    def test_load_batch(self):
+        dct_y, dct_c, dct_r = load_batch([self.jpeg_file, self.jpeg_file_420])
+        self.assertEqual([y.shape for y in dct_y], [(205, 205, 64), (50, 75, 64)], "wrong dct shape")
+        self.assertEqual([c.shape for c in dct_c], [(103, 103, 64), (25, 38, 64)], "wrong dct shape")
+        self.assertEqual([r.shape for r in dct_r], [(103, 103, 64), (25, 38, 64)], "wrong dct shape")
+
+        with self.assertRaises(IOError):
+            load_batch([self.jpeg_file, self.jpeg_file + '.missing'])
+
+    def test_decoder(self):
+        jpeg_files = [self.jpeg_file, self.jpeg_file_420, self.color_files['444']]
+        buffers = []
+        for jpeg_file in jpeg_files:
+            with open(jpeg_file, 'rb') as src:
+                buffers.append(src.read())
+        decoder = Decoder()
+        for _ in range(2):
+            for jpeg_file, buffer in zip(jpeg_files, buffers):
+                expected = loads(buffer)
+                for band, expected_band in zip(decoder.loads(buffer), expected):
+                    np.testing.assert_array_equal(band, expected_band)
+                for band, expected_band in zip(decoder.load(jpeg_file), expected):
+                    np.testing.assert_array_equal(band, expected_band)
+        # the bands of the released arrays are recycled
+        stats = decoder.pool_stats()
+        self.assertGreater(stats['hits'], 0)
+        self.assertGreater(stats['free_bytes'], 0)
+
+        # the decompressor of the thread is reset after a failure, and after the other decoders
+        with self.assertRaises(RuntimeError):
+            decoder.loads(b'not a jpeg')
+        add_restart_markers(buffers[1])
+        np.testing.assert_array_equal(decoder.loads(buffers[1])[0], loads(buffers[1])[0])
+
+        decoder = Decoder(channels=1, num_coefficients=8, dtype=np.float32, crop=(0, 0, 10, 20), pool_bytes=0)
+        [dct_y] = decoder.loads(buffers[0])
+        np.testing.assert_array_equal(dct_y, load(self.jpeg_file, channels=1, num_coefficients=8, dtype=np.float32,
+                                                  crop=(0, 0, 10, 20))[0])
+        self.assertEqual(decoder.pool_stats()['hits'], 0)
+
+        # any format is decoded straight into a preallocated buffer, laid out as image_buffer
+        decoder = Decoder(dtype=np.float16, mean=np.ones(64), std=2 * np.ones(64))
+        image = np.zeros(1 << 20, dtype=np.uint8)
+        bands = decoder.loads_into_buffer(buffers[1], image)
+        for band, expected_band in zip(bands, decoder.loads(buffers[1])):
+            self.assertEqual(band.dtype, np.float16)
+            self.assertEqual(band.base.ctypes.data, image.ctypes.data)
+            np.testing.assert_array_equal(band, expected_band)
+        image[:] = 0
+        self.assertIsNone(decoder.loads_into_buffer(buffers[0], image[:1024]))
+        self.assertFalse(image.any())
+
+        decoder = Decoder(pool_bytes=1 << 20)
+        dct_y, dct_c, dct_r = decoder.loads_batch(buffers[:1] * 3, num_threads=2)
+        self.assertEqual(dct_y.shape, (3, 205, 205, 64), "wrong dct shape")
+        (dct_y, _, _), ok, _ = decoder.load_batch([self.jpeg_file, self.jpeg_file + '.missing'], errors='drop')
+        self.assertEqual(ok.tolist(), [True, False])
+        self.assertLessEqual(decoder.pool_stats()['free_bytes'], 1 << 20)
+        with self.assertRaises(ValueError):
+            Decoder(channels=2)
+
+    def test_image_buffer(self):
+        with open(self.color_files['420'], 'rb') as src:
+            buffer = src.read()
+        bands = loads(buffer)
+        # the three bands share a single 64 bytes aligned buffer, at 64 bytes aligned offsets
+        image = image_buffer(bands[0])
+        for band in bands:
+            self.assertIs(image_buffer(band), image)
+            self.assertEqual(band.ctypes.data % 64, 0)
+        self.assertGreaterEqual(image.nbytes, sum(band.nbytes for band in bands))
+        copies = bands_from_buffer(bytes(image), [band.shape for band in bands])
+        for band, copy in zip(bands, copies):
+            np.testing.assert_array_equal(copy, band)
+        # the buffer outlives the bands
+        del bands
+        np.testing.assert_array_equal(bands_from_buffer(image, [copies[0].shape])[0], copies[0])
+
+        [dct_y] = load(self.jpeg_file, channels=1, dtype=np.float32, num_coefficients=8)
+        [copy] = bands_from_buffer(image_buffer(dct_y).copy(), [dct_y.shape], dtype=np.float32)
+        np.testing.assert_array_equal(copy, dct_y)
+        for bands in (loads_sparse(jpeg_to_sparse(buffer)), pixels_to_dct(np.zeros((40, 40, 3), dtype=np.uint8)),
+                      load_batch([self.jpeg_file, self.jpeg_file_420])[1]):
+            self.assertEqual(image_buffer(bands[0]).dtype, np.uint8)
+
+        with self.assertRaises(ValueError):
+            image_buffer(np.zeros((2, 2, 64), dtype=np.int16))
+        with self.assertRaises(ValueError):
+            bands_from_buffer(bytes(16), [(1, 1, 64)])
+
+    def test_concurrent_loads(self):
+        jpeg_files = [self.jpeg_file, self.jpeg_file_411, self.jpeg_file_420,
+                      self.jpeg_file_422, self.jpeg_file_440, self.jpeg_file_444]
+        buffers = []
+        for jpeg_file in jpeg_files:
+            with open(jpeg_file, 'rb') as src:
+                buffers.append(src.read())
+        # corrupted buffers make some of the threads go through the error path
+        buffers.append(buffers[0][:len(buffers[0]) // 2] + b'\xff\xd9')
+        buffers.append(b'not a jpeg')
+
+        def decode(buffer):
+            try:
+                return loads(buffer)
+            except RuntimeError:
+                return None
+
+        expected = [decode(buffer) for buffer in buffers]
+        self.assertIsNone(expected[-1])
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(decode, buffers * 25))
+        for i, result in enumerate(results):
+            expected_bands = expected[i % len(buffers)]
+            if expected_bands is None:
+                self.assertIsNone(result)
+                continue
+            for band, expected_band in zip(result, expected_bands):
+                np.testing.assert_array_equal(band, expected_band)
+
+    def test_loads_into(self):
+        for jpeg_file in (self.jpeg_file, self.jpeg_file_420, self.jpeg_file_444):
+            with open(jpeg_file, 'rb') as src:
+                buffer = src.read()
+            expected = loads(buffer)
+            self.assertEqual(dct_shapes(buffer), [band.shape for band in expected], "wrong dct shape")
+
+            outputs = [np.empty(shape, dtype=np.int16) for shape in dct_shapes(buffer)]
+            dct_y, dct_c, dct_r = loads_into(buffer, *outputs)
+            for band, output, expected_band in zip((dct_y, dct_c, dct_r), outputs, expected):
+                self.assertIs(band, output)
+                np.testing.assert_array_equal(band, expected_band)
+
+        [shape] = dct_shapes(buffer, channels=1)
+        [dct_y] = loads_into(buffer, np.empty(shape, dtype=np.int16), normalized=False)
+        np.testing.assert_array_equal(dct_y, loads(buffer, normalized=False, channels=1)[0])
+
+        with self.assertRaises(RuntimeError):
+            loads_into(buffer, np.empty((1, 1, 64), dtype=np.int16))
@@ -0,0 +1,117 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import signal
+from unittest import TestCase
+
+import numpy as np
+
+from jpeg2dct.numpy import load, loads
+from jpeg2dct.numpy.process_pool import ProcessPool
+
+
+class TestProcessPool(TestCase):
+    def setUp(self):
+        data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data')
+        self.jpeg_files = [os.path.join(data_dir, name) for name in sorted(os.listdir(data_dir))
+                           if name.endswith('.jpg')]
+
+    def assert_bands_equal(self, bands, expected):
+        self.assertEqual(len(bands), len(expected))
+        for band, expected_band in zip(bands, expected):
+            self.assertEqual(band.dtype, expected_band.dtype)
+            np.testing.assert_array_equal(band, expected_band)
+
+    def test_imap(self):
+        sources = self.jpeg_files * 3
+        with ProcessPool(num_workers=2, slots=3, max_size=(2048, 2048)) as pool:
+            indices = []
+            for index, bands in pool.imap(sources):
+                indices.append(index)
+                self.assert_bands_equal(bands, load(sources[index]))
+            self.assertEqual(indices, list(range(len(sources))))
+            self.assertEqual(pool.oversized, 0)
+
+            # unordered, from buffers
+            buffers = []
+            for jpeg_file in self.jpeg_files:
+                with open(jpeg_file, 'rb') as src:
+                    buffers.append(src.read())
+            indices = set()
+            for index, bands in pool.imap(buffers, ordered=False):
+                indices.add(index)
+                self.assert_bands_equal(bands, loads(buffers[index]))
+            self.assertEqual(indices, set(range(len(buffers))))
+
+    def test_options(self):
+        with open(self.jpeg_files[0], 'rb') as src:
+            buffer = src.read()
+        with ProcessPool(num_workers=1, slots=2, max_size=(2048, 2048), channels=1, num_coefficients=16,
+                         dtype=np.float32) as pool:
+            (_, bands), = pool.imap([buffer])
+            self.assert_bands_equal(bands, loads(buffer, channels=1, num_coefficients=16, dtype=np.float32))
+
+        with self.assertRaises(ValueError):
+            ProcessPool(errors='ignore')
+        with self.assertRaises(ValueError):
+            ProcessPool(num_coefficients=65)
+
+    def test_oversized(self):
+        # the images larger than a slot come through the pipe
+        with ProcessPool(num_workers=1, slots=2, max_size=(16, 16)) as pool:
+            for index, bands in pool.imap(self.jpeg_files):
+                self.assert_bands_equal(bands, load(self.jpeg_files[index]))
+            self.assertEqual(pool.oversized, len(self.jpeg_files))
+
+    def test_errors(self):
+        sources = [self.jpeg_files[0], b'not a jpeg', self.jpeg_files[1]]
+        with ProcessPool(num_workers=1, slots=2, max_size=(2048, 2048)) as pool:
+            with self.assertRaises(RuntimeError):
+                list(pool.imap(sources))
+            # the pool still works after a failure
+            self.assertEqual([index for index, _ in pool.imap(sources[2:])], [0])
+
+        with ProcessPool(num_workers=1, slots=2, max_size=(2048, 2048), errors='drop') as pool:
+            self.assertEqual([index for index, _ in pool.imap(sources)], [0, 2])
+
+    def test_worker_crash(self):
+        sources = self.jpeg_files * 2
+        with ProcessPool(num_workers=1, slots=4, max_size=(2048, 2048), errors='drop') as pool:
+            indices = []
+            for index, bands in pool.imap(sources):
+                if index == 0:
+                    os.kill(pool._workers[0].process.pid, signal.SIGKILL)
+                indices.append(index)
+                self.assert_bands_equal(bands, load(sources[index]))
+            self.assertEqual(pool.restarts, 1)
+            # only the image being decoded when the worker was killed is lost
+            self.assertGreaterEqual(len(indices), len(sources) - 1)
+            self.assertEqual([index for index, _ in pool.imap(sources[:2])], [0, 1])
+
+    def test_backpressure(self):
+        with ProcessPool(num_workers=1, slots=2, max_size=(2048, 2048)) as pool:
+            held = []
+            with self.assertRaises(RuntimeError):
+                for _, bands in pool.imap(self.jpeg_files * 2):
+                    held.append(bands)
+            self.assertEqual(len(held), 2)
+
+            # released views hand their slots back
+            del held, bands
+            self.assertEqual(sum(1 for _ in pool.imap(self.jpeg_files)), len(self.jpeg_files))
+
+    def test_close(self):
+        pool = ProcessPool(num_workers=1, slots=2, max_size=(2048, 2048))
+        (_, bands), = pool.imap(self.jpeg_files[:1])
+        pool.close()
+        # the views outlive the pool
+        self.assert_bands_equal(bands, load(self.jpeg_files[0]))
+        with self.assertRaises(ValueError):
+            next(pool.imap(self.jpeg_files))
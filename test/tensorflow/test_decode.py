@@ -8,10 +8,14 @@
 # limitations under the License.
 
 import os
+import shutil
+import tempfile
 from unittest import TestCase
 
+import numpy as np
 import tensorflow as tf
-from jpeg2dct.tensorflow import decode, batch_decode
+from jpeg2dct.common import ZIGZAG_ORDER
+from jpeg2dct.tensorflow import decode, batch_decode, make_dataset, probe, stats
 
 
 class TestLoad(TestCase):
@@ -120,4 +124,252 @@ class TestLoad(TestCase):
                                                feed_dict={image_bytes_tensor: images_bytes})
             self.assertEqual(dcty.shape, (batch_size, 205, 205, 64), "wrong dct shape")
             self.assertEqual(dctcb.shape, (batch_size, 103, 103, 64), "wrong dct shape")
-            self.assertEqual(dctcr.shape, (batch_size, 103, 103, 64), "wrong dct shape")
\ No newline at end of file
+            self.assertEqual(dctcr.shape, (batch_size, 103, 103, 64), "wrong dct shape")
+
+    def test_crop(self):
+        crop_window = tf.placeholder(shape=(4,), dtype=tf.int32)
+        dct_y_tf, dct_c_tf, dct_r_tf = decode(self.bytess_helper(self.jpeg_file), crop_window=crop_window)
+        dct_y_full_tf = decode(self.bytess_helper(self.jpeg_file))[0]
+
+        with self.sess.as_default():
+            dct_y, dct_c, dct_r, dct_y_full = self.sess.run([dct_y_tf, dct_c_tf, dct_r_tf, dct_y_full_tf],
+                                                            feed_dict={crop_window: [5, 3, 8, 7]})
+            self.assertEqual(dct_y.shape, (8, 7, 64), "wrong dct shape")
+            self.assertEqual(dct_c.shape, (5, 4, 64), "wrong dct shape")
+            self.assertEqual(dct_r.shape, (5, 4, 64), "wrong dct shape")
+            self.assertTrue((dct_y == dct_y_full[5:13, 3:10]).all(), "wrong cropped coefficients")
+
+            with self.assertRaises(tf.errors.UnknownError):
+                self.sess.run(dct_y_tf, feed_dict={crop_window: [200, 0, 10, 10]})
+
+    def test_target_blocks(self):
+        dct_y_tf, dct_c_tf, _ = decode(self.bytess_helper(self.jpeg_file), target_blocks=(64, 210),
+                                       target_crop='top_left')
+        self.assertEqual(dct_y_tf.shape.as_list(), [64, 210, 64], "static shape expected")
+        self.assertEqual(dct_c_tf.shape.as_list(), [32, 105, 64], "static shape expected")
+        dct_y_full_tf = decode(self.bytess_helper(self.jpeg_file))[0]
+
+        image_bytes_tensor = tf.placeholder(shape=(None,), dtype=tf.string)
+        batch = batch_decode(image_bytes_tensor, dtype=tf.float32, target_blocks=(32, 32), target_pad='edge')
+        self.assertEqual(batch[0].shape.as_list(), [None, 32, 32, 64], "static shape expected")
+        images_bytes = []
+        for jpeg_file in (self.jpeg_file, self.jpeg_file_420):
+            with open(jpeg_file, 'rb') as src:
+                images_bytes.append(src.read())
+
+        with self.sess.as_default():
+            dct_y, dct_c, dct_y_full = self.sess.run([dct_y_tf, dct_c_tf, dct_y_full_tf])
+            self.assertEqual(dct_c.shape, (32, 105, 64), "wrong dct shape")
+            self.assertTrue((dct_y[:, :205] == dct_y_full[:64]).all(), "wrong cropped coefficients")
+            self.assertFalse(dct_y[:, 205:].any(), "padding shall be zero")
+
+            dcty, dctcb, _ = self.sess.run(batch, feed_dict={image_bytes_tensor: images_bytes})
+            self.assertEqual(dcty.shape, (2, 32, 32, 64), "wrong dct shape")
+            self.assertEqual(dctcb.shape, (2, 16, 16, 64), "wrong dct shape")
+
+        with self.assertRaises(ValueError):
+            decode(self.bytess_helper(self.jpeg_file), target_blocks=(0, 8))
+
+    def test_scale(self):
+        dct_y_tf, dct_c_tf, _ = decode(self.bytess_helper(self.jpeg_file_420), scale=0.5)
+        image_bytes_tensor = tf.placeholder(shape=(2,), dtype=tf.string)
+        dct_y_batch_tf = batch_decode(image_bytes_tensor, scale=0.25)[0]
+        with open(self.jpeg_file_420, 'rb') as src:
+            image_bytes = src.read()
+
+        with self.sess.as_default():
+            dct_y, dct_c = self.sess.run([dct_y_tf, dct_c_tf])
+            self.assertEqual(dct_y.shape, (25, 38, 64), "wrong dct shape")
+            self.assertEqual(dct_c.shape, (13, 19, 64), "wrong dct shape")
+            dcty = self.sess.run(dct_y_batch_tf, feed_dict={image_bytes_tensor: [image_bytes] * 2})
+            self.assertEqual(dcty.shape, (2, 13, 19, 64), "wrong dct shape")
+
+        with self.assertRaises(ValueError):
+            decode(self.bytess_helper(self.jpeg_file), scale=0.3)
+
+    def test_coefficient_subset(self):
+        dct_y_tf, dct_c_tf, dct_r_tf = decode(self.bytess_helper(self.jpeg_file_420), num_coefficients=16)
+        self.assertEqual(dct_y_tf.shape.as_list(), [None, None, 16])
+        dct_y_full_tf = decode(self.bytess_helper(self.jpeg_file_420))[0]
+
+        image_bytes_tensor = tf.placeholder(shape=(2,), dtype=tf.string)
+        dct_y_batch_tf = batch_decode(image_bytes_tensor, coefficients=[0, 1, 8])[0]
+        self.assertEqual(dct_y_batch_tf.shape.as_list(), [2, None, None, 3])
+
+        with self.sess.as_default():
+            dct_y, dct_c, dct_y_full = self.sess.run([dct_y_tf, dct_c_tf, dct_y_full_tf])
+            self.assertEqual(dct_y.shape, (50, 75, 16), "wrong dct shape")
+            self.assertEqual(dct_c.shape, (25, 38, 16), "wrong dct shape")
+            self.assertTrue((dct_y == dct_y_full[..., ZIGZAG_ORDER[:16]]).all(), "wrong coefficients")
+
+            with open(self.jpeg_file_420, 'rb') as src:
+                image_bytes = src.read()
+            dct_y_batch = self.sess.run(dct_y_batch_tf, feed_dict={image_bytes_tensor: [image_bytes] * 2})
+            self.assertEqual(dct_y_batch.shape, (2, 50, 75, 3), "wrong dct shape")
+            self.assertTrue((dct_y_batch[1] == dct_y_full[..., [0, 1, 8]]).all(), "wrong coefficients")
+
+    def test_dtype(self):
+        mean = np.arange(64, dtype=np.float32)
+        dct_y_tf = decode(self.bytess_helper(self.jpeg_file_420), channels=1)[0]
+        dct_y_float_tf = decode(self.bytess_helper(self.jpeg_file_420), channels=1, dtype=tf.float32)[0]
+        dct_y_half_tf = decode(self.bytess_helper(self.jpeg_file_420), channels=1, dtype=tf.float16, mean=mean)[0]
+        self.assertEqual(dct_y_float_tf.dtype, tf.float32)
+
+        image_bytes_tensor = tf.placeholder(shape=(2,), dtype=tf.string)
+        dct_y_batch_tf = batch_decode(image_bytes_tensor, dtype=tf.float32, pad=True)[0]
+        self.assertEqual(dct_y_batch_tf.dtype, tf.float32)
+
+        with self.sess.as_default():
+            dct_y, dct_y_float, dct_y_half = self.sess.run([dct_y_tf, dct_y_float_tf, dct_y_half_tf])
+            self.assertTrue((dct_y_float == dct_y.astype(np.float32)).all(), "wrong coefficients")
+            self.assertTrue((dct_y_half == (dct_y - mean).astype(np.float16)).all(), "wrong coefficients")
+
+            images_bytes = []
+            for jpeg_file in (self.jpeg_file_420, self.jpeg_file):
+                with open(jpeg_file, 'rb') as src:
+                    images_bytes.append(src.read())
+            dct_y_batch = self.sess.run(dct_y_batch_tf, feed_dict={image_bytes_tensor: images_bytes})
+            self.assertTrue((dct_y_batch[0, :50, :75] == dct_y_float).all(), "wrong coefficients")
+            self.assertTrue((dct_y_batch[0, 50:] == 0).all(), "wrong padding")
+
+    def test_probe(self):
+        image_bytes_tensor = tf.placeholder(shape=(2,), dtype=tf.string)
+        info_tf = probe(image_bytes_tensor)
+        self.assertEqual(info_tf['size'].shape.as_list(), [2, 2])
+        self.assertEqual(info_tf['quant_tables'].shape.as_list(), [2, 3, 64])
+
+        images_bytes = []
+        for jpeg_file in (self.jpeg_file, self.jpeg_file_420):
+            with open(jpeg_file, 'rb') as src:
+                images_bytes.append(src.read())
+
+        with self.sess.as_default():
+            info = self.sess.run(info_tf, feed_dict={image_bytes_tensor: images_bytes})
+            self.assertEqual(info['dct_shapes'].tolist(), [[[205, 205], [103, 103], [103, 103]],
+                                                           [[50, 75], [25, 38], [25, 38]]])
+            self.assertEqual(info['num_components'].tolist()[0], 1)
+            self.assertFalse(info['progressive'].any())
+
+    def test_stats(self):
+        image_bytes_tensor = tf.placeholder(shape=(2,), dtype=tf.string)
+        dct_y_batch = batch_decode(image_bytes_tensor)[0]
+        stats_tf = stats(reset=True)
+        self.assertEqual(stats_tf['images'].shape.as_list(), [])
+        self.assertEqual(sorted(stats_tf['seconds']), ['coefficients', 'copy', 'header', 'resample', 'total',
+                                                       'transcode'])
+
+        with open(self.jpeg_file_420, 'rb') as src:
+            image_bytes = src.read()
+        with self.sess.as_default():
+            self.sess.run(stats_tf)
+            self.sess.run(dct_y_batch, feed_dict={image_bytes_tensor: [image_bytes] * 2})
+            values = self.sess.run(stats_tf)
+            self.assertEqual(values['images'], 2)
+            self.assertEqual(values['bytes'], 2 * len(image_bytes))
+            self.assertEqual(values['decode_paths']['direct'], 2)
+            self.assertGreater(values['seconds']['coefficients'], 0)
+            # the statistics were reset by the previous run
+            self.assertEqual(self.sess.run(stats_tf)['images'], 0)
+
+    def test_batch_pad(self):
+        image_bytes_tensor = tf.placeholder(shape=(2,), dtype=tf.string)
+        dct_y_batch, dct_cb_batch, dct_cr_batch, sizes_batch = batch_decode(image_bytes_tensor, pad=True)
+        self.assertEqual(dct_y_batch.shape.as_list(), [2, None, None, 64])
+        self.assertEqual(sizes_batch.shape.as_list(), [2, 3, 2])
+
+        images_bytes = []
+        for jpeg_file in (self.jpeg_file, self.jpeg_file_420):
+            with open(jpeg_file, 'rb') as src:
+                images_bytes.append(src.read())
+
+        with self.sess.as_default():
+            dcty, dctcb, dctcr, sizes = self.sess.run([dct_y_batch, dct_cb_batch, dct_cr_batch, sizes_batch],
+                                                      feed_dict={image_bytes_tensor: images_bytes})
+            self.assertEqual(dcty.shape, (2, 205, 205, 64), "wrong dct shape")
+            self.assertEqual(dctcb.shape, (2, 103, 103, 64), "wrong dct shape")
+            self.assertEqual(dctcr.shape, (2, 103, 103, 64), "wrong dct shape")
+            self.assertEqual(sizes.tolist(), [[[205, 205], [103, 103], [103, 103]],
+                                              [[50, 75], [25, 38], [25, 38]]])
+            self.assertFalse(dcty[1, 50:].any(), "padding shall be zero")
+            self.assertFalse(dcty[1, :, 75:].any(), "padding shall be zero")
+
+            dct_y_unpadded = batch_decode(image_bytes_tensor)[0]
+            with self.assertRaises(tf.errors.InvalidArgumentError):
+                self.sess.run(dct_y_unpadded, feed_dict={image_bytes_tensor: images_bytes})
+
+    def test_batch_errors(self):
+        image_bytes_tensor = tf.placeholder(shape=(3,), dtype=tf.string)
+        with open(self.jpeg_file, 'rb') as src:
+            buffer = src.read()
+        images_bytes = [buffer, buffer[:len(buffer) // 2], buffer]
+
+        with self.sess.as_default():
+            dct_y_batch, _, _, ok_batch, errors_batch = batch_decode(image_bytes_tensor, errors='zero')
+            dcty, ok, errors = self.sess.run([dct_y_batch, ok_batch, errors_batch],
+                                             feed_dict={image_bytes_tensor: images_bytes})
+            self.assertEqual(dcty.shape, (3, 205, 205, 64), "wrong dct shape")
+            self.assertEqual(ok.tolist(), [True, False, True])
+            self.assertEqual(errors[0], b'')
+            self.assertIn(b'Premature end of JPEG file', errors[1])
+            self.assertFalse(dcty[1].any(), "failed images shall be zero")
+
+            dct_y_batch, _, _, ok_batch, _ = batch_decode(image_bytes_tensor, errors='drop')
+            dcty, ok = self.sess.run([dct_y_batch, ok_batch], feed_dict={image_bytes_tensor: images_bytes})
+            self.assertEqual(dcty.shape, (2, 205, 205, 64), "wrong dct shape")
+
+            with self.assertRaises(tf.errors.UnknownError):
+                self.sess.run(batch_decode(image_bytes_tensor)[0], feed_dict={image_bytes_tensor: images_bytes})
+
+    def run_dataset(self, dataset):
+        next_batch = dataset.make_one_shot_iterator().get_next()
+        batches = []
+        with self.sess.as_default():
+            while True:
+                try:
+                    batches.append(self.sess.run(next_batch))
+                except tf.errors.OutOfRangeError:
+                    return batches
+
+    def test_make_dataset(self):
+        jpeg_files = [self.jpeg_file, self.jpeg_file_420, self.jpeg_file, self.jpeg_file_444]
+        dataset = make_dataset(jpeg_files, batch_size=2, labels=[0, 1, 2, 3], bucket_blocks=1, drop_remainder=True)
+        (dct_y, _, _, sizes), labels = dataset.output_shapes
+        self.assertEqual(dct_y.as_list(), [2, None, None, 64])
+        self.assertEqual(sizes.as_list(), [2, 3, 2])
+
+        batches = self.run_dataset(dataset)
+        # the images are grouped by block grid
+        self.assertEqual(sorted(sorted(labels.tolist()) for _, labels in batches), [[0, 2], [1, 3]])
+        for (dcty, dctcb, _, sizes), labels in batches:
+            expected_shape = (2, 205, 205, 64) if labels[0] % 2 == 0 else (2, 50, 75, 64)
+            self.assertEqual(dcty.shape, expected_shape, "wrong dct shape")
+            self.assertEqual(sizes[:, 0].tolist(), [list(expected_shape[1:3])] * 2)
+
+        # a single channel, without labels
+        batches = self.run_dataset(make_dataset(jpeg_files[:3], batch_size=2, channels=1, num_coefficients=8))
+        self.assertEqual(sorted(len(dcty) for dcty, _ in batches), [1, 2])
+        self.assertEqual(batches[0][0].shape[-1], 8)
+
+    def test_make_dataset_records(self):
+        directory = tempfile.mkdtemp()
+        try:
+            record_file = os.path.join(directory, 'images.tfrecord')
+            with open(self.jpeg_file_420, 'rb') as src:
+                buffer = src.read()
+            with tf.python_io.TFRecordWriter(record_file) as writer:
+                for label, image in enumerate([buffer, b'not a jpeg', buffer]):
+                    example = tf.train.Example(features=tf.train.Features(feature={
+                        'image': tf.train.Feature(bytes_list=tf.train.BytesList(value=[image])),
+                        'label': tf.train.Feature(int64_list=tf.train.Int64List(value=[label]))}))
+                    writer.write(example.SerializeToString())
+
+            dataset = make_dataset([record_file], batch_size=4, record_key='image',
+                                   record_features={'label': tf.FixedLenFeature([], tf.int64)}, errors='drop')
+            [((dcty, _, _, sizes), features)] = self.run_dataset(dataset)
+            self.assertEqual(dcty.shape, (2, 50, 75, 64), "wrong dct shape")
+            self.assertEqual(features['label'].tolist(), [0, 2])
+
+            with self.assertRaises(tf.errors.OpError):
+                self.run_dataset(make_dataset([record_file], batch_size=4, record_key='image'))
+        finally:
+            shutil.rmtree(directory)
@@ -0,0 +1,89 @@
+# Copyright (c) 2018 Uber Technologies, Inc.
+#
+# Licensed under the Uber Non-Commercial License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at the root directory of this project.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+from unittest import TestCase
+
+import numpy as np
+import torch
+from torch.utils.data import DataLoader
+
+from jpeg2dct.numpy import load
+from jpeg2dct.torch import BucketBatchSampler, DCTCollate, IterableJpegDataset, JpegDataset
+
+
+class TestDataset(TestCase):
+    def setUp(self):
+        data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data')
+        self.jpeg_files = [os.path.join(data_dir, name) for name in
+                           ['DCT_16_16.jpg', 'DCT_16_16_420.jpg', 'DCT_16_16_444.jpg', 'color_422.jpg']]
+
+    def assert_batch_equal(self, bands, sizes, jpeg_files, **options):
+        for i, jpeg_file in enumerate(jpeg_files):
+            for band, size, expected_band in zip(bands, sizes[i], load(jpeg_file, **options)):
+                self.assertEqual(tuple(size.tolist()), expected_band.shape[:2])
+                # n x nb dct coef x h x w views of the decoded bands
+                np.testing.assert_array_equal(band[i].permute(1, 2, 0)[:size[0], :size[1]].numpy(), expected_band)
+
+    def test_collate(self):
+        dataset = JpegDataset(self.jpeg_files, targets=list(range(len(self.jpeg_files))))
+        loader = DataLoader(dataset, batch_size=len(self.jpeg_files), collate_fn=DCTCollate(num_threads=2))
+        dct_y, dct_cb, dct_cr, sizes, targets = next(iter(loader))
+        self.assertEqual(tuple(dct_y.shape), (4, 64, 205, 205))
+        self.assertEqual(tuple(dct_cb.shape), (4, 64, 103, 103))
+        self.assertTrue(dct_y.is_contiguous(memory_format=torch.channels_last))
+        self.assertEqual(dct_y.dtype, torch.int16)
+        self.assertEqual(targets.tolist(), [0, 1, 2, 3])
+        self.assert_batch_equal((dct_y, dct_cb, dct_cr), sizes, self.jpeg_files)
+
+        collate = DCTCollate(channels=1, num_coefficients=8, dtype=np.float32, errors='drop')
+        buffers = [dataset[0][0], b'not a jpeg', dataset[1][0]]
+        dct_y, sizes, targets, ok, messages = collate(list(zip(buffers, [0, 1, 2])))
+        self.assertEqual(tuple(dct_y.shape), (2, 8, 205, 205))
+        self.assertEqual(dct_y.dtype, torch.float32)
+        self.assertEqual(targets.tolist(), [0, 2])
+        self.assertEqual(ok.tolist(), [True, False, True])
+        self.assertIsNotNone(messages[1])
+        self.assert_batch_equal((dct_y,), sizes, [self.jpeg_files[0], self.jpeg_files[1]], channels=1,
+                                num_coefficients=8, dtype=np.float32)
+
+        # the collate function is sent to the worker processes
+        collate = pickle.loads(pickle.dumps(DCTCollate()))
+        dct_y, _, _, sizes = collate([dataset[0][0]])
+        self.assertEqual(tuple(dct_y.shape), (1, 64, 205, 205))
+
+        # every batch gets the target block grid
+        collate = DCTCollate(target_blocks=(64, 64), target_crop='random')
+        dct_y, dct_cb, _, sizes = collate([dataset[0][0], dataset[3][0]])
+        self.assertEqual(tuple(dct_y.shape), (2, 64, 64, 64))
+        self.assertEqual(tuple(dct_cb.shape), (2, 64, 32, 32))
+
+    def test_iterable_dataset(self):
+        dataset = IterableJpegDataset(self.jpeg_files)
+        loader = DataLoader(dataset, batch_size=2, collate_fn=DCTCollate(), num_workers=2)
+        self.assertEqual(sum(len(batch[0]) for batch in loader), len(self.jpeg_files))
+
+    def test_bucket_batch_sampler(self):
+        dataset = JpegDataset([self.jpeg_files[0], self.jpeg_files[1], self.jpeg_files[0], self.jpeg_files[2]])
+        grids = dataset.block_grids()
+        self.assertEqual(grids.tolist(), [[205, 205], [50, 75], [205, 205], [50, 75]])
+
+        sampler = BucketBatchSampler(grids, batch_size=2)
+        self.assertEqual(len(sampler), 2)
+        for _ in range(3):
+            batches = list(sampler)
+            self.assertEqual(sorted(index for batch in batches for index in batch), [0, 1, 2, 3])
+            # the images of a batch share their block grid
+            for batch in batches:
+                self.assertEqual(len(set(tuple(grids[index]) for index in batch)), 1)
+
+        sampler = BucketBatchSampler(grids, batch_size=3, shuffle=False, drop_last=True)
+        self.assertEqual(list(sampler), [[1, 3, 0]])
+        self.assertEqual(len(sampler), 1)